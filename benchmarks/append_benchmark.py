@@ -0,0 +1,88 @@
+"""
+Artımlı ekleme ile tam yeniden yazımı karşılaştıran ölçüm betiği.
+
+Büyüyen bir "günlük sevkiyat" dosyasına art arda küçük belgeler eklenir.
+Artımlı eklemenin süresi dosya büyüdükçe sabit kalmalı, tam yeniden
+yazımınki ise dosya boyutuyla birlikte artmalıdır. Her güncelleme sayfa
+ağacının /Kids dizisini yeniden yazdığından artımlı dosya zamanla şişer;
+``--compact-every`` ile ara sıra tam sıkıştırmanın etkisi görülebilir.
+
+Kullanım:
+    python benchmarks/append_benchmark.py --rounds 200 --pages 5
+    python benchmarks/append_benchmark.py --rounds 200 --compact-every 50
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz # PyMuPDF
+from marnak_pdf_tools.core.merger import PdfMerger
+
+
+def create_document(path: str, pages: int, label: str):
+    """Metin ve basit çizim içeren örnek bir belge üretir."""
+    document = fitz.open()
+    for index in range(pages):
+        page = document.new_page()
+        page.insert_text((72, 72), f"{label} - Sayfa {index + 1}", fontsize=14)
+        page.draw_rect(fitz.Rect(72, 100, 520, 300), color=(0, 0, 0))
+    document.save(path)
+    document.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Artımlı ekleme ölçümü")
+    parser.add_argument("--rounds", type=int, default=200, help="Ekleme sayısı")
+    parser.add_argument("--pages", type=int, default=5, help="Her eklemedeki sayfa sayısı")
+    parser.add_argument("--every", type=int, default=25, help="Kaç eklemede bir satır yazdırılacağı")
+    parser.add_argument("--compact-every", type=int, default=0,
+                        help="Kaç eklemede bir tam sıkıştırma yapılacağı (0: hiç)")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="append_benchmark_")
+    try:
+        batch_path = os.path.join(work_dir, "yeni.pdf")
+        create_document(batch_path, args.pages, "Sevkiyat")
+
+        appended_path = os.path.join(work_dir, "artimli.pdf")
+        rewritten_path = os.path.join(work_dir, "yeniden.pdf")
+        merger = PdfMerger()
+
+        print(f"{'Ekleme':>7} {'Sayfa':>7} {'Boyut (KB)':>11} {'Artımlı (ms)':>13} {'Yeniden (ms)':>13}")
+        for round_index in range(1, args.rounds + 1):
+            compact = bool(args.compact_every) and round_index % args.compact_every == 0
+            start = time.perf_counter()
+            success, message, _ = merger.merge_pdfs([batch_path], appended_path,
+                                                    options={"append": True, "compact": compact})
+            append_ms = (time.perf_counter() - start) * 1000
+            if not success:
+                print(f"Hata: {message}")
+                return 1
+
+            # Karşılaştırma: mevcut dosya + yeni belge tamamen yeniden yazılır
+            start = time.perf_counter()
+            inputs = [rewritten_path, batch_path] if os.path.exists(rewritten_path) else [batch_path]
+            temp_path = rewritten_path + ".tmp"
+            success, message, _ = merger.merge_pdfs(inputs, temp_path)
+            if not success:
+                print(f"Hata: {message}")
+                return 1
+            os.replace(temp_path, rewritten_path)
+            rewrite_ms = (time.perf_counter() - start) * 1000
+
+            if round_index == 1 or round_index % args.every == 0:
+                pages = round_index * args.pages
+                size_kb = os.path.getsize(appended_path) / 1024
+                print(f"{round_index:>7} {pages:>7} {size_kb:>11.1f} {append_ms:>13.1f} {rewrite_ms:>13.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Ölçümler için sentetik PDF derlemi üreten modül.
+
+Derlem türleri:
+    single         1 sayfalık belge
+    text           Metin yoğun sayfalar (sayfa başına ~60 satır)
+    image          Her sayfada benzersiz, yüksek çözünürlüklü (~200 DPI) görüntü
+    many_small     1-3 sayfalık çok sayıda küçük dosya
+    huge           Tek bir çok sayfalı belge (1 ila 20.000 sayfa)
+    deep           İç içe form XObject'leri ve çok sayıda yazı tipi içeren sayfalar
+
+İçerik sabit bir tohumdan üretildiği için aynı profil her makinede aynı
+derlemi verir. Derlem klasörde ``manifest.json`` ile birlikte saklanır ve
+profil ile derlem sürümü değişmedikçe yeniden üretilmez.
+
+Kullanım:
+    python benchmarks/corpus.py --profile small --dir /tmp/marnak_derlem
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import fitz # PyMuPDF
+
+# Üretim mantığı değişince artırılır; eski derlemler yeniden üretilir
+CORPUS_VERSION = 1
+
+# Profil başına derlem boyutları (many_small için dosya sayısı, diğerleri için sayfa sayısı)
+PROFILES = {
+    "small": {"single": 1, "text": 100, "image": 10, "many_small": 100, "huge": 2000, "deep": 50},
+    "full": {"single": 1, "text": 1000, "image": 100, "many_small": 1000, "huge": 20000, "deep": 500},
+}
+
+# Sayfa boyutu (A4, punto)
+_PAGE_WIDTH, _PAGE_HEIGHT = 595, 842
+
+_WORDS = ("belge fatura sözleşme rapor tablo sayfa tarih imza onay arşiv müşteri tutar "
+          "toplam vergi adres teslim sipariş ürün miktar birim fiyat açıklama not").split()
+
+_FONTS = ("helv", "tiro", "cour", "hebo", "tibo", "cobo", "heit", "tiit")
+
+
+def default_corpus_dir(profile: str) -> str:
+    """Profilin varsayılan derlem klasörü (sistem geçici dizininde)."""
+    return os.path.join(tempfile.gettempdir(), f"marnak_derlem_{profile}")
+
+
+def _text_line(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _make_text(path: str, pages: int, rng: random.Random, lines: int = 60):
+    document = fitz.open()
+    for index in range(pages):
+        page = document.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+        text = "\n".join(_text_line(rng) for _ in range(lines))
+        page.insert_textbox(fitz.Rect(40, 40, _PAGE_WIDTH - 40, _PAGE_HEIGHT - 40), text, fontsize=9)
+        page.insert_text((40, _PAGE_HEIGHT - 20), f"Sayfa {index + 1}", fontsize=8)
+    document.save(path, deflate=True)
+    document.close()
+
+
+def _make_image(path: str, pages: int, rng: random.Random, side: int = 800):
+    # 800 piksel / 4 inç = 200 DPI: optimize işlemi küçültecek görüntü bulur
+    document = fitz.open()
+    rect = fitz.Rect(72, 72, 72 + 288, 72 + 288)
+    for index in range(pages):
+        page = document.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+        pixmap = fitz.Pixmap(fitz.csRGB, side, side, rng.randbytes(side * side * 3), False)
+        page.insert_image(rect, pixmap=pixmap)
+        page.insert_text((72, 400), f"Taranmış sayfa {index + 1}", fontsize=12)
+    document.save(path, deflate=True)
+    document.close()
+
+
+def _make_small(path: str, pages: int, rng: random.Random):
+    _make_text(path, pages, rng, lines=10)
+
+
+def _make_huge(path: str, pages: int, rng: random.Random):
+    # Sayfalar hafif tutulur; belge büyüklüğünü sayfa ağacı ve xref belirler
+    document = fitz.open()
+    for index in range(pages):
+        page = document.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+        page.insert_text((72, 72), f"Sayfa {index + 1} - {_text_line(rng, 6)}", fontsize=11)
+    document.save(path, deflate=True)
+    document.close()
+
+
+def _make_deep(path: str, pages: int, rng: random.Random, depth: int = 8):
+    # Her seviye bir öncekini form XObject olarak gösterir ve kendi yazı tipini ekler
+    level = fitz.open()
+    page = level.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+    page.insert_text((72, 72), "Seviye 0", fontname=_FONTS[0])
+    for depth_index in range(1, depth + 1):
+        next_level = fitz.open()
+        page = next_level.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+        page.insert_text((72, 40), f"Seviye {depth_index}", fontname=_FONTS[depth_index % len(_FONTS)])
+        page.show_pdf_page(fitz.Rect(20, 50, _PAGE_WIDTH - 20, _PAGE_HEIGHT - 20), level, 0)
+        level.close()
+        level = next_level
+
+    document = fitz.open()
+    for index in range(pages):
+        page = document.new_page(width=_PAGE_WIDTH, height=_PAGE_HEIGHT)
+        page.show_pdf_page(page.rect, level, 0)
+        page.insert_text((40, _PAGE_HEIGHT - 10), f"Sayfa {index + 1} {_text_line(rng, 4)}",
+                         fontname=_FONTS[index % len(_FONTS)], fontsize=8)
+    document.save(path, deflate=True)
+    document.close()
+    level.close()
+
+
+def write_large_pdf(path: str, size_mb: int, side: int = 800, seed: str = "buyuk") -> int:
+    """
+    Yaklaşık ``size_mb`` boyutunda, her sayfasında sıkıştırılmamış bir görüntü olan PDF yazar.
+
+    Belge bellekte kurulmadan nesne nesne diske yazılır; böylece birkaç GB'lık
+    girdiler de üretilebilir. Görüntüler rastgele olduğu için sayfalar
+    birbirinin kopyası değildir. Dosya zaten varsa yeniden yazılmaz.
+
+    Returns:
+        int: Sayfa sayısı
+    """
+    page_bytes = side * side * 3
+    pages = max(1, size_mb * 1024 * 1024 // page_bytes)
+    if os.path.exists(path):
+        return pages
+
+    rng = random.Random(f"{CORPUS_VERSION}:{seed}:{side}")
+    # Nesne numaraları: 1 katalog, 2 sayfa ağacı, sayfa başına 3 nesne (sayfa, içerik, görüntü)
+    offsets = {}
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        def write_object(number: int, body: bytes, stream: bytes = None):
+            offsets[number] = f.tell()
+            f.write(f"{number} 0 obj\n".encode() + body)
+            if stream is not None:
+                f.write(b"\nstream\n" + stream + b"\nendstream")
+            f.write(b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for index in range(pages):
+            page, content, image = 3 + 3 * index, 4 + 3 * index, 5 + 3 * index
+            drawing = f"q 288 0 0 288 72 400 cm /Im0 Do Q BT /F1 12 Tf 72 380 Td (Sayfa {index + 1}) Tj ET".encode()
+            write_object(page, (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {_PAGE_WIDTH} {_PAGE_HEIGHT}] "
+                                f"/Contents {content} 0 R /Resources << /XObject << /Im0 {image} 0 R >> "
+                                f"/Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >> >>")
+                         .encode())
+            write_object(content, f"<< /Length {len(drawing)} >>".encode(), drawing)
+            write_object(image, (f"<< /Type /XObject /Subtype /Image /Width {side} /Height {side} "
+                                 f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Length {page_bytes} >>").encode(),
+                         rng.randbytes(page_bytes))
+        kids = " ".join(f"{3 + 3 * index} 0 R" for index in range(pages))
+        write_object(2, f"<< /Type /Pages /Count {pages} /Kids [{kids}] >>".encode())
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+        xref = f.tell()
+        count = 3 + 3 * pages
+        f.write(f"xref\n0 {count}\n0000000000 65535 f \n".encode())
+        for number in range(1, count):
+            f.write(f"{offsets[number]:010d} 00000 n \n".encode())
+        f.write(f"trailer\n<< /Size {count} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    os.replace(temp_path, path)
+    return pages
+
+
+def _generate_entry(kind: str, size: int, directory: str, rng: random.Random) -> dict:
+    """Tek bir derlem türünü üretir; {kind, files, pages, bytes} döndürür."""
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    if kind == "many_small":
+        total_pages = 0
+        for index in range(size):
+            pages = rng.randint(1, 3)
+            path = os.path.join(directory, f"kucuk_{index:05d}.pdf")
+            _make_small(path, pages, rng)
+            files.append(path)
+            total_pages += pages
+    else:
+        makers = {"single": _make_text, "text": _make_text, "image": _make_image,
+                  "huge": _make_huge, "deep": _make_deep}
+        path = os.path.join(directory, f"{kind}_{size}.pdf")
+        makers[kind](path, size, rng)
+        files.append(path)
+        total_pages = size
+    return {
+        "kind": kind,
+        "files": files,
+        "pages": total_pages,
+        "bytes": sum(os.path.getsize(path) for path in files),
+    }
+
+
+def generate_corpus(directory: str, profile: str = "small", kinds=None, log=print) -> dict:
+    """
+    Derlemi üretir ya da klasörde geçerli bir derlem varsa onu döndürür.
+
+    Args:
+        directory: Derlem klasörü
+        profile: ``PROFILES`` anahtarı
+        kinds: Üretilecek türler (None: profildeki tümü)
+        log: İlerleme mesajları için fonksiyon
+
+    Returns:
+        dict: {"profile", "version", "entries": {tür: {kind, files, pages, bytes}}}
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Bilinmeyen profil: {profile}")
+    sizes = PROFILES[profile]
+    kinds = list(kinds or sizes)
+    manifest_path = os.path.join(directory, "manifest.json")
+
+    manifest = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("profile") != profile or manifest.get("version") != CORPUS_VERSION:
+            shutil.rmtree(directory, ignore_errors=True)
+            manifest = None
+    if manifest is None:
+        manifest = {"profile": profile, "version": CORPUS_VERSION, "entries": {}}
+
+    for kind in kinds:
+        entry = manifest["entries"].get(kind)
+        if entry and all(os.path.exists(os.path.join(directory, path)) for path in entry["files"]):
+            continue
+        start = time.perf_counter()
+        # Her tür kendi tohumunu kullanır: bir türü yeniden üretmek diğerlerini değiştirmez
+        rng = random.Random(f"{CORPUS_VERSION}:{kind}:{sizes[kind]}")
+        entry = _generate_entry(kind, sizes[kind], os.path.join(directory, kind), rng)
+        entry["files"] = [os.path.relpath(path, directory) for path in entry["files"]]
+        manifest["entries"][kind] = entry
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        if log:
+            log(f"Derlem üretildi: {kind} ({entry['pages']} sayfa, {len(entry['files'])} dosya, "
+                f"{entry['bytes'] / (1024 * 1024):.1f} MB, {time.perf_counter() - start:.1f} sn)")
+
+    entries = {kind: dict(manifest["entries"][kind],
+                          files=[os.path.join(directory, path) for path in manifest["entries"][kind]["files"]])
+               for kind in kinds}
+    return {"profile": profile, "version": CORPUS_VERSION, "entries": entries}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Sentetik PDF derlemi üretici")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small", help="Derlem boyutu")
+    parser.add_argument("--dir", help="Derlem klasörü (varsayılan: geçici dizin)")
+    parser.add_argument("--kinds", nargs="+", choices=sorted(PROFILES["small"]), help="Yalnızca bu türler")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.dir or default_corpus_dir(args.profile), args.profile, args.kinds)
+    for kind, entry in corpus["entries"].items():
+        print(f"{kind:<12} {entry['pages']:>7} sayfa {len(entry['files']):>6} dosya "
+              f"{entry['bytes'] / (1024 * 1024):>9.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
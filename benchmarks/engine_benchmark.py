@@ -0,0 +1,181 @@
+"""
+PDF motorlarını (PyPDF2, PyMuPDF) işlem başına karşılaştıran ölçüm betiği.
+
+Her işlem motor arayüzü üzerinden, çıktılar belleğe yazılarak ölçülür;
+her motorun en iyi süresi, ölçümden türetilen varsayılan ve
+``core/engines.py`` içindeki ``DEFAULT_ENGINES`` yazdırılır. ``--save`` ile
+sonuçlar ``engine_results.json`` dosyasına yazılır; ``DEFAULT_ENGINES`` bu
+kayıtlı sonuçlardan ``derive_defaults`` ile türetilen tabloyla aynı olmalıdır
+(``tests/test_core.py`` denetler).
+
+Kullanım:
+    python benchmarks/engine_benchmark.py --files 20 --pages 50
+    python benchmarks/engine_benchmark.py --repeat 5 --save
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz # PyMuPDF
+import PyPDF2
+from marnak_pdf_tools.core import engines
+
+# Kayıtlı ölçüm sonuçları
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "engine_results.json")
+
+# PyPDF2 bir işlemde varsayılan olmak için PyMuPDF'ten en az bu oranda hızlı olmalı.
+# Yakın sonuçlarda PyMuPDF seçilir: önizleme ve çizimle aynı belgeyi havuzdan paylaşır.
+SWITCH_MARGIN = 0.10
+
+
+def derive_defaults(timings: dict, margin: float = SWITCH_MARGIN) -> dict:
+    """
+    Ölçümlerden işlem başına varsayılan motoru türetir.
+
+    Args:
+        timings: İşlem -> {motor adı: en iyi süre (ms)}
+        margin: PyPDF2'nin seçilmesi için gereken en az göreli kazanç
+
+    Returns:
+        dict: İşlem -> motor adı (``DEFAULT_ENGINES`` biçiminde)
+    """
+    defaults = {}
+    for operation, times in timings.items():
+        pypdf2_wins = times[engines.ENGINE_PYPDF2] < times[engines.ENGINE_PYMUPDF] * (1 - margin)
+        defaults[operation] = engines.ENGINE_PYPDF2 if pypdf2_wins else engines.ENGINE_PYMUPDF
+    # PyPDF2 sayfa çizemez
+    defaults[engines.OP_RENDER] = engines.ENGINE_PYMUPDF
+    return defaults
+
+
+def load_results(path: str = RESULTS_PATH) -> dict:
+    """Kayıtlı ölçüm sonuçlarını okur."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def create_document(path: str, pages: int, label: str):
+    """Metin, çizim ve tüm sayfalarda ortak bir görüntü içeren örnek belge üretir."""
+    document = fitz.open()
+    pixmap = fitz.Pixmap(fitz.csRGB, 200, 200, os.urandom(200 * 200 * 3), False)
+    for index in range(pages):
+        page = document.new_page()
+        page.insert_text((72, 72), f"{label} - Sayfa {index + 1}", fontsize=14)
+        page.draw_rect(fitz.Rect(72, 100, 520, 300), color=(0, 0, 0))
+        page.insert_image(fitz.Rect(72, 320, 272, 520), pixmap=pixmap)
+    document.save(path)
+    document.close()
+
+
+def best_of(run, repeat: int) -> float:
+    """En iyi süre (ms)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def write_parts(engine, path: str, parts):
+    """Her parça için yeni belge oluşturup belleğe yazar."""
+    document = engine.open(path)
+    try:
+        for page_indices in parts:
+            target = engine.new_document()
+            engine.copy_pages(target, document, page_indices)
+            engine.write(target, io.BytesIO())
+    finally:
+        engine.close(document)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PDF motoru ölçümü")
+    parser.add_argument("--files", type=int, default=20, help="Birleştirilecek girdi sayısı")
+    parser.add_argument("--pages", type=int, default=50, help="Her girdideki sayfa sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--save", action="store_true", help=f"Sonuçları {os.path.basename(RESULTS_PATH)} dosyasına yaz")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="engine_benchmark_")
+    try:
+        inputs = []
+        for index in range(args.files):
+            path = os.path.join(work_dir, f"girdi_{index:03d}.pdf")
+            create_document(path, args.pages, f"Belge {index + 1}")
+            inputs.append(path)
+        large = os.path.join(work_dir, "buyuk.pdf")
+        create_document(large, args.files * args.pages, "Büyük")
+        total = args.files * args.pages
+
+        def merge(engine):
+            target = engine.new_document()
+            for path in inputs:
+                document = engine.open(path)
+                engine.copy_pages(target, document, range(engine.page_count(document)))
+                engine.close(document)
+            engine.write(target, io.BytesIO())
+
+        def page_count(engine):
+            for path in inputs:
+                document = engine.open(path)
+                engine.page_count(document)
+                engine.close(document)
+
+        scenarios = [
+            (engines.OP_MERGE, "birleştir", merge),
+            (engines.OP_SPLIT, "her 10 sayfada böl",
+             lambda engine: write_parts(engine, large, [range(i, min(i + 10, total)) for i in range(0, total, 10)])),
+            (engines.OP_EXTRACT, "her sayfayı çıkar",
+             lambda engine: write_parts(engine, large, [[i] for i in range(total)])),
+            (engines.OP_PAGE_COUNT, "sayfa say", page_count),
+        ]
+
+        names = [engines.ENGINE_PYPDF2, engines.ENGINE_PYMUPDF]
+        timings = {}
+        for operation, label, run in scenarios:
+            timings[operation] = {name: round(best_of(lambda: run(engines.ENGINES[name]), args.repeat), 1)
+                                  for name in names}
+        derived = derive_defaults(timings)
+
+        print(f"{args.files} girdi x {args.pages} sayfa, en iyi {args.repeat} tekrar")
+        print(f"{'İşlem':<20} {'pypdf2 (ms)':>12} {'pymupdf (ms)':>13} {'Türetilen':>10} {'Varsayılan':>11}")
+        for operation, label, _ in scenarios:
+            times = timings[operation]
+            print(f"{label:<20} {times[engines.ENGINE_PYPDF2]:>12.1f} {times[engines.ENGINE_PYMUPDF]:>13.1f} "
+                  f"{derived[operation]:>10} {engines.DEFAULT_ENGINES[operation]:>11}")
+
+        if args.save:
+            results = {
+                "files": args.files,
+                "pages": args.pages,
+                "repeat": args.repeat,
+                "environment": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpu_count": os.cpu_count(),
+                    "pymupdf": fitz.VersionBind,
+                    "pypdf2": PyPDF2.__version__,
+                },
+                "timings_ms": timings,
+            }
+            with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            print(f"Sonuçlar yazıldı: {RESULTS_PATH}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
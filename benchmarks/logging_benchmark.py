@@ -0,0 +1,127 @@
+"""
+Günlük yazımının büyük işlerdeki maliyetini ölçen betik.
+
+Büyük bir belge sayfa sayfa bölünürken günlükçü üç biçimde kurulur:
+
+    eşzamanlı      FileHandler + konsol, dosya başına satırlar dahil (eski yapılandırma)
+    kuyruk/DEBUG   QueueHandler + döndürülen dosya, dosya başına satırlar dahil
+    kuyruk/INFO    QueueHandler + döndürülen dosya, yalnızca iş özeti (varsayılan)
+
+Her kip için bölme işinin süresi ve işin iş parçacığında dosya başına
+satırın (``logger.debug("Dosya oluşturuldu: %s", ...)``) ortalama maliyeti
+raporlanır. Konsol çıktısı /dev/null'a yönlendirilir; terminale yazmanın
+maliyeti ölçüme katılmaz.
+
+Kullanım:
+    python benchmarks/logging_benchmark.py --pages 10000 --repeat 3
+"""
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz # PyMuPDF
+from marnak_pdf_tools.core.splitter import PdfSplitter
+from marnak_pdf_tools.utils.logging_config import LOG_FORMAT, setup_logging, shutdown_logging
+
+
+def create_document(path: str, pages: int):
+    """Hafif sayfalardan oluşan büyük bir belge üretir."""
+    document = fitz.open()
+    for index in range(pages):
+        document.new_page().insert_text((72, 72), f"Sayfa {index + 1}", fontsize=11)
+    document.save(path, deflate=True)
+    document.close()
+
+
+def configure(mode: str, log_path: str, console):
+    """Kök günlükçüyü ölçüm kipine göre kurar."""
+    root = logging.getLogger()
+    if mode == "eşzamanlı":
+        formatter = logging.Formatter(LOG_FORMAT)
+        for handler in (logging.FileHandler(log_path, encoding='utf-8'), logging.StreamHandler(console)):
+            handler.setFormatter(formatter)
+            root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+    else:
+        stdout, sys.stdout = sys.stdout, console
+        try:
+            # Oran sınırı kapalı: tüm satırların yazım maliyeti ölçülür
+            setup_logging(log_path, level="DEBUG" if mode == "kuyruk/DEBUG" else "INFO", rate=0)
+        finally:
+            sys.stdout = stdout
+
+
+def reset(mode: str):
+    """Kurulan işleyicileri kapatır; kuyruktaki kayıtlar bu sırada yazılır."""
+    if mode == "eşzamanlı":
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+    else:
+        shutdown_logging()
+
+
+def record_cost_us(logger: logging.Logger, count: int = 20000) -> float:
+    """Dosya başına günlük satırının çağıran iş parçacığındaki ortalama maliyeti (mikrosaniye)."""
+    start = time.perf_counter()
+    for index in range(count):
+        logger.debug("Dosya oluşturuldu: %s", f"/tmp/cikti/buyuk_sayfa_{index}.pdf")
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Günlük yazımı ölçümü")
+    parser.add_argument("--pages", type=int, default=10000, help="Sayfa sayısı (her sayfa ayrı dosya olur)")
+    parser.add_argument("--repeat", type=int, default=3, help="Kip başına tekrar (medyan alınır)")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="logging_benchmark_")
+    console = open(os.devnull, "w", encoding="utf-8")
+    try:
+        input_path = os.path.join(work_dir, "buyuk.pdf")
+        create_document(input_path, args.pages)
+        splitter = PdfSplitter(logger=logging.getLogger("PdfService"))
+
+        print(f"{'Kip':<14} {'Süre (sn)':>10} {'İş süresi (sn)':>15} {'Günlük (KB)':>12} {'Satır (µs)':>11}")
+        for mode in ("eşzamanlı", "kuyruk/DEBUG", "kuyruk/INFO"):
+            runs, job_runs = [], []
+            log_size = 0
+            log_path = os.path.join(work_dir, "app.log")
+            configure(mode, log_path, console)
+            line_cost = record_cost_us(splitter.logger)
+            reset(mode)
+            os.remove(log_path)
+            for _ in range(max(1, args.repeat)):
+                output_dir = os.path.join(work_dir, "cikti")
+                configure(mode, log_path, console)
+                start = time.perf_counter()
+                success, message, _ = splitter.split_pdf(input_path, output_dir,
+                                                         {"mode": PdfSplitter.SPLIT_MODE_ALL_PAGES})
+                job = time.perf_counter() - start
+                reset(mode)
+                runs.append(time.perf_counter() - start)
+                job_runs.append(job)
+                if not success:
+                    raise RuntimeError(message)
+                log_size = os.path.getsize(log_path)
+                os.remove(log_path)
+                shutil.rmtree(output_dir, ignore_errors=True)
+            # "İş süresi" işlemin döndüğü ana kadar; "Süre" kuyruğun boşaltılmasını da içerir
+            print(f"{mode:<14} {statistics.median(runs):>10.2f} {statistics.median(job_runs):>15.2f} "
+                  f"{log_size / 1024:>12.1f} {line_cost:>11.1f}")
+    finally:
+        console.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""
+Core işlemlerinin bellek kullanımını ölçen profil aracı.
+
+``MemoryProfiler`` herhangi bir işlemi sarar ve iki kaynaktan ölçüm alır:
+
+    RSS            Arka plandaki bir iş parçacığı /proc/self/status'u düzenli
+                   okur (toplam, anonim ve dosya kaynaklı RSS). Linux'ta
+                   işlem başında VmHWM sıfırlanabiliyorsa kesin en yüksek
+                   değer de kullanılır. MuPDF gibi C kütüphanelerinin
+                   ayırdığı bellek yalnızca burada görünür.
+    tracemalloc    Python tarafındaki ayırmaların en yükseği ve en yüksek
+                   noktaya yakın alınan anlık görüntüden en çok bellek
+                   ayıran satırlar.
+
+Bütçe kontrolleri her ölçümü yeni bir süreçte yapar; önceki işlemlerden
+kalan serbest yığın belleği yeni işlemin RSS artışını gizlemez.
+
+Kullanım:
+    python benchmarks/memory_profile.py --operation split --sizes 100 500 2000
+    python benchmarks/memory_profile.py --operation merge --sizes 200 --top 15
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import write_large_pdf
+from run_benchmarks import OPERATIONS, run_operation
+from marnak_pdf_tools.core.metrics import read_memory
+
+# Akışlı çalışan işlemlerin süreç başına en yüksek RSS bütçesi (MB), girdi boyutundan bağımsız.
+# Metin çıkarmada MuPDF'in kaynak önbelleği (varsayılan üst sınır 256 MB) dolana kadar RSS büyür.
+# Birleştirme çıktıyı bellekte kurduğu için bütçesi yoktur (RSS çıktı boyutuyla büyür).
+MEMORY_BUDGETS_MB: Dict[str, int] = {
+    "split": 300,
+    "extract": 300,
+    "text": 400,
+}
+
+_MB = 1024 * 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Sürecin en yüksek RSS kaydını (VmHWM) sıfırlar (Linux 4.0+); başarılı mı?
+
+    Kayıt bütün süreç için tutulur; yalnızca tek işlem ölçen bu araçta kullanılır.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+@dataclass
+class MemoryReport:
+    """Bir işlemin bellek profili. Değerler MB cinsindendir."""
+
+    wall_s: float
+    rss_start_mb: Optional[float] = None
+    peak_rss_mb: Optional[float] = None  # Toplam RSS'in en yükseği
+    peak_anon_mb: Optional[float] = None  # Anonim (özel) RSS'in örneklenen en yükseği
+    peak_file_mb: Optional[float] = None  # Dosya kaynaklı RSS'in (mmap, paylaşılan kütüphaneler) en yükseği
+    peak_traced_mb: Optional[float] = None  # tracemalloc ile izlenen Python ayırmalarının en yükseği
+    top_sites: List[tuple] = field(default_factory=list)  # (dosya:satır, MB, blok sayısı)
+    samples: int = 0
+
+    @property
+    def peak_delta_mb(self) -> Optional[float]:
+        """İşlem sırasında RSS'e eklenen en yüksek miktar."""
+        if self.peak_rss_mb is None or self.rss_start_mb is None:
+            return None
+        return self.peak_rss_mb - self.rss_start_mb
+
+
+class MemoryProfiler:
+    """
+    Bağlam yöneticisi olarak bir işlemin bellek profilini çıkarır.
+
+    Örnek:
+        with MemoryProfiler(trace=True) as profiler:
+            PdfSplitter().split_pdf(path, output_dir)
+        print(format_report(profiler.report))
+    """
+
+    def __init__(self, interval: float = 0.01, trace: bool = False, top: int = 10, frames: int = 1):
+        """
+        Args:
+            interval: RSS örnekleme aralığı (sn)
+            trace: tracemalloc ile Python ayırmaları da izlensin mi (işlemi yavaşlatır)
+            top: Raporlanacak en çok bellek ayıran satır sayısı
+            frames: Ayırma başına saklanacak çağrı yığını derinliği
+        """
+        self.interval = interval
+        self.trace = trace
+        self.top = top
+        self.frames = frames
+        self.report: Optional[MemoryReport] = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._peaks = {}
+        self._samples = 0
+        self._snapshot = None
+        self._snapshot_size = 0
+        self._hwm_reset = False
+        self._start = 0.0
+        self._rss_start = None
+
+    def __enter__(self) -> "MemoryProfiler":
+        if self.trace:
+            tracemalloc.start(self.frames)
+        self._hwm_reset = reset_peak_rss()
+        self._rss_start = read_memory().get("rss")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="MemoryProfiler", daemon=True)
+        self._thread.start()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._start
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+        peak_rss = self._peaks.get("rss")
+        hwm = read_memory().get("hwm")
+        if self._hwm_reset and hwm is not None:
+            # Örnekleme GIL'i bırakmayan C çağrıları sırasındaki tepeleri kaçırabilir
+            peak_rss = max(peak_rss or 0.0, hwm)
+
+        peak_traced = None
+        top_sites = []
+        if self.trace:
+            peak_traced = tracemalloc.get_traced_memory()[1] / _MB
+            snapshot = self._snapshot or tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            for stat in snapshot.statistics("lineno")[:self.top]:
+                frame = stat.traceback[0]
+                top_sites.append((f"{frame.filename}:{frame.lineno}", stat.size / _MB, stat.count))
+
+        self.report = MemoryReport(
+            wall_s=wall,
+            rss_start_mb=self._rss_start,
+            peak_rss_mb=peak_rss,
+            peak_anon_mb=self._peaks.get("anon"),
+            peak_file_mb=self._peaks.get("file"),
+            peak_traced_mb=peak_traced,
+            top_sites=top_sites,
+            samples=self._samples,
+        )
+        return False
+
+    def _sample(self):
+        current = read_memory()
+        self._samples += 1
+        for key in ("rss", "anon", "file"):
+            if current.get(key) is not None:
+                self._peaks[key] = max(self._peaks.get(key, 0.0), current[key])
+        if self.trace:
+            # En yüksek noktaya yakın bir anlık görüntü sakla (her %10 artışta yenilenir)
+            traced = tracemalloc.get_traced_memory()[0]
+            if traced > self._snapshot_size * 1.1:
+                self._snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = traced
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+
+def profile_memory(run: Callable[[], None], **options) -> MemoryReport:
+    """``run`` fonksiyonunu ``MemoryProfiler`` ile çalıştırıp raporu döndürür."""
+    with MemoryProfiler(**options) as profiler:
+        run()
+    return profiler.report
+
+
+def profile_operation(operation: str, files: list, output_dir: str, trace: bool = False,
+                      top: int = 10) -> MemoryReport:
+    """``run_benchmarks.OPERATIONS`` işlemlerinden birinin profilini çıkarır."""
+    import marnak_pdf_tools.core  # İçe aktarma belleği işleme sayılmaz
+    return profile_memory(lambda: run_operation(operation, files, output_dir), trace=trace, top=top)
+
+
+def profile_in_subprocess(operation: str, files: list, output_dir: str, trace: bool = False,
+                          top: int = 10) -> MemoryReport:
+    """``profile_operation``'ı yeni başlatılmış bir süreçte çalıştırır."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(profile_operation, operation, files, output_dir, trace, top).result()
+
+
+def format_report(report: MemoryReport) -> str:
+    """Raporu okunabilir metne dönüştürür."""
+    def mb(value):
+        return "-" if value is None else f"{value:.1f} MB"
+
+    lines = [
+        f"Süre: {report.wall_s:.2f} sn ({report.samples} örnek)",
+        f"RSS: başlangıç {mb(report.rss_start_mb)}, en yüksek {mb(report.peak_rss_mb)} "
+        f"(artış {mb(report.peak_delta_mb)})",
+        f"Anonim RSS en yüksek: {mb(report.peak_anon_mb)}, dosya kaynaklı: {mb(report.peak_file_mb)}",
+    ]
+    if report.peak_traced_mb is not None:
+        lines.append(f"Python ayırmaları (tracemalloc) en yüksek: {mb(report.peak_traced_mb)}")
+    if report.top_sites:
+        lines.append("En çok bellek ayıran satırlar (en yüksek noktaya yakın):")
+        for site, size, count in report.top_sites:
+            lines.append(f"  {size:>9.2f} MB {count:>8} blok  {site}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Core işlemleri bellek profili")
+    parser.add_argument("--operation", choices=OPERATIONS, default="split", help="Profili çıkarılacak işlem")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 400],
+                        help="Girdi boyutları (MB); her boyut için görüntü ağırlıklı bir PDF üretilir")
+    parser.add_argument("--dir", help="Büyük girdilerin klasörü (varsayılan: geçici dizin, yeniden kullanılır)")
+    parser.add_argument("--trace", action="store_true", help="tracemalloc ile Python ayırmalarını da izle")
+    parser.add_argument("--top", type=int, default=10, help="Raporlanacak ayırma satırı sayısı")
+    args = parser.parse_args()
+
+    input_dir = args.dir or os.path.join(tempfile.gettempdir(), "marnak_bellek")
+    os.makedirs(input_dir, exist_ok=True)
+    budget = MEMORY_BUDGETS_MB.get(args.operation)
+
+    rows = []
+    for size in sorted(args.sizes):
+        path = os.path.join(input_dir, f"buyuk_{size}mb.pdf")
+        pages = write_large_pdf(path, size)
+        output_dir = tempfile.mkdtemp(prefix="marnak_bellek_cikti_")
+        try:
+            report = profile_in_subprocess(args.operation, [path], output_dir, args.trace, args.top)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+        print(f"\n== {args.operation}: {size} MB, {pages} sayfa ==")
+        print(format_report(report))
+        rows.append((size, pages, report))
+
+    print(f"\n{'Girdi (MB)':>10} {'Sayfa':>7} {'Süre (sn)':>10} {'RSS (MB)':>9} {'Anonim (MB)':>12} "
+          f"{'Bütçe':>7}")
+    for size, pages, report in rows:
+        status = "-" if budget is None else ("tamam" if report.peak_rss_mb <= budget else "AŞILDI")
+        print(f"{size:>10} {pages:>7} {report.wall_s:>10.2f} {report.peak_rss_mb or 0:>9.1f} "
+              f"{report.peak_anon_mb or 0:>12.1f} {status:>7}")
+    if len(rows) > 1 and rows[0][2].peak_rss_mb is not None:
+        (first_size, _, first), (last_size, _, last) = rows[0], rows[-1]
+        growth = (last.peak_rss_mb - first.peak_rss_mb) / (last_size - first_size)
+        print(f"\nGirdi başına RSS artışı: {growth * 1024:.0f} MB / GB girdi "
+              f"({'sınırlı' if growth < 0.05 else 'girdiyle büyüyor'})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Paralel bölmede belleğe eşlenmiş (mmap) girdilerin RSS kazancını ölçen betik.
+
+Büyük bir PDF üretilir ve N işçi süreç aynı dosyanın farklı sayfa
+aralıklarını böler (çıktılar /dev/null'a yazılır). Tamponlu okumada her
+işçi dosyanın tamamını özel belleğine (RssAnon) kopyalar; mmap ile sayfalar
+işletim sisteminin sayfa önbelleğinden okunur (RssFile) ve işçiler
+arasında paylaşılır. İşçi başına ölçümler /proc/self/status'tan alınır
+(yalnızca Linux).
+
+Kullanım:
+    python benchmarks/mmap_benchmark.py --size-mb 2048 --workers 4
+    python benchmarks/mmap_benchmark.py --input buyuk.pdf --workers 8
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz # PyMuPDF
+from marnak_pdf_tools.core import pdf_io
+from marnak_pdf_tools.core.splitter import PdfSplitter
+
+
+def create_large_document(path: str, size_mb: int, chunk_pages: int = 50):
+    """
+    En az ``size_mb`` boyutunda, sıkıştırılmamış görüntülü sayfalardan oluşan bir PDF üretir.
+
+    Bellek kullanımını sınırlı tutmak için sayfalar parça parça artımlı kayıtla eklenir.
+    """
+    chunk = fitz.open()
+    for index in range(chunk_pages):
+        page = chunk.new_page()
+        page.insert_text((72, 72), f"Sayfa {index + 1}", fontsize=14)
+        pixmap = fitz.Pixmap(fitz.csRGB, 500, 500, os.urandom(500 * 500 * 3), False)
+        page.insert_image(fitz.Rect(72, 100, 522, 550), pixmap=pixmap)
+
+    chunk.save(path, deflate=False)
+    while os.path.getsize(path) < size_mb * 1024 * 1024:
+        document = fitz.open(path)
+        document.insert_pdf(chunk)
+        document.save(path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+        document.close()
+    chunk.close()
+
+
+def read_status() -> dict:
+    """Sürecin bellek satırlarını MB olarak döndürür."""
+    values = {}
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("RssAnon", "RssFile", "VmHWM"):
+                values[key] = int(rest.split()[0]) / 1024
+    return values
+
+
+def configure_worker(use_mmap: bool):
+    pdf_io.MMAP_INPUTS = use_mmap
+
+
+def split_range(task) -> dict:
+    """İşçi süreçte bir sayfa aralığını böler ve bellek ölçümünü döndürür."""
+    path, page_range = task
+    with open(os.devnull, "wb") as sink:
+        for _ in PdfSplitter().iter_split(path, lambda name: sink,
+                                          {"mode": PdfSplitter.SPLIT_MODE_PAGE_RANGE,
+                                           "page_range": page_range}):
+            pass
+    return read_status()
+
+
+def run(path: str, workers: int, use_mmap: bool) -> tuple:
+    """Dosyayı ``workers`` sürece paylaştırarak böler; (süre, işçi ölçümleri) döndürür."""
+    total_pages = fitz.open(path).page_count
+    size = -(-total_pages // workers)
+    tasks = [(path, f"{start + 1}-{min(start + size, total_pages)}")
+             for start in range(0, total_pages, size)]
+
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=configure_worker, initargs=(use_mmap,),
+                              maxtasksperchild=1) as pool:
+        results = pool.map(split_range, tasks, chunksize=1)
+    return time.perf_counter() - start, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="mmap girdi ölçümü")
+    parser.add_argument("--input", help="Ölçülecek PDF (verilmezse üretilir)")
+    parser.add_argument("--size-mb", type=int, default=2048, help="Üretilecek dosyanın boyutu (MB)")
+    parser.add_argument("--workers", type=int, default=4, help="Paralel işçi sayısı")
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/status"):
+        print("Bu ölçüm /proc gerektirir (Linux).")
+        return 1
+
+    work_dir = tempfile.mkdtemp(prefix="mmap_benchmark_")
+    try:
+        path = args.input
+        if not path:
+            path = os.path.join(work_dir, "buyuk.pdf")
+            print(f"{args.size_mb} MB'lık deneme dosyası üretiliyor...")
+            create_large_document(path, args.size_mb)
+        print(f"Dosya: {os.path.getsize(path) / (1024 * 1024):.0f} MB, {args.workers} işçi")
+
+        print(f"{'Okuma':<10} {'Süre (sn)':>10} {'Özel (MB)':>10} {'Paylaşılan (MB)':>16} {'En yüksek RSS (MB)':>19}")
+        for label, use_mmap in (("tamponlu", False), ("mmap", True)):
+            elapsed, results = run(path, args.workers, use_mmap)
+            anon = sum(r["RssAnon"] for r in results)
+            shared = sum(r["RssFile"] for r in results)
+            peak = max(r["VmHWM"] for r in results)
+            print(f"{label:<10} {elapsed:>10.2f} {anon:>10.0f} {shared:>16.0f} {peak:>19.0f}")
+        print("Özel: işçilerin RssAnon toplamı; Paylaşılan: RssFile toplamı (sayfa önbelleği, "
+              "süreçler arasında ortak)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
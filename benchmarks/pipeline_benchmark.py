@@ -0,0 +1,125 @@
+"""
+İş akışını (PdfPipeline) aynı adımların ayrı core çağrılarıyla yapılmasıyla karşılaştıran ölçüm betiği.
+
+İki tipik iş ölçülür:
+    1. Birleştir -> her N sayfada böl (ayrı çağrılarda birleştirilmiş ara dosya yazılıp yeniden okunur)
+    2. 1-2. sayfaları çıkar -> yeniden adlandır (çıkarılan sayfalar ara klasöre yazılıp kopyalanır)
+
+Boş sayfa atma adımının ayrı bir core karşılığı olmadığından karşılaştırmaya
+katılmaz. Her senaryonun en iyi süresi ve diske yazılan toplam bayt yazdırılır.
+
+Kullanım:
+    python benchmarks/pipeline_benchmark.py --files 40 --pages 25 --every 50
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz # PyMuPDF
+from marnak_pdf_tools.core import PdfMerger, PdfSplitter, PdfExtractor, PdfRenamer, PdfPipeline
+
+
+def create_document(path: str, pages: int, label: str):
+    """Metin ve basit çizim içeren örnek bir belge üretir."""
+    document = fitz.open()
+    for index in range(pages):
+        page = document.new_page()
+        page.insert_text((72, 72), f"{label} - Sayfa {index + 1}", fontsize=14)
+        page.draw_rect(fitz.Rect(72, 100, 520, 300), color=(0, 0, 0))
+    document.save(path)
+    document.close()
+
+
+def written_bytes(*directories: str) -> int:
+    """Klasörlerdeki tüm dosyaların toplam boyutu."""
+    return sum(os.path.getsize(os.path.join(root, name))
+               for directory in directories
+               for root, _, names in os.walk(directory)
+               for name in names)
+
+
+def measure(run, repeat: int, work_dir: str):
+    """Senaryoyu temiz klasörlerde ``repeat`` kez çalıştırır; (en iyi süre ms, yazılan bayt) döndürür."""
+    best, size = None, 0
+    for _ in range(repeat):
+        scratch = tempfile.mkdtemp(dir=work_dir)
+        start = time.perf_counter()
+        run(scratch)
+        elapsed = (time.perf_counter() - start) * 1000
+        size = written_bytes(scratch)
+        shutil.rmtree(scratch, ignore_errors=True)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="İş akışı ölçümü")
+    parser.add_argument("--files", type=int, default=40, help="Girdi dosyası sayısı")
+    parser.add_argument("--pages", type=int, default=25, help="Her girdideki sayfa sayısı")
+    parser.add_argument("--every", type=int, default=50, help="Bölme adımında bölüm başına sayfa")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyisi alınır)")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="pipeline_benchmark_")
+    try:
+        inputs = []
+        for index in range(args.files):
+            path = os.path.join(work_dir, f"girdi_{index:03d}.pdf")
+            create_document(path, args.pages, f"Belge {index + 1}")
+            inputs.append(path)
+
+        def merge_split_separate(scratch):
+            merged = os.path.join(scratch, "ara", "birlestirilmis.pdf")
+            success, message, _ = PdfMerger().merge_pdfs(inputs, merged, options={"strategy": "flat"})
+            assert success, message
+            success, message, _ = PdfSplitter().split_pdf(
+                merged, os.path.join(scratch, "cikti"),
+                {"mode": PdfSplitter.SPLIT_MODE_EVERY_N_PAGES, "pages_per_split": args.every})
+            assert success, message
+
+        def merge_split_pipeline(scratch):
+            steps = [{"op": "merge"}, {"op": "split", "pages_per_split": args.every}]
+            success, message, _ = PdfPipeline().run(inputs, steps, os.path.join(scratch, "cikti"))
+            assert success, message
+
+        def extract_rename_separate(scratch):
+            extracted = []
+            for path in inputs:
+                success, message, files = PdfExtractor().extract_pages(
+                    path, os.path.join(scratch, "ara"), {"extract_all": False, "page_range": "1-2"})
+                assert success, message
+                extracted.extend(files)
+            success, message, _ = PdfRenamer().rename_pdfs(
+                extracted, os.path.join(scratch, "cikti"), {"new_name": "kapak", "keep_originals": False})
+            assert success, message
+
+        def extract_rename_pipeline(scratch):
+            steps = [{"op": "extract", "page_range": "1-2"}, {"op": "rename", "new_name": "kapak"}]
+            success, message, _ = PdfPipeline().run(inputs, steps, os.path.join(scratch, "cikti"))
+            assert success, message
+
+        scenarios = [
+            ("birleştir -> böl", merge_split_separate, merge_split_pipeline),
+            ("çıkar -> adlandır", extract_rename_separate, extract_rename_pipeline),
+        ]
+
+        print(f"{args.files} girdi x {args.pages} sayfa, en iyi {args.repeat} tekrar")
+        print(f"{'Senaryo':<20} {'Ayrı (ms)':>10} {'Akış (ms)':>10} {'Hız':>6} "
+              f"{'Ayrı yazılan (KB)':>18} {'Akış yazılan (KB)':>18}")
+        for name, separate, pipeline in scenarios:
+            separate_ms, separate_bytes = measure(separate, args.repeat, work_dir)
+            pipeline_ms, pipeline_bytes = measure(pipeline, args.repeat, work_dir)
+            print(f"{name:<20} {separate_ms:>10.1f} {pipeline_ms:>10.1f} {separate_ms / pipeline_ms:>5.1f}x "
+                  f"{separate_bytes / 1024:>18.1f} {pipeline_bytes / 1024:>18.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
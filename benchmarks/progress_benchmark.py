@@ -0,0 +1,168 @@
+"""
+İlerleme bildirimlerinin arayüz olay döngüsüne maliyetini ölçen betik.
+
+Büyük bir belge sayfa sayfa bölünürken ``PDFSplitWorker``'ın ilerleme
+sinyalleri, arayüz pencerelerindeki gibi ilerleme çubuğunu ve etiketi
+güncelleyen bir yuvaya bağlanır. İki kip karşılaştırılır:
+
+    ham            Core'un her bildirimi ayrı bir kuyruklu sinyal (eski davranış)
+    seyrek         ``ProgressThrottle`` ile seyrekleştirilmiş bildirimler
+
+Her kip için olay döngüsünde işlenen olay sayısı, yuvalarda geçen süre,
+ana iş parçacığının olay işlemeyle geçirdiği toplam süre ve 16 ms'lik bir
+zamanlayıcının en büyük gecikmesi (arayüzün tepkisizlik süresi) raporlanır.
+
+Kullanım:
+    QT_QPA_PLATFORM=offscreen python benchmarks/progress_benchmark.py --pages 10000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fitz # PyMuPDF
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication, QLabel, QProgressBar, QVBoxLayout, QWidget
+from marnak_pdf_tools.core.splitter import PdfSplitter
+from marnak_pdf_tools.services.pdf_service import PDFSplitWorker
+
+# Arayüzün bir kare süresi (ms); zamanlayıcı gecikmesi bu aralıkla ölçülür
+FRAME_MS = 16
+
+
+class RawSplitWorker(PDFSplitWorker):
+    """Her core bildirimini doğrudan yayınlayan iş parçacığı (seyrekleştirme öncesi davranış)."""
+
+    def _update_progress(self, value):
+        self.progress.emit(value)
+
+
+class EventTimer:
+    """Ana iş parçacığında işlenen olayları ve işlenme sürelerini toplar."""
+
+    def __init__(self):
+        self.events = 0
+        self.busy_s = 0.0
+        self.depth = 0
+
+
+class _CountingApplication(QApplication):
+    """Olay işleme süresini ``EventTimer``'a bildiren uygulama."""
+
+    timer: EventTimer = None
+
+    def notify(self, receiver, event):
+        if self.timer is None:
+            return super().notify(receiver, event)
+        timer = self.timer
+        timer.events += 1
+        timer.depth += 1
+        start = time.perf_counter()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            timer.depth -= 1
+            if timer.depth == 0:  # İç içe olaylar bir kez sayılır
+                timer.busy_s += time.perf_counter() - start
+
+
+def create_document(path: str, pages: int):
+    """Hafif sayfalardan oluşan büyük bir belge üretir."""
+    document = fitz.open()
+    for index in range(pages):
+        document.new_page().insert_text((72, 72), f"Sayfa {index + 1}", fontsize=11)
+    document.save(path, deflate=True)
+    document.close()
+
+
+def run_case(app, worker_class, input_path: str, output_dir: str) -> dict:
+    """Bölme işini çalıştırır ve olay döngüsü ölçümlerini döndürür."""
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    progress = QProgressBar()
+    label = QLabel()
+    layout.addWidget(progress)
+    layout.addWidget(label)
+    window.show()
+
+    stats = {"slot_calls": 0, "slot_s": 0.0, "max_lag_ms": 0.0}
+
+    def update_progress(value):
+        # Pencerelerdeki update_progress ile aynı iş: çubuk + bilgi etiketi
+        start = time.perf_counter()
+        progress.setValue(value)
+        label.setText(f"İşlem ilerliyor: %{value}")
+        stats["slot_calls"] += 1
+        stats["slot_s"] += time.perf_counter() - start
+
+    heartbeat = QTimer()
+    last_tick = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        stats["max_lag_ms"] = max(stats["max_lag_ms"], (now - last_tick[0]) * 1000 - FRAME_MS)
+        last_tick[0] = now
+
+    heartbeat.timeout.connect(tick)
+
+    worker = worker_class(input_path, output_dir, {"mode": PdfSplitter.SPLIT_MODE_ALL_PAGES})
+    worker.progress.connect(update_progress)
+    result = {}
+    worker.finished.connect(lambda success, message: result.update(success=success, message=message))
+
+    app.timer = EventTimer()
+    start = time.perf_counter()
+    heartbeat.start(FRAME_MS)
+    worker.start()
+    while worker.isRunning() or not result:
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+    wall = time.perf_counter() - start
+    heartbeat.stop()
+    events, busy = app.timer.events, app.timer.busy_s
+    app.timer = None
+    window.close()
+
+    if not result.get("success"):
+        raise RuntimeError(result.get("message"))
+    return dict(stats, wall_s=wall, events=events, busy_s=busy)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="İlerleme bildirimi olay döngüsü ölçümü")
+    parser.add_argument("--pages", type=int, default=10000, help="Sayfa sayısı (her sayfa ayrı dosya olur)")
+    args = parser.parse_args()
+
+    app = _CountingApplication.instance() or _CountingApplication(sys.argv[:1])
+    work_dir = tempfile.mkdtemp(prefix="progress_benchmark_")
+    try:
+        input_path = os.path.join(work_dir, "buyuk.pdf")
+        create_document(input_path, args.pages)
+
+        rows = []
+        for name, worker_class in (("seyrek", PDFSplitWorker), ("ham", RawSplitWorker)):
+            output_dir = os.path.join(work_dir, name)
+            rows.append((name, run_case(app, worker_class, input_path, output_dir)))
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        print(f"{'Kip':<8} {'Süre (sn)':>10} {'Yuva çağrısı':>13} {'Yuva (ms)':>10} {'Olay':>8} "
+              f"{'Olay işleme (ms)':>17} {'En büyük gecikme (ms)':>22}")
+        for name, row in rows:
+            print(f"{name:<8} {row['wall_s']:>10.2f} {row['slot_calls']:>13} {row['slot_s'] * 1000:>10.1f} "
+                  f"{row['events']:>8} {row['busy_s'] * 1000:>17.1f} {row['max_lag_ms']:>22.1f}")
+        (_, throttled), (_, raw) = rows
+        if throttled["busy_s"] > 0:
+            print(f"\nOlay işleme süresi: {raw['busy_s'] / throttled['busy_s']:.1f} kat azaldı "
+                  f"({(raw['busy_s'] - throttled['busy_s']) * 1000:.0f} ms)")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
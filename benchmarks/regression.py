@@ -0,0 +1,263 @@
+"""
+Performans gerileme kapısı: sabit bir ölçüm alt kümesini kayıtlı taban değerlerle karşılaştırır.
+
+``tests/test_performance.py`` bu modülü ``pytest --perf`` ile çalıştırır.
+Her durum ısınma turundan sonra ``repeat`` kez ölçülür; medyan ve MAD
+(medyandan mutlak sapmaların medyanı) taban dosyasıyla karşılaştırılır.
+
+Taban süreleri makineler arasında taşınabilsin diye her çalıştırmada sabit
+bir kalibrasyon işi ölçülür ve taban süreleri bu işin süre oranıyla
+ölçeklenir. Bir durum, ölçeklenmiş tabanı hem göreli toleransı hem de
+gürültü payını (``NOISE_FACTOR`` x MAD) aştığında gerilemiş sayılır;
+gerileyen durumlar bir kez daha ölçülür ve karar iki turun birleşik
+örnekleriyle verilir (anlık yük tek başına testi düşürmez).
+
+Kullanım:
+    python -m pytest tests/test_performance.py --perf
+    python -m pytest tests/test_performance.py --perf --perf-update-baseline
+"""
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fitz # PyMuPDF
+from corpus import CORPUS_VERSION, generate_corpus, default_corpus_dir
+from marnak_pdf_tools.core import PdfMerger, PdfSplitter, PdfExtractor, PdfRenamer
+
+BASELINE_VERSION = 1
+
+# Kayıtlı taban dosyası
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Varsayılan tekrar sayısı ve eşikler
+DEFAULT_REPEAT = 7
+DEFAULT_TOLERANCE = 0.50
+NOISE_FACTOR = 3.0
+# Bu süreden kısa farklar zamanlayıcı gürültüsü sayılır
+MIN_NOISE_S = 0.002
+
+# Durumların kullandığı derlem türleri (profil: small)
+CORPUS_KINDS = ("text", "many_small", "huge")
+
+STATUS_OK = "tamam"
+STATUS_REGRESSED = "GERİLEDİ"
+STATUS_IMPROVED = "hızlandı"
+STATUS_NEW = "yeni"
+
+
+def _merge(files, output_dir):
+    return PdfMerger().merge_pdfs(files, os.path.join(output_dir, "birlesik.pdf"))
+
+
+def _merge_twice(files, output_dir):
+    return PdfMerger().merge_pdfs(files * 2, os.path.join(output_dir, "birlesik.pdf"))
+
+
+def _split_every_10(files, output_dir):
+    options = {"mode": PdfSplitter.SPLIT_MODE_EVERY_N_PAGES, "pages_per_split": 10}
+    return PdfSplitter().split_pdf(files[0], output_dir, options)
+
+
+def _split_single(files, output_dir):
+    return PdfSplitter().split_pdf(files[0], output_dir, {"mode": PdfSplitter.SPLIT_MODE_ALL_PAGES})
+
+
+def _extract_every_10th(files, output_dir):
+    return PdfExtractor().extract_pages(files[0], output_dir, {"extract_all": False, "page_range": "1-end:10"})
+
+
+def _rename(files, output_dir):
+    return PdfRenamer().rename_pdfs(files, output_dir, {"new_name": "belge", "keep_originals": True})
+
+
+# Ölçüm durumları: ad -> (derlem türü, işlem)
+CASES: Dict[str, tuple] = {
+    "merge/many_small": ("many_small", _merge),
+    "merge/text": ("text", _merge_twice),
+    "split/huge": ("huge", _split_every_10),
+    "split/text": ("text", _split_single),
+    "extract/huge": ("huge", _extract_every_10th),
+    "rename/many_small": ("many_small", _rename),
+}
+
+
+def median_mad(samples: List[float]) -> tuple:
+    """Örneklerin medyanı ve medyandan mutlak sapmaların medyanı."""
+    median = statistics.median(samples)
+    return median, statistics.median(abs(sample - median) for sample in samples)
+
+
+def _timed(run: Callable[[], None], repeat: int) -> List[float]:
+    # İlk çalıştırma ısınmadır (içe aktarma, dosya önbelleği) ve sayılmaz
+    run()
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def calibrate(repeat: int = DEFAULT_REPEAT) -> float:
+    """Makinenin hızını temsil eden sabit işin en kısa süresi (saniye).
+
+    Medyan yerine en kısa süre alınır: arka plan yükü yalnızca süreyi
+    uzatabildiğinden en kısa süre makinenin hızını daha kararlı gösterir.
+    """
+    def work():
+        document = fitz.open()
+        for index in range(200):
+            document.new_page().insert_text((72, 72), f"Kalibrasyon {index}")
+        data = document.tobytes()
+        document.close()
+        sum(len(str(index)) for index in range(100000))
+        fitz.open("pdf", data).close()
+
+    return min(_timed(work, repeat))
+
+
+def measure(names: Optional[List[str]] = None, repeat: int = DEFAULT_REPEAT,
+            corpus_dir: Optional[str] = None) -> dict:
+    """
+    Durumları ölçer.
+
+    Args:
+        names: Ölçülecek durum adları (None: tümü)
+        repeat: Isınmadan sonraki tekrar sayısı
+        corpus_dir: Derlem klasörü (varsayılan: small profilinin geçici klasörü)
+
+    Returns:
+        dict: Taban dosyası biçiminde ölçüm (calibration_s, cases, ...)
+    """
+    corpus = generate_corpus(corpus_dir or default_corpus_dir("small"), "small", CORPUS_KINDS, log=None)
+    calibration = calibrate(repeat)
+    cases = {}
+    work_dir = tempfile.mkdtemp(prefix="marnak_perf_")
+    try:
+        for name in names or CASES:
+            kind, operation = CASES[name]
+            files = corpus["entries"][kind]["files"]
+
+            def run():
+                output_dir = tempfile.mkdtemp(dir=work_dir)
+                try:
+                    success, message, _ = operation(files, output_dir)
+                    if not success:
+                        raise RuntimeError(f"{name}: {message}")
+                finally:
+                    shutil.rmtree(output_dir, ignore_errors=True)
+
+            samples = _timed(run, repeat)
+            median, mad = median_mad(samples)
+            cases[name] = {"median_s": median, "mad_s": mad, "runs_s": [round(s, 5) for s in samples]}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    # Ölçümlerden önce ve sonra kalibre edilir; anlık yavaşlamalar ölçeği bozmaz
+    calibration = min(calibration, calibrate(repeat))
+
+    return {
+        "version": BASELINE_VERSION,
+        "corpus_version": CORPUS_VERSION,
+        "repeat": repeat,
+        "calibration_s": calibration,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pymupdf": fitz.VersionBind,
+        },
+        "cases": cases,
+    }
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[dict]:
+    """Taban dosyasını okur; yoksa None."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(measurement: dict, path: str = BASELINE_PATH):
+    """Ölçümü taban dosyası olarak yazar."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(measurement, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare(measurement: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> List[dict]:
+    """
+    Ölçümü tabanla karşılaştırır.
+
+    Returns:
+        List[dict]: Durum başına {name, baseline_s, current_s, mad_s, limit_s, change, status}
+    """
+    scale = measurement["calibration_s"] / baseline["calibration_s"] if baseline.get("calibration_s") else 1.0
+    rows = []
+    for name, current in measurement["cases"].items():
+        row = {"name": name, "current_s": current["median_s"], "mad_s": current["mad_s"],
+               "baseline_s": None, "limit_s": None, "change": None, "status": STATUS_NEW}
+        old = baseline.get("cases", {}).get(name)
+        if old:
+            expected = old["median_s"] * scale
+            noise = max(NOISE_FACTOR * max(old["mad_s"] * scale, current["mad_s"]), MIN_NOISE_S)
+            limit = max(expected * (1 + tolerance), expected + noise)
+            if current["median_s"] > limit:
+                status = STATUS_REGRESSED
+            elif current["median_s"] < min(expected * (1 - tolerance), expected - noise):
+                status = STATUS_IMPROVED
+            else:
+                status = STATUS_OK
+            row.update(baseline_s=expected, limit_s=limit, status=status,
+                       change=current["median_s"] / expected - 1 if expected else 0.0)
+        rows.append(row)
+    return rows
+
+
+def check(baseline: dict, tolerance: float = DEFAULT_TOLERANCE, repeat: int = DEFAULT_REPEAT,
+          corpus_dir: Optional[str] = None) -> tuple:
+    """
+    Ölçüp tabanla karşılaştırır; gerileyen durumları doğrulamak için yeniden ölçer.
+
+    Returns:
+        tuple: (ölçüm, karşılaştırma satırları)
+    """
+    measurement = measure(repeat=repeat, corpus_dir=corpus_dir)
+    rows = compare(measurement, baseline, tolerance)
+    suspects = [row["name"] for row in rows if row["status"] == STATUS_REGRESSED]
+    if suspects:
+        retry = measure(suspects, repeat, corpus_dir)
+        measurement["calibration_s"] = min(measurement["calibration_s"], retry["calibration_s"])
+        for name in suspects:
+            samples = measurement["cases"][name]["runs_s"] + retry["cases"][name]["runs_s"]
+            median, mad = median_mad(samples)
+            measurement["cases"][name] = {"median_s": median, "mad_s": mad, "runs_s": samples}
+        rows = compare(measurement, baseline, tolerance)
+    return measurement, rows
+
+
+def format_table(rows: List[dict], scale: Optional[float] = None) -> str:
+    """Karşılaştırma satırlarını okunabilir bir tabloya dönüştürür."""
+    def ms(value):
+        return "-" if value is None else f"{value * 1000:.1f}"
+
+    lines = []
+    if scale is not None:
+        lines.append(f"Makine ölçeği (kalibrasyon oranı): {scale:.2f}")
+    lines.append(f"{'Durum':<20} {'Taban (ms)':>11} {'Şimdi (ms)':>11} {'MAD (ms)':>9} "
+                 f"{'Sınır (ms)':>11} {'Değişim':>9}  Sonuç")
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change'] * 100:+.1f}%"
+        lines.append(f"{row['name']:<20} {ms(row['baseline_s']):>11} {ms(row['current_s']):>11} "
+                     f"{ms(row['mad_s']):>9} {ms(row['limit_s']):>11} {change:>9}  {row['status']}")
+    return "\n".join(lines)
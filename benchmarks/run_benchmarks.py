@@ -0,0 +1,235 @@
+"""
+Tüm core işlemlerini sentetik derlem üzerinde ölçen ve sonuçları JSON olarak kaydeden betik.
+
+Her (derlem, işlem) ölçümü ayrı ve yeni başlatılmış bir süreçte yapılır;
+böylece en yüksek RSS yalnızca o işlemi yansıtır ve önceki ölçümlerin
+önbellekleri sonraki ölçümü etkilemez. Kaydedilen alanlar:
+
+    wall_s            Duvar saati süresi (tekrarların medyanı)
+    pages_per_s       Girdi sayfası / saniye
+    peak_rss_mb       Ölçüm sürecinin en yüksek RSS'i
+    rss_delta_mb      İşlem sırasında en yüksek RSS'e eklenen (içe aktarımlar hariç)
+    output_bytes      Üretilen dosyaların toplam boyutu
+    output_files      Üretilen dosya sayısı
+
+İşçi süreç kullanan işlemlerde (ağaç birleştirme, optimize, metin) çocuk
+süreçlerin en yükseği ``children_peak_rss_mb`` alanındadır.
+
+Kullanım:
+    python benchmarks/run_benchmarks.py --profile small
+    python benchmarks/run_benchmarks.py --operations merge split --corpora huge --repeat 3
+    python benchmarks/run_benchmarks.py --output yeni.json --compare benchmarks/baseline.json
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import PROFILES, generate_corpus, default_corpus_dir
+
+# Ölçülen işlemler (sıra raporlardaki sırayı belirler)
+OPERATIONS = ("merge", "split", "extract", "rename", "optimize", "text", "pipeline")
+
+# Sonuçların varsayılan klasörü
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def _peak_rss_mb(who=None):
+    """Sürecin (ya da çocuklarının) en yüksek RSS'i; desteklenmeyen sistemde None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who is None else who)
+    # Linux KB, macOS bayt döndürür
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return usage.ru_maxrss / divisor
+
+
+def run_operation(operation: str, files: list, output_dir: str):
+    """İşlemi core sınıflarıyla çalıştırır; başarısızsa hata fırlatır."""
+    from marnak_pdf_tools.core import (PdfMerger, PdfSplitter, PdfExtractor, PdfRenamer,
+                                       PdfOptimizer, PdfConverter, PdfPipeline)
+    results = []
+    if operation == "merge":
+        inputs = files if len(files) > 1 else files * 2
+        results.append(PdfMerger().merge_pdfs(inputs, os.path.join(output_dir, "birlesik.pdf")))
+    elif operation == "split":
+        options = {"mode": PdfSplitter.SPLIT_MODE_EVERY_N_PAGES, "pages_per_split": 10}
+        results.extend(PdfSplitter().split_pdf(path, output_dir, options) for path in files)
+    elif operation == "extract":
+        options = {"extract_all": False, "page_range": "1-end:10"}
+        results.extend(PdfExtractor().extract_pages(path, output_dir, options) for path in files)
+    elif operation == "rename":
+        results.append(PdfRenamer().rename_pdfs(files, output_dir, {"new_name": "belge", "keep_originals": False}))
+    elif operation == "optimize":
+        results.append(PdfOptimizer().optimize_pdfs(files, output_dir, {"target_dpi": 150}))
+    elif operation == "text":
+        results.append(PdfConverter().extract_text(files, os.path.join(output_dir, "metin.jsonl")))
+    elif operation == "pipeline":
+        steps = [{"op": "merge"}, {"op": "drop_blank"}, {"op": "split", "pages_per_split": 50}]
+        results.append(PdfPipeline().run(files, steps, output_dir))
+    else:
+        raise ValueError(f"Bilinmeyen işlem: {operation}")
+
+    for success, message, _ in results:
+        if not success:
+            raise RuntimeError(message)
+
+
+def _measure(operation: str, files: list, output_dir: str) -> dict:
+    """Ölçüm sürecinde çalışır: işlemi bir kez yapar, süre ve bellek döndürür."""
+    import marnak_pdf_tools.core  # İçe aktarma maliyeti ölçüme katılmaz
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    run_operation(operation, files, output_dir)
+    wall = time.perf_counter() - start
+    peak = _peak_rss_mb()
+    children = None
+    try:
+        import resource
+        children = _peak_rss_mb(resource.RUSAGE_CHILDREN)
+    except ImportError:
+        pass
+    return {
+        "wall_s": wall,
+        "peak_rss_mb": peak,
+        "rss_delta_mb": None if peak is None else peak - rss_before,
+        "children_peak_rss_mb": children or None,
+    }
+
+
+def _output_size(directory: str):
+    files = [os.path.join(root, name) for root, _, names in os.walk(directory) for name in names]
+    return sum(os.path.getsize(path) for path in files), len(files)
+
+
+def run_benchmark(entry: dict, operation: str, repeat: int, work_dir: str) -> dict:
+    """Bir (derlem, işlem) çiftini ``repeat`` kez, her seferinde yeni bir süreçte ölçer."""
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    output_bytes = output_files = 0
+    for _ in range(repeat):
+        output_dir = tempfile.mkdtemp(dir=work_dir)
+        try:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                runs.append(executor.submit(_measure, operation, entry["files"], output_dir).result())
+            output_bytes, output_files = _output_size(output_dir)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    wall = statistics.median(run["wall_s"] for run in runs)
+
+    def worst(key):
+        values = [run[key] for run in runs if run[key] is not None]
+        return round(max(values), 1) if values else None
+
+    return {
+        "pages": entry["pages"],
+        "input_files": len(entry["files"]),
+        "input_bytes": entry["bytes"],
+        "wall_s": round(wall, 4),
+        "wall_runs_s": [round(run["wall_s"], 4) for run in runs],
+        "pages_per_s": round(entry["pages"] / wall, 1) if wall > 0 else None,
+        "peak_rss_mb": worst("peak_rss_mb"),
+        "rss_delta_mb": worst("rss_delta_mb"),
+        "children_peak_rss_mb": worst("children_peak_rss_mb"),
+        "output_bytes": output_bytes,
+        "output_files": output_files,
+    }
+
+
+def environment() -> dict:
+    """Sonuçların karşılaştırılabilirliği için ortam bilgisi."""
+    import fitz
+    import PyPDF2
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pypdf2": PyPDF2.__version__,
+        "pymupdf": fitz.VersionBind,
+    }
+
+
+def print_comparison(results: dict, baseline: dict):
+    """Önceki bir sonuç dosyasına göre süre ve bellek değişimini yazdırır."""
+    print(f"\n{'Ölçüm':<24} {'Önce (sn)':>10} {'Sonra (sn)':>11} {'Değişim':>9} {'RSS farkı (MB)':>15}")
+    for key, result in results.items():
+        old = baseline.get("results", {}).get(key)
+        if not old:
+            print(f"{key:<24} {'-':>10} {result['wall_s']:>11.3f} {'yeni':>9}")
+            continue
+        change = (result["wall_s"] / old["wall_s"] - 1) * 100 if old["wall_s"] else 0.0
+        rss = ("-" if result["peak_rss_mb"] is None or old.get("peak_rss_mb") is None
+               else f"{result['peak_rss_mb'] - old['peak_rss_mb']:+.1f}")
+        print(f"{key:<24} {old['wall_s']:>10.3f} {result['wall_s']:>11.3f} {change:>+8.1f}% {rss:>15}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Core işlemleri ölçüm çalıştırıcısı")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small", help="Derlem boyutu")
+    parser.add_argument("--corpus-dir", help="Derlem klasörü (varsayılan: geçici dizin, yeniden kullanılır)")
+    parser.add_argument("--corpora", nargs="+", choices=sorted(PROFILES["small"]), help="Yalnızca bu derlemler")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, help="Yalnızca bu işlemler")
+    parser.add_argument("--repeat", type=int, default=1, help="Tekrar sayısı (süre medyanı alınır)")
+    parser.add_argument("--output", help="Sonuç JSON dosyası (varsayılan: benchmarks/results/<profil>_<zaman>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="Karşılaştırılacak önceki sonuç dosyası")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.corpus_dir or default_corpus_dir(args.profile), args.profile, args.corpora)
+    operations = args.operations or OPERATIONS
+
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix="marnak_olcum_")
+    try:
+        print(f"{'Ölçüm':<24} {'Süre (sn)':>10} {'Sayfa/sn':>10} {'RSS (MB)':>9} {'Δ RSS':>7} "
+              f"{'Çıktı (MB)':>11} {'Dosya':>7}")
+        for kind, entry in corpus["entries"].items():
+            for operation in operations:
+                key = f"{kind}/{operation}"
+                result = run_benchmark(entry, operation, max(1, args.repeat), work_dir)
+                results[key] = result
+                rss = "-" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f}"
+                delta = "-" if result["rss_delta_mb"] is None else f"{result['rss_delta_mb']:.0f}"
+                print(f"{key:<24} {result['wall_s']:>10.3f} {result['pages_per_s'] or 0:>10.0f} {rss:>9} "
+                      f"{delta:>7} {result['output_bytes'] / (1024 * 1024):>11.2f} {result['output_files']:>7}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "profile": args.profile,
+        "corpus_version": corpus["version"],
+        "repeat": max(1, args.repeat),
+        "environment": environment(),
+        "results": results,
+    }
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{args.profile}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\nSonuçlar kaydedildi: {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print_comparison(results, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
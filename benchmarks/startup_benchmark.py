@@ -0,0 +1,151 @@
+"""
+Arayüz açılışının ilk kareye kadar geçen süresini ölçen betik.
+
+Her ölçüm yeni bir Python sürecinde yapılır (içe aktarım önbelleği ısınmaz).
+Alt süreç ``app.main``'in açılış adımlarını izler: QApplication, yazı tipi
+ölçeği, ``PdfService``, ``MainWindow``, ``show``; ana pencerenin ilk boyama
+olayı işlenince ölçümü yazar ve çıkar. Raporlanan değerler:
+
+    süreç        Alt sürecin başlatılmasından ilk kareye kadar (yorumlayıcı açılışı dahil)
+    ilk kare     Alt süreçte ilk satırdan ilk kareye kadar (içe aktarımlar + kurulum + boyama)
+    içe aktarım  Uygulama modüllerinin içe aktarılması
+    pencere      ``MainWindow`` kurulumu
+    gezinme      İlk kareden sonra "Böl" sayfasının ilk kez gösterilmesi (pencere kurulumu)
+
+``--eager`` ile tüm araç pencereleri ilk kareden önce kurulur (eski açılışın
+karşılığı). İlk karede yüklü olan ağır modüller (fitz, PyPDF2) de raporlanır.
+
+Kullanım:
+    QT_QPA_PLATFORM=offscreen python benchmarks/startup_benchmark.py --repeat 5
+"""
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İlk karede yüklenmemesi gereken ağır modüller
+HEAVY_MODULES = ("fitz", "pymupdf", "PyPDF2")
+
+# Açılış kapısı (pytest --perf): ilk kare bu mutlak sınırın ve tüm pencereleri kuran
+# açılışın ``EAGER_RATIO`` katının altında kalmalı (oran makine hızından bağımsızdır)
+STARTUP_BUDGET_S = 1.0
+EAGER_RATIO = 0.75
+
+
+def run_child(eager: bool):
+    """
+    Alt süreçte çalışır: uygulamayı açar, ilk karede ölçümü stdout'a JSON satırı olarak yazar.
+
+    Gezinme ölçümü ikinci satırda yazılır; üst süreç ilk satırı okuduğu anı ilk kare sayar.
+    """
+    sys.path.insert(0, ROOT)
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    from PyQt6.QtGui import QFont
+    from PyQt6.QtWidgets import QApplication
+    from marnak_pdf_tools.services.pdf_service import PdfService
+    from marnak_pdf_tools.ui.windows.main_window import MainWindow
+    from marnak_pdf_tools.utils.settings import get_scale_factor
+    imported = time.perf_counter()
+
+    app = QApplication(sys.argv[:1])
+    app.setFont(QFont("Segoe UI", int(14 * get_scale_factor())))
+    window_start = time.perf_counter()
+    main_window = MainWindow(PdfService())
+    if eager:
+        for index in range(len(MainWindow.TOOL_WINDOWS)):
+            main_window.tool_window(index)
+        main_window.show_rename_window()
+    constructed = time.perf_counter()
+    painted = []
+
+    def first_frame():
+        now = time.perf_counter()
+        print(json.dumps(dict(
+            first_frame_s=now - _START,
+            import_s=imported - _START,
+            window_s=constructed - window_start,
+            heavy_modules=[name for name in HEAVY_MODULES if name in sys.modules],
+            built_windows=[attribute for attribute, _, _ in MainWindow.TOOL_WINDOWS
+                           if getattr(main_window, attribute) is not None],
+        )), flush=True)
+        start = time.perf_counter()
+        main_window.show_split_window()
+        app.processEvents()
+        print(json.dumps(dict(
+            navigation_s=time.perf_counter() - start,
+            built_after_navigation=[attribute for attribute, _, _ in MainWindow.TOOL_WINDOWS
+                                    if getattr(main_window, attribute) is not None],
+        )), flush=True)
+        app.quit()
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint and not painted:
+                painted.append(True)
+                # Boyama bitince ölçülür
+                QTimer.singleShot(0, first_frame)
+            return False
+
+    paint_filter = FirstPaint()
+    main_window.installEventFilter(paint_filter)
+    main_window.show()
+    app.exec()
+
+
+def measure_startup(eager: bool = False) -> dict:
+    """Yeni bir süreçte açılışı ölçer; süreç başlatmadan ilk kareye kadarki süreyi (``process_s``) ekler."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    command = [sys.executable, os.path.abspath(__file__), "--child"] + (["--eager"] if eager else [])
+    result = {}
+    start = time.perf_counter()
+    with subprocess.Popen(command, env=env, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True) as process:
+        for line in process.stdout:
+            if not line.startswith("{"):
+                continue
+            if not result:
+                result["process_s"] = time.perf_counter() - start
+            result.update(json.loads(line))
+        stderr = process.stderr.read()
+    if process.returncode != 0 or "navigation_s" not in result:
+        raise RuntimeError(f"Açılış ölçümü başarısız (çıkış {process.returncode}):\n{stderr[-2000:]}")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Arayüz açılış süresi ölçümü")
+    parser.add_argument("--repeat", type=int, default=5, help="Kip başına tekrar (medyan alınır)")
+    parser.add_argument("--eager", action="store_true", help="Tüm araç pencerelerini ilk kareden önce kur")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.eager)
+        return 0
+
+    modes = [("tembel", False), ("hepsi kurulu", True)] if not args.eager else [("hepsi kurulu", True)]
+    print(f"{'Kip':<13} {'Süreç (sn)':>11} {'İlk kare (sn)':>14} {'İçe aktarım (sn)':>17} "
+          f"{'Pencere (sn)':>13} {'Gezinme (sn)':>13}  Yüklü ağır modüller")
+    for name, eager in modes:
+        runs = [measure_startup(eager) for _ in range(max(1, args.repeat))]
+
+        def median(key):
+            return statistics.median(run[key] for run in runs)
+
+        heavy = ", ".join(runs[-1]["heavy_modules"]) or "-"
+        print(f"{name:<13} {median('process_s'):>11.3f} {median('first_frame_s'):>14.3f} "
+              f"{median('import_s'):>17.3f} {median('window_s'):>13.3f} {median('navigation_s'):>13.3f}  {heavy}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
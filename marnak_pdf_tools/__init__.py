@@ -9,12 +9,16 @@ __version__ = "1.0.0"
 __author__ = "Marnak Team"
 __email__ = "info@marnak.com"
 
-# Ana bileşenleri export et
-from .core import PdfRenamer, PdfSplitter, PdfMerger, PdfExtractor, PdfConverter
-from .services import PdfService
-from .ui import MainWindow
+# Ana bileşenleri export et (ilk erişimde içe aktarılır; paket içe aktarımı fitz/PyPDF2/Qt yüklemez)
+from ._lazy import lazy_exports
+
+__getattr__ = lazy_exports(__name__, {
+    'PdfRenamer': '.core', 'PdfSplitter': '.core', 'PdfMerger': '.core',
+    'PdfExtractor': '.core', 'PdfConverter': '.core', 'PdfOptimizer': '.core',
+    'PdfService': '.services', 'MainWindow': '.ui',
+})
 
 __all__ = [
-    'PdfRenamer', 'PdfSplitter', 'PdfMerger', 'PdfExtractor', 'PdfConverter',
+    'PdfRenamer', 'PdfSplitter', 'PdfMerger', 'PdfExtractor', 'PdfConverter', 'PdfOptimizer',
     'PdfService', 'MainWindow'
 ] 
\ No newline at end of file
@@ -1,11 +1,78 @@
 """
 Ana modül - GUI uygulamasını veya CLI komutlarını başlatır.
 """
+import multiprocessing
 import sys
+import json
 import argparse
+import contextlib
 import os
+import re
 from pathlib import Path
 
+# "-3-", "-1", "-2,5" gibi '-' ile başlayan sayfa aralıkları; argparse bunları seçenek sanmasın diye
+_DASH_RANGE = re.compile(r"^-(\d|end\b)")
+_RANGE_OPTIONS = ('-r', '--range')
+
+def join_range_values(argv):
+    """
+    '-' ile başlayan sayfa aralığı değerlerini seçeneğe bağlar.
+
+    argparse "-r -3-" içindeki "-3-" değerini yeni bir seçenek sanar;
+    "-r=-3-" biçimine çevrilince değer olarak okunur.
+    """
+    joined = []
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg in _RANGE_OPTIONS and index + 1 < len(argv) and _DASH_RANGE.match(argv[index + 1]):
+            joined.append(f"{arg}={argv[index + 1]}")
+            index += 2
+            continue
+        joined.append(arg)
+        index += 1
+    return joined
+
+def add_cache_arguments(parser):
+    """Sonuç önbelleği argümanlarını ekler."""
+    parser.add_argument('--cache', metavar='KLASÖR',
+                        help='Sonuç önbelleği klasörü; girdiler değişmediyse işlem yeniden yapılmaz')
+    parser.add_argument('--cache-size', type=int, default=1024, metavar='MB',
+                        help='Önbelleğin en fazla kaplayacağı alan (varsayılan: 1024 MB)')
+
+def add_engine_argument(parser):
+    """PDF motoru seçimi argümanını ekler."""
+    parser.add_argument('--engine', choices=['auto', 'pypdf2', 'pymupdf'], default='auto',
+                        help='PDF motoru (auto: işlem için ölçümlerde en hızlı olan)')
+
+def add_metrics_arguments(parser):
+    """İş ölçümü çıktısı argümanlarını ekler."""
+    parser.add_argument('--json', action='store_true',
+                        help='Sonucu ve iş ölçümlerini (aşama süreleri, sayfa/sn, bayt, en yüksek bellek) '
+                             'JSON olarak stdout\'a yaz; durum mesajları stderr\'e gider')
+    parser.add_argument('--metrics-log', metavar='DOSYA',
+                        help='İş ölçümünü JSONL ölçüm günlüğünün sonuna ekle')
+
+def add_profile_arguments(parser):
+    """Tanılama profili argümanlarını ekler."""
+    parser.add_argument('--profile', action='store_true',
+                        help='İşi cProfile ile profille; profil ve girdi/seçenek bilgisi günlük klasörüne yazılır '
+                             '(özet: profile-summary)')
+    parser.add_argument('--profile-dir', metavar='KLASÖR',
+                        help='Profil klasörü (varsayılan: günlük klasöründeki profiles/)')
+
+def create_cache(args):
+    """Argümanlara göre önbellek oluşturur (istenmediyse None)."""
+    if not args.cache:
+        return None
+    from .core.cache import ResultCache
+    return ResultCache(args.cache, max_bytes=args.cache_size * 1024 * 1024)
+
+def print_cache_status(cache):
+    """Önbellek isabet/ıska sayılarını yazdırır."""
+    if cache is not None:
+        print(f"Önbellek: {cache.hits} isabet, {cache.misses} ıska")
+
 def setup_cli_parser():
     """CLI argüman parser'ını oluşturur."""
     parser = argparse.ArgumentParser(
@@ -17,8 +84,29 @@ def setup_cli_parser():
     
     # Merge komutu
     merge_parser = subparsers.add_parser('merge', help='PDF dosyalarını birleştir')
-    merge_parser.add_argument('files', nargs='+', help='Birleştirilecek PDF dosyaları')
+    merge_parser.add_argument('files', nargs='+',
+                              help='Birleştirilecek PDF dosyaları (sayfa seçimi için dosya.pdf:3-9)')
     merge_parser.add_argument('-o', '--output', required=True, help='Çıktı dosyası yolu')
+    merge_parser.add_argument('--interleave', action='store_true',
+                              help='Girdilerden sırayla birer sayfa al (çift taraflı tarama: ön + arka yüzler)')
+    merge_parser.add_argument('--reverse', type=int, action='append', metavar='N',
+                              help='N. girdinin (1 tabanlı) sayfa sırasını ters çevir; tekrarlanabilir')
+    merge_parser.add_argument('--dedup', action='store_true',
+                              help='Ortak yazı tipi, görüntü ve XObject akışlarını tek kopyaya indir')
+    merge_parser.add_argument('--strategy', choices=['auto', 'flat', 'tree'], default='auto',
+                              help='Birleştirme stratejisi (tree: K\'lık gruplar halinde ara dosyalarla, '
+                                   'auto: girdi sayısına göre)')
+    merge_parser.add_argument('-k', '--batch-size', type=int,
+                              help='Ağaç birleştirmede grup boyutu (varsayılan: dosya tanıtıcısı ve '
+                                   'bellek sınırından otomatik)')
+    merge_parser.add_argument('-j', '--jobs', type=int,
+                              help='Ara dosyaları birleştiren paralel işçi sayısı (varsayılan: CPU sayısı)')
+    merge_parser.add_argument('--append', action='store_true',
+                              help='Çıktı dosyası varsa girdileri sonuna artımlı güncelleme ile ekle')
+    merge_parser.add_argument('--compact', action='store_true',
+                              help='Eklemeden sonra dosyayı baştan yazarak birikmiş güncellemeleri sıkıştır')
+    add_engine_argument(merge_parser)
+    add_cache_arguments(merge_parser)
     
     # Split komutu
     split_parser = subparsers.add_parser('split', help='PDF dosyasını böl')
@@ -26,16 +114,22 @@ def setup_cli_parser():
     split_parser.add_argument('-o', '--output', required=True, help='Çıktı klasörü')
     split_parser.add_argument('-m', '--mode', choices=['all', 'range', 'every'], 
                              default='all', help='Bölme modu (all: tüm sayfalar, range: aralık, every: her N sayfa)')
-    split_parser.add_argument('-r', '--range', help='Sayfa aralığı (örn: 1,3-5,7)')
+    split_parser.add_argument('-r', '--range', help='Sayfa aralığı (örn: 1,3-5,7, 10-end:2, -3-, 9-3; '
+                                                    '"-r -3-" ve "--range=-3-" ikisi de geçerli)')
     split_parser.add_argument('-n', '--number', type=int, help='Her N sayfada bir böl (every modu için)')
+    add_engine_argument(split_parser)
+    add_cache_arguments(split_parser)
     
     # Extract komutu
     extract_parser = subparsers.add_parser('extract', help='PDF sayfalarını çıkar')
     extract_parser.add_argument('file', help='PDF dosyası')
     extract_parser.add_argument('-o', '--output', required=True, help='Çıktı klasörü')
     extract_parser.add_argument('-a', '--all', action='store_true', help='Tüm sayfaları çıkar')
-    extract_parser.add_argument('-r', '--range', help='Sayfa aralığı (örn: 1,3-5,7)')
+    extract_parser.add_argument('-r', '--range', help='Sayfa aralığı (örn: 1,3-5,7, 10-end:2, -3-, 9-3; '
+                                                      '"-r -3-" ve "--range=-3-" ikisi de geçerli)')
     extract_parser.add_argument('-p', '--prefix', default='', help='Dosya adı öneki')
+    add_engine_argument(extract_parser)
+    add_cache_arguments(extract_parser)
     
     # Rename komutu
     rename_parser = subparsers.add_parser('rename', help='PDF dosyalarını yeniden adlandır')
@@ -44,19 +138,115 @@ def setup_cli_parser():
     rename_parser.add_argument('-n', '--name', help='Yeni dosya adı (opsiyonel)')
     rename_parser.add_argument('--keep-originals', action='store_true', help='Orijinal dosyaları koru')
     
+    # Text komutu
+    text_parser = subparsers.add_parser('text', help='PDF metnini sayfa başına JSONL olarak çıkar')
+    text_parser.add_argument('files', nargs='+', help='Metni çıkarılacak PDF dosyaları')
+    text_parser.add_argument('-o', '--output', default='-', help='JSONL çıktı dosyası (varsayılan: stdout)')
+    text_parser.add_argument('-w', '--words', action='store_true', help='Kelime kutularını da ekle')
+    text_parser.add_argument('-j', '--jobs', type=int, help='İşçi süreç sayısı (varsayılan: CPU sayısı)')
+    
+    # Optimize komutu
+    optimize_parser = subparsers.add_parser('optimize', help='Taranmış PDF dosyalarını küçült')
+    optimize_parser.add_argument('files', nargs='+', help='Optimize edilecek PDF dosyaları')
+    optimize_parser.add_argument('-o', '--output', required=True, help='Çıktı klasörü')
+    optimize_parser.add_argument('--dpi', type=int, default=150, help='Hedef çözünürlük (varsayılan: 150)')
+    optimize_parser.add_argument('-q', '--quality', type=int, default=75, help='JPEG kalitesi 1-100 (varsayılan: 75)')
+    optimize_parser.add_argument('-g', '--grayscale', action='store_true', help='Görüntüleri gri tonlamaya çevir')
+    optimize_parser.add_argument('-j', '--jobs', type=int, help='İşçi süreç sayısı (varsayılan: CPU sayısı)')
+    
+    # Pipeline komutu
+    pipeline_parser = subparsers.add_parser('pipeline',
+                                            help='JSON tanımındaki adımları ara dosya yazmadan art arda uygula')
+    pipeline_parser.add_argument('manifest', help='İş akışı tanımı (JSON: inputs, steps, output_dir)')
+    pipeline_parser.add_argument('files', nargs='*',
+                                 help='Tanımdaki girdilerin yerine kullanılacak PDF dosyaları (dosya.pdf:3-9)')
+    pipeline_parser.add_argument('-o', '--output', help='Çıktı klasörü (tanımdaki output_dir yerine)')
+    
+    for command_parser in subparsers.choices.values():
+        add_metrics_arguments(command_parser)
+        add_profile_arguments(command_parser)
+    
+    # Profil özeti komutu
+    summary_parser = subparsers.add_parser('profile-summary',
+                                           help='Kaydedilmiş iş profilinin en çok zaman alan fonksiyonlarını yazdır')
+    summary_parser.add_argument('file', nargs='?', help='Profil dosyası (.prof; varsayılan: en yeni profil)')
+    summary_parser.add_argument('--profile-dir', metavar='KLASÖR',
+                                help='En yeni profilin aranacağı klasör (varsayılan: günlük klasöründeki profiles/)')
+    summary_parser.add_argument('-n', '--top', type=int, default=20, help='Listelenecek fonksiyon sayısı (varsayılan: 20)')
+    summary_parser.add_argument('--sort', choices=['cumulative', 'tottime', 'ncalls'], default='cumulative',
+                                help='Sıralama: cumulative (alt çağrılar dahil), tottime (yalnız kendi), ncalls')
+    
     return parser
 
+def print_profile_summary(args):
+    """Kaydedilmiş profilin özetini yazdırır."""
+    from .core.profiling import latest_profile, summarize_profile
+    from .utils.settings import get_profile_dir
+    
+    path = args.file or latest_profile(args.profile_dir or get_profile_dir())
+    if not path or not os.path.exists(path):
+        print(f"Hata: Profil bulunamadı: {path or (args.profile_dir or get_profile_dir())}")
+        return 1
+    print(summarize_profile(path, top=args.top, sort=args.sort))
+    return 0
+
 def run_cli_command(args):
-    """CLI komutunu çalıştırır."""
+    """CLI komutunu ölçüm kaydı altında çalıştırır; istenirse kaydı JSON olarak yazar ve günlüğe ekler."""
+    from .core.metrics import collect_metrics, append_metrics_log
+    
+    if args.command == 'profile-summary':
+        return print_profile_summary(args)
+    
+    if args.json and args.command == 'text' and args.output == '-':
+        print("Hata: --json, metin stdout'a yazılırken kullanılamaz (-o ile dosya verin)", file=sys.stderr)
+        return 1
+    
+    json_output = sys.stdout
+    with collect_metrics(args.command) as metrics:
+        with contextlib.redirect_stdout(sys.stderr) if args.json else contextlib.nullcontext():
+            if args.profile or args.profile_dir:
+                from .core.profiling import profile_job
+                from .utils.settings import get_profile_dir
+                
+                options = {key: value for key, value in vars(args).items()
+                           if key not in ('command', 'json', 'metrics_log', 'profile', 'profile_dir')}
+                with profile_job(metrics, options, args.profile_dir or get_profile_dir()) as profile:
+                    exit_code = execute_command(args, metrics)
+                print(f"Profil kaydedildi: {profile['profile']}")
+            else:
+                exit_code = execute_command(args, metrics)
+    if metrics.success is None:
+        # İşlem başlamadan (girdi doğrulamasında) biten komut
+        metrics.success = exit_code == 0
+    
+    record = metrics.to_dict()
+    if args.metrics_log:
+        try:
+            append_metrics_log(record, args.metrics_log)
+        except OSError as e:
+            print(f"Uyarı: Ölçüm günlüğüne yazılamadı: {str(e)}", file=sys.stderr)
+    if args.json:
+        json.dump(dict(record, output_files=metrics.output_files), json_output, ensure_ascii=False, indent=2)
+        json_output.write("\n")
+    return exit_code
+
+def execute_command(args, metrics):
+    """CLI komutunu çalıştırır; girdileri ve sonucu ``metrics`` kaydına yazar."""
     try:
         from .services.pdf_service import PdfService
-        from .core import PdfSplitter, PdfMerger, PdfExtractor, PdfRenamer
+        from .core import PdfSplitter, PdfMerger, PdfExtractor, PdfRenamer, PdfConverter, PdfOptimizer
+        from .core.utils import parse_merge_input
+        from .core.pipeline import PdfPipeline, load_manifest
+        from .core.results import OperationError
         
         pdf_service = PdfService()
         
         if args.command == 'merge':
+            # "dosya.pdf:3-9" girdilerini (yol, sayfa ifadesi) çiftlerine ayır
+            merge_inputs = [parse_merge_input(spec) for spec in args.files]
+            
             # Dosya varlığını kontrol et
-            for file_path in args.files:
+            for file_path, _ in merge_inputs:
                 if not os.path.exists(file_path):
                     print(f"Hata: Dosya bulunamadı: {file_path}")
                     return 1
@@ -65,8 +255,29 @@ def run_cli_command(args):
             print(f"Giriş dosyaları: {', '.join(args.files)}")
             print(f"Çıktı dosyası: {args.output}")
             
-            merger = PdfMerger()
-            success, message, _ = merger.merge_pdfs(args.files, args.output)
+            for index in args.reverse or []:
+                if not 1 <= index <= len(merge_inputs):
+                    print(f"Hata: --reverse {index} geçersiz (1-{len(merge_inputs)} arası olmalı)")
+                    return 1
+            
+            options = {
+                'mode': PdfMerger.MERGE_MODE_INTERLEAVE if args.interleave else PdfMerger.MERGE_MODE_SEQUENTIAL,
+                'reverse_inputs': [index - 1 for index in args.reverse or []],
+                'deduplicate': args.dedup,
+                'strategy': args.strategy,
+                'batch_size': args.batch_size,
+                'workers': args.jobs,
+                'append': args.append,
+                'compact': args.compact,
+                'engine': args.engine
+            }
+            
+            metrics.add_inputs(merge_inputs)
+            cache = create_cache(args)
+            merger = PdfMerger(cache=cache)
+            success, message, output_files = merger.merge_pdfs(merge_inputs, args.output, options=options)
+            metrics.finish(success, message, output_files)
+            print_cache_status(cache)
             
             if success:
                 print(f"✅ Başarılı: {message}")
@@ -87,14 +298,23 @@ def run_cli_command(args):
             # Çıktı klasörünü oluştur
             os.makedirs(args.output, exist_ok=True)
             
-            options = {'mode': args.mode}
+            split_modes = {
+                'all': PdfSplitter.SPLIT_MODE_ALL_PAGES,
+                'range': PdfSplitter.SPLIT_MODE_PAGE_RANGE,
+                'every': PdfSplitter.SPLIT_MODE_EVERY_N_PAGES
+            }
+            options = {'mode': split_modes[args.mode], 'engine': args.engine}
             if args.mode == 'range' and args.range:
                 options['page_range'] = args.range
             elif args.mode == 'every' and args.number:
                 options['pages_per_split'] = args.number
             
-            splitter = PdfSplitter()
+            metrics.add_inputs([args.file])
+            cache = create_cache(args)
+            splitter = PdfSplitter(cache=cache)
             success, message, output_files = splitter.split_pdf(args.file, args.output, options)
+            metrics.finish(success, message, output_files)
+            print_cache_status(cache)
             
             if success:
                 print(f"✅ Başarılı: {message}")
@@ -121,11 +341,16 @@ def run_cli_command(args):
             options = {
                 'extract_all': args.all,
                 'page_range': args.range or '',
-                'file_prefix': args.prefix
+                'file_prefix': args.prefix,
+                'engine': args.engine
             }
             
-            extractor = PdfExtractor()
+            metrics.add_inputs([args.file])
+            cache = create_cache(args)
+            extractor = PdfExtractor(cache=cache)
             success, message, output_files = extractor.extract_pages(args.file, args.output, options)
+            metrics.finish(success, message, output_files)
+            print_cache_status(cache)
             
             if success:
                 print(f"✅ Başarılı: {message}")
@@ -156,8 +381,10 @@ def run_cli_command(args):
                 'keep_originals': args.keep_originals
             }
             
+            metrics.add_inputs(args.files)
             renamer = PdfRenamer()
             success, message, output_files = renamer.rename_pdfs(args.files, args.output, options)
+            metrics.finish(success, message, output_files)
             
             if success:
                 print(f"✅ Başarılı: {message}")
@@ -169,20 +396,124 @@ def run_cli_command(args):
                 print(f"❌ Hata: {message}")
                 return 1
                 
+        elif args.command == 'text':
+            # JSONL stdout'a yazılıyorsa durum mesajları stderr'e gider
+            status = sys.stderr if args.output == '-' else sys.stdout
+            
+            for file_path in args.files:
+                if not os.path.exists(file_path):
+                    print(f"Hata: Dosya bulunamadı: {file_path}", file=status)
+                    return 1
+            
+            print(f"PDF metni çıkarılıyor...", file=status)
+            print(f"Giriş dosyaları: {', '.join(args.files)}", file=status)
+            
+            options = {
+                'include_words': args.words,
+                'workers': args.jobs
+            }
+            
+            metrics.add_inputs(args.files)
+            converter = PdfConverter()
+            success, message, output_files = converter.extract_text(args.files, args.output, options)
+            metrics.finish(success, message, output_files)
+            
+            if success:
+                print(f"✅ Başarılı: {message}", file=status)
+                return 0
+            else:
+                print(f"❌ Hata: {message}", file=status)
+                return 1
+                
+        elif args.command == 'optimize':
+            for file_path in args.files:
+                if not os.path.exists(file_path):
+                    print(f"Hata: Dosya bulunamadı: {file_path}")
+                    return 1
+            
+            print(f"PDF dosyaları optimize ediliyor...")
+            print(f"Giriş dosyaları: {', '.join(args.files)}")
+            print(f"Çıktı klasörü: {args.output}")
+            
+            options = {
+                'target_dpi': args.dpi,
+                'jpeg_quality': args.quality,
+                'grayscale': args.grayscale,
+                'workers': args.jobs
+            }
+            
+            metrics.add_inputs(args.files)
+            optimizer = PdfOptimizer()
+            success, message, output_files = optimizer.optimize_pdfs(args.files, args.output, options)
+            metrics.finish(success, message, output_files)
+            
+            for report in optimizer.last_reports:
+                name = os.path.basename(report['file'])
+                if report['skipped']:
+                    print(f"  - {name}: zaten optimize, atlandı")
+                else:
+                    print(f"  - {name}: {report['original_size'] / 1024:.0f} KB -> "
+                          f"{report['optimized_size'] / 1024:.0f} KB "
+                          f"(%{report['reduction_percent']:.1f} küçülme, "
+                          f"{report['throughput_mb_s']:.2f} MB/sn)")
+            
+            if success:
+                print(f"✅ Başarılı: {message}")
+                return 0
+            else:
+                print(f"❌ Hata: {message}")
+                return 1
+                
+        elif args.command == 'pipeline':
+            try:
+                manifest = load_manifest(args.manifest)
+            except OperationError as e:
+                print(f"❌ Hata: {str(e)}")
+                return 1
+            inputs = [parse_merge_input(spec) for spec in args.files] or manifest['inputs']
+            output_dir = args.output or manifest['output_dir']
+            if not output_dir:
+                print("Hata: Çıktı klasörü belirtilmemiş (-o veya tanımda output_dir)")
+                return 1
+            
+            for file_path, _ in inputs:
+                if not os.path.exists(file_path):
+                    print(f"Hata: Dosya bulunamadı: {file_path}")
+                    return 1
+            
+            print(f"İş akışı çalıştırılıyor...")
+            print(f"Adımlar: {' -> '.join(str(step.get('op')) for step in manifest['steps'])}")
+            print(f"Çıktı klasörü: {output_dir}")
+            
+            metrics.add_inputs(inputs)
+            pipeline = PdfPipeline()
+            success, message, output_files = pipeline.run(inputs, manifest['steps'], output_dir)
+            metrics.finish(success, message, output_files)
+            
+            if success:
+                print(f"✅ Başarılı: {message}")
+                for file in output_files:
+                    print(f"  - {file}")
+                return 0
+            else:
+                print(f"❌ Hata: {message}")
+                return 1
+                
     except Exception as e:
         print(f"❌ Beklenmeyen hata: {str(e)}")
         return 1
 
-def main():
+def main(argv=None):
     """Ana fonksiyon - CLI veya GUI'yi başlatır."""
+    argv = sys.argv[1:] if argv is None else list(argv)
     # Eğer argüman yoksa GUI'yi başlat
-    if len(sys.argv) == 1:
+    if not argv:
         from .app import main as gui_main
         return gui_main()
     
     # CLI argümanlarını işle
     parser = setup_cli_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(join_range_values(argv))
     
     if not args.command:
         parser.print_help()
@@ -191,4 +522,7 @@ def main():
     return run_cli_command(args)
 
 if __name__ == "__main__":
+    # Donmuş (PyInstaller) yapıda süreç havuzu işçileri bu exe ile başlatılır;
+    # freeze_support işçide görevi çalıştırıp çıkar, arayüzün yeniden açılmasını önler
+    multiprocessing.freeze_support()
     sys.exit(main()) 
\ No newline at end of file
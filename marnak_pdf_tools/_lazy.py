@@ -0,0 +1,38 @@
+"""
+Paket düzeyindeki adları ilk kullanımda içe aktaran yardımcı.
+
+Paket ``__init__`` dosyaları alt modülleri doğrudan içe aktarınca, paketin
+herhangi bir modülüne erişmek (ör. ``core.metrics``) tüm alt modülleri ve
+fitz/PyPDF2 gibi ağır bağımlılıkları yükler. ``lazy_exports`` ile üretilen
+modül ``__getattr__``'ı (PEP 562) adı yalnızca ilk erişimde kendi
+modülünden alır ve paket sözlüğüne yazar; sonraki erişimler doğrudandır.
+
+Örnek:
+    __getattr__ = lazy_exports(__name__, {"PdfMerger": ".merger"})
+"""
+import importlib
+import sys
+from typing import Callable, Dict, Tuple, Union
+
+
+def lazy_exports(package: str, exports: Dict[str, Union[str, Tuple[str, str]]]) -> Callable[[str], object]:
+    """
+    Paket için tembel içe aktaran ``__getattr__`` üretir.
+
+    Args:
+        package: Paketin ``__name__``'i
+        exports: Ad -> göreli modül; modüldeki ad farklıysa ad -> (modül, modüldeki ad)
+
+    Returns:
+        Callable: Paket modülüne ``__getattr__`` olarak atanacak fonksiyon
+    """
+    def __getattr__(name: str):
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, attribute = (target, name) if isinstance(target, str) else target
+        value = getattr(importlib.import_module(module_name, package), attribute)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -1,6 +1,7 @@
 """
 Ana uygulama modülü.
 """
+import multiprocessing
 import sys
 import os
 import logging
@@ -17,39 +18,19 @@ if parent_dir not in sys.path:
 
 from marnak_pdf_tools.ui.windows.main_window import MainWindow
 from marnak_pdf_tools.services.pdf_service import PdfService
-from marnak_pdf_tools.utils.settings import load_settings, get_scale_factor
+from marnak_pdf_tools.utils.settings import load_settings, get_scale_factor, get_log_dir, get_log_level, get_event_loop_report_path
+from marnak_pdf_tools.utils.logging_config import setup_logging, shutdown_logging
+from marnak_pdf_tools.utils.stall_watchdog import StallWatchdog
 
 def get_log_path():
     """Kullanıcının yazma izni olan log dosyası yolunu döndürür."""
-    try:
-        # Kullanıcının Documents klasörünü tercih et
-        documents_path = Path.home() / "Documents" / "MarnakPDFAraclari"
-        documents_path.mkdir(exist_ok=True)
-        return documents_path / "app.log"
-    except:
-        try:
-            # Alternatif: Temp klasörü
-            import tempfile
-            temp_dir = Path(tempfile.gettempdir()) / "MarnakPDFAraclari"
-            temp_dir.mkdir(exist_ok=True)
-            return temp_dir / "app.log"
-        except:
-            # Son çare: Uygulama dizini
-            return Path("app.log")
+    return get_log_dir() / "app.log"
 
 def main():
     """Ana uygulama başlatıcı."""
-    # Loglama yapılandırması
+    # Loglama yapılandırması: kayıtlar kuyruktan arka plan iş parçacığında döndürülen dosyaya yazılır
     log_path = get_log_path()
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    setup_logging(log_path, level=get_log_level())
     logger = logging.getLogger("App")
     logger.info("Uygulama başlatılıyor...")
     logger.info(f"Log dosyası: {log_path}")
@@ -85,6 +66,10 @@ def main():
     main_window.show()
     
     logger.info("Ana pencere gösterildi")
+
+    # Olay döngüsü bekçisi: arayüz takılmalarında ana iş parçacığının yığınını günlüğe yazar
+    watchdog = StallWatchdog(logger=logging.getLogger("StallWatchdog"))
+    watchdog.start()
     
     # Uygulama döngüsünü başlat
     try:
@@ -94,6 +79,18 @@ def main():
     except Exception as e:
         logger.error(f"Uygulama hatası: {e}")
         return 1
+    finally:
+        watchdog.stop()
+        try:
+            report_path = get_event_loop_report_path()
+            watchdog.export(report_path)
+            logger.info(f"Olay döngüsü raporu: {report_path}")
+        except OSError as e:
+            logger.warning(f"Olay döngüsü raporu yazılamadı: {e}")
+        shutdown_logging()
 
 if __name__ == "__main__":
+    # Donmuş (PyInstaller) yapıda süreç havuzu işçileri bu exe ile başlatılır;
+    # freeze_support işçide görevi çalıştırıp çıkar, arayüzün yeniden açılmasını önler
+    multiprocessing.freeze_support()
     sys.exit(main()) 
\ No newline at end of file
@@ -1,11 +1,24 @@
 """
 Core modülü - PDF işlem sınıfları.
 """
-from .renamer import PdfRenamer
-from .splitter import PdfSplitter
-from .merger import PdfMerger
-from .extractor import PdfExtractor
-from .converter import PdfConverter
-from .utils import parse_page_ranges
+from .._lazy import lazy_exports
 
-__all__ = ['PdfRenamer', 'PdfSplitter', 'PdfMerger', 'PdfExtractor', 'PdfConverter', 'parse_page_ranges'] 
\ No newline at end of file
+# Sınıflar ilk erişimde içe aktarılır: ``core.metrics`` gibi hafif modüller fitz/PyPDF2 yüklemez
+__getattr__ = lazy_exports(__name__, {
+    'PdfRenamer': '.renamer', 'PdfSplitter': '.splitter', 'PdfMerger': '.merger',
+    'PdfExtractor': '.extractor', 'PdfConverter': '.converter', 'PdfOptimizer': '.optimizer',
+    'PdfPipeline': '.pipeline', 'ResultCache': '.cache', 'DocumentPool': '.document_pool',
+    'PdfEngine': '.engines', 'get_engine': '.engines',
+    'JobMetrics': '.metrics', 'collect_metrics': '.metrics',
+    'ProgressThrottle': '.progress', 'ProgressUpdate': '.progress',
+    'OperationResult': '.results', 'OperationError': '.results', 'OperationCancelled': '.results',
+    'PageSet': '.page_set',
+    'parse_page_ranges': '.utils', 'parse_page_selection': '.utils', 'parse_page_set': '.utils',
+    'parse_merge_input': '.utils', 'PageRangeError': '.utils',
+})
+
+__all__ = ['PdfRenamer', 'PdfSplitter', 'PdfMerger', 'PdfExtractor', 'PdfConverter', 'PdfOptimizer',
+           'PdfPipeline', 'ResultCache', 'DocumentPool', 'PdfEngine', 'get_engine', 'JobMetrics', 'collect_metrics',
+           'ProgressThrottle', 'ProgressUpdate', 'OperationResult', 'OperationError', 'OperationCancelled',
+           'PageSet', 'PageRangeError', 'parse_page_ranges', 'parse_page_selection', 'parse_page_set',
+           'parse_merge_input']
\ No newline at end of file
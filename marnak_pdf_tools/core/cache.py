@@ -0,0 +1,268 @@
+"""
+Birleştirme, bölme ve sayfa çıkarma sonuçlarını içerik adresli olarak saklayan önbellek modülü.
+"""
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from typing import List, Tuple, Optional, Dict, Any, Callable
+
+# Sonucu etkilemeyen (yalnızca hız/kaynak kullanımını değiştiren) seçenekler
+_VOLATILE_OPTIONS = {"workers", "batch_size", "strategy"}
+
+# Dosya okuma parça boyutu
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """Dosya içeriğinin SHA-256 özetini döndürür."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    İşlem sonuçlarını (girdi içerikleri, işlem, seçenekler, sürüm) anahtarıyla saklayan önbellek.
+
+    Girdiler değişmemişse işlem yeniden yapılmaz: çıktılar zaten yerinde ve
+    aynıysa atlanır, değilse önbellekten geri yüklenir. Girdi özetleri
+    (yol, boyut, değiştirilme zamanı) ile hatırlanır; değişmeyen dosyalar
+    her çalıştırmada yeniden okunmaz. Toplam boyut ``max_bytes``'ı aşınca en
+    uzun süredir kullanılmayan kayıtlar silinir.
+
+    Önbellek hataları işlemi asla başarısız kılmaz; işlem önbelleksiz yapılır.
+    """
+
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+    MANIFEST_FILENAME = "manifest.json"
+    HASHES_FILENAME = "hashes.json"
+
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None, logger=None):
+        """
+        Args:
+            cache_dir: Önbellek klasörü
+            max_bytes: Önbelleğin en fazla kaplayacağı alan (bayt)
+            logger: Loglama nesnesi (opsiyonel)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        self.logger = logger
+        self.entries_dir = os.path.join(cache_dir, "entries")
+        os.makedirs(self.entries_dir, exist_ok=True)
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.last_status: Optional[str] = None  # "hit", "miss" veya None (önbellek kullanılmadı)
+
+        self._hashes: Optional[Dict[str, List[Any]]] = None
+
+    def run(self,
+            operation: str,
+            input_paths: List[str],
+            options: Dict[str, Any],
+            compute: Callable[[], Tuple[bool, str, List[str]]]) -> Tuple[bool, str, List[str]]:
+        """
+        İşlemi önbellek üzerinden çalıştırır.
+
+        Args:
+            operation: İşlem adı (örn. "merge", "split")
+            input_paths: İçeriği sonucu belirleyen girdi dosyaları
+            options: Sonucu belirleyen seçenekler (çıktı yolu dahil)
+            compute: Önbellekte yoksa çağrılacak işlem; (Başarılı mı?, Mesaj, Çıktılar) döndürür
+
+        Returns:
+            Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Oluşturulan dosyalar)
+        """
+        self.last_status = None
+        try:
+            key = self.make_key(operation, input_paths, options)
+            restored = self._restore(key)
+        except Exception as e:
+            # Girdi okunamıyorsa hatayı işlemin kendisi raporlasın
+            if self.logger:
+                self.logger.warning(f"Önbellek kullanılamadı: {str(e)}")
+            return compute()
+
+        if restored is not None:
+            self.hits += 1
+            self.last_status = "hit"
+            message, output_files, copied = restored
+            if self.logger:
+                self.logger.info(f"Önbellek isabeti ({operation}): {len(output_files)} çıktı, "
+                                 f"{copied} dosya geri yüklendi")
+            return True, f"{message} (önbellekten, {copied} dosya geri yüklendi)", output_files
+
+        self.misses += 1
+        self.last_status = "miss"
+        success, message, output_files = compute()
+
+        if success and output_files:
+            try:
+                self._store(key, message, output_files)
+                self._evict()
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Sonuç önbelleğe yazılamadı: {str(e)}")
+        return success, message, output_files
+
+    def make_key(self, operation: str, input_paths: List[str], options: Dict[str, Any]) -> str:
+        """Girdi içerikleri, işlem, seçenekler ve araç sürümünden önbellek anahtarı üretir."""
+        from .. import __version__
+
+        stable_options = {k: v for k, v in options.items() if k not in _VOLATILE_OPTIONS}
+        digests = []
+        hashed = False
+        try:
+            for path in input_paths:
+                digest, fresh = self._input_digest(path)
+                digests.append(digest)
+                hashed = hashed or fresh
+        finally:
+            # Yeni özetler tek seferde yazılır (binlerce girdide her dosyada yeniden yazmak O(n²) olurdu)
+            if hashed:
+                self._save_hashes()
+        payload = {
+            "operation": operation,
+            "version": __version__,
+            "inputs": digests,
+            "options": stable_options
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def total_size(self) -> int:
+        """Önbellekteki kayıtların toplam boyutunu döndürür."""
+        return sum(size for _, _, size in self._list_entries())
+
+    def clear(self):
+        """Tüm kayıtları siler."""
+        shutil.rmtree(self.entries_dir, ignore_errors=True)
+        os.makedirs(self.entries_dir, exist_ok=True)
+
+    def _input_digest(self, path: str) -> Tuple[str, bool]:
+        """
+        Girdi özetini döndürür; dosya değişmediyse hatırlanan özeti kullanır.
+
+        Returns:
+            Tuple[str, bool]: (Özet, yeni hesaplandı mı). Yeni özetler bellekte
+            tutulur; diske ``_save_hashes`` ile yazılır.
+        """
+        if self._hashes is None:
+            self._hashes = self._load_hashes()
+
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+        remembered = self._hashes.get(real_path)
+        if remembered and remembered[0] == stat.st_size and remembered[1] == stat.st_mtime_ns:
+            return remembered[2], False
+
+        digest = file_digest(real_path)
+        self._hashes[real_path] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest, True
+
+    def _load_hashes(self) -> Dict[str, List[Any]]:
+        try:
+            with open(os.path.join(self.cache_dir, self.HASHES_FILENAME), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hashes(self):
+        path = os.path.join(self.cache_dir, self.HASHES_FILENAME)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._hashes, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def _restore(self, key: str) -> Optional[Tuple[str, List[str], int]]:
+        """
+        Kayıt varsa çıktıları yerine koyar.
+
+        Returns:
+            Optional[Tuple[str, List[str], int]]: (Mesaj, Çıktılar, Kopyalanan dosya sayısı)
+            ya da kayıt yoksa None
+        """
+        entry_dir = os.path.join(self.entries_dir, key)
+        manifest_path = os.path.join(entry_dir, self.MANIFEST_FILENAME)
+        if not os.path.exists(manifest_path):
+            return None
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        copied = 0
+        for output in manifest["outputs"]:
+            target = output["path"]
+            # Çıktı zaten yerinde ve aynıysa dokunma
+            if (os.path.exists(target) and os.path.getsize(target) == output["size"]
+                    and file_digest(target) == output["digest"]):
+                continue
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            shutil.copyfile(os.path.join(entry_dir, output["blob"]), target)
+            copied += 1
+
+        # LRU için son kullanım zamanını güncelle
+        os.utime(manifest_path)
+        return manifest["message"], [output["path"] for output in manifest["outputs"]], copied
+
+    def _store(self, key: str, message: str, output_files: List[str]):
+        """Çıktıların kopyasını yeni bir kayıt olarak saklar."""
+        entry_dir = os.path.join(self.entries_dir, key)
+        if os.path.exists(entry_dir):
+            return
+
+        # Yarım kalan kayıtlar görünmesin: geçici klasörde hazırla, sonra taşı
+        temp_dir = tempfile.mkdtemp(prefix=".yeni_", dir=self.entries_dir)
+        try:
+            outputs = []
+            for index, path in enumerate(output_files):
+                blob = f"{index:05d}{os.path.splitext(path)[1]}"
+                shutil.copyfile(path, os.path.join(temp_dir, blob))
+                outputs.append({
+                    "path": os.path.abspath(path),
+                    "blob": blob,
+                    "size": os.path.getsize(path),
+                    "digest": file_digest(path)
+                })
+
+            manifest = {"message": message, "outputs": outputs, "created": time.time()}
+            with open(os.path.join(temp_dir, self.MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+            os.rename(temp_dir, entry_dir)
+        except OSError:
+            # Aynı anahtar başka bir süreç tarafından yazılmış olabilir
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if not os.path.exists(entry_dir):
+                raise
+
+    def _list_entries(self) -> List[Tuple[str, float, int]]:
+        """Kayıtları (klasör, son kullanım zamanı, boyut) olarak listeler."""
+        entries = []
+        for name in os.listdir(self.entries_dir):
+            entry_dir = os.path.join(self.entries_dir, name)
+            manifest_path = os.path.join(entry_dir, self.MANIFEST_FILENAME)
+            if name.startswith(".") or not os.path.exists(manifest_path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+            entries.append((entry_dir, os.path.getmtime(manifest_path), size))
+        return entries
+
+    def _evict(self):
+        """Toplam boyut sınırı aşılırsa en uzun süredir kullanılmayan kayıtları siler."""
+        entries = self._list_entries()
+        total = sum(size for _, _, size in entries)
+        for entry_dir, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            if self.logger:
+                self.logger.info(f"Önbellek kaydı silindi: {os.path.basename(entry_dir)}")
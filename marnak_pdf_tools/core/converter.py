@@ -2,12 +2,96 @@
 PDF dönüştürme işlemlerini gerçekleştiren modül.
 """
 import os
+import sys
+import json
+import shutil
 import logging
-from typing import List, Tuple, Optional, Dict, Any, Callable
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterator
+import fitz # PyMuPDF
+from .pdf_io import PdfSource, is_path, check_source, source_label, open_document
+from .metrics import add_pages
+
+# Paralel metin çıkarmada bir işçi görevinin okuduğu en fazla sayfa
+TEXT_CHUNK_PAGES = 16
+
+# İşçi süreçte son açılan belge (yol, belge); aynı dosyanın sonraki görevleri yeniden açmaz
+_worker_document: Optional[Tuple[str, fitz.Document]] = None
+
+
+def _iter_page_records(document: fitz.Document, label: str, include_words: bool,
+                       start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Açık belgenin [start, stop) sayfalarını tek tek okuyup sayfa başına bir kayıt üretir.
+    
+    Aynı anda yalnızca bir sayfanın metni bellekte tutulur.
+    """
+    stop = document.page_count if stop is None else min(stop, document.page_count)
+    for page_index in range(start, stop):
+        page = document.load_page(page_index)
+        record = {
+            "file": label,
+            "page": page_index + 1,
+            "text": page.get_text("text")
+        }
+        if include_words:
+            # (x0, y0, x1, y1, kelime) - blok/satır numaraları atlanır
+            record["words"] = [
+                [round(w[0], 2), round(w[1], 2), round(w[2], 2), round(w[3], 2), w[4]]
+                for w in page.get_text("words")
+            ]
+        yield record
+
+
+def _iter_text_records(file_path: PdfSource, include_words: bool = False) -> Iterator[Dict[str, Any]]:
+    """PDF dosyasını açıp sayfa başına bir kayıt üretir; bitince belgeyi kapatır."""
+    document = open_document(file_path)
+    try:
+        yield from _iter_page_records(document, source_label(file_path), include_words)
+    finally:
+        document.close()
+
+
+def _write_text_records(file_path: PdfSource, output_stream, include_words: bool = False) -> int:
+    """Kayıtları JSONL satırları olarak akışa yazar, yazılan sayfa sayısını döndürür."""
+    page_count = 0
+    for record in _iter_text_records(file_path, include_words):
+        output_stream.write(json.dumps(record, ensure_ascii=False))
+        output_stream.write("\n")
+        page_count += 1
+    return page_count
+
+
+def _extract_text_chunk(file_path: str, start: int, stop: int, include_words: bool) -> List[str]:
+    """
+    İşçi süreçte çalışır: [start, stop) sayfalarının kayıtlarını JSONL satırları olarak döndürür.
+    
+    Belge işçide açık tutulur; aynı dosyanın sonraki görevleri onu yeniden
+    açıp ayrıştırmaz. Modül seviyesinde olmalı ki ProcessPoolExecutor
+    tarafından pickle edilebilsin.
+    """
+    global _worker_document
+    if _worker_document is None or _worker_document[0] != file_path:
+        if _worker_document is not None:
+            _worker_document[1].close()
+            _worker_document = None
+        _worker_document = (file_path, open_document(file_path))
+    document = _worker_document[1]
+    return [json.dumps(record, ensure_ascii=False) + "\n"
+            for record in _iter_page_records(document, source_label(file_path), include_words, start, stop)]
+
 
 class PdfConverter:
     """PDF dönüştürme işlemlerini yöneten sınıf."""
     
+    # Dönüştürme modları
+    CONVERT_MODE_COPY = "copy"  # Dosyayı olduğu gibi kopyala
+    CONVERT_MODE_TEXT = "text"  # PDF -> JSONL metin (sayfa başına bir kayıt)
+    
+    # Metin modunda varsayılan çıktı dosyası adı
+    TEXT_OUTPUT_FILENAME = "metin.jsonl"
+    
     def __init__(self, logger=None):
         """
         Args:
@@ -24,12 +108,20 @@ class PdfConverter:
         Args:
             file_paths: Dönüştürülecek dosya yolları listesi
             output_dir: Çıktı dizini
-            options: Dönüştürme seçenekleri
+            options: Dönüştürme seçenekleri (mode, include_words, workers)
             progress_callback: İlerleme geri çağrısı
             
         Returns:
             Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Çıktı dosyaları)
         """
+        options = options or {}
+        if options.get("mode") == self.CONVERT_MODE_TEXT:
+            if not output_dir:
+                return False, "Çıktı dizini belirtilmemiş.", []
+            os.makedirs(output_dir, exist_ok=True)
+            output_path = os.path.join(output_dir, self.TEXT_OUTPUT_FILENAME)
+            return self.extract_text(file_paths, output_path, options, progress_callback)
+        
         try:
             if not file_paths:
                 return False, "Dönüştürülecek dosya bulunamadı.", []
@@ -56,10 +148,9 @@ class PdfConverter:
                 
                 try:
                     # Dosyayı kopyala (gerçek dönüştürme işlemi burada olacak)
-                    import shutil
                     shutil.copy2(file_path, output_path)
                     output_files.append(output_path)
-                    self.logger.info(f"Dönüştürme başarılı: {file_path} -> {output_path}")
+                    self.logger.debug("Dönüştürme başarılı: %s -> %s", file_path, output_path)
                 except Exception as e:
                     self.logger.error(f"Dönüştürme hatası ({file_path}): {str(e)}")
                     continue
@@ -76,6 +167,172 @@ class PdfConverter:
             self.logger.error(f"Dönüştürme işlemi hatası: {str(e)}")
             return False, f"Dönüştürme işlemi başarısız: {str(e)}", []
     
+    def extract_text(self,
+                     file_paths: List[PdfSource],
+                     output_path=None,
+                     options: Optional[Dict[str, Any]] = None,
+                     progress_callback: Optional[Callable[[int], None]] = None,
+                     interrupt_check: Optional[Callable[[], bool]] = None) -> Tuple[bool, str, List[str]]:
+        """
+        PDF dosyalarının metnini sayfa başına bir JSON kaydı olarak (JSONL) yazar.
+        
+        Her satır ``{"file", "page", "text"}`` alanlarını, ``include_words``
+        seçeneği açıksa ayrıca ``words`` ([x0, y0, x1, y1, kelime] listesi) içerir.
+        Sayfalar ``TEXT_CHUNK_PAGES`` sayfalık görevler halinde işçi süreçlere
+        dağıtılır; tek bir büyük dosya da paralel işlenir (işçi sayısı görev
+        sayısıyla sınırlıdır). Her işçi bir dosyayı bir kez açar ve sonraki
+        görevlerinde açık belgeyi kullanır. Görevlerin kayıtları giriş ve sayfa
+        sırasıyla, her görev bitince çıktıya yazılır (büyük bir dosyanın
+        kayıtları da dosya bitmeden akar). Aynı anda en fazla işçi sayısının
+        dört katı görev beklediğinden hiçbir aşamada belgenin tüm metni
+        bellekte tutulmaz.
+        
+        Girdiler bellekteki PDF içerikleri (``bytes``, ``memoryview``, ikili
+        dosya nesnesi) de olabilir; bu durumda dosyalar bu süreçte sırayla
+        işlenir.
+        
+        Args:
+            file_paths: Metni çıkarılacak PDF dosyaları (yol veya bellekteki içerik)
+            output_path: JSONL çıktı dosyası ya da yazılabilir metin akışı;
+                None veya "-" ise stdout'a yazılır
+            options: Seçenekler (include_words: bool, workers: int)
+            progress_callback: İlerleme durumunu bildiren fonksiyon
+            interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
+            
+        Returns:
+            Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Çıktı dosyaları)
+        """
+        options = options or {}
+        include_words = bool(options.get("include_words", False))
+        workers = options.get("workers") or os.cpu_count() or 1
+        
+        if not file_paths:
+            return False, "Dönüştürülecek dosya bulunamadı.", []
+        
+        for file_path in file_paths:
+            try:
+                check_source(file_path)
+            except (FileNotFoundError, TypeError) as e:
+                return False, str(e), []
+        
+        to_stdout = output_path in (None, "-")
+        to_stream = not to_stdout and not is_path(output_path)
+        output_stream = None
+        try:
+            if to_stdout:
+                output_stream = sys.stdout
+            elif to_stream:
+                output_stream = output_path
+            else:
+                output_dir = os.path.dirname(output_path)
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+                output_stream = open(output_path, "w", encoding="utf-8")
+            
+            chunks = None
+            workers = max(1, int(workers))
+            if not all(map(is_path, file_paths)):
+                # Bellekteki girdiler işçi süreçlere kopyalanmaz
+                workers = 1
+            if workers > 1:
+                chunks = self._text_chunks(file_paths)
+                workers = min(workers, len(chunks))
+            if workers <= 1:
+                total_pages = self._extract_text_serial(
+                    file_paths, output_stream, include_words, progress_callback, interrupt_check)
+            else:
+                total_pages = self._extract_text_parallel(
+                    chunks, output_stream, include_words, workers, progress_callback, interrupt_check)
+            
+            if total_pages is None:
+                return False, "İşlem kullanıcı tarafından iptal edildi.", []
+            
+            add_pages(total_pages)
+            if progress_callback:
+                progress_callback(100)
+            
+            self.logger.info(f"Metin çıkarma tamamlandı: {len(file_paths)} dosya, {total_pages} sayfa")
+            outputs = [] if to_stdout or to_stream else [output_path]
+            return True, f"{len(file_paths)} dosyadan {total_pages} sayfa metni çıkarıldı.", outputs
+        
+        except Exception as e:
+            self.logger.error(f"Metin çıkarma hatası: {str(e)}")
+            if not to_stdout and not to_stream and output_stream is not None:
+                output_stream.close()
+                output_stream = None
+                if os.path.exists(output_path):
+                    try:
+                        os.remove(output_path)
+                    except OSError:
+                        pass
+            return False, f"Metin çıkarma işlemi başarısız: {str(e)}", []
+        finally:
+            if to_stdout:
+                sys.stdout.flush()
+            elif to_stream:
+                if hasattr(output_stream, "flush"):
+                    output_stream.flush()
+            elif output_stream is not None:
+                output_stream.close()
+    
+    def _extract_text_serial(self, file_paths, output_stream, include_words,
+                             progress_callback, interrupt_check) -> Optional[int]:
+        """Dosyaları bu süreçte sırayla işler; iptal edilirse None döndürür."""
+        total_pages = 0
+        for i, file_path in enumerate(file_paths):
+            if interrupt_check and interrupt_check():
+                return None
+            total_pages += _write_text_records(file_path, output_stream, include_words)
+            if progress_callback:
+                progress_callback(int(((i + 1) / len(file_paths)) * 100))
+            self.logger.debug("Metin çıkarıldı: %s", source_label(file_path))
+        return total_pages
+    
+    def _text_chunks(self, file_paths) -> deque:
+        """Dosyaları ``TEXT_CHUNK_PAGES`` sayfalık (yol, başlangıç, bitiş, sayfa sayısı) görevlerine böler."""
+        chunks = deque()
+        for file_path in file_paths:
+            document = open_document(file_path)
+            try:
+                page_count = document.page_count
+            finally:
+                document.close()
+            for start in range(0, page_count, TEXT_CHUNK_PAGES):
+                chunks.append((file_path, start, min(start + TEXT_CHUNK_PAGES, page_count), page_count))
+        return chunks
+    
+    def _extract_text_parallel(self, chunks, output_stream, include_words, workers,
+                               progress_callback, interrupt_check) -> Optional[int]:
+        """Sayfa gruplarını işçi süreçlere dağıtır, kayıtları giriş sırasıyla çıktıya akıtır."""
+        total_pages = sum(stop - start for _, start, stop, _ in chunks)
+        
+        written = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Bellekte aynı anda en fazla ``window`` görevin kayıtları bekler
+            window = workers * 4
+            pending = deque()
+            while chunks or pending:
+                while chunks and len(pending) < window:
+                    file_path, start, stop, page_count = chunks.popleft()
+                    pending.append((file_path, stop == page_count, executor.submit(
+                        _extract_text_chunk, file_path, start, stop, include_words)))
+                
+                if interrupt_check and interrupt_check():
+                    for _, _, future in pending:
+                        future.cancel()
+                    return None
+                
+                file_path, last_chunk, future = pending.popleft()
+                lines = future.result()
+                output_stream.writelines(lines)
+                written += len(lines)
+                
+                if progress_callback and total_pages:
+                    progress_callback(int((written / total_pages) * 100))
+                if last_chunk:
+                    self.logger.debug("Metin çıkarıldı: %s", file_path)
+        return written
+    
     def check_file(self, file_path: str) -> Tuple[bool, str]:
         """
         Dosyanın geçerliliğini kontrol eder.
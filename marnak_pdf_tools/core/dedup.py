@@ -0,0 +1,260 @@
+"""
+Birleştirilmiş PDF'lerde yinelenen kaynakları (yazı tipi, görüntü, XObject) tekilleştiren modül.
+"""
+import os
+import re
+import time
+import hashlib
+from typing import Dict, Any, Set, Tuple
+import fitz # PyMuPDF
+from .metrics import phase, PHASE_SERIALIZE
+
+# Nesne metnindeki dolaylı referanslar: "12 0 R"
+_REFERENCE_RE = re.compile(r"(?<![\d.])(\d+) 0 R\b")
+
+# Yazı tipi programlarının FontDescriptor'daki anahtarları
+_FONT_FILE_KEYS = ("FontFile", "FontFile2", "FontFile3")
+
+# Özet çıkarılırken içine inilmeyen nesneler: sayfa ağacı ve /P, /Parent taşıyan nesneler
+# (ör. /Type yazılmamış açıklamalar) yalnızca kendi xref'leriyle eşit sayılır
+_UNIQUE_TYPES = {"/Page", "/Pages", "/Catalog", "/Annot"}
+_UNIQUE_KEYS = ("P", "Parent")
+
+
+def _substitute_references(source: str, replace) -> str:
+    """
+    Nesne metnindeki "N 0 R" referanslarını ``replace`` ile değiştirir.
+
+    Dize sabitlerinin (``(...)`` ve ``<...>``) içi değiştirilmez; metin içindeki
+    "12 0 R" benzeri içerik referans sayılmaz.
+    """
+    parts = []
+    plain_start = index = 0
+    length = len(source)
+    while index < length:
+        char = source[index]
+        if char == "(":
+            end = index + 1
+            depth = 1
+            while end < length and depth:
+                if source[end] == "\\":
+                    end += 1
+                elif source[end] == "(":
+                    depth += 1
+                elif source[end] == ")":
+                    depth -= 1
+                end += 1
+        elif char == "<" and source.startswith("<<", index):
+            index += 2
+            continue
+        elif char == "<":
+            end = source.find(">", index)
+            end = length if end < 0 else end + 1
+        else:
+            index += 1
+            continue
+        parts.append(_REFERENCE_RE.sub(replace, source[plain_start:index]))
+        parts.append(source[index:end])
+        plain_start = index = end
+    parts.append(_REFERENCE_RE.sub(replace, source[plain_start:]))
+    return "".join(parts)
+
+
+def _find_candidates(document) -> Dict[int, str]:
+    """
+    Tekilleştirilebilecek akışlar: görüntüler, form XObject'leri ve yazı tipi programları.
+
+    Returns:
+        Dict[int, str]: {xref: rapor türü ("images", "xobjects", "fonts")}
+    """
+    candidates: Dict[int, str] = {}
+    for xref in range(1, document.xref_length()):
+        obj_type = document.xref_get_key(xref, "Type")[1]
+        if obj_type == "/FontDescriptor":
+            for key in _FONT_FILE_KEYS:
+                kind, value = document.xref_get_key(xref, key)
+                if kind == "xref":
+                    candidates[int(value.split()[0])] = "fonts"
+            continue
+        if not document.xref_is_stream(xref):
+            continue
+        subtype = document.xref_get_key(xref, "Subtype")[1]
+        if subtype == "/Image":
+            candidates[xref] = "images"
+        elif subtype == "/Form" and obj_type in ("/XObject", "null"):
+            candidates[xref] = "xobjects"
+    return {xref: kind for xref, kind in candidates.items() if document.xref_is_stream(xref)}
+
+
+def _structural_digest(document, xref: int, digests: Dict[int, bytes], active: Set[int]) -> bytes:
+    """
+    Nesnenin yapısal özeti: sözlük metni, referansların yerine hedeflerinin özeti ve ham akış.
+
+    Böylece aynı görüntünün farklı xref'lerdeki renk uzayı/ICC kopyaları ayrıca
+    tekilleştirilmeden görüntüler eşleşir. Sayfa ağacı nesneleri, /P ya da
+    /Parent taşıyan nesneler ve döngüler yalnızca kendi xref'leriyle özetlenir.
+    """
+    if xref in digests:
+        return digests[xref]
+    identity = f"xref {xref}".encode()
+    if xref in active or document.xref_get_key(xref, "Type")[1] in _UNIQUE_TYPES or any(
+            document.xref_get_key(xref, key)[0] != "null" for key in _UNIQUE_KEYS):
+        return identity
+    try:
+        source = document.xref_object(xref, compressed=True)
+    except Exception:
+        return identity  # Boş/silinmiş xref
+
+    active.add(xref)
+    try:
+        resolved = _substitute_references(
+            source, lambda match: "<" + _structural_digest(document, int(match.group(1)), digests, active).hex() + ">")
+    finally:
+        active.discard(xref)
+
+    digest = hashlib.sha256(resolved.encode("utf-8", "surrogatepass"))
+    if document.xref_is_stream(xref):
+        digest.update(b"\0stream\0")
+        digest.update(document.xref_stream_raw(xref))
+    digests[xref] = digest.digest()
+    return digests[xref]
+
+
+def _find_duplicates(document, candidates: Dict[int, str]) -> Dict[int, int]:
+    """Yapısal özeti aynı olan adayları bulur; {yinelenen xref: ilk xref} döndürür."""
+    first_by_hash: Dict[Tuple[str, bytes], int] = {}
+    duplicates: Dict[int, int] = {}
+    digests: Dict[int, bytes] = {}
+
+    for xref in sorted(candidates):
+        key = (candidates[xref], _structural_digest(document, xref, digests, set()))
+        if key in first_by_hash:
+            duplicates[xref] = first_by_hash[key]
+        else:
+            first_by_hash[key] = xref
+    return duplicates
+
+
+def _rewrite_references(document, duplicates: Dict[int, int]) -> None:
+    """Tüm nesnelerdeki referansları yinelenenlerden ilk kopyaya yönlendirir."""
+    def replace(match):
+        target = duplicates.get(int(match.group(1)))
+        return match.group(0) if target is None else f"{target} 0 R"
+
+    for xref in range(1, document.xref_length()):
+        if xref in duplicates:
+            continue
+        try:
+            source = document.xref_object(xref, compressed=True)
+        except Exception:
+            continue
+        if not _REFERENCE_RE.search(source):
+            continue
+
+        if document.xref_is_stream(xref):
+            # update_object akış verisini düşürür; akışlarda anahtarlar tek tek güncellenir
+            for key in document.xref_get_keys(xref):
+                value = document.xref_get_key(xref, key)[1]
+                rewritten = _substitute_references(value, replace)
+                if rewritten != value:
+                    document.xref_set_key(xref, key, rewritten)
+        else:
+            rewritten = _substitute_references(source, replace)
+            if rewritten != source:
+                document.update_object(xref, rewritten)
+
+
+def _deduplicate_document(document) -> Tuple[Set[int], Dict[str, int]]:
+    """Açık belgede yinelenen kaynaklara yapılan referansları ilk kopyaya yönlendirir."""
+    by_type = {"fonts": 0, "images": 0, "xobjects": 0}
+    candidates = _find_candidates(document)
+    duplicates = _find_duplicates(document, candidates)
+    for xref in duplicates:
+        by_type[candidates[xref]] += 1
+    if duplicates:
+        _rewrite_references(document, duplicates)
+    return set(duplicates), by_type
+
+
+def _make_report(removed: Set[int], by_type: Dict[str, int], bytes_before: int, bytes_after: int,
+                 start_time: float, logger=None) -> Dict[str, Any]:
+    """Tekilleştirme raporunu oluşturur ve loglar."""
+    report = {
+        "duplicates": len(removed),
+        "by_type": by_type,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "elapsed": time.perf_counter() - start_time
+    }
+
+    if logger:
+        logger.info(f"Kaynak tekilleştirme: {len(removed)} kopya kaldırıldı, "
+                    f"{report['bytes_saved'] / 1024:.1f} KB tasarruf, {report['elapsed']:.2f} sn")
+    return report
+
+
+def deduplicate_resources(pdf_path: str, logger=None) -> Dict[str, Any]:
+    """
+    PDF dosyasındaki aynı içerikli yazı tipi, görüntü ve XObject akışlarını tek kopyaya indirir.
+    
+    Yalnızca görüntü, form XObject ve yazı tipi programı (FontFile*) akışları
+    aday olur. Her aday yapısal olarak SHA-256 ile özetlenir (sözlük metni,
+    referansların yerine hedeflerinin özeti, ham akış); aynı özete sahip
+    adaylara yapılan referanslar ilk kopyaya yönlendirilir. Dize sabitlerinin
+    içindeki "N 0 R" metni değiştirilmez. Sahipsiz kalan kopyalar (ve yalnızca
+    onların kullandığı renk uzayı vb. nesneler) kaydederken atılır ve dosya
+    yerinde güncellenir.
+    
+    Args:
+        pdf_path: Tekilleştirilecek PDF dosyası (yerinde güncellenir)
+        logger: Loglama nesnesi (opsiyonel)
+        
+    Returns:
+        Dict[str, Any]: Rapor (duplicates, by_type, bytes_before, bytes_after,
+        bytes_saved, elapsed)
+    """
+    start_time = time.perf_counter()
+    bytes_before = os.path.getsize(pdf_path)
+
+    temp_path = pdf_path + ".dedup.tmp"
+    document = fitz.open(pdf_path)
+    try:
+        removed, by_type = _deduplicate_document(document)
+        if removed:
+            # garbage=2: artık referans verilmeyen kopyaları at ve xref tablosunu sıkıştır
+            with phase(PHASE_SERIALIZE):
+                document.save(temp_path, garbage=2)
+    finally:
+        document.close()
+
+    if removed:
+        if os.path.getsize(temp_path) < bytes_before:
+            os.replace(temp_path, pdf_path)
+        else:
+            os.remove(temp_path)
+
+    return _make_report(removed, by_type, bytes_before, os.path.getsize(pdf_path), start_time, logger)
+
+
+def deduplicate_bytes(data: bytes, logger=None) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    ``deduplicate_resources``'ın bellekteki PDF içeriği için olanı; geçici dosya kullanmaz.
+    
+    Returns:
+        Tuple[bytes, Dict[str, Any]]: (Tekilleştirilmiş içerik, Rapor)
+    """
+    start_time = time.perf_counter()
+    document = fitz.open(stream=data, filetype="pdf")
+    try:
+        removed, by_type = _deduplicate_document(document)
+        data_after = data
+        if removed:
+            with phase(PHASE_SERIALIZE):
+                deduplicated = document.tobytes(garbage=2)
+            if len(deduplicated) < len(data):
+                data_after = deduplicated
+    finally:
+        document.close()
+
+    return data_after, _make_report(removed, by_type, len(data), len(data_after), start_time, logger)
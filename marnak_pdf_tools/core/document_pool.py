@@ -0,0 +1,240 @@
+"""
+Bir oturum boyunca açılmış PDF belgelerini yeniden kullanan belge havuzu.
+
+Aynı dosya önizlemede gösterilip, doğrulanıp sonra bölündüğünde her adım
+belgeyi baştan açıp ayrıştırıyordu. Havuz, ayrıştırılmış belgeleri
+(dosya yolu, değiştirilme zamanı, boyut) anahtarıyla açık tutar:
+
+- Belgeler ödünç alınır (``borrow_document``/``borrow_reader`` ya da
+  ``acquire``/``release``) ve referans sayılır; ödünçteki belge kapatılmaz.
+- Dosya değişirse anahtar değişir; eski belge serbest kalınca kapatılır.
+- Toplam boyut bütçeyi aşarsa en uzun süredir kullanılmayan, ödünçte
+  olmayan belgeler kapatılır (LRU). Boyut, dosya boyutuyla tahmin edilir.
+
+İş parçacığı kuralları: PyMuPDF ve PyPDF2 belgeleri eşzamanlı kullanıma
+uygun değildir. Bir belge aynı anda yalnızca tek bir iş parçacığına ödünç
+verilir (aynı iş parçacığı birden çok kez alabilir). Belge başka bir iş
+parçacığındayken gelen istek beklemez; havuz dışı, özel bir kopya açılır ve
+iade edilince kapatılır. Böylece arayüz iş parçacığı arka plandaki bir
+işlem yüzünden donmaz.
+Bu yüzden arayüz bileşenleri belgeyi yalnızca çizim süresince ödünç alır:
+önizlenen belge ödünçte beklemez ve sonraki bölme/çıkarma işi onu havuzdan
+yeniden kullanır.
+"""
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+from PyPDF2 import PdfReader
+import fitz # PyMuPDF
+from .pdf_io import PdfSource, is_path, open_reader, open_document
+
+# Varsayılan havuz bütçesi (MB)
+DEFAULT_BUDGET_MB = 256
+
+
+class _PoolEntry:
+    """Havuzdaki tek bir açık belge."""
+
+    def __init__(self, key: tuple, value: Any, size: int):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.refcount = 0
+        self.owner: Optional[int] = None
+        self.stale = False
+
+
+class DocumentPool:
+    """
+    Açık PDF belgelerinin referans sayımlı, bütçeli LRU havuzu.
+
+    Yalnızca diskteki dosyalar havuzlanır; bellekteki girdiler her seferinde
+    açılır. ``KIND_DOCUMENT`` PyMuPDF belgesi, ``KIND_READER`` PyPDF2
+    okuyucusu için kullanılır.
+    """
+
+    KIND_DOCUMENT = "document"
+    KIND_READER = "reader"
+
+    def __init__(self, logger=None, budget_mb: int = DEFAULT_BUDGET_MB):
+        self.logger = logger
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._entries: "OrderedDict[tuple, _PoolEntry]" = OrderedDict()
+        self._borrowed: Dict[int, Tuple[Optional[_PoolEntry], Any]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Havuzdaki belgelerin tahmini toplam boyutu (bayt)."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(self, source: PdfSource, kind: str = KIND_DOCUMENT):
+        """
+        Belgeyi ödünç alır; iş bitince ``release`` ile iade edilmelidir.
+
+        Args:
+            source: PDF girdisi (yalnızca dosya yolları havuzlanır)
+            kind: ``KIND_DOCUMENT`` (PyMuPDF) veya ``KIND_READER`` (PyPDF2)
+
+        Returns:
+            fitz.Document ya da PdfReader
+        """
+        if kind not in (self.KIND_DOCUMENT, self.KIND_READER):
+            raise ValueError(f"Bilinmeyen belge türü: {kind}")
+        if not is_path(source):
+            return self._remember(None, self._open(source, kind))
+
+        path = os.path.realpath(os.fspath(source))
+        stat = os.stat(path)
+        key = (kind, path, stat.st_mtime_ns, stat.st_size)
+        thread_id = threading.get_ident()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.refcount and entry.owner != thread_id:
+                # Başka bir iş parçacığında: beklemeden özel kopya aç
+                entry = None
+                private = True
+            else:
+                private = False
+
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                entry.refcount += 1
+                entry.owner = thread_id
+                return self._remember(entry, entry.value)
+
+            self.misses += 1
+
+        # Ayrıştırma kilit dışında yapılır; diğer iş parçacıkları beklemez
+        value = self._open(path, kind)
+        if private:
+            return self._remember(None, value)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Aynı anda başka bir iş parçacığı eklediyse bu kopya özel kalır
+                return self._remember(None, value)
+            self._drop_stale(kind, path, key)
+            entry = _PoolEntry(key, value, stat.st_size)
+            entry.refcount = 1
+            entry.owner = thread_id
+            self._entries[key] = entry
+            self._size += entry.size
+            self._evict()
+            return self._remember(entry, value)
+
+    def release(self, value):
+        """Ödünç alınan belgeyi iade eder; havuz dışı kopyalar kapatılır."""
+        if value is None:
+            return
+        with self._lock:
+            record = self._borrowed.get(id(value))
+            if record is None or record[1] is not value:
+                return
+            entry, _ = record
+            if entry is None:
+                del self._borrowed[id(value)]
+                self._close(value)
+                return
+            entry.refcount -= 1
+            if entry.refcount == 0:
+                del self._borrowed[id(value)]
+                entry.owner = None
+                if entry.stale:
+                    self._close(value)
+                else:
+                    self._evict()
+
+    @contextmanager
+    def borrow_document(self, source: PdfSource) -> Iterator[fitz.Document]:
+        """PyMuPDF belgesini ``with`` bloğu boyunca ödünç verir."""
+        document = self.acquire(source, self.KIND_DOCUMENT)
+        try:
+            yield document
+        finally:
+            self.release(document)
+
+    @contextmanager
+    def borrow_reader(self, source: PdfSource) -> Iterator[PdfReader]:
+        """PyPDF2 okuyucusunu ``with`` bloğu boyunca ödünç verir."""
+        reader = self.acquire(source, self.KIND_READER)
+        try:
+            yield reader
+        finally:
+            self.release(reader)
+
+    def clear(self):
+        """Ödünçte olmayan tüm belgeleri kapatır; ödünçtekiler iade edilince kapanır."""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                self._remove(key)
+                if entry.refcount:
+                    entry.stale = True
+                else:
+                    self._close(entry.value)
+
+    def _remember(self, entry: Optional[_PoolEntry], value):
+        self._borrowed[id(value)] = (entry, value)
+        return value
+
+    def _open(self, source: PdfSource, kind: str):
+        if kind == self.KIND_READER:
+            return open_reader(source)
+        return open_document(source)
+
+    def _close(self, value):
+        # PyPDF2 okuyucusunun kapatılacak bir kaynağı yoktur; eşleme çöp toplayıcıyla kalkar
+        if isinstance(value, fitz.Document) and not value.is_closed:
+            value.close()
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def _drop_stale(self, kind: str, path: str, current_key: tuple):
+        """Dosya değiştiği için geçersiz kalan eski belgeleri havuzdan çıkarır."""
+        for key, entry in list(self._entries.items()):
+            if key[0] == kind and key[1] == path and key != current_key:
+                self._remove(key)
+                if entry.refcount:
+                    entry.stale = True
+                else:
+                    self._close(entry.value)
+                if self.logger:
+                    self.logger.debug(f"Değişen dosya havuzdan çıkarıldı: {path}")
+
+    def _evict(self):
+        """Bütçe aşıldıysa en eski, ödünçte olmayan belgeleri kapatır."""
+        for key, entry in list(self._entries.items()):
+            if self._size <= self.budget_bytes:
+                break
+            if entry.refcount:
+                continue
+            self._remove(key)
+            self._close(entry.value)
+            if self.logger:
+                self.logger.debug(f"Belge havuzdan çıkarıldı: {key[1]}")
+
+
+_session_pool: Optional[DocumentPool] = None
+_session_lock = threading.Lock()
+
+
+def session_pool() -> DocumentPool:
+    """Arayüz oturumu boyunca bileşenlerin paylaştığı belge havuzu."""
+    global _session_pool
+    with _session_lock:
+        if _session_pool is None:
+            _session_pool = DocumentPool()
+        return _session_pool
@@ -0,0 +1,249 @@
+"""
+PDF kütüphanelerini (PyPDF2, PyMuPDF) ortak bir arayüzün arkasına alan motor modülü.
+
+Core sınıfları sayfa açma, sayma, kopyalama ve yazma işlerini doğrudan bir
+kütüphaneyle değil ``PdfEngine`` üzerinden yapar. Her işlem için varsayılan
+motor, ``benchmarks/engine_results.json`` dosyasındaki kayıtlı ölçümlerden
+``benchmarks/engine_benchmark.py:derive_defaults`` ile türetilir (PyPDF2
+yalnızca belirgin farkla daha hızlıysa seçilir); seçeneklerdeki ``engine``
+anahtarı (CLI: ``--engine``, arayüz: ``pdf_engine`` ayarı) ile
+değiştirilebilir. Bir motor istenen işlemi desteklemiyorsa (PyPDF2 sayfa
+çizemez) varsayılana dönülür. PyPDF2'nin bellek eşlemeli okuma yolu
+(``pdf_io.open_reader``) ``pypdf2`` motoru seçildiğinde kullanılır.
+"""
+import abc
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+from PyPDF2 import PdfReader, PdfWriter
+import fitz # PyMuPDF
+from .pdf_io import PdfSource, open_reader, open_document
+from .document_pool import DocumentPool
+from .results import OperationError
+from .metrics import phase, PHASE_PARSE, PHASE_COPY, PHASE_SERIALIZE
+
+# Motor adları
+ENGINE_AUTO = "auto"
+ENGINE_PYPDF2 = "pypdf2"
+ENGINE_PYMUPDF = "pymupdf"
+
+# Motor seçilen işlemler
+OP_MERGE = "merge"
+OP_SPLIT = "split"
+OP_EXTRACT = "extract"
+OP_PAGE_COUNT = "page_count"
+OP_RENDER = "render"
+
+# İşlem başına varsayılan motor: benchmarks/engine_results.json'dan türetilir
+# (20 girdi x 50 sayfa, en iyi süre; tests/test_core.py tabloyla eşleştiğini denetler)
+DEFAULT_ENGINES = {
+    # PyPDF2 her sayfa nesnesini Python'da klonlar; MuPDF ardışık sayfaları tek insert_pdf ile kopyalar (~3x)
+    OP_MERGE: ENGINE_PYMUPDF,
+    # Aynı nedenle; parça başına 10 ardışık sayfa tek çağrıda kopyalanır (~1,7x)
+    OP_SPLIT: ENGINE_PYMUPDF,
+    # Tek sayfalık parçalarda fark ölçüm gürültüsü içinde; önizlemenin havuzdaki belgesi paylaşılır
+    OP_EXTRACT: ENGINE_PYMUPDF,
+    # PyPDF2 sayfa ağacını Python'da çözer; MuPDF yalnızca sayfa sayısını okur (~30x)
+    OP_PAGE_COUNT: ENGINE_PYMUPDF,
+    # Yalnızca PyMuPDF sayfa çizebilir
+    OP_RENDER: ENGINE_PYMUPDF,
+}
+
+
+class PdfEngine(abc.ABC):
+    """
+    PDF motoru arayüzü.
+
+    Belgeler motorun kendi nesneleridir (PdfReader, fitz.Document); çağıran
+    bunları yalnızca aynı motorun metotlarına geri verir. Soyut metotların
+    hepsini tanımlamayan bir motor oluşturulurken ``TypeError`` verir.
+    """
+
+    name = ""
+    # Havuzda (``DocumentPool``) hangi tür belge olarak tutulur
+    pool_kind = ""
+    operations = frozenset()
+
+    def supports(self, operation: str) -> bool:
+        """Motor işlemi destekliyor mu?"""
+        return operation in self.operations
+
+    def open(self, source: PdfSource, pool=None):
+        """Girdiyi açar; havuz verildiyse ayrıştırılmış belge ödünç alınır."""
+        if pool is not None:
+            return pool.acquire(source, self.pool_kind)
+        return self._open(source)
+
+    def close(self, document, pool=None):
+        """``open`` ile alınan belgeyi kapatır ya da havuza iade eder."""
+        if pool is not None:
+            pool.release(document)
+        else:
+            self._close(document)
+
+    @abc.abstractmethod
+    def page_count(self, document) -> int:
+        """Açılmış ya da oluşturulan belgenin sayfa sayısı."""
+
+    @abc.abstractmethod
+    def new_document(self):
+        """Sayfa kopyalanacak boş bir belge oluşturur."""
+
+    @abc.abstractmethod
+    def copy_pages(self, target, document, page_indices: Iterable[int]):
+        """``document``'taki 0 tabanlı sayfaları verilen sırayla ``target`` sonuna ekler."""
+
+    @abc.abstractmethod
+    def write(self, target, stream: BinaryIO):
+        """Oluşturulan belgeyi ikili akışa yazar."""
+
+    def render(self, document, page_index: int, zoom: float = 1.0) -> bytes:
+        """Sayfayı PNG olarak çizer."""
+        raise OperationError(f"{self.name} motoru sayfa görüntüsü oluşturamaz")
+
+    @abc.abstractmethod
+    def _open(self, source: PdfSource):
+        """Girdiyi havuz dışında açar."""
+
+    def _close(self, document):
+        pass
+
+
+class PyPDF2Engine(PdfEngine):
+    """PyPDF2 motoru: saf Python, sayfa nesnelerini yazıcıya klonlar."""
+
+    name = ENGINE_PYPDF2
+    pool_kind = DocumentPool.KIND_READER
+    operations = frozenset({OP_MERGE, OP_SPLIT, OP_EXTRACT, OP_PAGE_COUNT})
+
+    def page_count(self, document) -> int:
+        with phase(PHASE_PARSE):
+            return len(document.pages)
+
+    def new_document(self) -> PdfWriter:
+        return PdfWriter()
+
+    def copy_pages(self, target: PdfWriter, document: PdfReader, page_indices: Iterable[int]):
+        with phase(PHASE_COPY):
+            for page_idx in page_indices:
+                target.add_page(document.pages[page_idx])
+
+    def write(self, target: PdfWriter, stream: BinaryIO):
+        with phase(PHASE_SERIALIZE):
+            target.write(stream)
+
+    def _open(self, source: PdfSource) -> PdfReader:
+        return open_reader(source)
+
+
+class PyMuPDFEngine(PdfEngine):
+    """PyMuPDF motoru: MuPDF ile ardışık sayfaları tek çağrıda kopyalar."""
+
+    name = ENGINE_PYMUPDF
+    pool_kind = DocumentPool.KIND_DOCUMENT
+    operations = frozenset({OP_MERGE, OP_SPLIT, OP_EXTRACT, OP_PAGE_COUNT, OP_RENDER})
+
+    def page_count(self, document: fitz.Document) -> int:
+        with phase(PHASE_PARSE):
+            return document.page_count
+
+    def new_document(self) -> fitz.Document:
+        return fitz.open()
+
+    def copy_pages(self, target: fitz.Document, document: fitz.Document, page_indices: Iterable[int]):
+        # Ardışık (artan ya da azalan) sayfalar tek insert_pdf çağrısıyla eklenir
+        with phase(PHASE_COPY):
+            for first, last in _runs(page_indices):
+                target.insert_pdf(document, from_page=first, to_page=last)
+
+    def write(self, target: fitz.Document, stream: BinaryIO):
+        seekable = getattr(stream, "seekable", None)
+        with phase(PHASE_SERIALIZE):
+            if callable(seekable) and seekable():
+                # Belge bayt dizisine dönüştürülmeden doğrudan akışa yazılır (çıktı bellekte bir kez daha tutulmaz)
+                target.save(_StreamOutput(stream))
+            else:
+                stream.write(target.tobytes())
+
+    def render(self, document: fitz.Document, page_index: int, zoom: float = 1.0) -> bytes:
+        pixmap = document[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        return pixmap.tobytes("png")
+
+    def _open(self, source: PdfSource) -> fitz.Document:
+        return open_document(source)
+
+    def _close(self, document: fitz.Document):
+        document.close()
+
+
+class _StreamOutput:
+    """
+    ``fitz.Document.save``'in doğrudan yazabileceği akış sarmalayıcısı.
+
+    Konumlar PDF'in başına göredir; akışta önceden veri olsa da xref
+    ofsetleri doğru yazılır. ``name`` özniteliği bilerek yoktur: fitz ad
+    taşıyan nesnelere akış yerine o dosya yolu üzerinden yazar.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.start = stream.tell()
+
+    def write(self, data) -> int:
+        return self.stream.write(data)
+
+    def tell(self) -> int:
+        return self.stream.tell() - self.start
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            offset += self.start
+        return self.stream.seek(offset, whence) - self.start
+
+    def truncate(self, size: Optional[int] = None) -> int:
+        return self.stream.truncate(None if size is None else size + self.start)
+
+
+def _runs(page_indices: Iterable[int]) -> List[tuple]:
+    """Sayfa indekslerini ardışık (ilk, son) çiftlerine ayırır; azalan sıralar korunur."""
+    runs = []
+    for page_idx in page_indices:
+        if runs:
+            first, last = runs[-1]
+            step = last - first
+            if page_idx - last in (1, -1) and (step == 0 or (page_idx - last) * step > 0):
+                runs[-1] = (first, page_idx)
+                continue
+        runs.append((page_idx, page_idx))
+    return runs
+
+
+ENGINES: Dict[str, PdfEngine] = {
+    ENGINE_PYPDF2: PyPDF2Engine(),
+    ENGINE_PYMUPDF: PyMuPDFEngine(),
+}
+
+
+def get_engine(operation: str, name: Optional[str] = None, logger: Any = None) -> PdfEngine:
+    """
+    İşlem için motoru seçer.
+
+    Args:
+        operation: ``OP_*`` sabitlerinden biri
+        name: İstenen motor (None veya ``ENGINE_AUTO``: işlemin varsayılanı)
+        logger: Desteklenmeyen seçimde uyarı için (opsiyonel)
+
+    Returns:
+        PdfEngine: Seçilen motor
+    """
+    if operation not in DEFAULT_ENGINES:
+        raise OperationError(f"Bilinmeyen işlem: {operation}")
+    if not name or name == ENGINE_AUTO:
+        return ENGINES[DEFAULT_ENGINES[operation]]
+    if name not in ENGINES:
+        raise OperationError(f"Bilinmeyen PDF motoru: {name}")
+
+    engine = ENGINES[name]
+    if not engine.supports(operation):
+        if logger:
+            logger.warning(f"{name} motoru '{operation}' işlemini desteklemiyor, varsayılan kullanılıyor")
+        return ENGINES[DEFAULT_ENGINES[operation]]
+    return engine
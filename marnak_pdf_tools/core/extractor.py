@@ -2,33 +2,43 @@
 PDF sayfalarını çıkarma işlemlerini gerçekleştiren modül.
 """
 import os
+import time
 from typing import List, Tuple, Optional, Any, Dict
-from PyPDF2 import PdfReader, PdfWriter
-import fitz # PyMuPDF
-from .utils import parse_page_ranges
+from .utils import parse_page_set, PageRangeError
+from .pdf_io import PdfSource, OutputTarget, is_path, check_source, source_name
+from .engines import get_engine, OP_EXTRACT
+from .results import OperationError, ResultIterator, run_to_completion, check_cancelled
 
 class PdfExtractor:
     """PDF sayfalarını çıkarma işlemlerini yöneten sınıf."""
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, cache=None, pool=None):
         """
         Args:
             logger: Loglama nesnesi (opsiyonel)
+            cache: Sonuç önbelleği (``ResultCache``, opsiyonel)
+            pool: Açık belge havuzu (``DocumentPool``, opsiyonel)
         """
         self.logger = logger
+        self.cache = cache
+        self.pool = pool
     
     def extract_pages(self,
-                      file_path: str,
-                      output_dir: str,
+                      file_path: PdfSource,
+                      output_dir,
                       options: Optional[Dict[str, Any]] = None,
                       progress_callback: Optional[callable] = None,
                       interrupt_check: Optional[callable] = None) -> Tuple[bool, str, List[str]]:
         """
         PDF dosyasından belirtilen sayfa aralıklarını çıkarır.
         
+        ``iter_extract`` üzerinde ince bir sarmalayıcıdır. Önbellek verilmişse
+        dosya ve seçenekler değişmediğinde sayfalar yeniden çıkarılmaz,
+        çıktılar önbellekten geri yüklenir.
+        
         Args:
-            file_path: PDF dosyasının yolu
-            output_dir: Çıktı klasörü
+            file_path: PDF dosyasının yolu ya da bellekteki içeriği
+            output_dir: Çıktı klasörü (bellek ve akış hedefleri için bkz. ``iter_extract``)
             options: Çıkarma seçenekleri (extract_all, page_range, file_prefix)
             progress_callback: İlerleme durumunu bildiren fonksiyon
             interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
@@ -39,98 +49,123 @@ class PdfExtractor:
         if options is None:
             options = {}
 
+        # Girdi değişmediyse sonucu önbellekten al
+        if (self.cache is not None and is_path(file_path) and is_path(output_dir)
+                and os.path.exists(file_path)):
+            cache_options = dict(options, output_dir=os.path.abspath(output_dir))
+            return self.cache.run("extract", [file_path], cache_options,
+                                  lambda: self._extract_pages(file_path, output_dir, options,
+                                                              progress_callback, interrupt_check))
+
+        return self._extract_pages(file_path, output_dir, options, progress_callback, interrupt_check)
+
+    def _extract_pages(self,
+                       file_path: PdfSource,
+                       output_dir,
+                       options: Dict[str, Any],
+                       progress_callback: Optional[callable],
+                       interrupt_check: Optional[callable]) -> Tuple[bool, str, List[str]]:
+        """Sayfa çıkarma işlemini önbelleğe bakmadan yapar (bkz. ``extract_pages``)."""
+        return run_to_completion(
+            self.iter_extract(file_path, output_dir, options, progress_callback, interrupt_check),
+            "PDF sayfa çıkarma işlemi başarısız", self._cleanup_files, self.logger)
+
+    def iter_extract(self,
+                     file_path: PdfSource,
+                     output_dir,
+                     options: Optional[Dict[str, Any]] = None,
+                     progress_callback: Optional[callable] = None,
+                     interrupt_check: Optional[callable] = None) -> ResultIterator:
+        """
+        Sayfaları çıkarır ve her dosyayı oluşturulur oluşturulmaz bildirir.
+
+        Önbellek kullanılmaz. Hata durumunda ``OperationError``, iptalde
+        ``OperationCancelled`` fırlatılır; o ana kadar üretilen dosyalar
+        silinmez (tüketicinin elindedir).
+
+        Girdi bir dosya yolu, ``bytes``/``memoryview`` ya da ikili dosya
+        nesnesi olabilir. ``output_dir`` None ise sayfalar bellekte üretilir
+        (sonuçların ``data`` alanı); dosya adı alıp yazılabilir akış döndüren
+        bir fonksiyon verilirse her sayfa o akışa yazılır.
+
+        Args:
+            file_path: PDF dosyasının yolu ya da bellekteki içeriği
+            output_dir: Çıktı klasörü, None (bellek) ya da akış fabrikası
+            options: Çıkarma seçenekleri (extract_all, page_range, file_prefix, engine)
+            progress_callback: İlerleme durumunu bildiren fonksiyon
+            interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
+
+        Yields:
+            OperationResult: Oluşturulan her dosya için bir sonuç
+
+        Returns:
+            str: Özet mesajı (``StopIteration.value``)
+        """
+        if options is None:
+            options = {}
+
         extract_all = options.get("extract_all", True)
         page_range_str = options.get("page_range", "")
         file_prefix = options.get("file_prefix", "sayfa_")
 
-        output_files = []
         try:
-            if not os.path.exists(file_path):
-                return False, f"Dosya bulunamadı: {file_path}", []
+            check_source(file_path)
+        except (FileNotFoundError, TypeError) as e:
+            raise OperationError(str(e))
 
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
+        engine = get_engine(OP_EXTRACT, options.get("engine"), self.logger)
+        target = OutputTarget(output_dir)
+        target.prepare()
 
-            pdf_document = fitz.open(file_path)
-            total_pages = pdf_document.page_count
+        # Havuz verildiyse ayrıştırılmış belge ödünç alınır
+        pdf_document = engine.open(file_path, self.pool)
+        try:
+            total_pages = engine.page_count(pdf_document)
             if total_pages == 0:
-                pdf_document.close()
-                return False, "PDF dosyası sayfa içermiyor.", []
+                raise OperationError("PDF dosyası sayfa içermiyor.")
 
-            pages_to_extract = []
+            # Sayfalar listeye açılmaz: range veya PageSet tembel olarak yinelenir
             if extract_all:
-                for i in range(total_pages):
-                    # İptal kontrolü
-                    if interrupt_check and interrupt_check():
-                        pdf_document.close()
-                        return False, "İşlem kullanıcı tarafından iptal edildi.", []
-                    
-                    pages_to_extract.append(i)
+                pages_to_extract = range(total_pages)
             else:
-                # Sayfa aralığını ayrıştır (merkezi fonksiyon kullan)
-                parsed_ranges = parse_page_ranges(page_range_str, total_pages)
-                for page_list in parsed_ranges:
-                    for page_num in page_list:
-                        # İptal kontrolü
-                        if interrupt_check and interrupt_check():
-                            pdf_document.close()
-                            return False, "İşlem kullanıcı tarafından iptal edildi.", []
-                        
-                        if 0 <= page_num < total_pages:
-                            pages_to_extract.append(page_num)
-                pages_to_extract = sorted(list(set(pages_to_extract))) # Tekrarları kaldır ve sırala
+                # Sayfa aralığını ayrıştır (merkezi fonksiyon kullan) - sıralı ve tekrarsız
+                try:
+                    pages_to_extract = parse_page_set(page_range_str, total_pages)
+                except PageRangeError as e:
+                    raise OperationError(f"Geçersiz sayfa aralığı: {str(e)}")
 
             if not pages_to_extract:
-                pdf_document.close()
-                return False, "Çıkarılacak geçerli sayfa bulunamadı.", []
+                raise OperationError("Çıkarılacak geçerli sayfa bulunamadı.")
 
             total_extracted = len(pages_to_extract)
+            original_filename = source_name(file_path)
             for i, page_idx in enumerate(pages_to_extract):
                 # İptal kontrolü
-                if interrupt_check and interrupt_check():
-                    pdf_document.close()
-                    return False, "İşlem kullanıcı tarafından iptal edildi.", output_files
-                
-                writer = PdfWriter()
-                writer.add_page(pdf_document.load_page(page_idx))
-
-                # Dosya adı oluştur
-                original_filename = os.path.splitext(os.path.basename(file_path))[0]
-                output_filename = f"{file_prefix}{original_filename}_sayfa_{page_idx + 1}.pdf"
-                output_path = os.path.join(output_dir, output_filename)
-
-                # Aynı isimde dosya varsa yeni isim oluştur
-                counter = 1
-                while os.path.exists(output_path):
-                    output_filename = f"{file_prefix}{original_filename}_sayfa_{page_idx + 1}_{counter}.pdf"
-                    output_path = os.path.join(output_dir, output_filename)
-                    counter += 1
-
-                with open(output_path, "wb") as output_pdf_file:
-                    writer.write(output_pdf_file)
-                
-                output_files.append(output_path)
+                check_cancelled(interrupt_check)
+
+                start_time = time.perf_counter()
+                writer = engine.new_document()
+                try:
+                    engine.copy_pages(writer, pdf_document, (page_idx,))
+
+                    # Dosyayı kaydet (aynı isimde dosya varsa yeni isim oluştur)
+                    result = target.write(f"{file_prefix}{original_filename}_sayfa_{page_idx + 1}",
+                                          lambda stream: engine.write(writer, stream), 1, start_time)
+                finally:
+                    engine.close(writer)
 
                 if progress_callback:
                     progress = int(((i + 1) / total_extracted) * 100)
                     progress_callback(progress)
                 
                 if self.logger:
-                    self.logger.info(f"Sayfa çıkarıldı: {output_path}")
+                    self.logger.debug("Sayfa çıkarıldı: %s", result.path or result.name)
 
-            pdf_document.close()
-            return True, f"Sayfa çıkarma işlemi başarılı. {len(output_files)} dosya oluşturuldu.", output_files
+                yield result
 
-        except Exception as e:
-            error_msg = f"PDF sayfa çıkarma işlemi başarısız: {str(e)}"
-            if self.logger:
-                self.logger.error(error_msg)
-            
-            # Hata durumunda oluşturulan dosyaları temizle
-            self._cleanup_files(output_files)
-            if 'pdf_document' in locals() and not pdf_document.is_closed:
-                pdf_document.close()
-            return False, error_msg, []
+            return f"Sayfa çıkarma işlemi başarılı. {total_extracted} dosya oluşturuldu."
+        finally:
+            engine.close(pdf_document, self.pool)
     
 
     def _cleanup_files(self, file_paths: List[str]):
@@ -1,102 +1,640 @@
 """
 PDF dosyalarını birleştirme işlemlerini gerçekleştiren modül.
 """
+import gc
+import io
 import os
-from typing import List, Tuple, Optional
-from PyPDF2 import PdfReader, PdfWriter
+import time
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain, zip_longest
+from typing import List, Tuple, Optional, Dict, Any, Union
+from .utils import parse_page_selection, PageRangeError
+from .dedup import deduplicate_resources, deduplicate_bytes
+from .pdf_io import PdfSource, is_path, source_label, open_document, write_output
+from .engines import PdfEngine, get_engine, OP_MERGE
+from .results import (OperationResult, OperationError, OperationCancelled, ResultIterator,
+                      run_to_completion, check_cancelled)
+from .metrics import phase, PHASE_SERIALIZE
+import fitz # PyMuPDF
+
+# Birleştirme girdisi: dosya yolu/bellekteki PDF ya da (girdi, sayfa ifadesi) çifti
+MergeInput = Union[PdfSource, Tuple[PdfSource, Optional[str]]]
+
+# Otomatik grup boyutu sınırları
+_MIN_BATCH_SIZE = 2
+_MAX_BATCH_SIZE = 256
+
+# Loglar, arayüz ve kütüphaneler için ayrılan dosya tanıtıcısı payı (süreçte zaten açık olanlara ek)
+_RESERVED_FILE_HANDLES = 64
+
+# Bir grupta açık tutulan girdi başına dosya tanıtıcısı: MuPDF belgesinin dosyası ya da
+# PyPDF2 girdisinin bellek eşlemesi (mmap tanıtıcının bir kopyasını tutar)
+_FILE_HANDLES_PER_INPUT = 1
+
+# Bir girdinin okuyucu + yazıcı nesneleriyle bellekte kapladığı yaklaşık alan (dosya boyutunun katı)
+_MEMORY_PER_INPUT_FACTOR = 4
+
+
+def _merge_batch(batch: List[Tuple[MergeInput, bool]], output_path: str, engine_name: str) -> str:
+    """
+    Bir grup girdiyi ara dosyada birleştirir.
+
+    İşçi süreçte çalışır; sayfa seçimleri ve ters çevirme bu aşamada uygulanır.
+    """
+    merger = PdfMerger()
+    engine = get_engine(OP_MERGE, engine_name)
+    writer = engine.new_document()
+    try:
+        reverse_inputs = {i for i, (_, reverse) in enumerate(batch) if reverse}
+        merger._merge_sequential(engine, writer, [merge_input for merge_input, _ in batch], reverse_inputs)
+        with open(output_path, 'wb') as output_file:
+            engine.write(writer, output_file)
+    finally:
+        engine.close(writer)
+        # PyPDF2 okuyucuları döngüsel referanslarla bellek eşlemelerini (ve tanıtıcılarını) tutar;
+        # işçinin sonraki grubu açmadan önce bırakılır
+        gc.collect()
+    return output_path
+
+
+def _open_file_handles() -> int:
+    """Süreçte şu an açık dosya tanıtıcısı sayısı (fork ile işçilere de geçer); sayılamıyorsa 0."""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(fd_dir))
+        except OSError:
+            continue
+    return 0
+
 
 class PdfMerger:
     """PDF dosyalarını birleştirme işlemlerini yöneten sınıf."""
     
-    def __init__(self, logger=None):
+    # Birleştirme modları
+    MERGE_MODE_SEQUENTIAL = "sequential"  # Dosyaları art arda ekle
+    MERGE_MODE_INTERLEAVE = "interleave"  # Girdilerden sırayla birer sayfa al (çift taraflı tarama)
+    
+    # Birleştirme stratejileri
+    MERGE_STRATEGY_AUTO = "auto"  # Girdi sayısı grup boyutunu aşarsa ağaç, değilse düz
+    MERGE_STRATEGY_FLAT = "flat"  # Tüm girdiler tek yazıcıda
+    MERGE_STRATEGY_TREE = "tree"  # K'lık gruplar ara dosyalarda, sonra ara dosyalar birleştirilir
+    
+    # Bellek ve akış çıktılarında sonucun adı
+    MERGED_FILENAME = "birlestirilmis.pdf"
+    
+    def __init__(self, logger=None, cache=None):
         """
         Args:
             logger: Loglama nesnesi (opsiyonel)
+            cache: Sonuç önbelleği (``ResultCache``, opsiyonel)
         """
         self.logger = logger
+        self.cache = cache
+        # Son birleştirmenin kaynak tekilleştirme raporu (deduplicate seçiliyse)
+        self.last_dedup_report: Optional[Dict[str, Any]] = None
     
     def merge_pdfs(self, 
-                  file_paths: List[str], 
-                  output_path: str,
+                  file_paths: List[MergeInput], 
+                  output_path,
                   progress_callback: Optional[callable] = None,
-                  interrupt_check: Optional[callable] = None) -> Tuple[bool, str, List[str]]:
+                  interrupt_check: Optional[callable] = None,
+                  options: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, List[str]]:
         """
         PDF dosyalarını birleştirir.
         
+        Her girdi bir dosya yolu, bellekteki PDF içeriği (``bytes``,
+        ``memoryview``, ikili dosya nesnesi) ya da ``(girdi, sayfa ifadesi)``
+        çifti olabilir; ifade verilmişse (örn. "3-9", "1", "5-end", "-1") yalnızca
+        seçilen sayfalar verilen sırayla eklenir, ara dosya oluşturulmaz.
+        
+        Çıktı bir dosya yolu, yazılabilir ikili akış ya da None (bellekte
+        üretilir, ``iter_merge`` sonucunun ``data`` alanında döner) olabilir.
+        Bellekteki girdilerde veya dosya dışı çıktılarda hiçbir geçici dosya
+        oluşturulmaz: birleştirme her zaman düz stratejiyle yapılır, önbellek
+        ve ekleme modu kullanılmaz.
+        
+        ``interleave`` modunda girdilerden sırayla birer sayfa alınır
+        (ön yüzler 1, arka yüzler 1, ön yüzler 2...); biten girdiler atlanır.
+        ``reverse_inputs`` ile belirtilen girdilerin sayfa sırası ters çevrilir
+        (tarayıcıdan ters sırada gelen arka yüzler için).
+        
+        Çok sayıda girdide her okuyucu son yazıma kadar bellekte kalır.
+        ``tree`` stratejisinde girdiler K'lık gruplar halinde işçi süreçlerde
+        ara dosyalara birleştirilir, ara dosyalar da K'dan az kalana kadar aynı
+        şekilde gruplanır; son grup çıktıya yazılır ve ara dosyalar silinir.
+        ``auto`` (varsayılan) girdi sayısı K'yı aşınca ağaç stratejisini seçer.
+        K verilmezse dosya tanıtıcısı sınırı ve boş bellekten hesaplanır.
+        Harmanlama modu tüm girdilere aynı anda eriştiği için her zaman düz çalışır.
+        
+        ``append`` seçiliyse ve çıktı dosyası zaten varsa girdiler onun sonuna
+        artımlı güncelleme ile eklenir: yalnızca yeni nesneler ve yeni bir xref
+        bölümü dosyanın sonuna yazılır, mevcut içerik yeniden yazılmaz.
+        Her ekleme dosyayı biraz büyüttüğünden ``compact`` ile ara sıra tam
+        yeniden yazım (kullanılmayan nesnelerin atılması) yapılabilir.
+        
+        ``deduplicate`` seçiliyse kayıttan sonra aynı içerikli yazı tipi,
+        görüntü ve XObject akışları tek kopyaya indirilir; rapor
+        ``last_dedup_report`` içinde saklanır.
+        
+        ``iter_merge`` üzerinde ince bir sarmalayıcıdır. Önbellek verilmişse
+        (ekleme modu hariç) girdiler ve seçenekler değişmediğinde birleştirme
+        yapılmaz, çıktı önbellekten geri yüklenir.
+        
         Args:
-            file_paths: Birleştirilecek PDF dosyalarının yolları
-            output_path: Çıktı dosyasının yolu
+            file_paths: Birleştirilecek PDF dosyaları (girdi veya (girdi, sayfa ifadesi))
+            output_path: Çıktı dosyasının yolu, yazılabilir akış ya da None (bellek)
             progress_callback: İlerleme durumunu bildiren fonksiyon
             interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
+            options: Birleştirme seçenekleri (mode, reverse_inputs: 0 tabanlı girdi indeksleri,
+                deduplicate, strategy, batch_size, workers, append, compact, engine)
+            
+        Returns:
+            Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Oluşturulan dosyalar)
+        """
+        if options is None:
+            options = {}
+        
+        # Girdiler değişmediyse sonucu önbellekten al
+        input_paths = [self._split_merge_input(merge_input)[0] for merge_input in file_paths]
+        if (self.cache is not None and not options.get("append") and is_path(output_path)
+                and all(map(is_path, input_paths))):
+            cache_options = dict(options, inputs=[self._split_merge_input(m) for m in file_paths],
+                                 output_path=os.path.abspath(output_path))
+            return self.cache.run("merge", input_paths, cache_options,
+                                  lambda: self._merge_pdfs(file_paths, output_path, progress_callback,
+                                                           interrupt_check, options))
+        
+        return self._merge_pdfs(file_paths, output_path, progress_callback, interrupt_check, options)
+    
+    def _merge_pdfs(self,
+                    file_paths: List[MergeInput],
+                    output_path,
+                    progress_callback: Optional[callable],
+                    interrupt_check: Optional[callable],
+                    options: Dict[str, Any]) -> Tuple[bool, str, List[str]]:
+        """Birleştirmeyi önbelleğe bakmadan yapar (bkz. ``merge_pdfs``)."""
+        # Çıktı yalnızca başarıyla bildirildikten sonra tüketiciye aittir; yarım kalan
+        # çıktıyı ``iter_merge`` kendisi temizler
+        return run_to_completion(
+            self.iter_merge(file_paths, output_path, progress_callback, interrupt_check, options),
+            "PDF birleştirme işlemi başarısız", lambda output_files: None, self.logger)
+    
+    def iter_merge(self,
+                   file_paths: List[MergeInput],
+                   output_path,
+                   progress_callback: Optional[callable] = None,
+                   interrupt_check: Optional[callable] = None,
+                   options: Optional[Dict[str, Any]] = None) -> ResultIterator:
+        """
+        PDF dosyalarını birleştirir ve çıktı hazır olduğunda bildirir.
+        
+        Seçenekler ``merge_pdfs`` ile aynıdır; önbellek kullanılmaz. Hata
+        durumunda ``OperationError``, iptalde ``OperationCancelled`` fırlatılır.
+        Yarım kalan çıktı silinir; ekleme modunda mevcut dosyaya dokunulmaz.
+        
+        Yields:
+            OperationResult: Birleştirilmiş (veya eklenmiş) dosya; çıktı None
+            verildiyse içerik ``data`` alanındadır
             
         Returns:
-            Tuple[bool, str]: (Başarılı mı?, Mesaj)
+            str: Özet mesajı (``StopIteration.value``)
         """
+        if options is None:
+            options = {}
+        
+        self.last_dedup_report = None
+        
+        # Mevcut çıktının sonuna artımlı ekleme (yoksa normal birleştirme ile oluşturulur)
+        to_file = is_path(output_path)
+        if options.get("append") and to_file and os.path.exists(output_path):
+            return (yield from self._iter_append(file_paths, output_path, options,
+                                                 progress_callback, interrupt_check))
+        
+        start_time = time.perf_counter()
+        mode = options.get("mode", self.MERGE_MODE_SEQUENTIAL)
+        if mode not in (self.MERGE_MODE_SEQUENTIAL, self.MERGE_MODE_INTERLEAVE):
+            raise OperationError(f"Bilinmeyen birleştirme modu: {mode}")
+        
+        strategy = options.get("strategy", self.MERGE_STRATEGY_AUTO)
+        if strategy not in (self.MERGE_STRATEGY_AUTO, self.MERGE_STRATEGY_FLAT, self.MERGE_STRATEGY_TREE):
+            raise OperationError(f"Bilinmeyen birleştirme stratejisi: {strategy}")
+        
+        engine = get_engine(OP_MERGE, options.get("engine"), self.logger)
+        merger = None
+        temp_dir = None
         try:
             # Çıktı klasörünü kontrol et/oluştur
-            output_dir = os.path.dirname(output_path)
-            if not os.path.exists(output_dir):
+            output_dir = os.path.dirname(output_path) if to_file else None
+            if output_dir and not os.path.exists(output_dir):
                 os.makedirs(output_dir)
             
-            # PDF birleştirici oluştur
-            merger = PdfWriter()
-            total_files = len(file_paths)
-            
-            # Her dosyayı kontrol et ve birleştir
-            for i, file_path in enumerate(file_paths):
-                # İptal kontrolü
-                if interrupt_check and interrupt_check():
-                    return False, "İşlem kullanıcı tarafından iptal edildi.", []
+            reverse_inputs = set(options.get("reverse_inputs") or ())
+            
+            # Çok sayıda girdiyi önce gruplar halinde ara dosyalara indir (yalnızca dosyadan dosyaya)
+            on_disk = to_file and all(is_path(self._split_merge_input(m)[0]) for m in file_paths)
+            if mode == self.MERGE_MODE_SEQUENTIAL and file_paths and on_disk:
+                workers = max(1, int(options.get("workers") or os.cpu_count() or 1))
+                batch_size = options.get("batch_size") or self._auto_batch_size(file_paths, workers)
+                batch_size = max(_MIN_BATCH_SIZE, int(batch_size))
                 
-                try:
-                    # PDF kontrolü
-                    if not os.path.exists(file_path):
-                        raise FileNotFoundError(f"Dosya bulunamadı: {file_path}")
-                    
-                    # PDF'i aç ve sayfaları ekle
-                    pdf = PdfReader(file_path)
-                    if len(pdf.pages) == 0:
-                        raise ValueError(f"PDF dosyası boş: {file_path}")
-                    
-                    for page in pdf.pages:
-                        # İptal kontrolü
-                        if interrupt_check and interrupt_check():
-                            return False, "İşlem kullanıcı tarafından iptal edildi.", []
-                        
-                        merger.add_page(page)
+                if strategy != self.MERGE_STRATEGY_FLAT and len(file_paths) > batch_size:
+                    temp_dir = tempfile.mkdtemp(prefix=".birlestirme_", dir=output_dir or None)
+                    file_paths = self._reduce_in_batches(engine, file_paths, reverse_inputs, batch_size, workers,
+                                                         temp_dir, progress_callback, interrupt_check)
+                    if file_paths is None:
+                        raise OperationCancelled()
+                    reverse_inputs = set()
                     
-                    # İlerleme bildirimi
+                    # Son grup ilerlemenin kalan %10'unu oluşturur
                     if progress_callback:
-                        progress = int(((i + 1) / total_files) * 100)
-                        progress_callback(progress)
-                    
-                    if self.logger:
-                        self.logger.info(f"Dosya eklendi: {file_path}")
-                        
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Dosya işlenirken hata: {str(e)}")
-                    raise
+                        report_progress = progress_callback
+                        progress_callback = lambda value: report_progress(90 + value // 10)
             
-            # Birleştirilmiş PDF'i kaydet
-            with open(output_path, 'wb') as output_file:
-                merger.write(output_file)
+            # PDF birleştirici oluştur
+            merger = engine.new_document()
             
-            if self.logger:
-                self.logger.info(f"Birleştirme tamamlandı: {output_path}")
+            if mode == self.MERGE_MODE_SEQUENTIAL:
+                completed = self._merge_sequential(engine, merger, file_paths, reverse_inputs,
+                                                   progress_callback, interrupt_check)
+            else:
+                completed = self._merge_interleaved(engine, merger, file_paths, reverse_inputs,
+                                                    progress_callback, interrupt_check)
             
-            return True, "Birleştirme işlemi başarılı", [output_path]
+            if not completed:
+                raise OperationCancelled()
+            
+            message = "Birleştirme işlemi başarılı"
+            pages = engine.page_count(merger)
+            write_pdf = lambda stream: engine.write(merger, stream)
+            
+            # Birleştirilmiş PDF'i kaydet, ortak kaynakları tekilleştir
+            if to_file:
+                write_output(output_path, write_pdf, pages, start_time, self.MERGED_FILENAME)
+                if options.get("deduplicate"):
+                    self.last_dedup_report = deduplicate_resources(output_path, self.logger)
+                result = OperationResult.from_file(output_path, pages, start_time)
+            elif options.get("deduplicate"):
+                buffer = io.BytesIO()
+                write_pdf(buffer)
+                data, self.last_dedup_report = deduplicate_bytes(buffer.getvalue(), self.logger)
+                result = write_output(output_path, lambda stream: stream.write(data), pages,
+                                      start_time, self.MERGED_FILENAME)
+            else:
+                result = write_output(output_path, write_pdf, pages, start_time, self.MERGED_FILENAME)
             
-        except Exception as e:
-            error_msg = f"PDF birleştirme işlemi başarısız: {str(e)}"
             if self.logger:
-                self.logger.error(error_msg)
+                self.logger.debug("Birleştirme tamamlandı: %s", output_path if to_file else result.name)
+            
+            if self.last_dedup_report:
+                report = self.last_dedup_report
+                message += (f" (tekilleştirme: {report['duplicates']} kopya, "
+                            f"{report['bytes_saved'] / 1024:.1f} KB tasarruf, {report['elapsed']:.2f} sn)")
             
+        except OperationError:
+            raise
+        except Exception:
             # Hata durumunda çıktı dosyasını temizle
-            if os.path.exists(output_path):
+            if to_file and os.path.exists(output_path):
                 try:
                     os.remove(output_path)
                 except:
                     pass
+            raise
+        
+        finally:
+            if merger is not None:
+                engine.close(merger)
             
-            return False, error_msg, [] 
\ No newline at end of file
+            # Ara dosyaları temizle
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        yield result
+        return message
+    
+    def _iter_append(self,
+                     file_paths: List[MergeInput],
+                     output_path: str,
+                     options: Dict[str, Any],
+                     progress_callback: Optional[callable] = None,
+                     interrupt_check: Optional[callable] = None) -> ResultIterator:
+        """
+        Girdileri mevcut bir PDF'in sonuna artımlı güncelleme ile ekler.
+        
+        Hata veya iptal durumunda mevcut dosyaya dokunulmaz.
+        """
+        if options.get("mode", self.MERGE_MODE_SEQUENTIAL) != self.MERGE_MODE_SEQUENTIAL:
+            raise OperationError("Mevcut dosyaya ekleme yalnızca sıralı birleştirmede kullanılabilir.")
+        
+        start_time = time.perf_counter()
+        reverse_inputs = set(options.get("reverse_inputs") or ())
+        
+        try:
+            document = fitz.open(output_path)
+            try:
+                if not document.can_save_incrementally():
+                    raise ValueError(f"Dosya artımlı güncellemeye uygun değil: {output_path}")
+                
+                pages_before = document.page_count
+                for i, merge_input in enumerate(file_paths):
+                    # İptal kontrolü (kaydetmeden çıkılır, dosya değişmez)
+                    check_cancelled(interrupt_check)
+                    
+                    file_path, page_range = self._split_merge_input(merge_input)
+                    source = open_document(file_path)
+                    try:
+                        for page_range in self._selected_ranges(file_path, page_range, source.page_count,
+                                                                i in reverse_inputs):
+                            if abs(page_range.step) == 1:
+                                # Ardışık (veya ters ardışık) aralık tek çağrıda eklenir
+                                document.insert_pdf(source, from_page=page_range[0], to_page=page_range[-1])
+                            else:
+                                for page_idx in page_range:
+                                    document.insert_pdf(source, from_page=page_idx, to_page=page_idx)
+                    finally:
+                        source.close()
+                    
+                    # İlerleme bildirimi
+                    if progress_callback:
+                        progress_callback(int(((i + 1) / len(file_paths)) * 100))
+                    
+                    if self.logger:
+                        self.logger.debug("Dosya eklendi: %s", source_label(file_path))
+                
+                total_pages = document.page_count
+                pages_added = total_pages - pages_before
+                # Yalnızca yeni nesneler ve yeni xref bölümü dosyanın sonuna yazılır
+                with phase(PHASE_SERIALIZE):
+                    document.save(output_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            finally:
+                document.close()
+            
+            message = f"Ekleme işlemi başarılı ({pages_added} sayfa eklendi)"
+            
+            if options.get("compact"):
+                size_before = os.path.getsize(output_path)
+                self._compact(output_path)
+                message += f" (sıkıştırma: {(size_before - os.path.getsize(output_path)) / 1024:.1f} KB)"
+            
+            # Ortak kaynakları tekilleştir
+            if options.get("deduplicate"):
+                report = deduplicate_resources(output_path, self.logger)
+                self.last_dedup_report = report
+                message += (f" (tekilleştirme: {report['duplicates']} kopya, "
+                            f"{report['bytes_saved'] / 1024:.1f} KB tasarruf, {report['elapsed']:.2f} sn)")
+        
+        except OperationError:
+            raise
+        except Exception as e:
+            raise OperationError(f"PDF ekleme işlemi başarısız: {str(e)}") from e
+        
+        if self.logger:
+            self.logger.info(f"Ekleme tamamlandı: {output_path} (+{pages_added} sayfa)")
+        
+        yield OperationResult.from_file(output_path, total_pages, start_time)
+        return message
+    
+    def _compact(self, pdf_path: str):
+        """Artımlı güncellemeleri tek revizyona indirerek dosyayı baştan yazar."""
+        temp_path = pdf_path + ".compact.tmp"
+        document = fitz.open(pdf_path)
+        try:
+            # garbage=3: kullanılmayan ve yinelenen nesneleri at
+            with phase(PHASE_SERIALIZE):
+                document.save(temp_path, garbage=3, deflate=True)
+        finally:
+            document.close()
+        os.replace(temp_path, pdf_path)
+        
+        if self.logger:
+            self.logger.info(f"Dosya sıkıştırıldı: {pdf_path}")
+    
+    def _auto_batch_size(self, file_paths: List[MergeInput], workers: int) -> int:
+        """
+        Ağaç birleştirmede bir grupta kaç girdi olacağını belirler.
+        
+        Her işçi süreç grubundaki girdileri aynı anda açık tutar (girdi başına
+        bir tanıtıcı; PyPDF2 yolunda bellek eşlemesinin tuttuğu kopya). Grup
+        boyutu; süreç başına dosya tanıtıcısı sınırından (RLIMIT_NOFILE) şu an
+        açık olanlar, ayrılan pay ve ara çıktı dosyası düşüldükten sonra kalan
+        tanıtıcıları ve boş belleğin yarısının işçiler arasında paylaşımını
+        aşmayacak şekilde seçilir.
+        """
+        batch_size = _MAX_BATCH_SIZE
+        
+        # Dosya tanıtıcısı sınırı (Windows'ta resource modülü yok)
+        try:
+            import resource
+            soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft_limit != resource.RLIM_INFINITY:
+                free_handles = soft_limit - _open_file_handles() - _RESERVED_FILE_HANDLES - 1
+                batch_size = min(batch_size, free_handles // _FILE_HANDLES_PER_INPUT)
+        except (ImportError, ValueError, OSError):
+            pass
+        
+        # Boş bellek
+        try:
+            available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            available = 0
+        
+        if available > 0:
+            sample = file_paths[:100]
+            sizes = [os.path.getsize(path) for path, _ in map(self._split_merge_input, sample)
+                     if is_path(path) and os.path.exists(path)]
+            if sizes:
+                per_input = max(1, sum(sizes) // len(sizes)) * _MEMORY_PER_INPUT_FACTOR
+                batch_size = min(batch_size, (available // 2) // (per_input * workers))
+        
+        return max(_MIN_BATCH_SIZE, batch_size)
+    
+    def _reduce_in_batches(self, engine: PdfEngine, file_paths: List[MergeInput], reverse_inputs: set,
+                           batch_size: int,
+                           workers: int, temp_dir: str,
+                           progress_callback: Optional[callable] = None,
+                           interrupt_check: Optional[callable] = None) -> Optional[List[str]]:
+        """
+        Girdileri K'lık gruplar halinde paralel olarak ara dosyalara birleştirir.
+        
+        Ara dosya sayısı K'dan fazlaysa aynı işlem onlara da uygulanır. Sıra
+        korunur. İptal edilirse None döndürür.
+        
+        Returns:
+            Optional[List[str]]: Son seviyedeki ara dosyalar (en fazla K adet)
+        """
+        # Tüm seviyelerdeki toplam grup sayısı (ilerleme için)
+        total_batches, count = 0, len(file_paths)
+        while count > batch_size:
+            count = -(-count // batch_size)
+            total_batches += count
+        
+        level_inputs = [(merge_input, i in reverse_inputs) for i, merge_input in enumerate(file_paths)]
+        completed = 0
+        level = 0
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while len(level_inputs) > batch_size:
+                batches = [level_inputs[i:i + batch_size] for i in range(0, len(level_inputs), batch_size)]
+                futures = [
+                    executor.submit(_merge_batch, batch,
+                                    os.path.join(temp_dir, f"seviye{level}_{index:06d}.pdf"), engine.name)
+                    for index, batch in enumerate(batches)
+                ]
+                
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()  # İşçideki hatayı yeniden fırlat
+                    completed += len(done)
+                    
+                    if interrupt_check and interrupt_check():
+                        for future in pending:
+                            future.cancel()
+                        return None
+                    
+                    if progress_callback and done:
+                        progress_callback(int((completed / total_batches) * 90))
+                
+                if self.logger:
+                    self.logger.info(f"Ağaç birleştirme seviye {level}: {len(level_inputs)} girdi "
+                                     f"-> {len(batches)} ara dosya")
+                
+                level_inputs = [(future.result(), False) for future in futures]
+                level += 1
+        
+        return [path for path, _ in level_inputs]
+    
+    def _split_merge_input(self, merge_input: MergeInput) -> Tuple[PdfSource, Optional[str]]:
+        """Girdiyi (dosya yolu/bellekteki PDF, sayfa ifadesi) çiftine ayırır."""
+        if isinstance(merge_input, (tuple, list)):
+            file_path, page_range = merge_input
+            return file_path, (page_range or "").strip() or None
+        return merge_input, None
+    
+    def _selected_ranges(self, file_path: PdfSource, page_range: Optional[str], total_pages: int,
+                         reverse: bool = False) -> List[range]:
+        """
+        Girdiden eklenecek sayfaları sırayla kapsayan 0 tabanlı ``range`` listesini döndürür.
+        
+        ``reverse`` verilirse seçimin tamamı tersten okunur (range'ler listeye açılmadan).
+        """
+        if total_pages == 0:
+            raise ValueError(f"PDF dosyası boş: {source_label(file_path)}")
+        
+        if page_range:
+            try:
+                page_ranges = parse_page_selection(page_range, total_pages)
+            except PageRangeError as e:
+                raise ValueError(f"{os.path.basename(source_label(file_path))} için geçersiz sayfa aralığı: {str(e)}")
+        else:
+            page_ranges = [range(total_pages)]
+        
+        if reverse:
+            return [r[::-1] for r in reversed(page_ranges)]
+        return page_ranges
+    
+    def _open_input(self, engine: PdfEngine, merge_input: MergeInput, reverse: bool = False):
+        """
+        Girdiyi motorla açar ve eklenecek 0 tabanlı sayfa aralıklarıyla birlikte döndürür.
+        
+        Returns:
+            Tuple[PdfSource, Any, List[range]]: (Girdi, Motorun belgesi, Sayfa aralıkları)
+        """
+        file_path, page_range = self._split_merge_input(merge_input)
+        pdf = engine.open(file_path)
+        try:
+            page_ranges = self._selected_ranges(file_path, page_range, engine.page_count(pdf), reverse)
+        except Exception:
+            engine.close(pdf)
+            raise
+        return file_path, pdf, page_ranges
+    
+    def _merge_sequential(self, engine: PdfEngine, merger, file_paths: List[MergeInput], reverse_inputs: set,
+                          progress_callback: Optional[callable] = None,
+                          interrupt_check: Optional[callable] = None) -> bool:
+        """Girdileri art arda ekler; iptal edilirse False döndürür."""
+        total_files = len(file_paths)
+        
+        # Her dosyayı kontrol et ve birleştir
+        for i, merge_input in enumerate(file_paths):
+            # İptal kontrolü
+            if interrupt_check and interrupt_check():
+                return False
+            
+            try:
+                # PDF'i aç ve sayfaları aralık aralık ekle
+                file_path, pdf, page_ranges = self._open_input(engine, merge_input, i in reverse_inputs)
+                try:
+                    for page_range in page_ranges:
+                        # İptal kontrolü
+                        if interrupt_check and interrupt_check():
+                            return False
+                        
+                        engine.copy_pages(merger, pdf, page_range)
+                finally:
+                    engine.close(pdf)
+                
+                # İlerleme bildirimi
+                if progress_callback:
+                    progress = int(((i + 1) / total_files) * 100)
+                    progress_callback(progress)
+                
+                if self.logger:
+                    self.logger.debug("Dosya eklendi: %s", source_label(file_path))
+                    
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Dosya işlenirken hata: {str(e)}")
+                raise
+        
+        return True
+    
+    def _merge_interleaved(self, engine: PdfEngine, merger, file_paths: List[MergeInput], reverse_inputs: set,
+                           progress_callback: Optional[callable] = None,
+                           interrupt_check: Optional[callable] = None) -> bool:
+        """Girdilerden sırayla birer sayfa alarak tek geçişte harmanlar; iptal edilirse False döndürür."""
+        inputs = []
+        try:
+            for i, merge_input in enumerate(file_paths):
+                inputs.append(self._open_input(engine, merge_input, i in reverse_inputs))
+            
+            total_pages = sum(engine.page_count(pdf) for _, pdf, _ in inputs)
+            missing = object()
+            added = 0
+            
+            # Her turda her girdiden bir sayfa; biten girdiler atlanır
+            rows = zip_longest(*(chain.from_iterable(page_ranges) for _, _, page_ranges in inputs),
+                               fillvalue=missing)
+            for row in rows:
+                for (_, pdf, _), page_idx in zip(inputs, row):
+                    if page_idx is missing:
+                        continue
+                    
+                    # İptal kontrolü
+                    if interrupt_check and interrupt_check():
+                        return False
+                    
+                    engine.copy_pages(merger, pdf, (page_idx,))
+                    added += 1
+                
+                # İlerleme bildirimi (sayfa seçimi varsa yaklaşık)
+                if progress_callback and total_pages:
+                    progress_callback(min(99, int((added / total_pages) * 100)))
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Dosya işlenirken hata: {str(e)}")
+            raise
+        finally:
+            for _, pdf, _ in inputs:
+                engine.close(pdf)
+        
+        if progress_callback:
+            progress_callback(100)
+        
+        if self.logger:
+            self.logger.info(f"Dosyalar harmanlandı: {len(inputs)} girdi, {added} sayfa")
+        
+        return True
@@ -0,0 +1,256 @@
+"""
+İş başına ölçüm kaydı: aşama süreleri, sayfa ve bayt sayıları, bellek artışı.
+
+Core sınıfları ölçümü parametre olarak almaz; ``collect_metrics`` ile
+başlatılan iş, o iş parçacığının bağlamına (``contextvars``) yerleşir ve
+ortak noktalar (belge açma, motor işlemleri, çıktı yazma) ``phase`` ile
+kendi sürelerini etkin kayda ekler. Etkin kayıt yoksa bu çağrılar hiçbir
+şey yapmaz.
+
+Aşamalar:
+    open       Girdinin açılması ve xref'in okunması
+    parse      Sayfa ağacının çözülmesi (sayfa sayısı)
+    copy       Sayfaların hedef belgeye kopyalanması
+    serialize  Hedef belgenin PDF baytlarına dönüştürülmesi
+    write      Çıktının diske/akışa yazılması (serileştirme hariç)
+
+İç içe aşamalarda dıştaki aşamaya yalnızca kendi süresi yazılır. Hiçbir
+aşamaya girmeyen süre (ilerleme bildirimi, metin çıkarma, işçi süreçlerde
+geçen süre) ``other`` olarak raporlanır; işçi süreçlerin aşamaları
+kaydedilmez.
+
+Bellek: iş süresince arka plandaki bir iş parçacığı sürecin RSS'ini örnekler
+ve iş başındaki değerin en fazla ne kadar üstüne çıkıldığı raporlanır
+(``peak_rss_delta_mb``). Arayüzün ve belge havuzunun işten önce tuttuğu
+bellek sayılmaz; aynı anda çalışan işlerin artışları ise birbirine karışır.
+Sürecin en yüksek RSS kaydı (VmHWM) sıfırlanmaz, diğer işleri etkilemez.
+"""
+import contextvars
+import datetime
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+PHASE_OPEN = "open"
+PHASE_PARSE = "parse"
+PHASE_COPY = "copy"
+PHASE_SERIALIZE = "serialize"
+PHASE_WRITE = "write"
+PHASE_OTHER = "other"
+
+PHASES = (PHASE_OPEN, PHASE_PARSE, PHASE_COPY, PHASE_SERIALIZE, PHASE_WRITE)
+
+_current: contextvars.ContextVar = contextvars.ContextVar("marnak_job_metrics", default=None)
+
+# İş süresince RSS örnekleme aralığı (sn)
+RSS_SAMPLE_INTERVAL_S = 0.01
+
+
+def read_memory() -> Dict[str, float]:
+    """Sürecin anlık bellek değerleri (MB): rss, anon, file, hwm. /proc olmayan sistemde boş."""
+    values = {}
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssFile", "VmHWM"):
+                    values[key] = int(value.split()[0]) / 1024
+    except OSError:
+        return {}
+    return {"rss": values.get("VmRSS"), "anon": values.get("RssAnon"),
+            "file": values.get("RssFile"), "hwm": values.get("VmHWM")}
+
+
+class _RssSampler:
+    """İş süresince sürecin RSS'ini arka plandaki bir iş parçacığında örnekler."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.start_mb = read_memory().get("rss")
+        self.peak_mb = self.start_mb
+        self._stop = threading.Event()
+        self._thread = None
+        if self.start_mb is not None:
+            self._thread = threading.Thread(target=self._run, name="JobRssSampler", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        rss = read_memory().get("rss")
+        if rss is not None and rss > self.peak_mb:
+            self.peak_mb = rss
+
+    def stop(self) -> Optional[float]:
+        """Örneklemeyi durdurur; iş başından beri RSS'in en fazla artışı (MB), ölçülemiyorsa None."""
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        return max(0.0, self.peak_mb - self.start_mb)
+
+
+@dataclass
+class JobMetrics:
+    """Tek bir işin ölçüm kaydı."""
+
+    operation: str
+    started_at: str = ""  # ISO 8601 başlangıç zamanı
+    wall_s: float = 0.0
+    success: Optional[bool] = None
+    message: str = ""
+    pages: int = 0  # Üretilen (metin çıkarmada okunan) sayfa sayısı
+    files_in: int = 0
+    bytes_in: int = 0
+    files_out: int = 0
+    bytes_out: int = 0
+    peak_rss_delta_mb: Optional[float] = None  # İş sırasında RSS'in iş başındaki değerden en fazla artışı
+    phases: Dict[str, float] = field(default_factory=dict)
+    last_output: str = ""  # Son üretilen dosya (ilerleme bildirimi için; kayda yazılmaz)
+    input_paths: List[str] = field(default_factory=list, repr=False)  # Diskteki girdiler (profil için; kayda yazılmaz)
+    output_files: List[str] = field(default_factory=list, repr=False)  # Kayda (to_dict) yazılmaz
+    _stack: List[list] = field(default_factory=list, repr=False)
+
+    @property
+    def pages_per_s(self) -> Optional[float]:
+        return self.pages / self.wall_s if self.wall_s > 0 else None
+
+    def add_inputs(self, inputs: Iterable):
+        """Girdileri (yol, (yol, sayfa ifadesi) ya da bellekteki içerik) okunan bayt olarak ekler."""
+        for source in inputs:
+            if isinstance(source, tuple):
+                source = source[0]
+            self.files_in += 1
+            if isinstance(source, (str, os.PathLike)):
+                self.input_paths.append(os.fspath(source))
+                try:
+                    self.bytes_in += os.path.getsize(source)
+                except OSError:
+                    pass
+            elif isinstance(source, (bytes, bytearray, memoryview)):
+                self.bytes_in += len(source)
+
+    def add_phase(self, name: str, elapsed: float):
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def record_output(self, result):
+        """Üretilen bir dosyayı (``OperationResult``) kayda ekler."""
+        self.files_out += 1
+        self.pages += result.pages
+        self.bytes_out += result.bytes
+        self.last_output = result.path or result.name
+
+    def finish(self, success: bool, message: str, output_files: Iterable[str] = ()):
+        """
+        İşin sonucunu yazar.
+
+        Çıktıları tek tek bildirmeyen işlemler (optimize, metin) için dosya
+        sayısı ve boyutu ``output_files`` listesinden hesaplanır.
+        """
+        self.success = success
+        self.message = message
+        self.output_files = list(output_files)
+        if not self.files_out:
+            existing = [path for path in output_files if path and os.path.isfile(path)]
+            self.files_out = len(existing)
+            self.bytes_out = sum(os.path.getsize(path) for path in existing)
+
+    def to_dict(self) -> dict:
+        """JSON'a yazılabilir kayıt."""
+        phases = {name: round(self.phases.get(name, 0.0), 4) for name in PHASES}
+        phases[PHASE_OTHER] = round(max(0.0, self.wall_s - sum(self.phases.values())), 4)
+        pages_per_s = self.pages_per_s
+        return {
+            "operation": self.operation,
+            "started_at": self.started_at,
+            "success": self.success,
+            "message": self.message,
+            "wall_s": round(self.wall_s, 4),
+            "pages": self.pages,
+            "pages_per_s": None if pages_per_s is None else round(pages_per_s, 1),
+            "files_in": self.files_in,
+            "bytes_in": self.bytes_in,
+            "files_out": self.files_out,
+            "bytes_out": self.bytes_out,
+            "peak_rss_delta_mb": None if self.peak_rss_delta_mb is None else round(self.peak_rss_delta_mb, 1),
+            "phases": phases,
+        }
+
+
+def current_metrics() -> Optional[JobMetrics]:
+    """Bu bağlamda etkin ölçüm kaydı (yoksa None)."""
+    return _current.get()
+
+
+@contextmanager
+def collect_metrics(operation: str, inputs: Iterable = ()):
+    """
+    Bir işi ölçer; blok içindeki core çağrıları kayda yazar.
+
+    Args:
+        operation: İşlem adı (merge, split, ...)
+        inputs: Girdiler (yol, (yol, sayfa ifadesi) ya da bellekteki içerik); okunan bayt için
+
+    Yields:
+        JobMetrics: Blok bitince ``wall_s`` ve ``peak_rss_delta_mb`` dolan kayıt
+    """
+    metrics = JobMetrics(operation, started_at=datetime.datetime.now().isoformat(timespec="seconds"))
+    metrics.add_inputs(inputs)
+
+    sampler = _RssSampler()
+    token = _current.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_s = time.perf_counter() - start
+        _current.reset(token)
+        metrics.peak_rss_delta_mb = sampler.stop()
+
+
+@contextmanager
+def phase(name: str):
+    """Bloğun süresini etkin kayıtta ``name`` aşamasına ekler (etkin kayıt yoksa etkisiz)."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    frame = [time.perf_counter(), 0.0]  # [başlangıç, iç aşamaların süresi]
+    metrics._stack.append(frame)
+    try:
+        yield
+    finally:
+        metrics._stack.pop()
+        elapsed = time.perf_counter() - frame[0]
+        metrics.add_phase(name, elapsed - frame[1])
+        if metrics._stack:
+            metrics._stack[-1][1] += elapsed
+
+
+def record_output(result):
+    """Üretilen dosyayı etkin kayda ekler."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.record_output(result)
+
+
+def add_pages(count: int):
+    """Çıktı dosyası üretmeyen işlemlerin (metin çıkarma) işlediği sayfaları ekler."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.pages += count
+
+
+def append_metrics_log(record: dict, path: str):
+    """Kaydı (``JobMetrics.to_dict``) JSONL ölçüm günlüğünün sonuna ekler; dosya yalnızca büyür."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Tek write çağrısı: aynı günlüğe yazan süreçlerin satırları birbirine karışmaz
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -0,0 +1,286 @@
+"""
+Taranmış (görüntü ağırlıklı) PDF dosyalarını küçültme işlemlerini gerçekleştiren modül.
+"""
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Dict, Any
+import fitz # PyMuPDF
+from .pdf_io import (PdfSource, OutputTarget, is_path, check_source, source_label, source_name,
+                     read_source, open_document)
+from .metrics import phase, add_pages, PHASE_SERIALIZE
+
+
+def _recompress_image(image_bytes: bytes, stored_size: int, scale: float,
+                      jpeg_quality: int, grayscale: bool) -> Optional[bytes]:
+    """
+    Bir görüntüyü küçültür ve JPEG olarak yeniden sıkıştırır.
+
+    İşçi süreçte çalışır; sonuç PDF'te saklanan (sıkıştırılmış) akıştan
+    küçük değilse None döndürür.
+    """
+    pix = fitz.Pixmap(image_bytes)
+
+    # JPEG yalnızca gri ve RGB destekler
+    if grayscale and pix.n - pix.alpha > 1:
+        pix = fitz.Pixmap(fitz.csGRAY, pix)
+    elif pix.colorspace is not None and pix.colorspace.n not in (1, 3):
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+
+    if scale < 1.0:
+        width = max(1, int(pix.width * scale))
+        height = max(1, int(pix.height * scale))
+        pix = fitz.Pixmap(pix, width, height, None)
+
+    data = pix.tobytes("jpg", jpg_quality=jpeg_quality)
+    if len(data) >= stored_size:
+        return None
+    return data
+
+
+class PdfOptimizer:
+    """PDF dosyalarındaki görüntüleri küçülterek dosya boyutunu azaltan sınıf."""
+
+    DEFAULT_TARGET_DPI = 150
+    DEFAULT_JPEG_QUALITY = 75
+
+    def __init__(self, logger=None):
+        """
+        Args:
+            logger: Loglama nesnesi (opsiyonel)
+        """
+        self.logger = logger
+        # Son çalıştırmanın dosya başına raporları
+        self.last_reports: List[Dict[str, Any]] = []
+
+    def optimize_pdfs(self,
+                      file_paths: List[PdfSource],
+                      output_dir,
+                      options: Optional[Dict[str, Any]] = None,
+                      progress_callback: Optional[callable] = None,
+                      interrupt_check: Optional[callable] = None) -> Tuple[bool, str, List[str]]:
+        """
+        PDF dosyalarındaki yüksek çözünürlüklü görüntüleri küçültür ve yeniden sıkıştırır.
+
+        Hedef DPI'ın üzerindeki görüntüler küçültülür, JPEG (isteğe bağlı gri tonlama)
+        olarak yeniden sıkıştırılır ve kullanılmayan nesneler atılır. Görüntüler işçi
+        süreçlerde paralel işlenir. Küçültülecek görüntüsü olmayan ya da küçülmeyen
+        dosyalar atlanır. Dosya başına rapor ``last_reports`` içinde saklanır.
+
+        Girdiler bellekteki PDF içerikleri (``bytes``, ``memoryview``, ikili dosya
+        nesnesi) de olabilir. ``output_dir`` None ise optimize edilen dosyalar
+        bellekte üretilir ve raporun ``data`` alanında döner; dosya adı alıp
+        yazılabilir akış döndüren bir fonksiyon verilirse o akışa yazılır.
+
+        Args:
+            file_paths: Optimize edilecek PDF dosyaları (yol veya bellekteki içerik)
+            output_dir: Çıktı klasörü, None (bellek) ya da akış fabrikası
+            options: Seçenekler (target_dpi, jpeg_quality, grayscale, workers)
+            progress_callback: İlerleme durumunu bildiren fonksiyon
+            interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
+
+        Returns:
+            Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Oluşturulan dosyalar)
+        """
+        if options is None:
+            options = {}
+
+        target_dpi = options.get("target_dpi") or self.DEFAULT_TARGET_DPI
+        jpeg_quality = options.get("jpeg_quality") or self.DEFAULT_JPEG_QUALITY
+        grayscale = bool(options.get("grayscale", False))
+        workers = options.get("workers") or os.cpu_count() or 1
+
+        self.last_reports = []
+        output_files = []
+
+        if not file_paths:
+            return False, "Optimize edilecek dosya bulunamadı.", []
+
+        try:
+            target = OutputTarget(output_dir)
+            target.prepare()
+
+            with ProcessPoolExecutor(max_workers=max(1, int(workers))) as executor:
+                for i, file_path in enumerate(file_paths):
+                    if interrupt_check and interrupt_check():
+                        return False, "İşlem kullanıcı tarafından iptal edildi.", output_files
+
+                    check_source(file_path)
+
+                    report = self._optimize_file(file_path, target, target_dpi, jpeg_quality,
+                                                 grayscale, executor, workers)
+                    self.last_reports.append(report)
+                    if report["output"] and target.directory:
+                        output_files.append(report["output"])
+
+                    if progress_callback:
+                        progress = int(((i + 1) / len(file_paths)) * 100)
+                        progress_callback(progress)
+
+                    if self.logger:
+                        if report["skipped"]:
+                            self.logger.debug("Dosya zaten optimize, atlandı: %s", source_label(file_path))
+                        else:
+                            self.logger.debug("Dosya optimize edildi: %s (%%%.1f küçülme, %.2f MB/sn)",
+                                              report['output'], report['reduction_percent'],
+                                              report['throughput_mb_s'])
+
+            skipped = sum(1 for r in self.last_reports if r["skipped"])
+            saved = sum(r["original_size"] - r["optimized_size"] for r in self.last_reports)
+            message = (f"Optimizasyon tamamlandı. {len(output_files)} dosya optimize edildi, "
+                       f"{skipped} dosya atlandı. Toplam kazanç: {saved / (1024 * 1024):.2f} MB")
+            if self.logger:
+                self.logger.info(message)
+            return True, message, output_files
+
+        except Exception as e:
+            error_msg = f"PDF optimizasyon işlemi başarısız: {str(e)}"
+            if self.logger:
+                self.logger.error(error_msg)
+
+            # Hata durumunda oluşturulan dosyaları temizle
+            self._cleanup_files(output_files)
+            return False, error_msg, []
+
+    def _optimize_file(self, file_path: PdfSource, target: OutputTarget, target_dpi: float,
+                       jpeg_quality: int, grayscale: bool, executor: ProcessPoolExecutor, workers: int) -> Dict[str, Any]:
+        """Tek bir dosyayı optimize eder ve raporunu döndürür."""
+        start_time = time.perf_counter()
+        if is_path(file_path):
+            source = file_path
+            original_size = os.path.getsize(file_path)
+        else:
+            source = read_source(file_path)
+            original_size = memoryview(source).nbytes
+        report = {
+            "file": source_label(file_path),
+            "output": None,
+            "data": None,
+            "original_size": original_size,
+            "optimized_size": original_size,
+            "reduction_percent": 0.0,
+            "images_total": 0,
+            "images_recompressed": 0,
+            "skipped": True,
+            "elapsed": 0.0,
+            "throughput_mb_s": 0.0
+        }
+
+        document = open_document(source)
+        try:
+            report["images_total"], candidates = self._find_candidates(document, target_dpi, grayscale)
+
+            if candidates:
+                # Bellekte aynı anda en fazla ``window`` görüntü bekler
+                window = max(2, int(workers) * 2)
+                pending = deque()
+                for xref, (page_index, scale) in candidates.items():
+                    image_bytes = document.extract_image(xref)["image"]
+                    stored_size = len(document.xref_stream_raw(xref))
+                    future = executor.submit(_recompress_image, image_bytes, stored_size,
+                                             scale, jpeg_quality, grayscale)
+                    pending.append((xref, page_index, future))
+                    if len(pending) >= window:
+                        report["images_recompressed"] += self._apply_result(document, *pending.popleft())
+                while pending:
+                    report["images_recompressed"] += self._apply_result(document, *pending.popleft())
+
+            if report["images_recompressed"] and target.directory:
+                output_path = target.unique_path(f"{source_name(file_path)}_optimize")
+                # garbage=3: kullanılmayan ve yinelenen nesneleri at
+                with phase(PHASE_SERIALIZE):
+                    document.save(output_path, garbage=3, deflate=True)
+                optimized_size = os.path.getsize(output_path)
+
+                if optimized_size < original_size:
+                    report["output"] = output_path
+                    report["optimized_size"] = optimized_size
+                    report["reduction_percent"] = (1 - optimized_size / original_size) * 100
+                    report["skipped"] = False
+                    add_pages(document.page_count)
+                else:
+                    # Kazanç yoksa çıktıyı tutma
+                    os.remove(output_path)
+            elif report["images_recompressed"]:
+                # Bellek/akış hedefi: geçici dosya yerine bayt olarak üret
+                with phase(PHASE_SERIALIZE):
+                    data = document.tobytes(garbage=3, deflate=True)
+                if len(data) < original_size:
+                    result = target.write(f"{source_name(file_path)}_optimize",
+                                          lambda stream: stream.write(data), document.page_count, start_time)
+                    report["output"] = result.path or result.name
+                    report["data"] = result.data
+                    report["optimized_size"] = len(data)
+                    add_pages(document.page_count)
+                    report["reduction_percent"] = (1 - len(data) / original_size) * 100
+                    report["skipped"] = False
+        finally:
+            document.close()
+
+        report["elapsed"] = time.perf_counter() - start_time
+        if report["elapsed"] > 0:
+            report["throughput_mb_s"] = original_size / (1024 * 1024) / report["elapsed"]
+        return report
+
+    def _find_candidates(self, document, target_dpi: float,
+                         grayscale: bool) -> Tuple[int, Dict[int, Tuple[int, float]]]:
+        """
+        Yeniden sıkıştırılacak görüntüleri bulur.
+
+        Bir görüntü birden fazla yerde kullanılabilir; küçültme oranı en büyük
+        yerleşime (en düşük etkin DPI'a) göre belirlenir.
+
+        Returns:
+            Tuple[int, Dict[int, Tuple[int, float]]]: (Toplam görüntü sayısı,
+            xref -> (ilk kullanıldığı sayfa, küçültme oranı))
+        """
+        min_dpi: Dict[int, float] = {}
+        first_page: Dict[int, int] = {}
+
+        for page_index in range(document.page_count):
+            page = document.load_page(page_index)
+            for info in page.get_image_info(xrefs=True):
+                xref = info.get("xref", 0)
+                if not xref:
+                    continue  # Satır içi görüntüler değiştirilemez
+                bbox = fitz.Rect(info["bbox"])
+                if bbox.is_empty or bbox.width <= 0 or bbox.height <= 0:
+                    continue
+                dpi = min(info["width"] / (bbox.width / 72), info["height"] / (bbox.height / 72))
+                min_dpi[xref] = min(min_dpi.get(xref, dpi), dpi)
+                first_page.setdefault(xref, page_index)
+
+        candidates: Dict[int, Tuple[int, float]] = {}
+        for xref, dpi in min_dpi.items():
+            # Saydamlık maskesi olan ve 1 bitlik (siyah-beyaz) görüntüler JPEG'e uygun değil
+            if document.xref_get_key(xref, "SMask")[0] != "null":
+                continue
+            if document.xref_get_key(xref, "ImageMask")[1] == "true":
+                continue
+            bpc_type, bpc = document.xref_get_key(xref, "BitsPerComponent")
+            if bpc_type == "int" and int(bpc) < 8:
+                continue
+            colorspace = document.xref_get_key(xref, "ColorSpace")[1]
+            needs_gray = grayscale and colorspace not in ("/DeviceGray", "/CalGray")
+            scale = target_dpi / dpi if dpi > target_dpi else 1.0
+            if scale < 1.0 or needs_gray:
+                candidates[xref] = (first_page[xref], scale)
+        return len(min_dpi), candidates
+
+    def _apply_result(self, document, xref: int, page_index: int, future) -> int:
+        """İşçi sonucunu belgeye uygular; görüntü değiştiyse 1 döndürür."""
+        data = future.result()
+        if data is None:
+            return 0
+        document.load_page(page_index).replace_image(xref, stream=data)
+        return 1
+
+    def _cleanup_files(self, file_paths: List[str]):
+        """Oluşturulan dosyaları temizler."""
+        for path in file_paths:
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except:
+                pass
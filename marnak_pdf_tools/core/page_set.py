@@ -0,0 +1,87 @@
+"""
+Sayfa aralıklarını sıkıştırılmış biçimde tutan küme türü.
+"""
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+
+class PageSet:
+    """
+    Sıralı ve birleştirilmiş aralıklardan oluşan sayfa kümesi.
+
+    Sayfalar 0 tabanlıdır ve her aralık yarı açık ``[başlangıç, bitiş)`` olarak
+    saklanır. "1-200000" gibi bir seçim tek bir aralık olarak tutulur; sayfalar
+    yalnızca üzerinde yinelenirken tek tek üretilir. Üyelik kontrolü ikili
+    arama ile O(log n) zamanda yapılır (n: aralık sayısı).
+    """
+
+    __slots__ = ("_starts", "_stops")
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()):
+        """
+        Args:
+            intervals: Yarı açık (başlangıç, bitiş) aralıkları; sırasız ve
+                çakışan olabilir, boş aralıklar yok sayılır.
+        """
+        starts: List[int] = []
+        stops: List[int] = []
+        for start, stop in sorted(iv for iv in intervals if iv[0] < iv[1]):
+            # Çakışan veya bitişik aralıkları birleştir
+            if stops and start <= stops[-1]:
+                if stop > stops[-1]:
+                    stops[-1] = stop
+            else:
+                starts.append(start)
+                stops.append(stop)
+        self._starts = starts
+        self._stops = stops
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[range]) -> "PageSet":
+        """
+        ``range`` nesnelerinden küme oluşturur.
+
+        Adımı 1 olan aralıklar tek parça olarak eklenir; diğer adımlar
+        sayfa sayfa eklenir (ardışık olmadıkları için birleşemezler).
+        """
+        intervals = []
+        for page_range in ranges:
+            if not page_range:
+                continue
+            if abs(page_range.step) == 1:
+                low, high = min(page_range[0], page_range[-1]), max(page_range[0], page_range[-1])
+                intervals.append((low, high + 1))
+            else:
+                intervals.extend((page, page + 1) for page in page_range)
+        return cls(intervals)
+
+    def intervals(self) -> List[Tuple[int, int]]:
+        """Birleştirilmiş yarı açık aralıkları döndürür."""
+        return list(zip(self._starts, self._stops))
+
+    def ranges(self) -> Iterator[range]:
+        """Her aralığı bir ``range`` nesnesi olarak döndürür."""
+        for start, stop in zip(self._starts, self._stops):
+            yield range(start, stop)
+
+    def __contains__(self, page: int) -> bool:
+        index = bisect_right(self._starts, page) - 1
+        return index >= 0 and page < self._stops[index]
+
+    def __iter__(self) -> Iterator[int]:
+        for start, stop in zip(self._starts, self._stops):
+            yield from range(start, stop)
+
+    def __len__(self) -> int:
+        return sum(stop - start for start, stop in zip(self._starts, self._stops))
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PageSet):
+            return NotImplemented
+        return self._starts == other._starts and self._stops == other._stops
+
+    def __repr__(self) -> str:
+        return f"PageSet({self.intervals()!r})"
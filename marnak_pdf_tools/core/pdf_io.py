@@ -0,0 +1,254 @@
+"""
+Core işlemlerinin girdi ve çıktılarını dosya yolu, bellek ve akış arasında soyutlayan modül.
+
+Girdiler (``PdfSource``) dosya yolu, ``bytes``/``bytearray``/``memoryview``
+ya da okunabilir ikili dosya nesnesi olabilir. Çıktılar diske, belleğe
+(sonucun ``data`` alanı) veya çağıranın verdiği yazılabilir akışa yazılır;
+bellek ve akış hedeflerinde hiçbir geçici dosya oluşturulmaz.
+
+Diskteki girdiler PyPDF2'ye ``mmap`` ile eşlenerek verilir: okuyucu dosyanın
+özel bir kopyasını belleğe almaz, sayfalar gerektikçe işletim sisteminin
+sayfa önbelleğinden okunur ve aynı dosyayı açan işçi süreçler bu sayfaları
+paylaşır. PyMuPDF yol ile açılan dosyaları zaten talep üzerine okuduğundan
+yol ile açılır.
+"""
+import io
+import os
+import mmap
+import time
+from typing import Union, BinaryIO, Callable, Optional, Set
+from PyPDF2 import PdfReader
+import fitz # PyMuPDF
+from .results import OperationResult, OperationError
+from .metrics import phase, PHASE_OPEN, PHASE_WRITE
+
+# İşlem girdisi: dosya yolu, bellekteki PDF içeriği ya da okunabilir ikili akış
+PdfSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+# Bellekteki girdiler için varsayılan dosya adı kökü
+DEFAULT_SOURCE_NAME = "belge"
+
+# Diskteki girdiler PyPDF2 için belleğe eşlensin mi? Windows'ta eşlenmiş
+# dosyalar silinemediği ve üzerine yazılamadığı için kapalıdır.
+MMAP_INPUTS = os.name != "nt"
+
+
+def is_path(source) -> bool:
+    """Girdi/çıktı bir dosya sistemi yolu mu?"""
+    return isinstance(source, (str, os.PathLike))
+
+
+def is_in_memory(source) -> bool:
+    """Girdi bellekteki bir PDF içeriği ya da okunabilir akış mı?"""
+    return isinstance(source, (bytes, bytearray, memoryview)) or hasattr(source, "read")
+
+
+def check_source(source: PdfSource):
+    """Girdiyi doğrular; yol yoksa ``FileNotFoundError``, tür geçersizse ``TypeError`` fırlatır."""
+    if is_path(source):
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Dosya bulunamadı: {os.fspath(source)}")
+    elif not is_in_memory(source):
+        raise TypeError(f"Geçersiz PDF girdisi: {type(source)}")
+
+
+def source_label(source: PdfSource) -> str:
+    """Mesaj ve loglarda girdiyi tanıtan metin (yol ya da bellek boyutu)."""
+    if is_path(source):
+        return os.fspath(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return name
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return f"<bellek: {memoryview(source).nbytes} bayt>"
+    return "<akış>"
+
+
+def source_name(source: PdfSource) -> str:
+    """Çıktı dosya adlarında kullanılacak, uzantısız girdi adı."""
+    name = os.fspath(source) if is_path(source) else getattr(source, "name", None)
+    if not isinstance(name, str) or not name:
+        return DEFAULT_SOURCE_NAME
+    return os.path.splitext(os.path.basename(name))[0] or DEFAULT_SOURCE_NAME
+
+
+def read_source(source: PdfSource) -> Union[bytes, bytearray, memoryview]:
+    """Girdinin içeriğini döndürür; bellekteki içerik kopyalanmaz, akışlar bulunduğu konumdan okunur."""
+    check_source(source)
+    if is_path(source):
+        with open(source, "rb") as f:
+            return f.read()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return source
+    return source.read()
+
+
+def map_file(path) -> Optional[mmap.mmap]:
+    """
+    Dosyayı salt okunur olarak belleğe eşler.
+
+    ``open`` ile alınan tanıtıcı hemen kapatılır, ancak ``mmap`` onun bir
+    kopyasını (dup) alır: her eşleme, kapatılana ya da son referansı
+    bırakılana kadar bir dosya tanıtıcısı tutar. PyPDF2 okuyucusu eşlemeyi,
+    okuyucuya da sayfalarını kopyalayan yazıcı ve okuyucunun kendi döngüsel
+    referansları bağlı kalır; tanıtıcı çoğu zaman çöp toplayıcı çalışınca
+    bırakılır. Eşlenemeyen dosyalarda (boş dosya, desteklemeyen dosya
+    sistemi) None döndürür.
+    """
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return None
+
+
+def open_reader(source: PdfSource) -> PdfReader:
+    """Girdiyi PyPDF2 ile açar; diskteki dosyalar kopyalanmadan belleğe eşlenir."""
+    check_source(source)
+    with phase(PHASE_OPEN):
+        if is_path(source):
+            mapped = map_file(source) if MMAP_INPUTS else None
+            return PdfReader(mapped if mapped is not None else source)
+        if hasattr(source, "read") and hasattr(source, "seek") and source.seekable():
+            return PdfReader(source)
+        return PdfReader(io.BytesIO(read_source(source)))
+
+
+def open_document(source: PdfSource) -> fitz.Document:
+    """Girdiyi PyMuPDF ile açar."""
+    check_source(source)
+    with phase(PHASE_OPEN):
+        if is_path(source):
+            return fitz.open(source)
+        return fitz.open(stream=read_source(source), filetype="pdf")
+
+
+class _CountingWriter:
+    """
+    Çağıranın akışına yazarken yazılan bayt sayısını tutar.
+
+    ``tell`` PDF'in başından itibaren konumu döndürür; böylece akışta önceden
+    veri olsa da xref ofsetleri doğru hesaplanır.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, data) -> int:
+        self.stream.write(data)
+        self.count += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.count
+
+    def flush(self):
+        if hasattr(self.stream, "flush"):
+            self.stream.flush()
+
+
+def write_output(target, write_pdf: Callable[[BinaryIO], None], pages: int,
+                 start_time: float, name: str) -> OperationResult:
+    """
+    Tek bir çıktıyı hedefe yazar.
+
+    Args:
+        target: Dosya yolu, None (bellek) ya da yazılabilir ikili akış
+        write_pdf: PDF'i verilen akışa yazan fonksiyon
+        pages: Sayfa sayısı
+        start_time: Sürenin ölçüleceği başlangıç (``time.perf_counter``)
+        name: Bellek ve akış çıktılarında sonucun adı
+
+    Returns:
+        OperationResult: Yazılan dosya (bellekte ise ``data`` dolu, ``path`` None)
+    """
+    with phase(PHASE_WRITE):
+        return _write_output(target, write_pdf, pages, start_time, name)
+
+
+def _write_output(target, write_pdf: Callable[[BinaryIO], None], pages: int,
+                  start_time: float, name: str) -> OperationResult:
+    if is_path(target):
+        # Önce geçici dosyaya yaz: hedef, belleğe eşlenmiş bir girdinin kendisi olabilir
+        # ve yerinde kısaltılırsa okuyucu henüz kopyalanmamış sayfalara erişemez
+        temp_path = f"{os.fspath(target)}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as output_file:
+                write_pdf(output_file)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return OperationResult.from_file(os.fspath(target), pages, start_time)
+
+    if target is None:
+        buffer = io.BytesIO()
+        write_pdf(buffer)
+        return OperationResult.from_data(name, buffer.getvalue(), pages, start_time)
+
+    if not hasattr(target, "write"):
+        raise OperationError(f"Geçersiz çıktı hedefi: {type(target)}")
+    writer = _CountingWriter(target)
+    write_pdf(writer)
+    writer.flush()
+    return OperationResult(None, pages, writer.count, time.perf_counter() - start_time, name)
+
+
+class OutputTarget:
+    """
+    Birden fazla dosya üreten işlemlerin çıktı hedefi.
+
+    - Klasör yolu: dosyalar klasöre yazılır
+    - None: dosyalar bellekte üretilir ve sonuçların ``data`` alanında döner
+    - Çağrılabilir: her dosya adı için çağıranın döndürdüğü yazılabilir akışa
+      yazılır (akışı kapatmak çağırana aittir)
+
+    Aynı ad daha önce kullanıldıysa ``_<sayaç>`` eki eklenir.
+    """
+
+    def __init__(self, target):
+        if target is not None and not is_path(target) and not callable(target):
+            raise OperationError(f"Geçersiz çıktı dizini: {type(target)}")
+        self.target = target
+        self._used_names: Set[str] = set()
+
+    @property
+    def directory(self) -> Optional[str]:
+        """Çıktı klasörü; bellek veya akış hedefinde None."""
+        return os.fspath(self.target) if is_path(self.target) else None
+
+    def prepare(self):
+        """Çıktı klasörünü (varsa) oluşturur."""
+        if self.directory and not os.path.exists(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+
+    def unique_name(self, stem: str) -> str:
+        """Çakışmayan bir dosya adı seçer ve kullanılmış olarak işaretler."""
+        name = f"{stem}.pdf"
+        counter = 1
+        while self._is_taken(name):
+            name = f"{stem}_{counter}.pdf"
+            counter += 1
+        self._used_names.add(name)
+        return name
+
+    def unique_path(self, stem: str) -> str:
+        """Klasör hedefinde çakışmayan bir çıktı dosyası yolu oluşturur."""
+        return os.path.join(self.directory, self.unique_name(stem))
+
+    def write(self, stem: str, write_pdf: Callable[[BinaryIO], None], pages: int,
+              start_time: float) -> OperationResult:
+        """``stem`` adıyla bir çıktı dosyası yazar."""
+        name = self.unique_name(stem)
+        if self.directory:
+            return write_output(os.path.join(self.directory, name), write_pdf, pages, start_time, name)
+        if self.target is None:
+            return write_output(None, write_pdf, pages, start_time, name)
+        return write_output(self.target(name), write_pdf, pages, start_time, name)
+
+    def _is_taken(self, name: str) -> bool:
+        if name in self._used_names:
+            return True
+        return bool(self.directory) and os.path.exists(os.path.join(self.directory, name))
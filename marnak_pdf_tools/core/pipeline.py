@@ -0,0 +1,316 @@
+"""
+Birden fazla işlemi ara dosya yazmadan, bellekteki sayfalar üzerinde art arda uygulayan iş akışı modülü.
+"""
+import os
+import re
+import json
+import time
+from dataclasses import dataclass
+from itertools import chain
+from typing import List, Tuple, Optional, Dict, Any
+from PyPDF2 import PdfWriter, PageObject
+from PyPDF2.generic import ArrayObject
+from .utils import parse_page_selection, parse_page_set, parse_merge_input, PageRangeError
+from .pdf_io import PdfSource, OutputTarget, is_path, source_name, source_label, open_reader
+from .results import OperationError, ResultIterator, run_to_completion, check_cancelled
+
+# İçerik akışında iz bırakan (boyayan) operatörler: dolgu/çizgi, gölgeleme, XObject ve satır içi görüntü
+_PAINT_OPERATOR_RE = re.compile(rb"(?<![A-Za-z*'\"])(?:f\*?|F|S|s|B\*?|b\*?|sh|Do|BI)(?![A-Za-z*])")
+
+
+@dataclass
+class PipelineDocument:
+    """İş akışında ilerleyen, henüz diske yazılmamış bir belge."""
+
+    name: str  # Uzantısız çıktı adı
+    pages: List[PageObject]  # Okuyuculardaki sayfalara referanslar (kopyalanmaz)
+
+
+def is_blank_page(page: PageObject) -> bool:
+    """
+    Sayfa boş mu?
+
+    İçerik akışı boşsa ya da sayfada metin yoksa ve hiçbir boyama operatörü
+    (çizim, görüntü, XObject) kullanılmıyorsa sayfa boş kabul edilir.
+    """
+    contents = page.get_contents()
+    if contents is None:
+        return True
+    if isinstance(contents, ArrayObject):
+        # Birden fazla içerik akışı
+        data = b"\n".join(part.get_object().get_data() for part in contents)
+    else:
+        data = contents.get_data()
+    if not data.strip():
+        return True
+    if page.extract_text().strip():
+        return False
+    return not _PAINT_OPERATOR_RE.search(data)
+
+
+class PdfPipeline:
+    """Birleştirme, sayfa seçimi, bölme gibi adımları tek geçişte uygulayan iş akışı."""
+
+    # İş akışı adımları
+    STEP_MERGE = "merge"  # Tüm belgeleri tek belgede birleştir (name)
+    STEP_SELECT = "select"  # Her belgede yalnızca seçilen sayfaları tut (page_range)
+    STEP_DROP_BLANK = "drop_blank"  # Boş sayfaları at
+    STEP_SPLIT = "split"  # Her belgeyi N sayfalık bölümlere ayır (pages_per_split)
+    STEP_EXTRACT = "extract"  # Seçilen her sayfayı ayrı belge yap (page_range, file_prefix)
+    STEP_RENAME = "rename"  # Belgeleri sırayla yeniden adlandır (new_name)
+
+    # Birleştirme adımının varsayılan çıktı adı
+    MERGED_NAME = "birlestirilmis"
+
+    def __init__(self, logger=None):
+        """
+        Args:
+            logger: Loglama nesnesi (opsiyonel)
+        """
+        self.logger = logger
+        self._steps = {
+            self.STEP_MERGE: self._merge,
+            self.STEP_SELECT: self._select,
+            self.STEP_DROP_BLANK: self._drop_blank,
+            self.STEP_SPLIT: self._split,
+            self.STEP_EXTRACT: self._extract,
+            self.STEP_RENAME: self._rename,
+        }
+
+    def run(self,
+            inputs: List[Any],
+            steps: List[Dict[str, Any]],
+            output_dir,
+            progress_callback: Optional[callable] = None,
+            interrupt_check: Optional[callable] = None) -> Tuple[bool, str, List[str]]:
+        """
+        Girdilere adımları sırayla uygular ve yalnızca son belgeleri yazar.
+
+        ``iter_run`` üzerinde ince bir sarmalayıcıdır.
+
+        Args:
+            inputs: Girdiler (yol, bellekteki PDF ya da (girdi, sayfa ifadesi))
+            steps: Adımlar; her biri ``{"op": <adım>, ...seçenekler}`` sözlüğü
+            output_dir: Çıktı klasörü, None (bellek) ya da akış fabrikası
+            progress_callback: İlerleme durumunu bildiren fonksiyon
+            interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
+
+        Returns:
+            Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Oluşturulan dosyalar)
+        """
+        return run_to_completion(
+            self.iter_run(inputs, steps, output_dir, progress_callback, interrupt_check),
+            "İş akışı başarısız", self._cleanup_files, self.logger)
+
+    def iter_run(self,
+                 inputs: List[Any],
+                 steps: List[Dict[str, Any]],
+                 output_dir,
+                 progress_callback: Optional[callable] = None,
+                 interrupt_check: Optional[callable] = None) -> ResultIterator:
+        """
+        Girdilere adımları sırayla uygular ve her son belgeyi yazıldıkça bildirir.
+
+        Girdiler bir kez okunur; adımlar yalnızca sayfa referanslarını
+        düzenlediği için ara dosya oluşmaz ve sayfalar yeniden ayrıştırılmaz.
+        Hata durumunda ``OperationError``, iptalde ``OperationCancelled``
+        fırlatılır.
+
+        Yields:
+            OperationResult: Oluşturulan her dosya için bir sonuç
+
+        Returns:
+            str: Özet mesajı (``StopIteration.value``)
+        """
+        if not inputs:
+            raise OperationError("İşlenecek dosya bulunamadı.")
+        self._validate_steps(steps)
+
+        target = OutputTarget(output_dir)
+        target.prepare()
+
+        # Girdileri oku (ilerlemenin ilk %20'si)
+        documents = []
+        for i, merge_input in enumerate(inputs):
+            check_cancelled(interrupt_check)
+            documents.append(self._load(merge_input))
+            if progress_callback:
+                progress_callback(int(((i + 1) / len(inputs)) * 20))
+
+        # Adımları uygula
+        for step in steps:
+            check_cancelled(interrupt_check)
+            documents = self._steps[step["op"]](documents, step)
+            if self.logger:
+                self.logger.info(f"İş akışı adımı '{step['op']}': {len(documents)} belge, "
+                                 f"{sum(len(d.pages) for d in documents)} sayfa")
+
+        if not documents:
+            raise OperationError("İş akışı sonunda yazılacak sayfa kalmadı.")
+
+        # Son belgeleri yaz
+        for i, document in enumerate(documents):
+            check_cancelled(interrupt_check)
+
+            start_time = time.perf_counter()
+            writer = PdfWriter()
+            for page in document.pages:
+                writer.add_page(page)
+            result = target.write(document.name, writer.write, len(writer.pages), start_time)
+
+            if progress_callback:
+                progress_callback(20 + int(((i + 1) / len(documents)) * 80))
+
+            if self.logger:
+                self.logger.debug("Dosya oluşturuldu: %s", result.path or result.name)
+
+            yield result
+
+        return f"İş akışı tamamlandı. {len(steps)} adım, {len(documents)} dosya oluşturuldu."
+
+    def _validate_steps(self, steps: List[Dict[str, Any]]):
+        """Adımları girdiler okunmadan önce doğrular."""
+        for step in steps:
+            op = step.get("op") if isinstance(step, dict) else None
+            if op not in self._steps:
+                raise OperationError(f"Bilinmeyen iş akışı adımı: {op}")
+            if op == self.STEP_SPLIT:
+                pages_per_split = step.get("pages_per_split")
+                if not isinstance(pages_per_split, int) or pages_per_split < 1:
+                    raise OperationError("Bölme adımında geçerli bir 'pages_per_split' belirtilmeli.")
+            elif op == self.STEP_SELECT and not step.get("page_range"):
+                raise OperationError("Seçim adımında sayfa aralığı belirtilmemiş.")
+            elif op == self.STEP_RENAME and not step.get("new_name"):
+                raise OperationError("Yeni dosya adı belirtilmemiş.")
+
+    def _load(self, merge_input) -> PipelineDocument:
+        """Girdiyi okur; sayfa ifadesi verilmişse yalnızca seçilen sayfaları alır."""
+        if isinstance(merge_input, str):
+            merge_input = parse_merge_input(merge_input)
+        source, page_range = merge_input if isinstance(merge_input, (tuple, list)) else (merge_input, None)
+
+        try:
+            reader = open_reader(source)
+        except (FileNotFoundError, TypeError) as e:
+            raise OperationError(str(e))
+        pages = reader.pages
+        if page_range:
+            try:
+                ranges = parse_page_selection(page_range, len(pages))
+            except PageRangeError as e:
+                raise OperationError(f"{os.path.basename(source_label(source))} için geçersiz sayfa aralığı: "
+                                     f"{str(e)}")
+            return PipelineDocument(source_name(source), [pages[i] for i in chain.from_iterable(ranges)])
+        return PipelineDocument(source_name(source), list(pages))
+
+    def _merge(self, documents: List[PipelineDocument], step: Dict[str, Any]) -> List[PipelineDocument]:
+        pages = [page for document in documents for page in document.pages]
+        return [PipelineDocument(step.get("name") or self.MERGED_NAME, pages)]
+
+    def _select(self, documents: List[PipelineDocument], step: Dict[str, Any]) -> List[PipelineDocument]:
+        selected = []
+        for document in documents:
+            try:
+                ranges = parse_page_selection(step["page_range"], len(document.pages))
+            except PageRangeError as e:
+                raise OperationError(f"{document.name} için geçersiz sayfa aralığı: {str(e)}")
+            selected.append(PipelineDocument(document.name,
+                                             [document.pages[i] for i in chain.from_iterable(ranges)]))
+        return selected
+
+    def _drop_blank(self, documents: List[PipelineDocument], step: Dict[str, Any]) -> List[PipelineDocument]:
+        kept = []
+        for document in documents:
+            pages = [page for page in document.pages if not is_blank_page(page)]
+            if self.logger and len(pages) != len(document.pages):
+                self.logger.info(f"{document.name}: {len(document.pages) - len(pages)} boş sayfa atıldı")
+            if pages:
+                kept.append(PipelineDocument(document.name, pages))
+        return kept
+
+    def _split(self, documents: List[PipelineDocument], step: Dict[str, Any]) -> List[PipelineDocument]:
+        # Adlandırma PdfSplitter ile aynı: <ad>_bolum_<n>
+        size = step["pages_per_split"]
+        return [
+            PipelineDocument(f"{document.name}_bolum_{i // size + 1}", document.pages[i:i + size])
+            for document in documents
+            for i in range(0, len(document.pages), size)
+        ]
+
+    def _extract(self, documents: List[PipelineDocument], step: Dict[str, Any]) -> List[PipelineDocument]:
+        # Adlandırma PdfExtractor ile aynı: <önek><ad>_sayfa_<n>
+        file_prefix = step.get("file_prefix", "sayfa_")
+        extracted = []
+        for document in documents:
+            total_pages = len(document.pages)
+            if step.get("page_range"):
+                try:
+                    page_indices = parse_page_set(step["page_range"], total_pages)
+                except PageRangeError as e:
+                    raise OperationError(f"{document.name} için geçersiz sayfa aralığı: {str(e)}")
+            else:
+                page_indices = range(total_pages)
+            extracted.extend(
+                PipelineDocument(f"{file_prefix}{document.name}_sayfa_{i + 1}", [document.pages[i]])
+                for i in page_indices
+            )
+        return extracted
+
+    def _rename(self, documents: List[PipelineDocument], step: Dict[str, Any]) -> List[PipelineDocument]:
+        # Adlandırma PdfRenamer ile aynı: <yeni ad>_<n>
+        return [PipelineDocument(f"{step['new_name']}_{i + 1}", document.pages)
+                for i, document in enumerate(documents)]
+
+    def _cleanup_files(self, file_paths: List[str]):
+        """Oluşturulan dosyaları temizler."""
+        for path in file_paths:
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except:
+                pass
+
+
+def load_manifest(manifest_path: str) -> Dict[str, Any]:
+    """
+    JSON iş akışı tanımını okur.
+
+    Biçim::
+
+        {
+          "inputs": ["a.pdf", "b.pdf:3-9"],
+          "steps": [{"op": "merge"}, {"op": "drop_blank"},
+                    {"op": "split", "pages_per_split": 50}],
+          "output_dir": "cikti/"
+        }
+
+    Göreli yollar tanım dosyasının bulunduğu klasöre göre çözülür.
+
+    Returns:
+        Dict[str, Any]: inputs, steps, output_dir (verilmemişse None)
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise OperationError(f"İş akışı tanımı okunamadı: {str(e)}")
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("steps"), list):
+        raise OperationError("İş akışı tanımında 'steps' listesi bulunmalı.")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    def resolve(path):
+        return path if not is_path(path) or os.path.isabs(path) else os.path.join(base_dir, path)
+
+    inputs = []
+    for spec in manifest.get("inputs") or []:
+        file_path, page_range = parse_merge_input(resolve(spec))
+        inputs.append((file_path, page_range))
+
+    output_dir = manifest.get("output_dir")
+    return {
+        "inputs": inputs,
+        "steps": manifest["steps"],
+        "output_dir": resolve(output_dir) if output_dir else None
+    }
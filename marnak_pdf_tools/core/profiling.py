@@ -0,0 +1,172 @@
+"""
+İş başına isteğe bağlı cProfile kaydı ve özet raporu.
+
+``profile_job`` bir işi cProfile ile çalıştırır ve profil klasörüne iki
+dosya yazar:
+
+    <zaman>_<işlem>_<pid>.prof   pstats biçiminde profil (snakeviz vb. ile de açılabilir)
+    <zaman>_<işlem>_<pid>.json   İşlem, girdi parmak izleri (boyut, zaman, SHA-256),
+                                 seçenekler, iş ölçümü ve ortam bilgisi
+
+cProfile yalnızca işi çalıştıran iş parçacığını izler; işçi süreçlerde
+(ağaç birleştirme, optimize, metin) geçen süre profilde görünmez.
+"""
+import cProfile
+import datetime
+import json
+import os
+import platform
+import pstats
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+import fitz # PyMuPDF
+from .cache import file_digest
+from .metrics import JobMetrics
+
+PROFILE_SUFFIX = ".prof"
+INFO_SUFFIX = ".json"
+
+# Özet raporunun sıralama ölçütleri
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+def fingerprint_inputs(paths: List[str]) -> List[Dict[str, Any]]:
+    """Girdi dosyalarının parmak izi: yol, boyut, değiştirilme zamanı ve SHA-256."""
+    fingerprints = []
+    for path in paths:
+        entry = {"path": os.path.abspath(path)}
+        try:
+            stat = os.stat(path)
+            entry.update(bytes=stat.st_size,
+                         modified=datetime.datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+                         sha256=file_digest(path))
+        except OSError as e:
+            entry["error"] = str(e)
+        fingerprints.append(entry)
+    return fingerprints
+
+
+def _jsonable(value):
+    """Seçenekleri JSON'a yazılabilir hale getirir (yazılamayan değerler metne çevrilir)."""
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        if isinstance(value, dict):
+            return {str(key): _jsonable(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_jsonable(item) for item in value]
+        return repr(value)
+
+
+@contextmanager
+def profile_job(metrics: JobMetrics, options: Optional[dict], directory: str):
+    """
+    Bloğu cProfile ile çalıştırır; profil ve açıklama dosyasını ``directory``'ye yazar.
+
+    Girdiler ``metrics.input_paths``'ten okunur; parmak izleri profil
+    durdurulduktan sonra hesaplanır ve profile katılmaz.
+
+    Args:
+        metrics: İşin ölçüm kaydı (``collect_metrics``)
+        options: İşlem seçenekleri
+        directory: Profil klasörü
+
+    Yields:
+        dict: Blok bitince ``profile`` ve ``info`` anahtarlarıyla yazılan dosya yolları
+    """
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    base = os.path.join(directory, f"{stamp}_{metrics.operation}_{os.getpid()}")
+    paths = {"profile": base + PROFILE_SUFFIX, "info": base + INFO_SUFFIX}
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield paths
+    finally:
+        profiler.disable()
+        wall = time.perf_counter() - start
+        profiler.dump_stats(paths["profile"])
+
+        info = {
+            "operation": metrics.operation,
+            "started_at": metrics.started_at,
+            "profile_wall_s": round(wall, 4),
+            "success": metrics.success,
+            "message": metrics.message,
+            "pages": metrics.pages,
+            "files_out": metrics.files_out,
+            "bytes_out": metrics.bytes_out,
+            "phases": {name: round(value, 4) for name, value in metrics.phases.items()},
+            "options": _jsonable(options or {}),
+            "inputs": fingerprint_inputs(metrics.input_paths),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "pymupdf": fitz.VersionBind,
+            },
+        }
+        with open(paths["info"], "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+
+def latest_profile(directory: str) -> Optional[str]:
+    """Klasördeki en yeni profil dosyası; yoksa None."""
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(PROFILE_SUFFIX)]
+    except OSError:
+        return None
+    if not names:
+        return None
+    return max((os.path.join(directory, name) for name in names), key=os.path.getmtime)
+
+
+def summarize_profile(path: str, top: int = 20, sort: str = "cumulative") -> str:
+    """
+    Profilin okunabilir özeti: iş bilgisi ve en çok zaman alan fonksiyonlar.
+
+    Args:
+        path: ``.prof`` dosyası
+        top: Listelenecek fonksiyon sayısı
+        sort: Sıralama ölçütü (``SORT_KEYS``)
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Geçersiz sıralama: {sort} (seçenekler: {', '.join(SORT_KEYS)})")
+    stats = pstats.Stats(path)
+    lines = [f"Profil: {path}"]
+
+    info_path = path[:-len(PROFILE_SUFFIX)] + INFO_SUFFIX if path.endswith(PROFILE_SUFFIX) else None
+    if info_path and os.path.exists(info_path):
+        with open(info_path, "r", encoding="utf-8") as f:
+            info = json.load(f)
+        lines.append(f"İşlem: {info['operation']} ({info['started_at']}), "
+                     f"{info['profile_wall_s']:.2f} sn, {info['pages']} sayfa, "
+                     f"{'başarılı' if info['success'] else 'başarısız'}")
+        for entry in info["inputs"]:
+            detail = (entry["error"] if "error" in entry
+                      else f"{entry['bytes']} bayt, {entry['modified']}, sha256 {entry['sha256'][:16]}")
+            lines.append(f"Girdi: {entry['path']} ({detail})")
+        if info["options"]:
+            lines.append(f"Seçenekler: {json.dumps(info['options'], ensure_ascii=False)}")
+
+    lines.append(f"Toplam: {stats.total_calls} çağrı, {stats.total_tt:.3f} sn")
+    lines.append(f"{'Çağrı':>9} {'Kendi (sn)':>11} {'Toplam (sn)':>12}  Fonksiyon")
+    stats.sort_stats(sort)
+    for func in stats.fcn_list[:top]:
+        _, calls, own, cumulative, _ = stats.stats[func]
+        filename, line, name = func
+        location = name if filename == "~" else f"{_short_path(filename)}:{line}({name})"
+        lines.append(f"{calls:>9} {own:>11.3f} {cumulative:>12.3f}  {location}")
+    return "\n".join(lines)
+
+
+def _short_path(filename: str) -> str:
+    """Paket içi dosyaları paket adından, diğerlerini dosya adından itibaren gösterir."""
+    marker = "marnak_pdf_tools" + os.sep
+    index = filename.find(marker)
+    return filename[index:] if index >= 0 else os.path.basename(filename)
@@ -0,0 +1,132 @@
+"""
+İlerleme bildirimlerini seyrekleştiren kanal.
+
+Core döngüleri ``progress_callback``'i her sayfada ya da parçada çağırır;
+10.000 sayfalık bir bölmede bu, arayüz iş parçacığına 10.000 kuyruklu
+sinyal ve etiket güncellemesi demektir. ``ProgressThrottle`` bu çağrıları
+toplar: yüzde değişmediyse hiçbir şey yayınlamaz, değiştiyse en fazla
+``interval_ms``'de bir yayınlar (ilk ve %100 bildirimi her zaman geçer).
+Yayınlanan ``ProgressUpdate`` yüzdeye ek olarak geçen süreyi, kalan süre
+tahminini ve etkin ölçüm kaydındaki (``metrics.collect_metrics``) sayfa ve
+dosya sayılarını taşır.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .metrics import current_metrics
+
+# Varsayılan en kısa yayın aralığı (ms)
+DEFAULT_INTERVAL_MS = 100
+
+
+@dataclass(frozen=True)
+class ProgressUpdate:
+    """Arayüze gönderilen ilerleme bildirimi."""
+
+    percent: int
+    elapsed_s: float
+    eta_s: Optional[float] = None  # Kalan süre tahmini; ilk bildirimde bilinmez
+    pages: int = 0  # Şimdiye kadar üretilen sayfa
+    files: int = 0  # Şimdiye kadar üretilen dosya
+    current_file: str = ""  # Son üretilen dosyanın adı
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """Kalan süreyi kısa metne dönüştürür (ör. "~2 dk 5 sn")."""
+    if seconds is None:
+        return "hesaplanıyor"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"~{seconds} sn"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"~{minutes} dk {seconds} sn"
+    hours, minutes = divmod(minutes, 60)
+    return f"~{hours} sa {minutes} dk"
+
+
+class ProgressThrottle:
+    """
+    ``progress_callback`` yerine verilen, bildirimleri seyrekleştiren çağrılabilir nesne.
+
+    Örnek:
+        throttle = ProgressThrottle(worker.progress_detail.emit)
+        throttle.start()
+        splitter.split_pdf(path, output_dir, progress_callback=throttle)
+        throttle.flush()
+    """
+
+    def __init__(self, emit: Callable[[ProgressUpdate], None], interval_ms: int = DEFAULT_INTERVAL_MS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            emit: Seyrekleştirilmiş bildirimleri alan fonksiyon
+            interval_ms: İki yayın arasındaki en kısa süre (ms)
+            clock: Zaman kaynağı (sn)
+        """
+        self.emit = emit
+        self.interval = interval_ms / 1000
+        self.clock = clock
+        self.start()
+
+    def start(self):
+        """Yeni bir iş için sayaçları ve süreyi sıfırlar."""
+        self.received = 0  # Core'dan gelen bildirim sayısı
+        self.emitted = 0  # Yayınlanan bildirim sayısı
+        self._start = self.clock()
+        self._last_emit = None
+        self._last_percent = None
+        self._last_counts = None
+        self._pending = None
+
+    def __call__(self, percent: int):
+        self.received += 1
+        percent = max(0, min(100, int(percent)))
+        if percent == self._last_percent:
+            return
+        now = self.clock()
+        if percent < 100 and self._last_emit is not None and now - self._last_emit < self.interval:
+            # Aralık dolmadı: değeri sakla, sonraki bildirimde ya da flush'ta yayınlanır
+            self._pending = percent
+            return
+        self._publish(percent, now)
+
+    def flush(self):
+        """
+        Aralık yüzünden bekleyen son değeri yayınlar (iş bitince çağrılır).
+
+        Core döngüleri ilerlemeyi dosyayı teslim etmeden önce bildirdiğinden
+        son bildirimdeki sayaçlar bir dosya geride kalır; sayaçlar değiştiyse
+        son yüzde güncel sayaçlarla yeniden yayınlanır.
+        """
+        if self._pending is not None and self._pending != self._last_percent:
+            self._publish(self._pending, self.clock())
+        elif self._last_percent is not None and self._counts() != self._last_counts:
+            self._publish(self._last_percent, self.clock())
+
+    def _counts(self) -> tuple:
+        """Etkin ölçüm kaydından (sayfa, dosya, son dosya adı)."""
+        metrics = current_metrics()
+        if metrics is None:
+            return 0, 0, ""
+        return metrics.pages, metrics.files_out, os.path.basename(metrics.last_output)
+
+    def _publish(self, percent: int, now: float):
+        self._pending = None
+        self._last_percent = percent
+        self._last_emit = now
+        elapsed = now - self._start
+        if percent >= 100:
+            eta = 0.0
+        elif percent > 0:
+            eta = elapsed * (100 - percent) / percent
+        else:
+            eta = None
+
+        self._last_counts = self._counts()
+        pages, files, current_file = self._last_counts
+
+        self.emitted += 1
+        self.emit(ProgressUpdate(percent, elapsed, eta, pages, files, current_file))
@@ -2,9 +2,13 @@
 PDF dosyalarını yeniden adlandırma işlemlerini gerçekleştiren modül.
 """
 import os
+import time
 import shutil
 from typing import List, Tuple, Optional, Dict, Any
-from PyPDF2 import PdfReader
+from .pdf_io import PdfSource, OutputTarget, is_path, is_in_memory, read_source
+from .engines import get_engine, OP_PAGE_COUNT
+from .results import OperationResult, OperationError, ResultIterator, run_to_completion, check_cancelled
+from .metrics import phase, PHASE_WRITE
 
 class PdfRenamer:
     """PDF dosyalarını yeniden adlandırma işlemlerini yöneten sınıf."""
@@ -27,37 +31,61 @@ class PdfRenamer:
             Tuple[bool, str]: (Geçerli mi?, Hata mesajı)
         """
         try:
+            self._validate_pdf(file_path)
+            return True, ""
+        except ValueError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"PDF kontrolü başarısız: {str(e)}"
+    
+    def _validate_pdf(self, file_path) -> int:
+        """
+        PDF dosyasını (yol ya da bellekteki içerik) doğrular ve sayfa sayısını
+        döndürür; geçersizse ValueError fırlatır.
+        """
+        if is_path(file_path):
             if not os.path.exists(file_path):
-                return False, "Dosya bulunamadı"
+                raise ValueError("Dosya bulunamadı")
                 
             if os.path.getsize(file_path) == 0:
-                return False, "Dosya boş"
+                raise ValueError("Dosya boş")
                 
             # PDF header kontrolü
             with open(file_path, 'rb') as f:
                 header = f.read(4)
-                if header != b'%PDF':
-                    return False, "Geçerli bir PDF dosyası değil"
-                    
-            # PyPDF2 ile açılabilirlik kontrolü
-            PdfReader(file_path)
-            return True, ""
-            
+        else:
+            if len(file_path) == 0:
+                raise ValueError("Dosya boş")
+            header = bytes(file_path[:4])
+        
+        if header != b'%PDF':
+            raise ValueError("Geçerli bir PDF dosyası değil")
+                
+        # Açılabilirlik kontrolü (sayfa saymada en hızlı motorla)
+        try:
+            engine = get_engine(OP_PAGE_COUNT)
+            document = engine.open(file_path)
+            try:
+                return engine.page_count(document)
+            finally:
+                engine.close(document)
         except Exception as e:
-            return False, f"PDF kontrolü başarısız: {str(e)}"
+            raise ValueError(f"PDF kontrolü başarısız: {str(e)}")
     
     def rename_pdfs(self,
-                   file_paths: List[str],
-                   output_dir: str,
+                   file_paths: List[PdfSource],
+                   output_dir,
                    options: Optional[Dict[str, Any]] = None,
                    progress_callback: Optional[callable] = None,
                    interrupt_check: Optional[callable] = None) -> Tuple[bool, str, List[str]]:
         """
         PDF dosyalarını yeniden adlandırır.
 
+        ``iter_rename`` üzerinde ince bir sarmalayıcıdır.
+
         Args:
-            file_paths: İşlenecek PDF dosyalarının yolları
-            output_dir: Çıktı klasörü
+            file_paths: İşlenecek PDF dosyalarının yolları ya da bellekteki içerikleri
+            output_dir: Çıktı klasörü (bellek ve akış hedefleri için bkz. ``iter_rename``)
             options: Yeniden adlandırma seçenekleri (new_name, keep_originals)
             progress_callback: İlerleme durumunu bildiren fonksiyon
             interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
@@ -68,82 +96,121 @@ class PdfRenamer:
         if options is None:
             options = {}
 
+        keep_originals = options.get("keep_originals", True) and is_path(output_dir)
+        original_dir = os.path.join(output_dir, "Orijinal_Dosyalar") if keep_originals else None
+
+        def cleanup(processed_files: List[str]):
+            # Hata durumunda temizlik
+            self._cleanup_files(processed_files)
+            if keep_originals and os.path.exists(original_dir) and not os.listdir(original_dir):
+                os.rmdir(original_dir)
+
+        return run_to_completion(
+            self.iter_rename(file_paths, output_dir, options, progress_callback, interrupt_check),
+            "PDF'ler yeniden adlandırılırken hata oluştu", cleanup, self.logger)
+
+    def iter_rename(self,
+                    file_paths: List[PdfSource],
+                    output_dir,
+                    options: Optional[Dict[str, Any]] = None,
+                    progress_callback: Optional[callable] = None,
+                    interrupt_check: Optional[callable] = None) -> ResultIterator:
+        """
+        PDF dosyalarını yeniden adlandırır ve her dosyayı kopyalanır kopyalanmaz bildirir.
+
+        Hata durumunda ``OperationError``, iptalde ``OperationCancelled``
+        fırlatılır; o ana kadar üretilen dosyalar silinmez (tüketicinin elindedir).
+
+        Girdiler dosya yolu, ``bytes``/``memoryview`` ya da ikili dosya nesnesi
+        olabilir. ``output_dir`` None ise dosyalar bellekte üretilir (sonuçların
+        ``data`` alanı); dosya adı alıp yazılabilir akış döndüren bir fonksiyon
+        verilirse her dosya o akışa yazılır. Orijinallerin yedeği yalnızca
+        diskteki girdiler klasöre yazılırken alınır.
+
+        Args:
+            file_paths: İşlenecek PDF dosyalarının yolları ya da bellekteki içerikleri
+            output_dir: Çıktı klasörü, None (bellek) ya da akış fabrikası
+            options: Yeniden adlandırma seçenekleri (new_name, keep_originals)
+            progress_callback: İlerleme durumunu bildiren fonksiyon
+            interrupt_check: İşlem iptal edildi mi kontrol eden fonksiyon
+
+        Yields:
+            OperationResult: Yeni adla oluşturulan her dosya için bir sonuç
+
+        Returns:
+            str: Özet mesajı (``StopIteration.value``)
+        """
+        if options is None:
+            options = {}
+
         new_name = options.get("new_name")
         if not new_name:
-            return False, "Yeni dosya adı belirtilmemiş.", []
+            raise OperationError("Yeni dosya adı belirtilmemiş.")
 
-        keep_originals = options.get("keep_originals", True)
+        target = OutputTarget(output_dir)
+        keep_originals = options.get("keep_originals", True) and target.directory is not None
 
-        try:
-            # Çıktı klasörünü kontrol et/oluştur
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                
-            # Orijinal dosyalar klasörü
-            original_dir = os.path.join(output_dir, "Orijinal_Dosyalar")
-            if keep_originals:
-                os.makedirs(original_dir, exist_ok=True)
+        # Çıktı klasörünü kontrol et/oluştur
+        target.prepare()
             
-            processed_files = []
-            total_files = len(file_paths)
+        # Orijinal dosyalar klasörü
+        if keep_originals:
+            original_dir = os.path.join(target.directory, "Orijinal_Dosyalar")
+            os.makedirs(original_dir, exist_ok=True)
+        
+        total_files = len(file_paths)
+        
+        for i, file_path in enumerate(file_paths):
+            # İptal kontrolü
+            check_cancelled(interrupt_check)
             
-            for i, file_path in enumerate(file_paths):
-                # İptal kontrolü
-                if interrupt_check and interrupt_check():
-                    return False, "İşlem kullanıcı tarafından iptal edildi.", processed_files
+            start_time = time.perf_counter()
+            try:
+                if not is_path(file_path) and not is_in_memory(file_path):
+                    raise ValueError(f"Geçersiz PDF girdisi: {type(file_path)}")
                 
+                # Bellekteki girdiler (ve diske yazılmayacak çıktılar için dosyalar) bir kez okunur
+                on_disk = is_path(file_path) and target.directory is not None
+                source = file_path if on_disk else read_source(file_path)
+                
+                # PDF kontrolü
                 try:
-                    # PDF kontrolü
-                    is_valid, error = self.check_pdf(file_path)
-                    if not is_valid:
-                        raise ValueError(f"Geçersiz PDF: {error}")
-                    
+                    pages = self._validate_pdf(source)
+                except ValueError as e:
+                    raise ValueError(f"Geçersiz PDF: {str(e)}")
+                
+                if on_disk:
                     # Orijinal dosyayı kopyala
-                    if keep_originals:
-                        original_name = os.path.basename(file_path)
-                        original_target = os.path.join(original_dir, original_name)
-                        shutil.copy2(file_path, original_target)
+                    with phase(PHASE_WRITE):
+                        if keep_originals:
+                            original_name = os.path.basename(file_path)
+                            original_target = os.path.join(original_dir, original_name)
+                            shutil.copy2(file_path, original_target)
                         
-                    # Yeni isimle kopyala
-                    new_filename = f"{new_name}_{i+1}.pdf"
-                    new_path = os.path.join(output_dir, new_filename)
-                    
-                    # Aynı isimde dosya varsa yeni isim oluştur
-                    counter = 1
-                    while os.path.exists(new_path):
-                        new_filename = f"{new_name}_{i+1}_{counter}.pdf"
-                        new_path = os.path.join(output_dir, new_filename)
-                        counter += 1
-                    
-                    shutil.copy2(file_path, new_path)
-                    processed_files.append(new_path)
-                    
-                    # İlerleme bildirimi
-                    if progress_callback:
-                        progress = int(((i + 1) / total_files) * 100)
-                        progress_callback(progress)
-                    
-                    if self.logger:
-                        self.logger.info(f"Dosya yeniden adlandırıldı: {new_path}")
-                        
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Dosya işlenirken hata: {str(e)}")
-                    raise
+                        # Yeni isimle kopyala (aynı isimde dosya varsa yeni isim oluştur)
+                        new_path = target.unique_path(f"{new_name}_{i+1}")
+                        shutil.copy2(file_path, new_path)
+                    result = OperationResult.from_file(new_path, pages, start_time)
+                else:
+                    result = target.write(f"{new_name}_{i+1}", lambda stream: stream.write(source),
+                                          pages, start_time)
+                
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Dosya işlenirken hata: {str(e)}")
+                raise
             
-            return True, "İşlem başarılı", processed_files
+            # İlerleme bildirimi
+            if progress_callback:
+                progress = int(((i + 1) / total_files) * 100)
+                progress_callback(progress)
             
-        except Exception as e:
-            error_msg = f"PDF'ler yeniden adlandırılırken hata oluştu: {str(e)}"
             if self.logger:
-                self.logger.error(error_msg)
+                self.logger.debug("Dosya yeniden adlandırıldı: %s", result.path or result.name)
             
-            # Hata durumunda temizlik
-            self._cleanup_files(processed_files)
-            if keep_originals and os.path.exists(original_dir) and not os.listdir(original_dir):
-                os.rmdir(original_dir)
-                
-            return False, error_msg, []
+            yield result
+        
+        return "İşlem başarılı"
     
     def _cleanup_files(self, file_paths: List[str]):
         """İşlenmiş dosyaları temizler."""
@@ -152,4 +219,4 @@ class PdfRenamer:
                 if os.path.exists(path):
                     os.remove(path)
             except:
-                pass 
\ No newline at end of file
+                pass
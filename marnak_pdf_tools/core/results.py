@@ -0,0 +1,100 @@
+"""
+Core işlemlerinin ürettiği dosyaları tek tek bildiren sonuç türleri.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Generator, List, Tuple, Optional, Callable
+from .metrics import record_output
+
+# İşlem yineleyicileri: her dosya için bir sonuç üretir, bitince özet mesajı döndürür
+ResultIterator = Generator["OperationResult", None, str]
+
+
+@dataclass
+class OperationResult:
+    """İşlemin ürettiği tek bir dosya."""
+
+    path: Optional[str]  # Oluşturulan dosya (bellek veya akış çıktısında None)
+    pages: int  # Sayfa sayısı
+    bytes: int  # Dosya boyutu
+    elapsed: float  # Dosyanın üretilmesi için geçen süre (sn)
+    name: str = ""  # Dosya adı
+    data: Optional[bytes] = None  # Bellekte üretilen dosyanın içeriği
+
+    @classmethod
+    def from_file(cls, path: str, pages: int, start_time: float) -> "OperationResult":
+        """Diske yazılmış dosya için sonuç oluşturur; süre ``start_time``'dan itibaren ölçülür."""
+        return cls(path, pages, os.path.getsize(path), time.perf_counter() - start_time,
+                   os.path.basename(path))
+
+    @classmethod
+    def from_data(cls, name: str, data: bytes, pages: int, start_time: float) -> "OperationResult":
+        """Bellekte üretilmiş dosya için sonuç oluşturur."""
+        return cls(None, pages, len(data), time.perf_counter() - start_time, name, data)
+
+
+class OperationError(Exception):
+    """İşlem başarısız olduğunda fırlatılır; mesaj kullanıcıya olduğu gibi gösterilir."""
+
+
+class OperationCancelled(OperationError):
+    """İşlem kullanıcı tarafından iptal edildiğinde fırlatılır."""
+
+    def __init__(self, message: str = "İşlem kullanıcı tarafından iptal edildi."):
+        super().__init__(message)
+
+
+def run_to_completion(results: ResultIterator,
+                      error_prefix: str,
+                      cleanup: Callable[[List[str]], None],
+                      logger=None) -> Tuple[bool, str, List[str]]:
+    """
+    Bir işlem yineleyicisini sonuna kadar çalıştırır ve klasik sonuç üçlüsünü döndürür.
+
+    İptalde o ana kadar üretilen dosyalar korunur ve döndürülür. Hata
+    durumunda üretilen dosyalar ``cleanup`` ile silinir; ``OperationError``
+    mesajları olduğu gibi, diğer hatalar ``error_prefix`` ile raporlanır.
+    Başarıyla biten işin özeti (dosya, sayfa, boyut, süre) ``logger``'a
+    INFO düzeyinde tek satır olarak yazılır; dosya başına satırlar DEBUG'dır.
+    Yalnızca diske yazılan dosyalar listelenir; bellek ve akış çıktıları için
+    yineleyicinin kendisi kullanılmalıdır.
+
+    Returns:
+        Tuple[bool, str, List[str]]: (Başarılı mı?, Mesaj, Oluşturulan dosyalar)
+    """
+    output_files: List[str] = []
+    produced = pages = total_bytes = 0
+    start_time = time.perf_counter()
+    try:
+        while True:
+            try:
+                result = next(results)
+            except StopIteration as stop:
+                if logger:
+                    logger.info("%s (%d dosya, %d sayfa, %.2f MB, %.2f sn)", stop.value, produced, pages,
+                                total_bytes / (1024 * 1024), time.perf_counter() - start_time)
+                return True, stop.value, output_files
+            record_output(result)
+            produced += 1
+            pages += result.pages
+            total_bytes += result.bytes
+            if result.path is not None:
+                output_files.append(result.path)
+    except OperationCancelled as e:
+        return False, str(e), output_files
+    except OperationError as e:
+        error_msg = str(e)
+    except Exception as e:
+        error_msg = f"{error_prefix}: {str(e)}"
+
+    if logger:
+        logger.error(error_msg)
+    cleanup(output_files)
+    return False, error_msg, []
+
+
+def check_cancelled(interrupt_check: Optional[Callable[[], bool]]):
+    """İşlem iptal edildiyse ``OperationCancelled`` fırlatır."""
+    if interrupt_check and interrupt_check():
+        raise OperationCancelled()
@@ -1,59 +1,172 @@
 """
 Core modülü için yardımcı fonksiyonlar.
 """
-from typing import List
+import os
+import re
+from typing import List, Optional, Tuple
+from .page_set import PageSet
 
-def parse_page_ranges(range_text: str, total_pages: int) -> List[List[int]]:
+# Sayfa sınırı: 5 (baştan), -2 (sondan ikinci), end/son (son sayfa)
+_PAGE_BOUND = r"(?:-?\d+|end|son)"
+
+# Parça: tek sayfa ya da [başlangıç]-[bitiş][:adım]
+_PAGE_TOKEN_RE = re.compile(
+    rf"^(?P<start>{_PAGE_BOUND})?"
+    rf"(?:(?P<dash>\s*-\s*)(?P<stop>{_PAGE_BOUND})?)?"
+    r"(?:\s*:\s*(?P<step>-?\d+))?$",
+    re.IGNORECASE
+)
+
+# Kullanıcıya gösterilecek söz dizimi özeti
+PAGE_RANGE_SYNTAX_HELP = (
+    "Virgülle ayrılmış parçalar: 5 (tek sayfa), 3-9 (aralık), 9-3 (ters sırada), "
+    "5- veya 5-end (sona kadar), -1 veya end (son sayfa), -3- (son 3 sayfa), "
+    "10-end:2 (10'dan itibaren iki sayfada bir)"
+)
+
+
+class PageRangeError(ValueError):
+    """Sayfa aralığı ifadesi geçersiz olduğunda fırlatılır."""
+
+
+def _resolve_page_bound(bound: str, total_pages: int, token: str) -> int:
+    """Bir sınırı 1 tabanlı sayfa numarasına çevirir (aralık dışı kalabilir)."""
+    if bound.lower() in ("end", "son"):
+        return total_pages
+    value = int(bound)
+    if value == 0:
+        raise PageRangeError(f"'{token}': sayfa numaraları 1'den başlar")
+    if value < 0:
+        # -1 son sayfa, -2 sondan ikinci sayfa...
+        return total_pages + value + 1
+    return value
+
+
+def _parse_page_token(token: str, total_pages: int) -> range:
+    """Tek bir parçayı 0 tabanlı ``range`` nesnesine çevirir."""
+    match = _PAGE_TOKEN_RE.match(token)
+    if not match:
+        raise PageRangeError(f"'{token}' geçerli bir sayfa ifadesi değil. {PAGE_RANGE_SYNTAX_HELP}")
+
+    start, dash, stop, step = match.group("start", "dash", "stop", "step")
+
+    # Tek sayfa (örn. 3, -1, end)
+    if dash is None:
+        if step is not None:
+            raise PageRangeError(f"'{token}': adım yalnızca aralıklarda kullanılabilir (örn. 1-end:2)")
+        page = _resolve_page_bound(start, total_pages, token)
+        if not 1 <= page <= total_pages:
+            raise PageRangeError(f"'{token}': sayfa mevcut değil (belgede {total_pages} sayfa var)")
+        return range(page - 1, page)
+
+    # Aralık (örn. 3-5, 5-, -3-, 9-3, 1-end:2); eksik sınırlar belgenin başı/sonudur
+    first = _resolve_page_bound(start, total_pages, token) if start else 1
+    last = _resolve_page_bound(stop, total_pages, token) if stop else total_pages
+    step_value = int(step) if step is not None else 1
+    if step_value < 1:
+        raise PageRangeError(f"'{token}': adım pozitif bir sayı olmalı")
+
+    if max(first, last) < 1 or min(first, last) > total_pages:
+        raise PageRangeError(f"'{token}': aralık belge dışında (belgede {total_pages} sayfa var)")
+
+    # Kısmen taşan aralıklar belge sınırlarına kırpılır
+    first = min(max(first, 1), total_pages)
+    last = min(max(last, 1), total_pages)
+
+    if first <= last:
+        return range(first - 1, last, step_value)
+    return range(first - 1, last - 2, -step_value)
+
+
+def parse_page_selection(range_text: str, total_pages: int) -> List[range]:
     """
-    Sayfa aralıkları metnini ayrıştırır ve sayfa listesi listesi döndürür.
-    
+    Sayfa aralıkları metnini ayrıştırır ve her parça için bir ``range`` döndürür.
+
+    Sayfalar listeye açılmaz; "1-200000" tek bir ``range`` nesnesidir.
+    Parçaların sırası, yönü ve çakışmaları korunur (bölme işlemi her parça
+    için ayrı dosya üretir). Desteklenen söz dizimi için
+    ``PAGE_RANGE_SYNTAX_HELP``'e bakın.
+
     Args:
-        range_text: Sayfa aralıkları metni, örn. "1,3-5,7"
+        range_text: Sayfa aralıkları metni, örn. "1,3-5,7", "-3-", "10-end:2"
         total_pages: PDF'deki toplam sayfa sayısı
-    
+
     Returns:
-        Sayfa numaraları listesi listesi
+        0 tabanlı sayfa indekslerini kapsayan ``range`` listesi
+
+    Raises:
+        PageRangeError: Geçersiz veya belge dışında kalan bir parça varsa
     """
     result = []
-    
+
     # Metin boş ise boş liste döndür
     if not range_text or range_text.strip() == "":
         return result
-        
-    # Virgülle ayrılmış parçalara böl
-    parts = range_text.split(",")
-    
-    for part in parts:
+
+    # Virgülle ayrılmış parçalara böl (boş parçalar, örn. sondaki virgül, atlanır)
+    for part in range_text.split(","):
         part = part.strip()
-        
-        # Aralık (örn. 3-5)
-        if "-" in part:
-            try:
-                start, end = part.split("-", 1)
-                start = int(start.strip())
-                end = int(end.strip())
-                
-                # 0 tabanlı indeksleme için ayarla (PDF okuyucu 1 tabanlı gösterir)
-                start = max(1, start) - 1  # En az 1, sonra 0-tabanlı için -1
-                end = min(total_pages, end) - 1  # En fazla toplam sayfa, sonra 0-tabanlı için -1
-                
-                if start <= end:
-                    result.append(list(range(start, end + 1)))
-            except:
-                # Ayrıştırma hatası, bu parçayı atla
-                continue
-        
-        # Tek sayfa (örn. 3)
-        else:
-            try:
-                page = int(part)
-                # 0 tabanlı indeksleme için ayarla
-                page = max(1, page) - 1  # En az 1, sonra 0-tabanlı için -1
-                
-                if 0 <= page < total_pages:
-                    result.append([page])
-            except:
-                # Ayrıştırma hatası, bu parçayı atla
-                continue
-                
+        if part:
+            result.append(_parse_page_token(part, total_pages))
+
     return result
+
+def parse_page_set(range_text: str, total_pages: int) -> PageSet:
+    """
+    Sayfa aralıkları metnini sıralı, tekrarsız bir ``PageSet`` olarak ayrıştırır.
+
+    Args:
+        range_text: Sayfa aralıkları metni, örn. "1,3-5,7"
+        total_pages: PDF'deki toplam sayfa sayısı
+
+    Returns:
+        0 tabanlı sayfaları içeren ``PageSet``
+
+    Raises:
+        PageRangeError: Geçersiz veya belge dışında kalan bir parça varsa
+    """
+    return PageSet.from_ranges(parse_page_selection(range_text, total_pages))
+
+def parse_page_ranges(range_text: str, total_pages: int) -> List[List[int]]:
+    """
+    Sayfa aralıkları metnini ayrıştırır ve sayfa listesi listesi döndürür.
+
+    Geriye dönük uyumluluk için korunur; yeni kod ``parse_page_selection``
+    veya ``parse_page_set`` kullanmalıdır.
+
+    Args:
+        range_text: Sayfa aralıkları metni, örn. "1,3-5,7"
+        total_pages: PDF'deki toplam sayfa sayısı
+
+    Returns:
+        Sayfa numaraları listesi listesi
+
+    Raises:
+        PageRangeError: Geçersiz veya belge dışında kalan bir parça varsa
+    """
+    return [list(page_range) for page_range in parse_page_selection(range_text, total_pages)]
+
+def parse_merge_input(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    "dosya.pdf:3-9" biçimindeki birleştirme girdisini (yol, sayfa ifadesi) çiftine ayırır.
+
+    Ayrım ".pdf:" üzerinden yapılır; böylece "C:\\belge.pdf" gibi sürücü
+    harfli yollar ve "a.pdf:1-end:2" gibi adımlı ifadeler bozulmaz. Tam adı
+    mevcut bir dosyaya karşılık gelen girdiler olduğu gibi yol kabul edilir.
+
+    Args:
+        spec: Komut satırından gelen girdi
+
+    Returns:
+        Tuple[str, Optional[str]]: (Dosya yolu, Sayfa ifadesi ya da None)
+    """
+    if os.path.exists(spec):
+        return spec, None
+
+    index = spec.lower().rfind(".pdf:")
+    if index == -1:
+        return spec, None
+
+    file_path = spec[:index + 4]
+    page_range = spec[index + 5:].strip()
+    return file_path, page_range or None
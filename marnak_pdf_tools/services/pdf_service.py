@@ -5,14 +5,52 @@ import os
 import logging
 from typing import List, Tuple, Optional, Callable
 from PyQt6.QtCore import QThread, pyqtSignal, QObject
-from ..core import PdfRenamer, PdfSplitter, PdfMerger, PdfExtractor
-import fitz
+# İşlem sınıfları (fitz/PyPDF2) iş parçacığı kurulurken içe aktarılır; servis uygulama açılışını yavaşlatmaz
+from ..core.metrics import collect_metrics, append_metrics_log
+from ..core.progress import ProgressThrottle
+from ..utils.settings import get_pdf_engine, get_metrics_log_path, get_profile_jobs, get_profile_dir
+
+
+def _progress_throttle(worker: QThread) -> ProgressThrottle:
+    """Core bildirimlerini seyrekleştirip iş parçacığının ``progress`` ve ``progress_detail`` sinyallerine aktarır."""
+    def emit(update):
+        worker.progress.emit(update.percent)
+        worker.progress_detail.emit(update)
+    return ProgressThrottle(emit)
+
+
+def _run_with_metrics(worker: QThread, operation: str, inputs, run: Callable[[], tuple]) -> tuple:
+    """
+    İşi ölçüm kaydı altında çalıştırır ve kaydı iş parçacığının ``metrics`` sinyaliyle yayınlar.
+
+    İş parçacığının ``profile_dir``'i verilmişse iş cProfile ile profillenir.
+    """
+    def run_and_finish():
+        success, message, output_files = run()
+        metrics.finish(success, message, output_files)
+        return success, message, output_files
+
+    worker.progress_throttle.start()
+    with collect_metrics(operation, inputs) as metrics:
+        if worker.profile_dir:
+            from ..core.profiling import profile_job
+            with profile_job(metrics, worker.options, worker.profile_dir) as profile:
+                success, message, output_files = run_and_finish()
+            if worker.logger:
+                worker.logger.info(f"İş profili kaydedildi: {profile['profile']}")
+        else:
+            success, message, output_files = run_and_finish()
+        worker.progress_throttle.flush()
+    worker.metrics.emit(metrics.to_dict())
+    return success, message, output_files
 
 
 class PDFRenameWorker(QThread):
     """PDF yeniden adlandırma işlemini arka planda yürüten iş parçacığı."""
     progress = pyqtSignal(int)
+    progress_detail = pyqtSignal(object)  # Seyrekleştirilmiş ProgressUpdate (yüzde, kalan süre, sayfa, dosya)
     finished = pyqtSignal(bool, str)
+    metrics = pyqtSignal(dict)  # İş bitince ölçüm kaydı (JobMetrics.to_dict)
     
     def __init__(self, pdf_files, output_dir, options=None, logger=None):
         super().__init__()
@@ -20,18 +58,21 @@ class PDFRenameWorker(QThread):
         self.output_dir = output_dir
         self.options = options or {}
         self._interrupted = False
+        self.progress_throttle = _progress_throttle(self)
+        self.profile_dir = None # Verilirse iş cProfile ile profillenir (Ayarlar > Tanılama)
+        from ..core.renamer import PdfRenamer
         self.renamer = PdfRenamer(logger=logger) # PdfRenamer instance ve logger aktarımı
         self.logger = logger # Logger'ı sakla
         
     def run(self):
         try:
-            success, message, _ = self.renamer.rename_pdfs(
+            success, message, _ = _run_with_metrics(self, "rename", self.pdf_files, lambda: self.renamer.rename_pdfs(
                 file_paths=self.pdf_files,
                 output_dir=self.output_dir,
                 options=self.options,
                 progress_callback=self._update_progress,
                 interrupt_check=self.is_interrupted
-            )
+            ))
             if self._interrupted:
                 self.finished.emit(False, "İşlem kullanıcı tarafından iptal edildi.")
                 return
@@ -42,7 +83,7 @@ class PDFRenameWorker(QThread):
             self.finished.emit(False, f"Beklenmeyen hata: {str(e)}")
     
     def _update_progress(self, value):
-        self.progress.emit(value)
+        self.progress_throttle(value)
 
     def requestInterruption(self):
         """İşlemi nazikçe durdurmak için."""
@@ -57,26 +98,31 @@ class PDFSplitWorker(QThread):
     """PDF bölme işlemini arka planda yürüten iş parçacığı."""
     
     progress = pyqtSignal(int)
+    progress_detail = pyqtSignal(object)  # Seyrekleştirilmiş ProgressUpdate (yüzde, kalan süre, sayfa, dosya)
     finished = pyqtSignal(bool, str)
+    metrics = pyqtSignal(dict)  # İş bitince ölçüm kaydı (JobMetrics.to_dict)
     
-    def __init__(self, pdf_file, output_dir, options, logger=None):
+    def __init__(self, pdf_file, output_dir, options, logger=None, pool=None):
         super().__init__()
         self.pdf_file = pdf_file
         self.output_dir = output_dir
         self.options = options or {}
         self._interrupted = False
-        self.splitter = PdfSplitter(logger=logger) # PdfSplitter instance ve logger aktarımı
+        self.progress_throttle = _progress_throttle(self)
+        self.profile_dir = None # Verilirse iş cProfile ile profillenir (Ayarlar > Tanılama)
+        from ..core.splitter import PdfSplitter
+        self.splitter = PdfSplitter(logger=logger, pool=pool) # PdfSplitter instance ve logger aktarımı
         self.logger = logger # Logger'ı sakla
         
     def run(self):
         try:
-            success, message, _ = self.splitter.split_pdf(
+            success, message, _ = _run_with_metrics(self, "split", [self.pdf_file], lambda: self.splitter.split_pdf(
                 file_path=self.pdf_file,
                 output_dir=self.output_dir,
                 options=self.options,
                 progress_callback=self._update_progress,
                 interrupt_check=self.is_interrupted
-            )
+            ))
             if self._interrupted:
                 self.finished.emit(False, "İşlem kullanıcı tarafından iptal edildi.")
                 return
@@ -85,7 +131,7 @@ class PDFSplitWorker(QThread):
             self.finished.emit(False, f"Hata: {str(e)}")
 
     def _update_progress(self, value):
-        self.progress.emit(value)
+        self.progress_throttle(value)
             
     def requestInterruption(self):
         """İşlemi nazikçe durdurmak için."""
@@ -100,24 +146,31 @@ class PDFMergeWorker(QThread):
     """PDF birleştirme işlemini arka planda yürüten iş parçacığı."""
     
     progress = pyqtSignal(int)
+    progress_detail = pyqtSignal(object)  # Seyrekleştirilmiş ProgressUpdate (yüzde, kalan süre, sayfa, dosya)
     finished = pyqtSignal(bool, str)
+    metrics = pyqtSignal(dict)  # İş bitince ölçüm kaydı (JobMetrics.to_dict)
     
-    def __init__(self, pdf_files, output_file, logger=None):
+    def __init__(self, pdf_files, output_file, options=None, logger=None):
         super().__init__()
-        self.pdf_files = pdf_files
+        self.pdf_files = pdf_files # Yol ya da (yol, sayfa ifadesi) çiftleri
         self.output_file = output_file
+        self.options = options or {}
         self._interrupted = False
+        self.progress_throttle = _progress_throttle(self)
+        self.profile_dir = None # Verilirse iş cProfile ile profillenir (Ayarlar > Tanılama)
+        from ..core.merger import PdfMerger
         self.merger = PdfMerger(logger=logger) # PdfMerger instance ve logger aktarımı
         self.logger = logger # Logger'ı sakla
         
     def run(self):
         try:
-            success, message, _ = self.merger.merge_pdfs(
+            success, message, _ = _run_with_metrics(self, "merge", self.pdf_files, lambda: self.merger.merge_pdfs(
                 file_paths=self.pdf_files,
                 output_path=self.output_file,
                 progress_callback=self._update_progress,
-                interrupt_check=self.is_interrupted
-            )
+                interrupt_check=self.is_interrupted,
+                options=self.options
+            ))
             if self._interrupted:
                 self.finished.emit(False, "İşlem kullanıcı tarafından iptal edildi.")
                 return
@@ -126,7 +179,7 @@ class PDFMergeWorker(QThread):
             self.finished.emit(False, f"Hata: {str(e)}")
 
     def _update_progress(self, value):
-        self.progress.emit(value)
+        self.progress_throttle(value)
             
     def requestInterruption(self):
         """İşlemi nazikçe durdurmak için."""
@@ -140,9 +193,11 @@ class PDFMergeWorker(QThread):
 class PDFExtractWorker(QThread):
     """PDF sayfa çıkarma işlemini arka planda yürüten iş parçacığı."""
     progress = pyqtSignal(int)
+    progress_detail = pyqtSignal(object)  # Seyrekleştirilmiş ProgressUpdate (yüzde, kalan süre, sayfa, dosya)
     finished = pyqtSignal(bool, str)
+    metrics = pyqtSignal(dict)  # İş bitince ölçüm kaydı (JobMetrics.to_dict)
     
-    def __init__(self, pdf_file, output_dir, extract_all, page_range, file_prefix, logger=None):
+    def __init__(self, pdf_file, output_dir, extract_all, page_range, file_prefix, logger=None, pool=None):
         super().__init__()
         self.pdf_file = pdf_file
         self.output_dir = output_dir
@@ -152,18 +207,21 @@ class PDFExtractWorker(QThread):
             "file_prefix": file_prefix
         }
         self._interrupted = False
-        self.extractor = PdfExtractor(logger=logger) # PdfExtractor instance ve logger aktarımı
+        self.progress_throttle = _progress_throttle(self)
+        self.profile_dir = None # Verilirse iş cProfile ile profillenir (Ayarlar > Tanılama)
+        from ..core.extractor import PdfExtractor
+        self.extractor = PdfExtractor(logger=logger, pool=pool) # PdfExtractor instance ve logger aktarımı
         self.logger = logger # Logger'ı sakla
         
     def run(self):
         try:
-            success, message, _ = self.extractor.extract_pages(
+            success, message, _ = _run_with_metrics(self, "extract", [self.pdf_file], lambda: self.extractor.extract_pages(
                 file_path=self.pdf_file,
                 output_dir=self.output_dir,
                 options=self.options,
                 progress_callback=self._update_progress,
                 interrupt_check=self.is_interrupted
-            )
+            ))
             if self._interrupted:
                 self.finished.emit(False, "İşlem kullanıcı tarafından iptal edildi.")
                 return
@@ -172,7 +230,54 @@ class PDFExtractWorker(QThread):
             self.finished.emit(False, f"Hata: {str(e)}")
 
     def _update_progress(self, value):
-        self.progress.emit(value)
+        self.progress_throttle(value)
+            
+    def requestInterruption(self):
+        """İşlemi nazikçe durdurmak için."""
+        self._interrupted = True
+        super().requestInterruption()
+        
+    def is_interrupted(self):
+        """İşlem iptal edildi mi kontrol eder."""
+        return self._interrupted
+
+class PDFOptimizeWorker(QThread):
+    """PDF optimizasyon (görüntü küçültme) işlemini arka planda yürüten iş parçacığı."""
+    progress = pyqtSignal(int)
+    progress_detail = pyqtSignal(object)  # Seyrekleştirilmiş ProgressUpdate (yüzde, kalan süre, sayfa, dosya)
+    finished = pyqtSignal(bool, str)
+    metrics = pyqtSignal(dict)  # İş bitince ölçüm kaydı (JobMetrics.to_dict)
+    
+    def __init__(self, pdf_files, output_dir, options=None, logger=None):
+        super().__init__()
+        self.pdf_files = pdf_files if isinstance(pdf_files, list) else [pdf_files]
+        self.output_dir = output_dir
+        self.options = options or {}
+        self._interrupted = False
+        self.progress_throttle = _progress_throttle(self)
+        self.profile_dir = None # Verilirse iş cProfile ile profillenir (Ayarlar > Tanılama)
+        from ..core.optimizer import PdfOptimizer
+        self.optimizer = PdfOptimizer(logger=logger) # PdfOptimizer instance ve logger aktarımı
+        self.logger = logger # Logger'ı sakla
+        
+    def run(self):
+        try:
+            success, message, _ = _run_with_metrics(self, "optimize", self.pdf_files, lambda: self.optimizer.optimize_pdfs(
+                file_paths=self.pdf_files,
+                output_dir=self.output_dir,
+                options=self.options,
+                progress_callback=self._update_progress,
+                interrupt_check=self.is_interrupted
+            ))
+            if self._interrupted:
+                self.finished.emit(False, "İşlem kullanıcı tarafından iptal edildi.")
+                return
+            self.finished.emit(success, message)
+        except Exception as e:
+            self.finished.emit(False, f"Hata: {str(e)}")
+
+    def _update_progress(self, value):
+        self.progress_throttle(value)
             
     def requestInterruption(self):
         """İşlemi nazikçe durdurmak için."""
@@ -187,14 +292,23 @@ class PdfService(QObject):
     """PDF işlemleri için servis sınıfı."""
     
     progress_updated = pyqtSignal(int)
+    job_metrics = pyqtSignal(dict)  # Biten her işin ölçüm kaydı (ölçüm günlüğüne de eklenir)
     
-    def __init__(self):
+    def __init__(self, metrics_log_path: Optional[str] = None):
         super().__init__()
         self.split_worker = None
         self.merge_worker = None
         self.extract_worker = None
         self.rename_worker = None
+        self.optimize_worker = None
         self.logger = logging.getLogger("PdfService") # Logger ekle
+        self.metrics_log_path = metrics_log_path or get_metrics_log_path()
+
+    @property
+    def document_pool(self):
+        """Önizleme ve işlemlerin paylaştığı açık belgeler (havuz ilk kullanımda kurulur)."""
+        from ..core.document_pool import session_pool
+        return session_pool()
         
     def check_pdf(self, file_path: str) -> tuple:
         """PDF dosyasını kontrol eder."""
@@ -204,15 +318,14 @@ class PdfService(QObject):
                 return False, "Dosya bulunamadı: " + file_path, None
                 
             # PDF'i aç ve bilgileri al
-            pdf = fitz.open(file_path)
-            info = {
-                "sayfa_sayısı": len(pdf),
-                "başlık": pdf.metadata.get("title", ""),
-                "yazar": pdf.metadata.get("author", ""),
-                "oluşturma_tarihi": pdf.metadata.get("creationDate", ""),
-                "boyut": os.path.getsize(file_path)
-            }
-            pdf.close()
+            with self.document_pool.borrow_document(file_path) as pdf:
+                info = {
+                    "sayfa_sayısı": len(pdf),
+                    "başlık": pdf.metadata.get("title", ""),
+                    "yazar": pdf.metadata.get("author", ""),
+                    "oluşturma_tarihi": pdf.metadata.get("creationDate", ""),
+                    "boyut": os.path.getsize(file_path)
+                }
             
             self.logger.info(f"PDF kontrolü başarılı: {file_path}")
             return True, "PDF dosyası geçerli.", info
@@ -220,17 +333,34 @@ class PdfService(QObject):
             self.logger.error(f"PDF kontrolü başarısız ({file_path}): {str(e)}")
             return False, f"PDF dosyası açılamadı: {str(e)}", None
     
+    def _with_engine(self, options) -> dict:
+        """Seçeneklere ayarlardaki PDF motorunu ekler (seçeneklerde verilmediyse)."""
+        options = dict(options or {})
+        options.setdefault("engine", get_pdf_engine())
+        return options
+    
+    def _profile_dir(self) -> Optional[str]:
+        """Tanılama profili açıksa profil klasörü, değilse None."""
+        return get_profile_dir() if get_profile_jobs() else None
+    
     def create_split_worker(self, file_path: str, output_dir: str, options=None) -> PDFSplitWorker:
         """Bölme iş parçacığı oluşturur."""
-        self.split_worker = PDFSplitWorker(file_path, output_dir, options, logger=self.logger) # Logger'ı aktar
+        options = self._with_engine(options)
+        self.split_worker = PDFSplitWorker(file_path, output_dir, options, logger=self.logger,
+                                           pool=self.document_pool) # Logger'ı aktar
         self.split_worker.progress.connect(self.progress_updated)
+        self.split_worker.metrics.connect(self._handle_job_metrics)
+        self.split_worker.profile_dir = self._profile_dir()
         self.split_worker.finished.connect(lambda success, message: self._handle_worker_finished(self.split_worker, success, message))
         return self.split_worker
     
-    def create_merge_worker(self, file_paths: List[str], output_path: str) -> PDFMergeWorker:
-        """Birleştirme iş parçacığı oluşturur."""
-        self.merge_worker = PDFMergeWorker(file_paths, output_path, logger=self.logger) # Logger'ı aktar
+    def create_merge_worker(self, file_paths: list, output_path: str, options=None) -> PDFMergeWorker:
+        """Birleştirme iş parçacığı oluşturur (girdiler yol ya da (yol, sayfa ifadesi) olabilir)."""
+        options = self._with_engine(options)
+        self.merge_worker = PDFMergeWorker(file_paths, output_path, options, logger=self.logger) # Logger'ı aktar
         self.merge_worker.progress.connect(self.progress_updated)
+        self.merge_worker.metrics.connect(self._handle_job_metrics)
+        self.merge_worker.profile_dir = self._profile_dir()
         self.merge_worker.finished.connect(lambda success, message: self._handle_worker_finished(self.merge_worker, success, message))
         return self.merge_worker
     
@@ -238,8 +368,12 @@ class PdfService(QObject):
                              extract_all: bool, page_range: str,
                              file_prefix: str) -> PDFExtractWorker:
         """Ayıklama iş parçacığı oluşturur."""
-        self.extract_worker = PDFExtractWorker(pdf_file, output_dir, extract_all, page_range, file_prefix, logger=self.logger) # Logger'ı aktar
+        self.extract_worker = PDFExtractWorker(pdf_file, output_dir, extract_all, page_range, file_prefix,
+                                               logger=self.logger, pool=self.document_pool) # Logger'ı aktar
+        self.extract_worker.options = self._with_engine(self.extract_worker.options)
         self.extract_worker.progress.connect(self.progress_updated)
+        self.extract_worker.metrics.connect(self._handle_job_metrics)
+        self.extract_worker.profile_dir = self._profile_dir()
         self.extract_worker.finished.connect(lambda success, message: self._handle_worker_finished(self.extract_worker, success, message))
         return self.extract_worker
         
@@ -247,9 +381,20 @@ class PdfService(QObject):
         """Yeniden adlandırma iş parçacığı oluşturur."""
         self.rename_worker = PDFRenameWorker(file_paths, output_dir, options, logger=self.logger) # Logger'ı aktar
         self.rename_worker.progress.connect(self.progress_updated)
+        self.rename_worker.metrics.connect(self._handle_job_metrics)
+        self.rename_worker.profile_dir = self._profile_dir()
         self.rename_worker.finished.connect(lambda success, message: self._handle_worker_finished(self.rename_worker, success, message))
         return self.rename_worker 
 
+    def create_optimize_worker(self, file_paths, output_dir: str, options=None) -> PDFOptimizeWorker:
+        """Optimizasyon iş parçacığı oluşturur."""
+        self.optimize_worker = PDFOptimizeWorker(file_paths, output_dir, options, logger=self.logger) # Logger'ı aktar
+        self.optimize_worker.progress.connect(self.progress_updated)
+        self.optimize_worker.metrics.connect(self._handle_job_metrics)
+        self.optimize_worker.profile_dir = self._profile_dir()
+        self.optimize_worker.finished.connect(lambda success, message: self._handle_worker_finished(self.optimize_worker, success, message))
+        return self.optimize_worker
+
     def validate_files(self, file_paths: list) -> tuple:
         """
         Dosya listesinin geçerliliğini kontrol eder.
@@ -282,6 +427,16 @@ class PdfService(QObject):
         
         return True, "Tüm dosyalar geçerli"
 
+    def _handle_job_metrics(self, record: dict):
+        """İşin ölçüm kaydını günlüğe ekler ve yayınlar."""
+        self.logger.info(f"İş ölçümü: {record['operation']} {record['wall_s']:.2f} sn, "
+                         f"{record['pages']} sayfa, en yüksek RSS artışı {record['peak_rss_delta_mb']} MB")
+        try:
+            append_metrics_log(record, self.metrics_log_path)
+        except OSError as e:
+            self.logger.warning(f"Ölçüm günlüğüne yazılamadı ({self.metrics_log_path}): {str(e)}")
+        self.job_metrics.emit(record)
+    
     def _handle_worker_finished(self, worker_thread: QThread, success: bool, message: str):
         """İş parçacığı tamamlandığında çağrılır."""
         if success:
@@ -1,12 +1,16 @@
 """
 UI modülü - PyQt arayüz bileşenleri.
 """
-from .windows.main_window import MainWindow
-from .windows import PDFRenameWindow, PDFSplitWindow, PDFMergeWindow, PDFExtractWindow
-from .components import (
-    ModernButton, ModernLineEdit, DragDropWidget, FileListWidget,
-    ModernProgressBar, HeaderLabel, InfoLabel, ErrorLabel
-)
+from .._lazy import lazy_exports
+
+__getattr__ = lazy_exports(__name__, {
+    'MainWindow': '.windows.main_window',
+    'PDFRenameWindow': '.windows', 'PDFSplitWindow': '.windows',
+    'PDFMergeWindow': '.windows', 'PDFExtractWindow': '.windows',
+    'ModernButton': '.components', 'ModernLineEdit': '.components', 'DragDropWidget': '.components',
+    'FileListWidget': '.components', 'ModernProgressBar': '.components',
+    'HeaderLabel': '.components', 'InfoLabel': '.components', 'ErrorLabel': '.components',
+})
 
 __all__ = [
     'MainWindow', 'PDFRenameWindow', 'PDFSplitWindow', 'PDFMergeWindow', 'PDFExtractWindow',
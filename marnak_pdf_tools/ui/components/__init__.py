@@ -1,15 +1,20 @@
 """
 UI components modülü - Yeniden kullanılabilir arayüz bileşenleri.
 """
+from ..._lazy import lazy_exports
+
+# Bileşenler ilk erişimde içe aktarılır; fitz yalnızca PdfViewer/PdfPreviewPopup istenince yüklenir.
 # Düğmeler artık modern_button.py'den içe aktarılıyor
-from .modern_button import ModernButton
-from .inputs import ModernLineEdit
-from .drag_drop import DragDropWidget
-from .list_widget import PDFListWidget as FileListWidget
-from .progress import ModernProgressBar
-from .labels import HeaderLabel, InfoLabel, ErrorLabel
-from .pdf_viewer import PdfViewer
-from .pdf_preview_popup import PdfPreviewPopup
+__getattr__ = lazy_exports(__name__, {
+    'ModernButton': '.modern_button',
+    'ModernLineEdit': '.inputs',
+    'DragDropWidget': '.drag_drop',
+    'FileListWidget': ('.list_widget', 'PDFListWidget'),
+    'ModernProgressBar': '.progress',
+    'HeaderLabel': '.labels', 'InfoLabel': '.labels', 'ErrorLabel': '.labels',
+    'PdfViewer': '.pdf_viewer',
+    'PdfPreviewPopup': '.pdf_preview_popup',
+})
 
 __all__ = [
     'ModernButton',
@@ -2,7 +2,7 @@
 Liste widget bileşenleri.
 """
 import os
-from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QMenu, QScrollBar
+from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QMenu, QScrollBar, QInputDialog
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QKeyEvent, QAction, QFont, QCursor
 
@@ -14,6 +14,11 @@ MARNAK_LIGHT_GREEN = "#E8F5EA"
 MARNAK_GRAY = "#F5F5F5"
 MARNAK_DARK_GRAY = "#E0E0E0"
 
+# Satıra ait sayfa ifadesinin saklandığı rol (örn. "3-9")
+PAGE_RANGE_ROLE = Qt.ItemDataRole.UserRole + 1
+# Satırın sayfa sırasının ters çevrilip çevrilmeyeceği
+REVERSE_ROLE = Qt.ItemDataRole.UserRole + 2
+
 class PDFListWidget(QListWidget):
     """PDF dosyaları için liste widget'ı."""
     
@@ -22,11 +27,12 @@ class PDFListWidget(QListWidget):
     files_removed = pyqtSignal()  # Dosyalar kaldırıldığında özel sinyal
     pdf_selected = pyqtSignal(str)  # PDF seçildiğinde (dosya yolu)
     
-    def __init__(self, parent=None, selectable=False):
+    def __init__(self, parent=None, selectable=False, page_ranges=False):
         """
         Args:
             parent: Üst widget
             selectable: Öğelerin seçilebilir (checkbox) olup olmadığı
+            page_ranges: Satır başına sayfa ifadesi ve ters sıra seçilebilir mi
         """
         super().__init__(parent)
         self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
@@ -38,6 +44,11 @@ class PDFListWidget(QListWidget):
         # Seçilebilir mi?
         self.selectable = selectable
         
+        # Satır başına sayfa aralığı
+        self.page_ranges = page_ranges
+        if page_ranges:
+            self.itemDoubleClicked.connect(self.edit_page_range)
+        
         # PDF Önizleme sistemi - tıklama ile
         # Hover sistemi kaldırıldı, tıklama sistemi kullanılacak
         
@@ -106,12 +117,7 @@ class PDFListWidget(QListWidget):
             checked: İşaretli mi (sadece selectable=True ise geçerli)
         """
         if file_path.lower().endswith('.pdf'):
-            # Dosya adını kısalt
-            display_name = os.path.basename(file_path)
-            if len(display_name) > 30:
-                display_name = display_name[:15] + "..." + display_name[-15:]
-            
-            item = QListWidgetItem("📄 " + display_name)
+            item = QListWidgetItem(self._display_text(file_path))
             item.setData(Qt.ItemDataRole.UserRole, file_path)
             item.setToolTip(file_path)  # Tam dosya yolunu tooltip olarak göster
             
@@ -126,6 +132,86 @@ class PDFListWidget(QListWidget):
             self.addItem(item)
             self.files_changed.emit()
             
+    def _display_text(self, file_path: str, page_range: str = "", reverse: bool = False) -> str:
+        """Satırda gösterilecek metni oluşturur."""
+        # Dosya adını kısalt
+        display_name = os.path.basename(file_path)
+        if len(display_name) > 30:
+            display_name = display_name[:15] + "..." + display_name[-15:]
+        
+        text = "📄 " + display_name
+        if page_range:
+            text += f"  [{page_range}]"
+        if reverse:
+            text += "  ⇅"
+        return text
+    
+    def _refresh_item(self, item: QListWidgetItem):
+        """Satır metnini ve ipucunu saklanan verilere göre günceller."""
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        page_range = item.data(PAGE_RANGE_ROLE) or ""
+        reverse = bool(item.data(REVERSE_ROLE))
+        item.setText(self._display_text(file_path, page_range, reverse))
+        
+        tooltip = file_path
+        if page_range:
+            tooltip += f"\nSayfalar: {page_range}"
+        if reverse:
+            tooltip += "\nSayfa sırası ters çevrilecek"
+        item.setToolTip(tooltip)
+    
+    def set_page_range(self, row: int, page_range: str):
+        """Bir satırın sayfa ifadesini ayarlar (boş metin tüm sayfalar demektir)."""
+        item = self.item(row)
+        if item is None:
+            return
+        
+        item.setData(PAGE_RANGE_ROLE, (page_range or "").strip())
+        self._refresh_item(item)
+        self.files_changed.emit()
+    
+    def get_page_range(self, row: int) -> str:
+        """Bir satırın sayfa ifadesini döndürür."""
+        item = self.item(row)
+        return (item.data(PAGE_RANGE_ROLE) or "") if item else ""
+    
+    def edit_page_range(self, item: QListWidgetItem):
+        """Satırın sayfa ifadesini düzenlemek için giriş penceresi açar."""
+        row = self.row(item)
+        file_name = os.path.basename(item.data(Qt.ItemDataRole.UserRole))
+        page_range, ok = QInputDialog.getText(
+            self,
+            "Sayfa Aralığı",
+            f"{file_name} için sayfalar (boş bırakılırsa tümü):\nÖrn: 1, 3-9, 5-end, -1 (son sayfa)",
+            text=self.get_page_range(row)
+        )
+        if ok:
+            self.set_page_range(row, page_range)
+    
+    def set_reversed(self, row: int, reverse: bool):
+        """Bir satırın sayfa sırasının ters çevrilip çevrilmeyeceğini ayarlar."""
+        item = self.item(row)
+        if item is None:
+            return
+        
+        item.setData(REVERSE_ROLE, bool(reverse))
+        self._refresh_item(item)
+        self.files_changed.emit()
+    
+    def is_reversed(self, row: int) -> bool:
+        """Bir satırın sayfa sırası ters çevrilecek mi?"""
+        item = self.item(row)
+        return bool(item.data(REVERSE_ROLE)) if item else False
+    
+    def get_reversed_rows(self):
+        """Sayfa sırası ters çevrilecek satırların indekslerini döndürür."""
+        return [i for i in range(self.count()) if self.is_reversed(i)]
+    
+    def get_file_entries(self):
+        """Dosya yollarını sayfa ifadeleriyle birlikte [(yol, ifade), ...] olarak döndürür."""
+        return [(self.item(i).data(Qt.ItemDataRole.UserRole), self.get_page_range(i))
+                for i in range(self.count())]
+    
     def get_files(self):
         """Liste widget'ındaki tüm dosya yollarını döndürür."""
         return [self.item(i).data(Qt.ItemDataRole.UserRole) for i in range(self.count())]
@@ -194,6 +280,23 @@ class PDFListWidget(QListWidget):
             delete_action.triggered.connect(self.remove_selected)
             menu.addAction(delete_action)
         
+        # Sayfa aralığı belirle
+        if self.page_ranges:
+            current_item = self.itemAt(position)
+            if current_item is not None:
+                range_action = QAction("📑 Sayfa Aralığı Belirle...", self)
+                range_action.setFont(QFont("Segoe UI", 10))
+                range_action.triggered.connect(lambda: self.edit_page_range(current_item))
+                menu.addAction(range_action)
+                
+                reverse_action = QAction("⇅ Sayfa Sırasını Ters Çevir (sondan başa)", self)
+                reverse_action.setFont(QFont("Segoe UI", 10))
+                reverse_action.setCheckable(True)
+                reverse_action.setChecked(self.is_reversed(self.row(current_item)))
+                reverse_action.triggered.connect(
+                    lambda checked: self.set_reversed(self.row(current_item), checked))
+                menu.addAction(reverse_action)
+        
         menu.addSeparator()
         
         # Tümünü seç
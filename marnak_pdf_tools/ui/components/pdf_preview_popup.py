@@ -10,6 +10,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize, QRect, QPoint
 from PyQt6.QtGui import QPixmap, QFont, QPainter, QColor, QCursor
 import fitz  # PyMuPDF
+from ...core.document_pool import session_pool
 
 from ..styles import get_card_style, get_header_style, get_scaled_styles
 
@@ -23,7 +24,6 @@ class PdfPreviewPopup(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.pdf_path = None
-        self.pdf_document = None
         # Daha büyük önizleme boyutu
         self.preview_size = QSize(450, 600)
         
@@ -197,11 +197,6 @@ class PdfPreviewPopup(QWidget):
     def clear_preview(self):
         """Önceki önizlemeyi temizle."""
         try:
-            # PDF belgesini kapat
-            if self.pdf_document:
-                self.pdf_document.close()
-                self.pdf_document = None
-                
             # Görüntüyü temizle
             self.image_label.clear()
             self.info_label.clear()
@@ -222,49 +217,49 @@ class PdfPreviewPopup(QWidget):
             return
             
         try:
-            # PDF belgesini aç
+            # PDF belgesini yalnızca çizim süresince havuzdan ödünç al; iade edilen
+            # belgeyi arka plandaki bölme/çıkarma işi havuzdan yeniden kullanır
             print("PDF belgesi açılıyor...")
-            self.pdf_document = fitz.open(self.pdf_path)
-            
-            if len(self.pdf_document) == 0:
-                print("PDF boş")
-                self.show_error("PDF boş")
-                return
+            with session_pool().borrow_document(self.pdf_path) as pdf_document:
+                if len(pdf_document) == 0:
+                    print("PDF boş")
+                    self.show_error("PDF boş")
+                    return
                 
-            print(f"PDF açıldı, sayfa sayısı: {len(self.pdf_document)}")
+                print(f"PDF açıldı, sayfa sayısı: {len(pdf_document)}")
                 
-            # İlk sayfayı render et
-            page = self.pdf_document[0]
+                # İlk sayfayı render et
+                page = pdf_document[0]
             
-            # Ölçek hesapla - daha yüksek kalite için
-            page_rect = page.rect
-            available_width = self.preview_size.width() - 30  # Daha fazla padding
-            available_height = self.preview_size.height() - 30
+                # Ölçek hesapla - daha yüksek kalite için
+                page_rect = page.rect
+                available_width = self.preview_size.width() - 30  # Daha fazla padding
+                available_height = self.preview_size.height() - 30
             
-            scale_x = available_width / page_rect.width
-            scale_y = available_height / page_rect.height
-            scale = min(scale_x, scale_y, 3.0)  # Maksimum 3x büyütme (daha yüksek kalite)
+                scale_x = available_width / page_rect.width
+                scale_y = available_height / page_rect.height
+                scale = min(scale_x, scale_y, 3.0)  # Maksimum 3x büyütme (daha yüksek kalite)
             
-            print(f"Render ölçeği: {scale}, boyut: {self.preview_size}")
+                print(f"Render ölçeği: {scale}, boyut: {self.preview_size}")
             
-            # Sayfayı pixmap'e render et
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat)
+                # Sayfayı pixmap'e render et
+                mat = fitz.Matrix(scale, scale)
+                pix = page.get_pixmap(matrix=mat)
             
-            # PyQt6 QPixmap'e çevir
-            img_data = pix.tobytes("ppm")
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_data)
+                # PyQt6 QPixmap'e çevir
+                img_data = pix.tobytes("ppm")
+                pixmap = QPixmap()
+                pixmap.loadFromData(img_data)
             
-            print(f"Pixmap oluşturuldu: {pixmap.size()}")
+                print(f"Pixmap oluşturuldu: {pixmap.size()}")
             
-            # Görüntüyü label'a set et
-            self.image_label.setPixmap(pixmap)
+                # Görüntüyü label'a set et
+                self.image_label.setPixmap(pixmap)
             
-            # Dosya bilgisi
-            file_size = os.path.getsize(self.pdf_path) / (1024 * 1024)  # MB
-            info_text = f"📄 {len(self.pdf_document)} sayfa\n💾 {file_size:.1f} MB"
-            self.info_label.setText(info_text)
+                # Dosya bilgisi
+                file_size = os.path.getsize(self.pdf_path) / (1024 * 1024)  # MB
+                info_text = f"📄 {len(pdf_document)} sayfa\n💾 {file_size:.1f} MB"
+                self.info_label.setText(info_text)
             
             print("PDF render tamamlandı")
             
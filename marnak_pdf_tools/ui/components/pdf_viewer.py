@@ -11,6 +11,7 @@ from PyQt6.QtGui import QPixmap, QFont
 import fitz  # PyMuPDF
 
 from .modern_button import ModernButton
+from ...core.document_pool import session_pool
 from ..styles import (
     CARD_STYLE, FORM_STYLE, PRIMARY_BUTTON_STYLE, 
     SECONDARY_BUTTON_STYLE, INFO_BOX_STYLE
@@ -24,7 +25,8 @@ class PdfViewer(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.pdf_document = None
+        # Belge açık tutulmaz; her çizimde oturum havuzundan ödünç alınıp iade edilir
+        self.pdf_path = None
         self.current_page = 0
         self.total_pages = 0
         self.page_scale = 1.0
@@ -162,9 +164,12 @@ class PdfViewer(QWidget):
                 self.show_error(self.tr("Dosya bulunamadı: {}").format(file_path))
                 return False
                 
-            # PDF belgesini aç
-            self.pdf_document = fitz.open(file_path)
-            self.total_pages = len(self.pdf_document)
+            # Sayfa sayısı için belgeyi oturum havuzundan ödünç al ve hemen iade et;
+            # arka plandaki bölme/çıkarma işi aynı belgeyi havuzdan yeniden kullanır
+            self.release_document()
+            with session_pool().borrow_document(file_path) as pdf_document:
+                self.total_pages = len(pdf_document)
+            self.pdf_path = file_path
             self.current_page = 0
             
             if self.total_pages > 0:
@@ -181,16 +186,14 @@ class PdfViewer(QWidget):
     
     def show_page(self, page_number):
         """Belirtilen sayfayı gösterir."""
-        if not self.pdf_document or page_number < 0 or page_number >= self.total_pages:
+        if not self.pdf_path or page_number < 0 or page_number >= self.total_pages:
             return
             
         try:
-            # Sayfayı al
-            page = self.pdf_document[page_number]
-            
-            # Sayfayı görüntüye dönüştür
+            # Sayfayı görüntüye dönüştür (belge yalnızca çizim süresince ödünç alınır)
             mat = fitz.Matrix(self.page_scale, self.page_scale)
-            pix = page.get_pixmap(matrix=mat)
+            with session_pool().borrow_document(self.pdf_path) as pdf_document:
+                pix = pdf_document[page_number].get_pixmap(matrix=mat)
             
             # QPixmap'e dönüştür
             img_data = pix.tobytes("png")
@@ -228,7 +231,7 @@ class PdfViewer(QWidget):
         if self.page_scale < 3.0:
             self.page_scale += 0.25
             self.update_zoom()
-            if self.pdf_document:
+            if self.pdf_path:
                 self.show_page(self.current_page)
     
     def zoom_out(self):
@@ -236,18 +239,18 @@ class PdfViewer(QWidget):
         if self.page_scale > 0.25:
             self.page_scale -= 0.25
             self.update_zoom()
-            if self.pdf_document:
+            if self.pdf_path:
                 self.show_page(self.current_page)
     
     def fit_to_width(self):
         """Genişliğe sığdır."""
-        if not self.pdf_document or self.current_page < 0:
+        if not self.pdf_path or self.current_page < 0:
             return
             
         try:
             # Mevcut sayfanın genişliğini al
-            page = self.pdf_document[self.current_page]
-            page_width = page.rect.width
+            with session_pool().borrow_document(self.pdf_path) as pdf_document:
+                page_width = pdf_document[self.current_page].rect.width
             
             # Scroll area'nın kullanılabilir genişliğini al
             available_width = self.scroll_area.viewport().width() - 20  # Padding için
@@ -271,7 +274,7 @@ class PdfViewer(QWidget):
     
     def update_controls(self):
         """Kontrol butonlarının durumunu günceller."""
-        if not self.pdf_document:
+        if not self.pdf_path:
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
             return
@@ -293,11 +296,13 @@ class PdfViewer(QWidget):
         """)
         self.update_controls()
     
+    def release_document(self):
+        """Gösterilen belgeyi bırakır (belge havuzda açık kalır, yalnızca yolu unutulur)."""
+        self.pdf_path = None
+    
     def clear(self):
         """Önizlemeyi temizler."""
-        if self.pdf_document:
-            self.pdf_document.close()
-            self.pdf_document = None
+        self.release_document()
             
         self.current_page = 0
         self.total_pages = 0
@@ -319,6 +324,5 @@ class PdfViewer(QWidget):
     
     def closeEvent(self, event):
         """Widget kapatılırken PDF belgesini temizle."""
-        if self.pdf_document:
-            self.pdf_document.close()
+        self.release_document()
         event.accept()
@@ -2,9 +2,14 @@
 PDF işlem pencereleri modülü.
 """
 
-from .pdf_rename_window import PDFRenameWindow
-from .pdf_split_window import PDFSplitWindow
-from .pdf_merge_window import PDFMergeWindow
-from .pdf_extract_window import PDFExtractWindow
+from ..._lazy import lazy_exports
+
+# Pencereler ilk erişimde içe aktarılır (ana pencere araç pencerelerini ilk gezinmede kurar)
+__getattr__ = lazy_exports(__name__, {
+    'PDFRenameWindow': '.pdf_rename_window',
+    'PDFSplitWindow': '.pdf_split_window',
+    'PDFMergeWindow': '.pdf_merge_window',
+    'PDFExtractWindow': '.pdf_extract_window',
+})
 
 __all__ = ['PDFRenameWindow', 'PDFSplitWindow', 'PDFMergeWindow', 'PDFExtractWindow'] 
\ No newline at end of file
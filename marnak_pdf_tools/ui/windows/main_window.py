@@ -1,6 +1,7 @@
 """
 Ana pencere.
 """
+import importlib
 import os
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -10,10 +11,6 @@ from PyQt6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QIcon, QFont
 
 from ..components import ModernButton, HeaderLabel
-from .pdf_rename_window import PDFRenameWindow
-from .pdf_split_window import PDFSplitWindow
-from .pdf_merge_window import PDFMergeWindow
-from .pdf_extract_window import PDFExtractWindow
 from .settings_window import SettingsWindow
 from ..styles import (
     MAIN_WINDOW_STYLE,
@@ -36,6 +33,14 @@ from ...utils.settings import get_scale_factor
 class MainWindow(QMainWindow):
     """Ana pencere."""
     
+    # İçerik sayfaları (menü sırasıyla): öznitelik, modül, sınıf. Pencereler ilk gezinmede kurulur;
+    # modülleri (ve fitz/PyPDF2 kullanan görüntüleyiciler) o zamana kadar içe aktarılmaz.
+    TOOL_WINDOWS = (
+        ("rename_window", ".pdf_rename_window", "PDFRenameWindow"),
+        ("split_window", ".pdf_split_window", "PDFSplitWindow"),
+        ("merge_window", ".pdf_merge_window", "PDFMergeWindow"),
+    )
+    
     def __init__(self, pdf_service):
         super().__init__()
         self.pdf_service = pdf_service
@@ -129,14 +134,10 @@ class MainWindow(QMainWindow):
         self.content = QStackedWidget()
         self.content.setStyleSheet(CONTENT_WIDGET_STYLE)
         
-        # Pencereler
-        self.rename_window = PDFRenameWindow(self.pdf_service)
-        self.split_window = PDFSplitWindow(self.pdf_service)
-        self.merge_window = PDFMergeWindow(self.pdf_service)
-        
-        self.content.addWidget(self.rename_window)
-        self.content.addWidget(self.split_window)
-        self.content.addWidget(self.merge_window)
+        # Pencereler: kurulana kadar her sayfada boş bir yer tutucu durur
+        for attribute, _, _ in self.TOOL_WINDOWS:
+            setattr(self, attribute, None)
+            self.content.addWidget(QWidget())
         
         self.main_layout.addWidget(self.content)
         
@@ -146,6 +147,29 @@ class MainWindow(QMainWindow):
         # Mevcut ayarları yükle ve uygula
         self.load_initial_settings()
         
+        # Yalnızca açılış sayfası kurulur
+        self.show_rename_window()
+        
+    def tool_window(self, index: int) -> QWidget:
+        """İçerik sayfasının penceresini döndürür; ilk çağrıda kurar ve yer tutucunun yerine koyar."""
+        attribute, module_name, class_name = self.TOOL_WINDOWS[index]
+        window = getattr(self, attribute)
+        if window is None:
+            window_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            window = window_class(self.pdf_service)
+            placeholder = self.content.widget(index)
+            self.content.insertWidget(index, window)
+            self.content.removeWidget(placeholder)
+            placeholder.deleteLater()
+            setattr(self, attribute, window)
+            
+            # Açılışta diğer pencerelere uygulanan ölçek ve stiller
+            self.refresh_window_styles(window, self.get_content_styles())
+            font = QFont("Segoe UI", int(14 * get_scale_factor()))
+            window.setFont(font)
+            self.update_widget_scale_recursive(window, font)
+        return window
+        
     def toggle_menu(self):
         """Menüyü daralt/genişlet"""
         # Daralt/genişlet durumunu değiştir
@@ -236,15 +260,15 @@ class MainWindow(QMainWindow):
         
     def show_rename_window(self):
         """Yeniden adlandırma penceresini gösterir."""
-        self.content.setCurrentIndex(0)
+        self.content.setCurrentWidget(self.tool_window(0))
         
     def show_split_window(self):
         """Bölme penceresini gösterir."""
-        self.content.setCurrentIndex(1)
+        self.content.setCurrentWidget(self.tool_window(1))
         
     def show_merge_window(self):
         """Birleştirme penceresini gösterir."""
-        self.content.setCurrentIndex(2)
+        self.content.setCurrentWidget(self.tool_window(2))
         
     def show_settings_window(self):
         """Ayarlar penceresini gösterir."""
@@ -307,37 +331,39 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Stiller yenilenirken hata: {e}")
             
+    def get_content_styles(self) -> dict:
+        """İçerik pencerelerine uygulanan güncel (ölçeklenmiş) stiller."""
+        return {
+            'header': get_header_style(),
+            'subheader': get_subheader_style(),
+            'card': get_card_style(),
+            'button': get_button_style(),
+            'primary_button': get_primary_button_style(),
+            'secondary_button': get_secondary_button_style()
+        }
+            
     def refresh_content_windows_styles(self):
         """İçerik pencerelerinin stillerini yenile."""
         try:
             # Yeni dinamik stiller
-            header_style = get_header_style()
-            subheader_style = get_subheader_style()
-            card_style = get_card_style()
-            button_style = get_button_style()
-            primary_button_style = get_primary_button_style()
-            secondary_button_style = get_secondary_button_style()
+            styles = self.get_content_styles()
             
-            # StackedWidget içindeki tüm pencereler
+            # StackedWidget içindeki tüm pencereler (kurulmamış sayfaların yer tutucuları dahil)
             for i in range(self.content.count()):
-                widget = self.content.widget(i)
-                if widget and hasattr(widget, 'refresh_styles'):
-                    # Eğer pencerede refresh_styles metodu varsa çağır
-                    widget.refresh_styles()
-                elif widget:
-                    # Yoksa manuel olarak stilleri güncelle
-                    self.apply_styles_to_widget(widget, {
-                        'header': header_style,
-                        'subheader': subheader_style,
-                        'card': card_style,
-                        'button': button_style,
-                        'primary_button': primary_button_style,
-                        'secondary_button': secondary_button_style
-                    })
+                self.refresh_window_styles(self.content.widget(i), styles)
                     
         except Exception as e:
             print(f"İçerik penceresi stilleri yenilenirken hata: {e}")
             
+    def refresh_window_styles(self, widget, styles):
+        """Tek bir içerik penceresinin stillerini yenile."""
+        if widget and hasattr(widget, 'refresh_styles'):
+            # Eğer pencerede refresh_styles metodu varsa çağır
+            widget.refresh_styles()
+        elif widget:
+            # Yoksa manuel olarak stilleri güncelle
+            self.apply_styles_to_widget(widget, styles)
+            
     def apply_styles_to_widget(self, widget, styles):
         """Widget'a stilleri uygula."""
         try:
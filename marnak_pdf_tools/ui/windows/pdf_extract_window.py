@@ -13,6 +13,7 @@ from ..components import (
     PdfViewer
 )
 from ...services.pdf_service import PdfService
+from ...core.utils import PAGE_RANGE_SYNTAX_HELP
 from ...utils.file_utils import open_file
 
 class PDFExtractWindow(QWidget):
@@ -108,6 +109,7 @@ class PDFExtractWindow(QWidget):
         
         range_label = QLabel(self.tr("Sayfa Aralığı:"))
         self.page_range_input = ModernLineEdit("1,3-5,7")
+        self.page_range_input.setToolTip(PAGE_RANGE_SYNTAX_HELP)
         
         range_layout.addWidget(range_label, 1)
         range_layout.addWidget(self.page_range_input, 4)
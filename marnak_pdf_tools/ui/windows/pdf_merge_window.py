@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QFileDialog,
     QMessageBox, QLineEdit, QProgressBar,
-    QFrame, QScrollArea, QSplitter, QSizePolicy
+    QFrame, QScrollArea, QSplitter, QSizePolicy, QCheckBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSize
 from PyQt6.QtGui import QIcon, QPixmap, QResizeEvent
@@ -17,6 +17,7 @@ from ..components import (
     InfoLabel, ErrorLabel
 )
 from ...services.pdf_service import PdfService
+from ...core.merger import PdfMerger
 from ...utils.file_utils import open_file
 from ..styles import (
     SECTION_TITLE_STYLE, CARD_STYLE, FILE_LIST_STYLE,
@@ -188,7 +189,7 @@ class PDFMergeWindow(QWidget):
         file_list_label.setStyleSheet(FORM_STYLE)
         file_card_layout.addWidget(file_list_label)
         
-        self.file_list = FileListWidget(selectable=True)  # Seçilebilir mod
+        self.file_list = FileListWidget(selectable=True, page_ranges=True)  # Seçilebilir mod, satır başına sayfa aralığı
         self.file_list.setStyleSheet(FILE_LIST_STYLE)
         self.file_list.setMinimumHeight(400)  # PDF listesi için daha fazla alan
         self.file_list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -196,6 +197,13 @@ class PDFMergeWindow(QWidget):
         self.file_list.pdf_selected.connect(self.show_pdf_preview)
         file_card_layout.addWidget(self.file_list, 1)  # Stretch factor 1 ile ekle
         
+        # Sayfa aralığı ipucu
+        range_hint = QLabel("İpucu: Bir dosyanın yalnızca bazı sayfalarını eklemek için satıra çift tıklayın (örn: 1, 3-9). "
+                            "Sayfa sırasını ters çevirmek için sağ tıklayın.")
+        range_hint.setStyleSheet(INFO_BOX_STYLE)
+        range_hint.setWordWrap(True)
+        file_card_layout.addWidget(range_hint)
+        
         file_layout.addWidget(file_card, 1)  # Stretch factor 1 ile ekle
 
         # Orta panel - PDF Önizleme
@@ -255,6 +263,30 @@ class PDFMergeWindow(QWidget):
         
         output_card_layout.addLayout(output_path_layout)
         
+        # Harmanlama (çift taraflı tarama) modu
+        self.interleave_check = QCheckBox("Sayfaları dönüşümlü birleştir (çift taraflı tarama)")
+        self.interleave_check.setStyleSheet(CHECKBOX_STYLE)
+        self.interleave_check.setToolTip(
+            "Dosyalardan sırayla birer sayfa alınır: ön yüz 1, arka yüz 1, ön yüz 2...\n"
+            "Arka yüzler ters sırada tarandıysa o dosyaya sağ tıklayıp sırasını ters çevirin.")
+        output_card_layout.addWidget(self.interleave_check)
+        
+        # Ortak kaynakları tekilleştirme
+        self.dedup_check = QCheckBox("Ortak yazı tipi ve görselleri tekilleştir")
+        self.dedup_check.setStyleSheet(CHECKBOX_STYLE)
+        self.dedup_check.setToolTip(
+            "Aynı yazı tiplerini ve logoları içeren çok sayıda dosya birleştirilirken\n"
+            "her kaynağın tek kopyası yazılır; çıktı belirgin şekilde küçülür.")
+        output_card_layout.addWidget(self.dedup_check)
+        
+        # Mevcut dosyanın sonuna ekleme
+        self.append_check = QCheckBox("Çıktı dosyası varsa sonuna ekle")
+        self.append_check.setStyleSheet(CHECKBOX_STYLE)
+        self.append_check.setToolTip(
+            "Mevcut dosya yeniden yazılmaz; yeni sayfalar dosyanın sonuna artımlı olarak eklenir.\n"
+            "Sürekli büyüyen dosyalar (örn. günlük sevkiyat dosyası) için uygundur.")
+        output_card_layout.addWidget(self.append_check)
+        
         output_layout.addWidget(output_card)
 
         # Birleştirme düğmesi
@@ -352,7 +384,11 @@ class PDFMergeWindow(QWidget):
     def process_merge(self):
         """PDF birleştirme işlemini başlatır."""
         try:
-            files_to_merge = self.file_list.get_files()
+            # Sayfa aralığı girilmiş satırlar (yol, ifade) çifti olarak gönderilir
+            files_to_merge = [
+                (file_path, page_range) if page_range else file_path
+                for file_path, page_range in self.file_list.get_file_entries()
+            ]
             output_path = self.output_path.text().strip()
             
             if not files_to_merge:
@@ -394,7 +430,14 @@ class PDFMergeWindow(QWidget):
             self.merge_btn.setEnabled(False) # Butonu devre dışı bırak
             
             # İş parçacığını başlat
-            self.worker = self.pdf_service.create_merge_worker(files_to_merge, output_path)
+            options = {
+                "mode": (PdfMerger.MERGE_MODE_INTERLEAVE if self.interleave_check.isChecked()
+                         else PdfMerger.MERGE_MODE_SEQUENTIAL),
+                "reverse_inputs": self.file_list.get_reversed_rows(),
+                "deduplicate": self.dedup_check.isChecked(),
+                "append": self.append_check.isChecked()
+            }
+            self.worker = self.pdf_service.create_merge_worker(files_to_merge, output_path, options)
             self.worker.finished.connect(self.handle_merge_finished)
             self.worker.progress.connect(self.update_progress)
             self.worker.start()
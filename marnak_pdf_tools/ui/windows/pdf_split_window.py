@@ -19,6 +19,8 @@ from ..components import (
     InfoLabel, ErrorLabel, PdfViewer
 )
 from ...services.pdf_service import PdfService
+from ...core.utils import PAGE_RANGE_SYNTAX_HELP
+from ...core.progress import format_eta
 from ..styles import (
     SECTION_TITLE_STYLE, CARD_STYLE, FILE_LIST_STYLE,
     FORM_STYLE, CHECKBOX_STYLE, RADIO_STYLE,
@@ -297,7 +299,8 @@ class PDFSplitWindow(QWidget):
         range_layout.addWidget(range_label)
         
         self.range_input = ModernLineEdit()
-        self.range_input.setPlaceholderText("Örn: 1-5, 8-10, 15")
+        self.range_input.setPlaceholderText("Örn: 1-5, 8-10, 15, 20-end, -3-")
+        self.range_input.setToolTip(PAGE_RANGE_SYNTAX_HELP)
         range_layout.addWidget(self.range_input)
         
         range_help = QLabel("Her aralık ayrı bir PDF olarak oluşturulacaktır. Virgülle ayırın.")
@@ -748,6 +751,7 @@ class PDFSplitWindow(QWidget):
                 
                 # Sinyalleri bağla
                 self.worker.progress.connect(self.update_file_progress)
+                self.worker.progress_detail.connect(self.update_file_detail)
                 self.worker.finished.connect(self.handle_file_finished)
                 
                 # İş parçacığını başlat
@@ -778,6 +782,13 @@ class PDFSplitWindow(QWidget):
         total_progress = int((self.processed_files * file_weight) + (value * file_weight / 100))
         self.progress.setValue(total_progress)
     
+    def update_file_detail(self, update):
+        """Dosyanın ürettiği sayfa/bölüm sayısını ve kalan süreyi gösterir."""
+        self.info_label.setText(
+            f"İşleniyor: Dosya {self.current_file_index+1}/{self.total_files} - "
+            f"{update.files} bölüm, {update.pages} sayfa, kalan süre {format_eta(update.eta_s)}"
+        )
+    
     def handle_file_finished(self, success, message):
         """Bir dosya işlendiğinde çağrılır."""
         try:
@@ -2,12 +2,16 @@
 Ayarlar penceresi modülü.
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QComboBox, QPushButton, QMessageBox, QFrame, QApplication)
+                             QComboBox, QPushButton, QMessageBox, QFrame, QApplication, QCheckBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from ..styles import (CARD_STYLE, HEADER_LABEL_STYLE, FORM_STYLE, 
                      PRIMARY_BUTTON_STYLE, SECONDARY_BUTTON_STYLE)
-from ...utils.settings import load_settings, save_settings, get_scale_factor, set_scale_factor, get_scale_name, get_scale_options
+from ...utils.settings import (load_settings, save_settings, get_scale_factor, set_scale_factor, get_scale_name,
+                               get_scale_options, get_pdf_engine, set_pdf_engine, get_pdf_engine_options,
+                               get_log_level, set_log_level, get_log_level_options,
+                               get_profile_jobs, set_profile_jobs, get_profile_dir)
+from ...utils.logging_config import set_level
 
 class SettingsWindow(QWidget):
     """Ayarlar penceresi."""
@@ -73,7 +77,7 @@ class SettingsWindow(QWidget):
         scale_options = get_scale_options()
         for option_text, _ in scale_options:
             self.scale_combo.addItem(option_text)
-        self.scale_combo.setStyleSheet("""
+        combo_style = """
             QComboBox {
                 border: 1px solid #7F8C8D;
                 border-radius: 6px;
@@ -102,7 +106,8 @@ class SettingsWindow(QWidget):
                 border-right: 5px solid transparent;
                 border-bottom: none;
             }
-        """)
+        """
+        self.scale_combo.setStyleSheet(combo_style)
         
         # Ölçek değişikliği sinyalini bağla
         self.scale_combo.currentTextChanged.connect(self.on_scale_preview)
@@ -112,6 +117,43 @@ class SettingsWindow(QWidget):
         scale_layout.addStretch()
         card_layout.addLayout(scale_layout)
         
+        # PDF motoru ayarı (bölme, birleştirme ve sayfa çıkarma işlemleri)
+        engine_layout = QHBoxLayout()
+        engine_label = QLabel("PDF Motoru:")
+        engine_label.setStyleSheet(scale_label.styleSheet())
+        
+        self.engine_combo = QComboBox()
+        for option_text, engine in get_pdf_engine_options():
+            self.engine_combo.addItem(option_text, engine)
+        self.engine_combo.setStyleSheet(combo_style)
+        
+        engine_layout.addWidget(engine_label)
+        engine_layout.addWidget(self.engine_combo)
+        engine_layout.addStretch()
+        card_layout.addLayout(engine_layout)
+        
+        # Günlük ayrıntısı (dosya/sayfa başına satırlar yalnızca ayrıntılı düzeyde yazılır)
+        log_layout = QHBoxLayout()
+        log_label = QLabel("Günlük Ayrıntısı:")
+        log_label.setStyleSheet(scale_label.styleSheet())
+        
+        self.log_level_combo = QComboBox()
+        for option_text, level in get_log_level_options():
+            self.log_level_combo.addItem(option_text, level)
+        self.log_level_combo.setStyleSheet(combo_style)
+        
+        log_layout.addWidget(log_label)
+        log_layout.addWidget(self.log_level_combo)
+        log_layout.addStretch()
+        card_layout.addLayout(log_layout)
+        
+        # Tanılama: her iş için cProfile profili (yavaşlık bildirimlerinde profil dosyası istenir)
+        self.profile_checkbox = QCheckBox("Tanılama: her iş için performans profili kaydet")
+        self.profile_checkbox.setToolTip(f"Profiller şu klasöre yazılır: {get_profile_dir()}\n"
+                                         "Özet: python -m marnak_pdf_tools profile-summary")
+        self.profile_checkbox.setStyleSheet(scale_label.styleSheet())
+        card_layout.addWidget(self.profile_checkbox)
+        
         # Boş alan ekle
         card_layout.addStretch()
         
@@ -154,6 +196,13 @@ class SettingsWindow(QWidget):
                 
         if closest_option:
             self.scale_combo.setCurrentText(closest_option)
+        
+        engine_index = self.engine_combo.findData(get_pdf_engine())
+        self.engine_combo.setCurrentIndex(max(0, engine_index))
+        
+        log_level_index = self.log_level_combo.findData(get_log_level())
+        self.log_level_combo.setCurrentIndex(max(0, log_level_index))
+        self.profile_checkbox.setChecked(get_profile_jobs())
             
     def save_settings(self):
         """Ayarları kaydet."""
@@ -170,6 +219,10 @@ class SettingsWindow(QWidget):
                 
             # Qt Settings ile kaydet
             set_scale_factor(scale_factor)
+            set_pdf_engine(self.engine_combo.currentData())
+            set_log_level(self.log_level_combo.currentData())
+            set_level(self.log_level_combo.currentData())
+            set_profile_jobs(self.profile_checkbox.isChecked())
             
             # Ayarları anında uygula
             self.apply_settings_immediately(scale_factor)
@@ -178,7 +231,7 @@ class SettingsWindow(QWidget):
             QMessageBox.information(
                 self, 
                 "Başarılı", 
-                "Program ölçeği başarıyla kaydedildi ve uygulandı."
+                "Ayarlar başarıyla kaydedildi ve uygulandı."
             )
             
             # Pencereyi kapat
@@ -0,0 +1,136 @@
+"""
+Uygulama günlüğünün yapılandırması: kuyruklu, hız sınırlı ve döndürülen dosya.
+
+İşlem iş parçacıkları ``logger.info`` çağrısında diske ya da konsola
+yazmaz; kayıt ``QueueHandler`` ile bir kuyruğa bırakılır ve
+``QueueListener`` iş parçacığı kayıtları boyutu sınırlı, döndürülen bir
+dosyaya (``RotatingFileHandler``) ve konsola yazar. WARNING altındaki
+kayıtlar saniyede ``rate`` kayıtla sınırlanır; atlanan kayıtların sayısı bir
+sonraki geçen kayda eklenir. Core sınıfları dosya/sayfa başına ayrıntıyı
+DEBUG, iş özetini INFO düzeyinde yazar; ayrıntı için düzey DEBUG yapılır
+(arayüz: Ayarlar > Günlük Ayrıntısı).
+"""
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Callable, Optional, Union
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Günlük dosyası bu boyuta ulaşınca döndürülür; en fazla DEFAULT_BACKUP_COUNT eski dosya saklanır
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+# WARNING altındaki kayıtlar için saniyedeki en yüksek kayıt sayısı
+DEFAULT_RATE = 200
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    WARNING altındaki kayıtları jeton kovasıyla sınırlayan süzgeç.
+
+    Uyarı ve hatalar hiçbir zaman atlanmaz. Atlanan kayıt sayısı, süzgeçten
+    geçen bir sonraki kaydın mesajına eklenir.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: Saniyede geçen kayıt sayısı
+            burst: Art arda geçebilecek en fazla kayıt (varsayılan: ``rate``)
+            clock: Zaman kaynağı (sn)
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.clock = clock
+        self.suppressed = 0
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if record.levelno < logging.WARNING:
+                if self._tokens < 1:
+                    self.suppressed += 1
+                    return False
+                self._tokens -= 1
+            suppressed, self.suppressed = self.suppressed, 0
+        if suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} kayıt hız sınırı nedeniyle atlandı)"
+            record.args = None
+        return True
+
+
+def setup_logging(log_path: str, level: Union[int, str] = logging.INFO, console: bool = True,
+                  max_bytes: int = DEFAULT_MAX_BYTES, backup_count: int = DEFAULT_BACKUP_COUNT,
+                  rate: float = DEFAULT_RATE) -> logging.handlers.QueueListener:
+    """
+    Kök günlükçüyü kuyruklu yazıma ayarlar ve yazıcı iş parçacığını başlatır.
+
+    Tekrar çağrılırsa önceki dinleyici durdurulur (kuyruktakiler yazılır) ve
+    yerine yenisi kurulur.
+
+    Args:
+        log_path: Günlük dosyası
+        level: Kök günlükçü düzeyi ("INFO", "DEBUG" ya da logging sabiti)
+        console: Kayıtlar stdout'a da yazılsın mı
+        max_bytes: Döndürme boyutu (0: döndürme yok)
+        backup_count: Saklanacak eski dosya sayısı
+        rate: WARNING altı kayıtların saniyedeki üst sınırı (0: sınırsız)
+
+    Returns:
+        QueueListener: Uygulama kapanırken ``shutdown_logging`` ile durdurulmalı
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.handlers.RotatingFileHandler(log_path, maxBytes=max_bytes,
+                                                     backupCount=backup_count, encoding='utf-8')]
+    if console:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    if rate:
+        _queue_handler.addFilter(RateLimitFilter(rate))
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def set_level(level: Union[int, str]):
+    """Kök günlükçünün düzeyini değiştirir (ör. ayrıntı için "DEBUG")."""
+    logging.getLogger().setLevel(level)
+
+
+def shutdown_logging():
+    """Kuyruktaki kayıtları yazar, yazıcı iş parçacığını durdurur ve dosyaları kapatır."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
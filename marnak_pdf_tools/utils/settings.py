@@ -3,6 +3,8 @@ Uygulama ayarlarını yöneten modül.
 """
 import json
 import os
+import tempfile
+from pathlib import Path
 from typing import Dict, Any
 from PyQt6.QtCore import QSettings
 
@@ -13,6 +15,30 @@ def get_settings_file_path() -> str:
     os.makedirs(app_data_dir, exist_ok=True)
     return os.path.join(app_data_dir, "settings.json")
 
+def get_log_dir() -> Path:
+    """Kullanıcının yazma izni olan günlük klasörünü döndürür."""
+    # Kullanıcının Documents klasörünü tercih et, olmazsa geçici klasör, son çare uygulama dizini
+    for candidate in (Path.home() / "Documents" / "MarnakPDFAraclari",
+                      Path(tempfile.gettempdir()) / "MarnakPDFAraclari"):
+        try:
+            candidate.mkdir(exist_ok=True)
+            return candidate
+        except OSError:
+            continue
+    return Path(".")
+
+def get_metrics_log_path() -> str:
+    """İş ölçümlerinin satır satır eklendiği JSONL dosyasının yolu (uygulama günlüğünün yanında)."""
+    return str(get_log_dir() / "metrics.jsonl")
+
+def get_profile_dir() -> str:
+    """Tanılama profillerinin (cProfile) yazıldığı klasör (uygulama günlüğünün yanında)."""
+    return str(get_log_dir() / "profiles")
+
+def get_event_loop_report_path() -> str:
+    """Olay döngüsü gecikme histogramı ve takılma raporunun yolu (uygulama günlüğünün yanında)."""
+    return str(get_log_dir() / "event_loop.json")
+
 def load_settings() -> Dict[str, Any]:
     """
     Ayarları dosyadan yükler.
@@ -126,3 +152,48 @@ def get_scale_options():
         ("Büyük (115%)", 1.15),
         ("Çok Büyük (125%)", 1.25)
     ]
+
+def get_pdf_engine():
+    """Seçili PDF motorunu döndür ("auto": işlem başına en hızlı motor)."""
+    settings = get_qt_settings()
+    return settings.value("pdf_engine", "auto", type=str)
+
+def set_pdf_engine(engine: str):
+    """PDF motorunu ayarla."""
+    settings = get_qt_settings()
+    settings.setValue("pdf_engine", engine)
+
+def get_pdf_engine_options():
+    """PDF motoru seçeneklerini döndür."""
+    return [
+        ("Otomatik (en hızlı)", "auto"),
+        ("PyMuPDF", "pymupdf"),
+        ("PyPDF2", "pypdf2")
+    ]
+
+def get_log_level():
+    """Uygulama günlüğünün düzeyini döndür ("INFO": iş özetleri, "DEBUG": dosya/sayfa ayrıntısı)."""
+    settings = get_qt_settings()
+    return settings.value("log_level", "INFO", type=str)
+
+def set_log_level(level: str):
+    """Uygulama günlüğünün düzeyini ayarla."""
+    settings = get_qt_settings()
+    settings.setValue("log_level", level)
+
+def get_log_level_options():
+    """Günlük ayrıntısı seçeneklerini döndür."""
+    return [
+        ("Özet (iş başına)", "INFO"),
+        ("Ayrıntılı (dosya/sayfa başına)", "DEBUG")
+    ]
+
+def get_profile_jobs() -> bool:
+    """Tanılama: her iş cProfile ile profillenip profil klasörüne yazılsın mı?"""
+    settings = get_qt_settings()
+    return settings.value("profile_jobs", False, type=bool)
+
+def set_profile_jobs(enabled: bool):
+    """Tanılama profilini aç/kapat."""
+    settings = get_qt_settings()
+    settings.setValue("profile_jobs", enabled)
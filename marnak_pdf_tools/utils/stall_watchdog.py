@@ -0,0 +1,242 @@
+"""
+Arayüz olay döngüsü takılma bekçisi.
+
+Ana iş parçacığında ``interval_ms`` aralıklı bir kalp atışı zamanlayıcısı
+çalışır; her atışta beklenen zamandan ne kadar geç kalındığı (olay döngüsü
+gecikmesi) kayan bir pencerede saklanır. Ayrı bir izleme iş parçacığı son
+atıştan bu yana ``threshold_ms``'den uzun süre geçtiğini görürse ana iş
+parçacığının o anki çağrı yığınını alır ve günlüğe WARNING olarak yazar;
+takılma sürerken yığın her ``threshold_ms``'de bir yeniden örneklenir
+(yığın değişmediyse yazılmaz). Olay döngüsü yeniden döndüğünde takılmanın
+toplam süresi yazılır.
+
+Sınır: izleme iş parçacığı da GIL'e ihtiyaç duyar. Ana iş parçacığı GIL'i
+bırakmayan uzun bir C çağrısındayken (ör. büyük bir sayfayı işleyen bir
+PyMuPDF çağrısı) izleyici çalışamaz ve takılma sırasında yığın alınamaz;
+en fazla çağrı döndükten hemen sonra, gecikmeli bir örnek alınabilir. Hiç
+örnek alınamadıysa takılma, olay döngüsü döndüğünde geciken kalp atışından
+yakalanır: eşiği aşan atış boşluğu yığınsız bir takılma olarak kaydedilir
+ve günlüğe yazılır.
+
+Gecikme dağılımı ve son takılmalar ``export`` ile JSON olarak dışa
+aktarılır; uygulama kapanırken günlük klasörüne ``event_loop.json`` yazılır.
+"""
+import bisect
+import collections
+import datetime
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+# Varsayılanlar: kalp atışı aralığı, takılma eşiği, kayan pencere (atış sayısı: 50 ms'de ~10 dk)
+DEFAULT_INTERVAL_MS = 50
+DEFAULT_THRESHOLD_MS = 250
+DEFAULT_WINDOW = 12000
+
+# Histogram kova üst sınırları (ms); son kova bunların üstündeki gecikmeleri toplar
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Saklanan son takılma sayısı
+MAX_STALLS = 50
+
+# Takılma yığınında gösterilen en fazla çerçeve
+STACK_LIMIT = 25
+
+
+def _innermost_app_frame(stack) -> str:
+    """Yığındaki en içteki uygulama çerçevesi (yoksa en içteki çerçeve); takılmanın özeti için."""
+    frames = [entry.strip().splitlines()[0] for entry in stack]
+    for frame in reversed(frames):
+        if "marnak_pdf_tools" in frame:
+            return frame
+    return frames[-1] if frames else ""
+
+
+class LatencyHistogram:
+    """Son ``window`` gecikme ölçümünün kova histogramı ve yüzdelikleri."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, buckets_ms=BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.samples = collections.deque(maxlen=window)
+        self.total = 0  # Başlangıçtan beri ölçüm sayısı
+        self._lock = threading.Lock()
+
+    def add(self, latency_ms: float):
+        with self._lock:
+            self.samples.append(latency_ms)
+            self.total += 1
+
+    def snapshot(self) -> dict:
+        """Penceredeki ölçümlerin kovaları, yüzdelikleri ve en büyüğü."""
+        with self._lock:
+            samples = sorted(self.samples)
+        counts = [0] * (len(self.buckets_ms) + 1)
+        for latency in samples:
+            counts[bisect.bisect_left(self.buckets_ms, latency)] += 1
+        labels = [f"<={limit}" for limit in self.buckets_ms] + [f">{self.buckets_ms[-1]}"]
+
+        def percentile(fraction):
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 2)
+
+        return {
+            "samples": len(samples),
+            "total_samples": self.total,
+            "buckets_ms": dict(zip(labels, counts)),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1], 2) if samples else None,
+        }
+
+
+class StallWatchdog(QObject):
+    """
+    Olay döngüsü gecikmesini ölçen ve takılmalarda ana iş parçacığının yığınını kaydeden bekçi.
+
+    Örnek:
+        watchdog = StallWatchdog(logger=logging.getLogger("StallWatchdog"))
+        watchdog.start()
+        ...
+        watchdog.stop()
+        watchdog.export(path)
+    """
+
+    def __init__(self, interval_ms: int = DEFAULT_INTERVAL_MS, threshold_ms: int = DEFAULT_THRESHOLD_MS,
+                 window: int = DEFAULT_WINDOW, logger: Optional[logging.Logger] = None, parent=None):
+        """
+        Args:
+            interval_ms: Kalp atışı aralığı (ms)
+            threshold_ms: Bu süreden uzun atış boşluğu takılma sayılır (ms)
+            window: Histogramın kayan penceresi (atış sayısı)
+            logger: Takılma kayıtları için günlükçü
+            parent: Qt üst nesnesi
+        """
+        super().__init__(parent)
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.logger = logger or logging.getLogger("StallWatchdog")
+        self.histogram = LatencyHistogram(window)
+        self.stalls = collections.deque(maxlen=MAX_STALLS)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._beat)
+        self._main_thread_id = threading.main_thread().ident
+        self._last_beat = 0.0
+        self._current_stall: Optional[dict] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor = None
+
+    def start(self):
+        """Kalp atışını ve izleme iş parçacığını başlatır (ana iş parçacığından çağrılmalı)."""
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._monitor = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        """Bekçiyi durdurur."""
+        self._timer.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            gap_ms = (now - self._last_beat) * 1000
+            self._last_beat = now
+            stall, self._current_stall = self._current_stall, None
+        self.histogram.add(max(0.0, gap_ms - self.interval_ms))
+
+        if stall is not None:
+            stall["duration_ms"] = round(gap_ms, 1)
+            self.logger.warning(f"Olay döngüsü {gap_ms:.0f} ms takıldı "
+                                f"({len(stall['stacks'])} yığın örneği, en üstte: {stall['top']})")
+        elif gap_ms >= self.threshold_ms:
+            # İzleyici takılma boyunca çalışamadı (GIL'i bırakmayan C çağrısı); geciken atış kaydedilir
+            with self._lock:
+                self.stalls.append({
+                    "started_at": (datetime.datetime.now()
+                                   - datetime.timedelta(milliseconds=gap_ms)).isoformat(timespec="milliseconds"),
+                    "duration_ms": round(gap_ms, 1),
+                    "stacks": [],
+                    "top": "",
+                    "sampled_ms": 0.0,
+                })
+            self.logger.warning(f"Olay döngüsü {gap_ms:.0f} ms takıldı (yığın alınamadı: ana iş parçacığı "
+                                f"GIL'i bırakmayan bir çağrıdaydı)")
+
+    def _watch(self):
+        # Eşiğin yarısı aralığında yoklanır; takılma en geç 1,5 eşik içinde yakalanır
+        poll = self.threshold_ms / 2000
+        while not self._stop.wait(poll):
+            with self._lock:
+                stalled_ms = (time.monotonic() - self._last_beat) * 1000
+                stall = self._current_stall
+                if stalled_ms < self.threshold_ms:
+                    continue
+                if stall is not None and stalled_ms - stall["sampled_ms"] < self.threshold_ms:
+                    continue
+            self._sample_stack(stalled_ms)
+
+    def _sample_stack(self, stalled_ms: float):
+        """Ana iş parçacığının yığınını alır ve takılma kaydına ekler."""
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        stack = traceback.format_stack(frame, limit=STACK_LIMIT)
+        del frame
+
+        with self._lock:
+            stall = self._current_stall
+            first = stall is None
+            if first:
+                stall = {
+                    "started_at": (datetime.datetime.now()
+                                   - datetime.timedelta(milliseconds=stalled_ms)).isoformat(timespec="milliseconds"),
+                    "duration_ms": None,
+                    "stacks": [],
+                    "top": _innermost_app_frame(stack),
+                }
+                self._current_stall = stall
+                self.stalls.append(stall)
+            stall["sampled_ms"] = stalled_ms
+            changed = not stall["stacks"] or stall["stacks"][-1] != stack
+            if changed:
+                stall["stacks"].append(stack)
+
+        if changed:
+            self.logger.warning(f"Olay döngüsü {stalled_ms:.0f} ms'dir yanıt vermiyor; ana iş parçacığı yığını:\n"
+                                + "".join(stack).rstrip())
+
+    def report(self) -> dict:
+        """Histogram ve son takılmalar (JSON'a yazılabilir)."""
+        with self._lock:
+            stalls = [{key: value for key, value in stall.items() if key != "sampled_ms"}
+                      for stall in self.stalls]
+        return {
+            "interval_ms": self.interval_ms,
+            "threshold_ms": self.threshold_ms,
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "latency": self.histogram.snapshot(),
+            "stalls": stalls,
+        }
+
+    def export(self, path: str):
+        """Raporu JSON dosyasına yazar."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+            f.write("\n")
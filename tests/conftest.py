@@ -0,0 +1,29 @@
+"""
+Pytest ayarları: performans gerileme testleri için komut satırı seçenekleri.
+"""
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "Performans gerileme kapısı")
+    group.addoption("--perf", action="store_true", default=False,
+                    help="'perf' işaretli performans testlerini çalıştır")
+    group.addoption("--perf-update-baseline", action="store_true", default=False,
+                    help="Ölçümleri benchmarks/baseline.json dosyasına yaz (karşılaştırma yapılmaz)")
+    group.addoption("--perf-tolerance", type=float, default=None,
+                    help="İzin verilen göreli yavaşlama (varsayılan: 0.50)")
+    group.addoption("--perf-memory-input-mb", type=int, default=2048,
+                    help="Bellek bütçesi testlerinin girdi boyutu (MB, varsayılan: 2048)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: performans gerileme testi (yalnızca --perf ile çalışır)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--perf") or config.getoption("--perf-update-baseline"):
+        return
+    skip = pytest.mark.skip(reason="Performans testleri için --perf verin")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
@@ -1,9 +1,15 @@
 """
 Core modülleri için birim testler.
 """
+import io
+import json
+import logging
 import os
 import tempfile
+import time
 import shutil
+import subprocess
+import sys
 import pytest
 from pathlib import Path
 
@@ -11,6 +17,22 @@ from marnak_pdf_tools.core.merger import PdfMerger
 from marnak_pdf_tools.core.splitter import PdfSplitter
 from marnak_pdf_tools.core.renamer import PdfRenamer
 from marnak_pdf_tools.core.extractor import PdfExtractor
+from marnak_pdf_tools.core.converter import PdfConverter
+from marnak_pdf_tools.core.optimizer import PdfOptimizer
+from marnak_pdf_tools.core.cache import ResultCache
+from marnak_pdf_tools.core.document_pool import DocumentPool
+from marnak_pdf_tools.core import engines
+from marnak_pdf_tools.core.pipeline import PdfPipeline, load_manifest
+from marnak_pdf_tools.core.results import OperationResult, OperationError, OperationCancelled
+from marnak_pdf_tools.core.page_set import PageSet
+from marnak_pdf_tools.core.metrics import collect_metrics, append_metrics_log
+from marnak_pdf_tools.core.progress import ProgressThrottle
+from marnak_pdf_tools.core.profiling import profile_job, summarize_profile, latest_profile
+from marnak_pdf_tools.utils.logging_config import RateLimitFilter, setup_logging, shutdown_logging
+from marnak_pdf_tools.utils.stall_watchdog import StallWatchdog
+from marnak_pdf_tools.core.utils import (
+    parse_page_ranges, parse_page_selection, parse_page_set, parse_merge_input, PageRangeError
+)
 
 
 class TestPdfMerger:
@@ -78,6 +100,234 @@ class TestPdfMerger:
         merged_doc.close()
 
 
+    def test_merge_with_page_selections(self):
+        """Girdi başına sayfa seçimi tek geçişte uygulanmalı."""
+        import fitz
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+        
+        output_path = os.path.join(self.temp_dir, "merged_output.pdf")
+        files = [(sample_3_pages, "3"), sample_1_page, (sample_3_pages, "2-1")]
+        
+        success, message, output_files = self.merger.merge_pdfs(files, output_path)
+        
+        assert success, f"Birleştirme başarısız: {message}"
+        merged_doc = fitz.open(output_files[0])
+        assert [page.get_text().strip() for page in merged_doc] == [
+            "Test PDF - Sayfa 3", "Test PDF - 1 sayfa", "Test PDF - Sayfa 2", "Test PDF - Sayfa 1"
+        ]
+        merged_doc.close()
+    
+    def test_merge_interleave_with_reversed_input(self):
+        """Harmanlama modu girdilerden sırayla birer sayfa almalı, ters girdiyi tersten okumalı."""
+        import fitz
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+        
+        output_path = os.path.join(self.temp_dir, "collated.pdf")
+        options = {"mode": PdfMerger.MERGE_MODE_INTERLEAVE, "reverse_inputs": [1]}
+        success, message, output_files = self.merger.merge_pdfs(
+            [sample_3_pages, (sample_3_pages, "1-2"), sample_1_page], output_path, options=options)
+        
+        assert success, f"Birleştirme başarısız: {message}"
+        merged_doc = fitz.open(output_files[0])
+        assert [page.get_text().strip()[-1] for page in merged_doc] == ["1", "2", "a", "2", "1", "3"]
+        merged_doc.close()
+    
+    def test_merge_invalid_page_selection(self):
+        """Geçersiz sayfa seçimi dosya adıyla birlikte raporlanmalı."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        output_path = os.path.join(self.temp_dir, "merged_output.pdf")
+        success, message, output_files = self.merger.merge_pdfs([(sample_3_pages, "7")], output_path)
+        
+        assert not success
+        assert "sample_3_pages.pdf" in message
+        assert not os.path.exists(output_path)
+
+    def test_iter_merge_yields_result_and_raises_errors(self):
+        """Birleştirme yineleyicisi çıktıyı sonuç olarak vermeli, hataları istisna olarak fırlatmalı."""
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+
+        output_path = os.path.join(self.temp_dir, "merged_output.pdf")
+        results = list(self.merger.iter_merge([sample_1_page, sample_3_pages], output_path))
+        assert [(r.path, r.pages, r.bytes) for r in results] == [
+            (output_path, 4, os.path.getsize(output_path))
+        ]
+
+        with pytest.raises(OperationError, match="Bilinmeyen birleştirme modu"):
+            list(self.merger.iter_merge([sample_1_page], output_path, options={"mode": "yok"}))
+
+    def test_merge_tree_strategy_matches_flat(self):
+        """Ağaç birleştirme düz birleştirmeyle aynı sayfa sırasını üretmeli ve ara dosyaları silmeli."""
+        import fitz
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+
+        inputs = [sample_3_pages, sample_1_page, (sample_3_pages, "2-3"), sample_1_page,
+                  sample_3_pages, (sample_3_pages, "end")]
+        flat_dir = os.path.join(self.temp_dir, "flat")
+        tree_dir = os.path.join(self.temp_dir, "tree")
+        flat_path = os.path.join(flat_dir, "flat.pdf")
+        tree_path = os.path.join(tree_dir, "tree.pdf")
+
+        self.merger.merge_pdfs(inputs, flat_path, options={"strategy": PdfMerger.MERGE_STRATEGY_FLAT,
+                                                           "reverse_inputs": [4]})
+        progress = []
+        success, message, _ = self.merger.merge_pdfs(
+            inputs, tree_path, progress_callback=progress.append,
+            options={"strategy": PdfMerger.MERGE_STRATEGY_TREE, "batch_size": 2, "workers": 2,
+                     "reverse_inputs": [4]})
+
+        assert success, f"Birleştirme başarısız: {message}"
+        assert os.listdir(tree_dir) == ["tree.pdf"]
+        assert progress[-1] == 100
+
+        flat_doc, tree_doc = fitz.open(flat_path), fitz.open(tree_path)
+        assert tree_doc.page_count == flat_doc.page_count == 11
+        assert [p.get_text() for p in tree_doc] == [p.get_text() for p in flat_doc]
+        flat_doc.close()
+        tree_doc.close()
+
+    def test_auto_batch_size_counts_held_file_handles(self, monkeypatch):
+        """Açık bellek eşlemelerinin tuttuğu tanıtıcılar otomatik grup boyutundan düşülmeli."""
+        resource = pytest.importorskip("resource")
+        from marnak_pdf_tools.core.pdf_io import map_file
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages) or not os.path.isdir("/proc/self/fd"):
+            pytest.skip("Test PDF dosyası ya da /proc/self/fd bulunamadı")
+        
+        monkeypatch.setattr(resource, "getrlimit", lambda _: (250, 250))
+        # Bellek sınırı devre dışı: yalnızca tanıtıcı sınırı belirleyici olsun
+        def no_sysconf(name):
+            raise ValueError(name)
+        monkeypatch.setattr(os, "sysconf", no_sysconf)
+        
+        inputs = [sample_3_pages] * 10
+        before = self.merger._auto_batch_size(inputs, 2)
+        # Her eşleme tanıtıcının bir kopyasını tutar
+        held = [map_file(sample_3_pages) for _ in range(30)]
+        try:
+            assert self.merger._auto_batch_size(inputs, 2) == before - 30
+        finally:
+            for mapping in held:
+                mapping.close()
+    
+    def test_merge_append_is_incremental(self):
+        """Ekleme modu mevcut dosyayı yeniden yazmadan sonuna eklemeli; hata dosyayı bozmamalı."""
+        import fitz
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+
+        output_path = os.path.join(self.temp_dir, "sevkiyat.pdf")
+        options = {"append": True}
+        success, _, _ = self.merger.merge_pdfs([sample_1_page], output_path, options=options)
+        assert success
+        with open(output_path, "rb") as f:
+            original_bytes = f.read()
+
+        success, message, _ = self.merger.merge_pdfs([(sample_3_pages, "3-2")], output_path, options=options)
+        assert success, f"Ekleme başarısız: {message}"
+        with open(output_path, "rb") as f:
+            appended_bytes = f.read()
+        assert appended_bytes.startswith(original_bytes)
+
+        success, _, _ = self.merger.merge_pdfs(["yok.pdf"], output_path, options=options)
+        assert not success
+        assert os.path.getsize(output_path) == len(appended_bytes)
+
+        success, _, _ = self.merger.merge_pdfs([sample_1_page], output_path,
+                                               options={"append": True, "compact": True})
+        assert success
+        merged_doc = fitz.open(output_path)
+        assert [page.get_text().strip() for page in merged_doc] == [
+            "Test PDF - 1 sayfa", "Test PDF - Sayfa 3", "Test PDF - Sayfa 2", "Test PDF - 1 sayfa"
+        ]
+        merged_doc.close()
+
+    def test_merge_deduplicates_shared_resources(self):
+        """Aynı logo ve yazı tipini içeren dosyalar tek kopya kaynakla birleştirilmeli."""
+        import fitz
+        invoice_paths = [os.path.join(self.temp_dir, f"fatura_{index}.pdf") for index in range(4)]
+        doc = fitz.open()
+        page = doc.new_page()
+        pix = fitz.Pixmap(fitz.csRGB, 200, 200, os.urandom(3 * 200 * 200), False)
+        page.insert_image(fitz.Rect(72, 72, 144, 144), pixmap=pix)
+        page.insert_font(fontname="F0", fontbuffer=fitz.Font("tiro").buffer)
+        page.insert_text((72, 200), "Fatura", fontname="F0")
+        # /Type yazılmamış açıklama her sayfada ayrı kalmalı; metnindeki referans benzeri
+        # dizeler (birleşik belgedeki tüm küçük xref'ler) değişmemeli
+        contents = "bkz. " + " ".join(f"{xref} 0 R" for xref in range(1, 100))
+        annot_xref = doc.get_new_xref()
+        doc.update_object(annot_xref, f"<</Subtype/Text/Rect[0 0 20 20]/Contents({contents})>>")
+        doc.xref_set_key(page.xref, "Annots", f"[{annot_xref} 0 R]")
+        doc.save(invoice_paths[0])
+        doc.close()
+        for path in invoice_paths[1:]:
+            shutil.copy(invoice_paths[0], path)
+
+        plain_path = os.path.join(self.temp_dir, "plain.pdf")
+        dedup_path = os.path.join(self.temp_dir, "dedup.pdf")
+        self.merger.merge_pdfs(invoice_paths, plain_path)
+        success, message, _ = self.merger.merge_pdfs(
+            invoice_paths, dedup_path, options={"deduplicate": True})
+
+        assert success, f"Birleştirme başarısız: {message}"
+        report = self.merger.last_dedup_report
+        # Dört ayrı girdi: ilk kopya dışındaki üç görüntü ve üç yazı tipi programı paylaştırılır
+        assert report["by_type"] == {"fonts": 3, "images": 3, "xobjects": 0}
+        assert report["bytes_saved"] > 0
+        assert os.path.getsize(dedup_path) < os.path.getsize(plain_path)
+
+        merged_doc = fitz.open(dedup_path)
+        assert merged_doc.page_count == 4
+        assert {page.get_images()[0][0] for page in merged_doc} == {merged_doc[0].get_images()[0][0]}
+        assert all(page.get_text().strip() == "Fatura" for page in merged_doc)
+        annots = {int(merged_doc.xref_get_key(page.xref, "Annots")[1].strip("[]").split()[0])
+                  for page in merged_doc}
+        assert len(annots) == 4
+        assert all(merged_doc.xref_get_key(annot, "Contents")[1] == contents for annot in annots)
+        merged_doc.close()
+
+    def test_merge_onto_mapped_input(self):
+        """Girdiler belleğe eşlenirken çıktı bir girdinin üzerine yazılabilmeli."""
+        from marnak_pdf_tools.core import pdf_io
+        sample = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        if not os.path.exists(sample):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        target = os.path.join(self.temp_dir, "hedef.pdf")
+        shutil.copy(sample, target)
+
+        if pdf_io.MMAP_INPUTS:
+            import mmap
+            assert isinstance(pdf_io.open_reader(target).stream, mmap.mmap)
+
+        success, message, _ = self.merger.merge_pdfs([target, sample], target)
+        assert success, f"Birleştirme başarısız: {message}"
+        assert len(pdf_io.open_reader(target).pages) == 6
+        assert os.listdir(self.temp_dir) == ["hedef.pdf"]
+
+
 class TestPdfSplitter:
     """PdfSplitter sınıfı testleri."""
     
@@ -121,6 +371,75 @@ class TestPdfSplitter:
         # Tüm çıktı dosyalarının varlığını kontrol et
         for output_file in output_files:
             assert os.path.exists(output_file), f"Çıktı dosyası bulunamadı: {output_file}"
+    
+    def test_split_reversed_range(self):
+        """Ters aralık sayfaları ters sırada tek dosyaya yazmalı."""
+        import fitz
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        options = {"mode": self.splitter.SPLIT_MODE_PAGE_RANGE, "page_range": "end-1"}
+        success, message, output_files = self.splitter.split_pdf(sample_3_pages, self.temp_dir, options)
+        
+        assert success, f"Bölme başarısız: {message}"
+        assert os.path.basename(output_files[0]) == "sample_3_pages_sayfa_3-1.pdf"
+        
+        doc = fitz.open(output_files[0])
+        assert [page.get_text().strip() for page in doc] == [
+            "Test PDF - Sayfa 3", "Test PDF - Sayfa 2", "Test PDF - Sayfa 1"
+        ]
+        doc.close()
+    
+    def test_split_invalid_range(self):
+        """Geçersiz sayfa ifadesi açık bir hata mesajı döndürmeli."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        options = {"mode": self.splitter.SPLIT_MODE_PAGE_RANGE, "page_range": "1,x"}
+        success, message, output_files = self.splitter.split_pdf(sample_3_pages, self.temp_dir, options)
+        
+        assert not success
+        assert "'x'" in message
+        assert output_files == []
+    
+    def test_iter_split_yields_files_as_they_are_written(self):
+        """Yineleyici her dosyayı yazılır yazılmaz bildirmeli; iptal üretilenleri silmemeli."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        options = {"mode": self.splitter.SPLIT_MODE_EVERY_N_PAGES, "pages_per_split": 2}
+        results = self.splitter.iter_split(sample_3_pages, self.temp_dir, options)
+        
+        first = next(results)
+        assert isinstance(first, OperationResult)
+        assert os.path.exists(first.path)
+        assert (first.pages, first.bytes) == (2, os.path.getsize(first.path))
+        assert len(os.listdir(self.temp_dir)) == 1  # İkinci dosya henüz yazılmadı
+        
+        rest = list(results)
+        assert [r.pages for r in rest] == [1]
+        
+        # İptal: o ana kadar üretilen dosyalar tüketicide kalır
+        cancel_dir = os.path.join(self.temp_dir, "iptal")
+        produced = []
+        with pytest.raises(OperationCancelled):
+            for result in self.splitter.iter_split(sample_3_pages, cancel_dir,
+                                                   interrupt_check=lambda: len(produced) == 1):
+                produced.append(result)
+        assert [os.path.exists(r.path) for r in produced] == [True]
+        
+        # Klasik API iptalde üretilen dosyaları döndürür
+        success, message, output_files = self.splitter.split_pdf(
+            sample_3_pages, cancel_dir, interrupt_check=lambda: len(os.listdir(cancel_dir)) >= 2)
+        assert not success
+        assert "iptal" in message
+        assert len(output_files) == 1
 
 
 class TestPdfRenamer:
@@ -231,6 +550,1131 @@ class TestPdfExtractor:
             assert os.path.exists(output_file), f"Çıktı dosyası bulunamadı: {output_file}"
 
 
+class TestPdfConverter:
+    """PdfConverter sınıfı testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.converter = PdfConverter()
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_extract_text_jsonl(self):
+        """Metin modu sayfa başına bir JSONL kaydı üretmeli (paralel, giriş sırasıyla)."""
+        import json
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+        
+        output_path = os.path.join(self.temp_dir, "metin.jsonl")
+        options = {"include_words": True, "workers": 2}
+        success, message, output_files = self.converter.extract_text(
+            [sample_3_pages, sample_1_page], output_path, options)
+        
+        assert success, f"Metin çıkarma başarısız: {message}"
+        assert output_files == [output_path]
+        
+        with open(output_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        
+        assert [(r["file"], r["page"]) for r in records] == [
+            (sample_3_pages, 1), (sample_3_pages, 2), (sample_3_pages, 3), (sample_1_page, 1)
+        ]
+        assert "Sayfa 2" in records[1]["text"]
+        assert records[0]["words"][0][4] == "Test"
+    
+    def test_extract_text_streams_pages_in_order(self):
+        """Paralel modda kayıtlar dosya bitmeden, sayfa grupları halinde ve sırayla yazılmalı."""
+        import fitz
+        from marnak_pdf_tools.core.converter import TEXT_CHUNK_PAGES
+        
+        paths = []
+        for name, page_count in (("uzun.pdf", TEXT_CHUNK_PAGES * 2 + 3), ("kisa.pdf", 2)):
+            document = fitz.open()
+            for i in range(page_count):
+                document.new_page().insert_text((72, 72), f"Sayfa {i + 1}")
+            path = os.path.join(self.temp_dir, name)
+            document.save(path)
+            document.close()
+            paths.append(path)
+        
+        class RecordingStream(io.StringIO):
+            """Her ``writelines`` çağrısını ayrı bir yazım olarak sayar."""
+            def __init__(self):
+                super().__init__()
+                self.writes = 0
+            
+            def writelines(self, lines):
+                self.writes += 1
+                super().writelines(lines)
+        
+        stream = RecordingStream()
+        success, message, _ = self.converter.extract_text(paths, stream, {"workers": 2})
+        
+        assert success, f"Metin çıkarma başarısız: {message}"
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [(r["file"], r["page"]) for r in records] == (
+            [(paths[0], page) for page in range(1, TEXT_CHUNK_PAGES * 2 + 4)] + [(paths[1], 1), (paths[1], 2)])
+        assert records[TEXT_CHUNK_PAGES]["text"].strip() == f"Sayfa {TEXT_CHUNK_PAGES + 1}"
+        # Uzun dosya 3 grup, kısa dosya 1 grup
+        assert stream.writes == 4
+    
+    def test_extract_text_single_large_file_runs_in_parallel(self, monkeypatch):
+        """Tek büyük dosya sayfa gruplarıyla paralel işlenmeli; işçi aynı belgeyi her grupta yeniden açmamalı."""
+        import fitz
+        from marnak_pdf_tools.core import converter
+        
+        path = os.path.join(self.temp_dir, "tek.pdf")
+        document = fitz.open()
+        for i in range(converter.TEXT_CHUNK_PAGES * 3):
+            document.new_page().insert_text((72, 72), f"Sayfa {i + 1}")
+        document.save(path)
+        document.close()
+        
+        calls = []
+        parallel = self.converter._extract_text_parallel
+        def spy(chunks, *args):
+            calls.append((len(chunks), args[2]))
+            return parallel(chunks, *args)
+        monkeypatch.setattr(self.converter, "_extract_text_parallel", spy)
+        
+        output_path = os.path.join(self.temp_dir, "tek.jsonl")
+        success, message, _ = self.converter.extract_text([path], output_path, {"workers": 8})
+        
+        assert success, f"Metin çıkarma başarısız: {message}"
+        # 3 görev: işçi sayısı dosya sayısıyla değil görev sayısıyla sınırlanır
+        assert calls == [(3, 3)]
+        with open(output_path, encoding="utf-8") as f:
+            assert [json.loads(line)["page"] for line in f] == list(range(1, converter.TEXT_CHUNK_PAGES * 3 + 1))
+        
+        # İşçi tarafı: aynı dosyanın sonraki grubu açık belgeyi kullanır
+        try:
+            first = converter._extract_text_chunk(path, 0, 2, False)
+            document = converter._worker_document[1]
+            second = converter._extract_text_chunk(path, 2, 4, False)
+            assert converter._worker_document[1] is document and not document.is_closed
+            assert [json.loads(line)["page"] for line in first + second] == [1, 2, 3, 4]
+        finally:
+            converter._worker_document[1].close()
+            converter._worker_document = None
+    
+    def test_extract_text_nonexistent_file(self):
+        """Var olmayan dosya ile metin çıkarma testi."""
+        output_path = os.path.join(self.temp_dir, "metin.jsonl")
+        success, message, output_files = self.converter.extract_text(["nonexistent.pdf"], output_path)
+        
+        assert not success
+        assert len(output_files) == 0
+        assert not os.path.exists(output_path)
+
+
+class TestPdfOptimizer:
+    """PdfOptimizer sınıfı testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.optimizer = PdfOptimizer()
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _create_scan_pdf(self, path):
+        """2x2 inç alana yerleştirilmiş 1000x1000 piksellik (500 DPI) görüntü içeren PDF üretir."""
+        import fitz
+        doc = fitz.open()
+        page = doc.new_page()
+        pix = fitz.Pixmap(fitz.csRGB, 1000, 1000, os.urandom(3 * 1000 * 1000), False)
+        page.insert_image(fitz.Rect(72, 72, 216, 216), pixmap=pix)
+        doc.save(path)
+        doc.close()
+    
+    def test_optimize_downsamples_scans_and_skips_optimal(self):
+        """Yüksek DPI'lı görüntü küçültülmeli, görüntüsüz dosya atlanmalı."""
+        import fitz
+        scan_path = os.path.join(self.temp_dir, "scan.pdf")
+        self._create_scan_pdf(scan_path)
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        
+        if not os.path.exists(sample_1_page):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        output_dir = os.path.join(self.temp_dir, "out")
+        options = {"target_dpi": 150, "workers": 2}
+        success, message, output_files = self.optimizer.optimize_pdfs(
+            [scan_path, sample_1_page], output_dir, options)
+        
+        assert success, f"Optimizasyon başarısız: {message}"
+        assert len(output_files) == 1
+        
+        scan_report, text_report = self.optimizer.last_reports
+        assert not scan_report["skipped"]
+        assert scan_report["optimized_size"] < scan_report["original_size"]
+        assert scan_report["throughput_mb_s"] > 0
+        assert text_report["skipped"]
+        
+        doc = fitz.open(output_files[0])
+        image_xref = doc[0].get_images()[0][0]
+        assert doc.extract_image(image_xref)["width"] <= 300
+        doc.close()
+
+
+class TestInMemoryIO:
+    """Bellekteki girdi/çıktı testleri."""
+
+    def setup_method(self):
+        """Her test öncesi çalışır; geçici dosyalar ve çalışma klasörü izlenir."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.watched_temp = os.path.join(self.temp_dir, "tmp")
+        self.watched_cwd = os.path.join(self.temp_dir, "cwd")
+        os.makedirs(self.watched_temp)
+        os.makedirs(self.watched_cwd)
+
+        assets = os.path.abspath(os.path.join("tests", "assets"))
+        if not os.path.exists(os.path.join(assets, "sample_3_pages.pdf")):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        with open(os.path.join(assets, "sample_3_pages.pdf"), "rb") as f:
+            self.three_pages = f.read()
+        with open(os.path.join(assets, "sample_1_page.pdf"), "rb") as f:
+            self.one_page = f.read()
+        self.assets_before = sorted(os.listdir(assets))
+        self.assets = assets
+
+        self.old_cwd = os.getcwd()
+        self.old_tempdir = tempfile.tempdir
+        os.chdir(self.watched_cwd)
+        tempfile.tempdir = self.watched_temp
+
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if hasattr(self, "old_cwd"):
+            os.chdir(self.old_cwd)
+            tempfile.tempdir = self.old_tempdir
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def assert_no_files_created(self):
+        assert os.listdir(self.watched_temp) == []
+        assert os.listdir(self.watched_cwd) == []
+        assert sorted(os.listdir(self.assets)) == self.assets_before
+
+    def page_count(self, data) -> int:
+        from PyPDF2 import PdfReader
+        return len(PdfReader(io.BytesIO(data)).pages)
+
+    def test_bytes_in_bytes_out_creates_no_files(self):
+        """bytes/memoryview/akış girdileri bellekte işlenmeli, diske hiçbir şey yazılmamalı."""
+        inputs = [self.three_pages, (memoryview(self.one_page), "1"), io.BytesIO(self.three_pages)]
+
+        # Ağaç stratejisi istense bile ara dosya oluşturulmaz
+        results = list(PdfMerger().iter_merge(inputs, None, options={"strategy": "tree", "batch_size": 2}))
+        assert len(results) == 1 and results[0].path is None
+        assert results[0].pages == 7 and self.page_count(results[0].data) == 7
+
+        # Çağıranın akışına yazma (tekilleştirme dahil)
+        stream = io.BytesIO(b"onceki veri")
+        success, _, output_files = PdfMerger().merge_pdfs([self.three_pages, self.three_pages], stream,
+                                                          options={"deduplicate": True})
+        assert success and output_files == []
+        assert self.page_count(stream.getvalue()[len(b"onceki veri"):]) == 6
+
+        parts = list(PdfSplitter().iter_split(self.three_pages, None))
+        assert [part.name for part in parts] == ["belge_sayfa_1.pdf", "belge_sayfa_2.pdf", "belge_sayfa_3.pdf"]
+        assert all(self.page_count(part.data) == 1 for part in parts)
+
+        streams = {}
+        pages = list(PdfExtractor().iter_extract(memoryview(self.three_pages),
+                                                 lambda name: streams.setdefault(name, io.BytesIO()),
+                                                 {"extract_all": False, "page_range": "2-3"}))
+        assert [page.name for page in pages] == sorted(streams) == ["sayfa_belge_sayfa_2.pdf",
+                                                                    "sayfa_belge_sayfa_3.pdf"]
+        assert [page.bytes for page in pages] == [len(streams[p.name].getvalue()) for p in pages]
+
+        renamed = list(PdfRenamer().iter_rename([io.BytesIO(self.one_page)], None, {"new_name": "fatura"}))
+        assert renamed[0].name == "fatura_1.pdf" and renamed[0].data == self.one_page
+
+        text = io.StringIO()
+        success, _, outputs = PdfConverter().extract_text([self.three_pages, self.one_page], text,
+                                                          {"workers": 4})
+        assert success and outputs == []
+        assert len(text.getvalue().splitlines()) == 4
+
+        self.assert_no_files_created()
+
+    def test_in_memory_errors_are_reported(self):
+        """Geçersiz bellek girdileri hata vermeli ve dosya bırakmamalı."""
+        with pytest.raises(OperationError):
+            list(PdfSplitter().iter_split(b"PDF degil", None))
+
+        success, message, _ = PdfMerger().merge_pdfs([self.one_page, b"PDF degil"], None)
+        assert not success and "başarısız" in message
+
+        success, message, _ = PdfRenamer().rename_pdfs([b""], None, {"new_name": "x"})
+        assert not success and "Dosya boş" in message
+
+        self.assert_no_files_created()
+
+
+class TestPdfPipeline:
+    """PdfPipeline sınıfı testleri."""
+
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        import fitz
+        self.pipeline = PdfPipeline()
+        self.temp_dir = tempfile.mkdtemp()
+
+        # 6 sayfa: 3. sayfa boş, 6. sayfada yalnızca çizim var
+        self.input_path = os.path.join(self.temp_dir, "tarama.pdf")
+        document = fitz.open()
+        for index in range(6):
+            page = document.new_page()
+            if index == 5:
+                page.draw_rect(fitz.Rect(72, 72, 300, 300), color=(0, 0, 0))
+            elif index != 2:
+                page.insert_text((72, 72), f"Sayfa {index + 1}")
+        document.save(self.input_path)
+        document.close()
+
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_merge_drop_blank_split_writes_only_final_files(self):
+        """Adımlar bellekte uygulanmalı, yalnızca son dosyalar yazılmalı."""
+        from PyPDF2 import PdfReader
+        output_dir = os.path.join(self.temp_dir, "cikti")
+        steps = [{"op": "merge", "name": "paket"}, {"op": "drop_blank"},
+                 {"op": "split", "pages_per_split": 4}]
+
+        success, message, output_files = self.pipeline.run(
+            [self.input_path, (self.input_path, "2-1")], steps, output_dir)
+
+        assert success, message
+        assert sorted(os.listdir(output_dir)) == ["paket_bolum_1.pdf", "paket_bolum_2.pdf"]
+        texts = [page.extract_text().strip() for path in output_files for page in PdfReader(path).pages]
+        assert texts == ["Sayfa 1", "Sayfa 2", "Sayfa 4", "Sayfa 5", "", "Sayfa 2", "Sayfa 1"]
+
+        results = list(self.pipeline.iter_run([self.input_path], [{"op": "extract", "page_range": "1-2"},
+                                                                  {"op": "rename", "new_name": "kapak"}], None))
+        assert [(r.name, r.pages) for r in results] == [("kapak_1.pdf", 1), ("kapak_2.pdf", 1)]
+
+    def test_manifest_and_invalid_steps(self):
+        """JSON tanımı göreli yolları çözmeli; geçersiz adımlar girdiler okunmadan reddedilmeli."""
+        import json
+        manifest_path = os.path.join(self.temp_dir, "is.json")
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"inputs": ["tarama.pdf:1-2"], "steps": [{"op": "select", "page_range": "end"}],
+                       "output_dir": "cikti"}, f)
+
+        manifest = load_manifest(manifest_path)
+        assert manifest["inputs"] == [(self.input_path, "1-2")]
+        assert manifest["output_dir"] == os.path.join(self.temp_dir, "cikti")
+
+        success, _, output_files = self.pipeline.run(manifest["inputs"], manifest["steps"],
+                                                     manifest["output_dir"])
+        assert success and [os.path.basename(f) for f in output_files] == ["tarama.pdf"]
+
+        for steps in ([{"op": "yok"}], [{"op": "split"}], [{"op": "rename"}]):
+            with pytest.raises(OperationError):
+                list(self.pipeline.iter_run(["olmayan.pdf"], steps, None))
+
+
+class TestDocumentPool:
+    """DocumentPool sınıfı testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.temp_dir = tempfile.mkdtemp()
+        sample = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        if not os.path.exists(sample):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        self.paths = []
+        for index in range(3):
+            path = os.path.join(self.temp_dir, f"belge_{index}.pdf")
+            shutil.copy(sample, path)
+            self.paths.append(path)
+        self.pool = DocumentPool()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if hasattr(self, "pool"):
+            self.pool.clear()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_reuse_refcount_and_invalidation(self):
+        """Aynı dosya yeniden ayrıştırılmamalı; dosya değişince yeni belge açılmalı."""
+        path = self.paths[0]
+        success, message, _ = PdfExtractor(pool=self.pool).extract_pages(path, os.path.join(self.temp_dir, "sayfa"))
+        assert success, message
+        assert (self.pool.misses, len(self.pool)) == (1, 1)
+
+        with self.pool.borrow_document(path) as first:
+            with self.pool.borrow_document(path) as second:
+                assert second is first
+        with self.pool.borrow_document(path) as third:
+            assert third is first and not third.is_closed
+        assert (self.pool.hits, self.pool.misses, len(self.pool)) == (3, 1, 1)
+
+        # Bölme işlemi aynı belgeyi ödünç alır; PyPDF2 motoru ayrı bir okuyucu tutar
+        splitter = PdfSplitter(pool=self.pool)
+        for engine in ("pymupdf", "pypdf2", "pypdf2"):
+            success, message, _ = splitter.split_pdf(path, os.path.join(self.temp_dir, "bolum"),
+                                                     {"engine": engine})
+            assert success, message
+        assert (self.pool.hits, self.pool.misses, len(self.pool)) == (5, 2, 2)
+
+        # Dosya değişti: eski belge kapatılır, yenisi açılır
+        shutil.copy(os.path.join("tests", "assets", "sample_1_page.pdf"), path)
+        os.utime(path, ns=(os.stat(path).st_mtime_ns + 10 ** 9,) * 2)
+        with self.pool.borrow_document(path) as changed:
+            assert changed is not first and first.is_closed
+            assert len(changed) == 1
+
+    def test_lru_eviction_and_thread_rule(self):
+        """Bütçe aşılınca ödünçte olmayan en eski belge kapanmalı; başka iş parçacığı özel kopya almalı."""
+        import threading
+        self.pool.budget_bytes = 2 * os.path.getsize(self.paths[0])
+        held = self.pool.acquire(self.paths[0])
+        with self.pool.borrow_document(self.paths[1]) as second:
+            pass
+        with self.pool.borrow_document(self.paths[2]):
+            pass
+        # belge_0 ödünçte olduğu için kalır, en eski serbest belge (belge_1) kapanır
+        assert second.is_closed and not held.is_closed
+        assert len(self.pool) == 2 and self.pool.size <= self.pool.budget_bytes
+
+        borrowed = []
+        def worker():
+            with self.pool.borrow_document(self.paths[0]) as document:
+                borrowed.append(document)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert borrowed[0] is not held and borrowed[0].is_closed
+        self.pool.release(held)
+        assert not held.is_closed
+
+
+    def test_worker_split_after_gui_preview_hits_pool(self, monkeypatch):
+        """Önizlemeden sonra iş parçacığındaki bölme, önizlemenin açtığı belgeyi havuzdan almalı."""
+        import threading
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        from marnak_pdf_tools.ui.components import pdf_viewer
+        app = QApplication.instance() or QApplication([])
+        if not isinstance(app, QApplication):
+            pytest.skip("Bu süreçte QApplication yerine QCoreApplication açılmış")
+        monkeypatch.setattr(pdf_viewer, "session_pool", lambda: self.pool)
+
+        path = self.paths[0]
+        viewer = pdf_viewer.PdfViewer()
+        assert viewer.load_pdf(path)
+        assert (self.pool.hits, self.pool.misses) == (1, 1)
+
+        results = []
+        def worker():
+            results.append(PdfSplitter(pool=self.pool).split_pdf(
+                path, os.path.join(self.temp_dir, "bolum"), {"engine": "pymupdf"}))
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert results[0][0], results[0][1]
+        # Özel kopya açılmadı: bölme önizlemenin belgesini havuzdan ödünç aldı
+        assert (self.pool.hits, self.pool.misses, len(self.pool)) == (2, 1, 1)
+        viewer.next_page()
+        assert viewer.current_page == 1
+        viewer.clear()
+
+
+class TestEngines:
+    """PDF motorlarının eşdeğerlik testleri: iki motor da sayfa bazında aynı çıktıyı üretmeli."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır; döndürülmüş sayfa ve ortak görüntü içeren bir belge üretir."""
+        import fitz
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.temp_dir, "kaynak.pdf")
+        doc = fitz.open()
+        pix = fitz.Pixmap(fitz.csRGB, 40, 40, bytes(range(256)) * 18 + bytes(192), False)
+        for index in range(5):
+            page = doc.new_page(width=595 if index != 2 else 842, height=842 if index != 2 else 595)
+            page.insert_text((72, 72), f"Motor testi - Sayfa {index + 1}")
+            page.insert_image(fitz.Rect(72, 100, 172, 200), pixmap=pix)
+            if index == 3:
+                page.set_rotation(90)
+        doc.save(self.source)
+        doc.close()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def page_signatures(self, path):
+        """Her sayfa için (boyut, döndürme, metin, görüntü özeti)."""
+        import fitz, hashlib
+        with fitz.open(path) as doc:
+            return [(tuple(round(v) for v in page.rect), page.rotation, page.get_text().strip(),
+                     hashlib.md5(page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5)).samples).hexdigest())
+                    for page in doc]
+    
+    def run_with_engines(self, operation):
+        """İşlemi iki motorla ayrı klasörlerde çalıştırır; {dosya adı: sayfa imzaları} döndürür."""
+        outputs = {}
+        for name in (engines.ENGINE_PYPDF2, engines.ENGINE_PYMUPDF):
+            output_dir = os.path.join(self.temp_dir, name)
+            success, message, files = operation(name, output_dir)
+            assert success, f"{name}: {message}"
+            outputs[name] = {os.path.basename(f): self.page_signatures(f) for f in files}
+        return outputs[engines.ENGINE_PYPDF2], outputs[engines.ENGINE_PYMUPDF]
+    
+    def test_merge_split_extract_are_page_identical(self):
+        """Birleştirme, bölme ve çıkarma iki motorla aynı sayfaları üretmeli."""
+        merge_cases = [
+            ([(self.source, "5-3"), self.source], {}),
+            ([self.source, (self.source, "2-4")], {"mode": PdfMerger.MERGE_MODE_INTERLEAVE, "reverse_inputs": [1]}),
+        ]
+        for inputs, options in merge_cases:
+            pypdf2, pymupdf = self.run_with_engines(
+                lambda name, out: PdfMerger().merge_pdfs(inputs, os.path.join(out, "birlesik.pdf"),
+                                                         options=dict(options, engine=name)))
+            assert pypdf2 == pymupdf and len(pypdf2["birlesik.pdf"]) == 8
+
+        split_cases = [
+            ({"mode": PdfSplitter.SPLIT_MODE_EVERY_N_PAGES, "pages_per_split": 2}, [2, 2, 1]),
+            ({"mode": PdfSplitter.SPLIT_MODE_PAGE_RANGE, "page_range": "4-2,5"}, [3, 1]),
+        ]
+        for options, part_pages in split_cases:
+            pypdf2, pymupdf = self.run_with_engines(
+                lambda name, out: PdfSplitter().split_pdf(self.source, out, dict(options, engine=name)))
+            assert pypdf2 == pymupdf and [len(pages) for pages in pypdf2.values()] == part_pages
+
+        pypdf2, pymupdf = self.run_with_engines(
+            lambda name, out: PdfExtractor().extract_pages(
+                self.source, out, {"extract_all": False, "page_range": "1,4", "engine": name}))
+        assert pypdf2 == pymupdf
+        assert [sig[0][1] for sig in pypdf2.values()] == [0, 90]
+    
+    def test_engine_selection(self):
+        """Varsayılan motor işleme göre seçilmeli; desteklenmeyen işlemde varsayılana dönülmeli."""
+        for operation, name in engines.DEFAULT_ENGINES.items():
+            assert engines.get_engine(operation).name == name
+            assert engines.get_engine(operation, engines.ENGINE_AUTO).name == name
+        assert engines.get_engine(engines.OP_SPLIT, engines.ENGINE_PYPDF2).name == engines.ENGINE_PYPDF2
+        assert engines.get_engine(engines.OP_RENDER, engines.ENGINE_PYPDF2).name == engines.ENGINE_PYMUPDF
+        with pytest.raises(OperationError):
+            engines.get_engine(engines.OP_SPLIT, "yok")
+
+        success, message, _ = PdfSplitter().split_pdf(self.source, self.temp_dir, {"engine": "yok"})
+        assert not success and "Bilinmeyen PDF motoru" in message
+
+        engine = engines.get_engine(engines.OP_RENDER)
+        document = engine.open(self.source)
+        try:
+            assert engine.render(document, 0, 0.25).startswith(b"\x89PNG")
+        finally:
+            engine.close(document)
+
+    def test_write_after_existing_stream_data(self):
+        """Önünde veri bulunan akışlara da geçerli (ofsetleri doğru) PDF yazılmalı."""
+        import fitz
+        from marnak_pdf_tools.core import pdf_io
+
+        def written_pages(data):
+            assert data.startswith(b"onek%PDF")
+            with fitz.open("pdf", data[4:]) as written:
+                assert not written.is_repaired
+                return [page.get_text().strip() for page in written]
+
+        expected = ["Motor testi - Sayfa 5", "Motor testi - Sayfa 1"]
+        for name in (engines.ENGINE_PYPDF2, engines.ENGINE_PYMUPDF):
+            engine = engines.ENGINES[name]
+            document = engine.open(self.source)
+            target = engine.new_document()
+            engine.copy_pages(target, document, [4, 0])
+            stream = io.BytesIO(b"onek")
+            stream.seek(0, io.SEEK_END)
+            pdf_io.write_output(stream, lambda output: engine.write(target, output), 2, 0.0, "cikti.pdf")
+            assert written_pages(stream.getvalue()) == expected, name
+
+            if name == engines.ENGINE_PYMUPDF:
+                # Aranabilir akışa belge doğrudan (bayt dizisine dönüştürülmeden) yazılır
+                stream = io.BytesIO(b"onek")
+                stream.seek(0, io.SEEK_END)
+                engine.write(target, stream)
+                assert written_pages(stream.getvalue()) == expected
+            engine.close(document)
+    
+    def test_defaults_match_recorded_benchmark(self):
+        """DEFAULT_ENGINES, kayıtlı motor ölçümlerinden türetilen tabloyla aynı olmalı."""
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+        import engine_benchmark
+        
+        results = engine_benchmark.load_results()
+        assert engine_benchmark.derive_defaults(results["timings_ms"]) == engines.DEFAULT_ENGINES
+    
+    def test_incomplete_engine_fails_on_creation(self):
+        """Soyut metotları tanımlamayan motor, iş sırasında değil oluşturulurken hata vermeli."""
+        class CountOnlyEngine(engines.PdfEngine):
+            name = "sayac"
+            
+            def page_count(self, document):
+                return 0
+        
+        with pytest.raises(TypeError):
+            CountOnlyEngine()
+
+
+class TestResultCache:
+    """ResultCache sınıfı testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ResultCache(os.path.join(self.temp_dir, "cache"))
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_unchanged_inputs_hit_and_restore(self):
+        """Değişmeyen girdiler önbellekten gelmeli, silinen çıktı geri yüklenmeli."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        input_path = os.path.join(self.temp_dir, "girdi.pdf")
+        shutil.copy(sample_3_pages, input_path)
+        output_dir = os.path.join(self.temp_dir, "out")
+        splitter = PdfSplitter(cache=self.cache)
+        
+        success, _, first_files = splitter.split_pdf(input_path, output_dir)
+        assert success and self.cache.last_status == "miss"
+        
+        os.remove(first_files[0])
+        success, message, second_files = splitter.split_pdf(input_path, output_dir)
+        assert success and self.cache.last_status == "hit"
+        assert "önbellekten" in message
+        assert second_files == first_files
+        assert sorted(os.listdir(output_dir)) == sorted(os.path.basename(f) for f in first_files)
+        
+        # Farklı seçenek ya da değişen içerik yeniden hesaplanmalı
+        splitter.split_pdf(input_path, output_dir, {"mode": PdfSplitter.SPLIT_MODE_PAGE_RANGE,
+                                                    "page_range": "1-2"})
+        assert self.cache.last_status == "miss"
+        shutil.copy(os.path.join("tests", "assets", "sample_1_page.pdf"), input_path)
+        splitter.split_pdf(input_path, os.path.join(self.temp_dir, "out2"))
+        assert self.cache.last_status == "miss"
+        assert (self.cache.hits, self.cache.misses) == (1, 3)
+    
+    def test_size_based_eviction(self):
+        """Boyut sınırı aşılınca en eski kayıtlar silinmeli."""
+        sample_1_page = os.path.join("tests", "assets", "sample_1_page.pdf")
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_1_page) or not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyaları bulunamadı")
+        
+        self.cache.max_bytes = os.path.getsize(sample_3_pages) * 3
+        merger = PdfMerger(cache=self.cache)
+        for index in range(4):
+            output_path = os.path.join(self.temp_dir, f"birlesik_{index}.pdf")
+            success, _, _ = merger.merge_pdfs([sample_3_pages, sample_1_page], output_path)
+            assert success
+        
+        assert self.cache.misses == 4
+        assert self.cache.total_size() <= self.cache.max_bytes
+        
+        # En son kayıt korunur
+        merger.merge_pdfs([sample_3_pages, sample_1_page], os.path.join(self.temp_dir, "birlesik_3.pdf"))
+        assert self.cache.last_status == "hit"
+    
+    def test_input_hashes_saved_once_per_key(self):
+        """Çok girdili anahtarda yeni özetler tek seferde yazılmalı ve sonraki örnekte yeniden okunmalı."""
+        paths = []
+        for index in range(20):
+            path = os.path.join(self.temp_dir, f"girdi_{index}.pdf")
+            with open(path, "wb") as f:
+                f.write(f"%PDF-1.4 {index}".encode())
+            paths.append(path)
+        
+        def count_saves(cache):
+            saves = []
+            save = cache._save_hashes
+            cache._save_hashes = lambda: (saves.append(1), save())
+            return saves
+        
+        saves = count_saves(self.cache)
+        key = self.cache.make_key("merge", paths, {})
+        assert len(saves) == 1
+        
+        reopened = ResultCache(self.cache.cache_dir)
+        reopened_saves = count_saves(reopened)
+        assert reopened.make_key("merge", paths, {}) == key
+        assert reopened_saves == []
+
+
+class TestPageSet:
+    """PageSet ve sayfa aralığı ayrıştırıcı testleri."""
+    
+    def test_intervals_are_sorted_and_merged(self):
+        """Çakışan ve bitişik aralıklar tek aralıkta birleşmeli."""
+        page_set = PageSet([(10, 12), (0, 3), (2, 5), (5, 6)])
+        
+        assert page_set.intervals() == [(0, 6), (10, 12)]
+        assert list(page_set) == [0, 1, 2, 3, 4, 5, 10, 11]
+        assert len(page_set) == 8
+    
+    def test_membership(self):
+        """Üyelik kontrolü aralık sınırlarına uymalı."""
+        page_set = PageSet([(0, 3), (10, 12)])
+        
+        assert 0 in page_set and 2 in page_set and 11 in page_set
+        assert 3 not in page_set and -1 not in page_set and 12 not in page_set
+        assert not PageSet()
+    
+    def test_large_range_is_not_materialized(self):
+        """Büyük aralıklar tek aralık olarak tutulmalı."""
+        page_set = parse_page_set("1-200000", 200000)
+        
+        assert page_set.intervals() == [(0, 200000)]
+        assert len(page_set) == 200000
+        assert 199999 in page_set
+    
+    def test_parse_page_ranges_compatibility(self):
+        """Eski dönüş biçimi (liste listesi) korunmalı."""
+        assert parse_page_ranges("1,3-5", 6) == [[0], [2, 3, 4]]
+        assert parse_page_set("3-5,1,4", 6) == PageSet([(0, 1), (2, 5)])
+    
+    def test_extended_expressions(self):
+        """Açık uçlu, sondan sayılan, adımlı ve ters aralıklar."""
+        def pages(text):
+            return [[p + 1 for p in r] for r in parse_page_selection(text, 12)]
+        
+        assert pages("end,-2") == [[12], [11]]
+        assert pages("-3-") == [[10, 11, 12]]
+        assert pages("9-") == [[9, 10, 11, 12]]
+        assert pages("8-end:2") == [[8, 10, 12]]
+        assert pages("5-3") == [[5, 4, 3]]
+        assert pages("end-1:5") == [[12, 7, 2]]
+        assert pages("1-100") == [list(range(1, 13))]
+    
+    def test_invalid_tokens_raise(self):
+        """Geçersiz parçalar atlanmamalı, açık bir hata vermeli."""
+        for text in ["1,abc", "0", "13", "4:2", "1-5:0", "20-30"]:
+            with pytest.raises(PageRangeError):
+                parse_page_selection(text, 12)
+    
+    def test_parse_merge_input(self):
+        """CLI girdisi "dosya.pdf:3-9" yol ve sayfa ifadesine ayrılmalı."""
+        assert parse_merge_input("b.pdf:3-9") == ("b.pdf", "3-9")
+        assert parse_merge_input("C:\\Belgeler\\b.PDF:1-end:2") == ("C:\\Belgeler\\b.PDF", "1-end:2")
+        assert parse_merge_input("a.pdf") == ("a.pdf", None)
+    
+    def test_stepped_ranges_in_page_set(self):
+        """Adımlı ve ters aralıklar PageSet'e sıralı eklenmeli."""
+        assert list(parse_page_set("6-1:2,2", 6)) == [1, 3, 5]
+
+
+class TestJobMetrics:
+    """İş ölçümü kaydı testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_split_records_pages_bytes_and_phases(self):
+        """Bölme kaydı sayfa, bayt ve aşama sürelerini içermeli; günlüğe satır eklenmeli."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        output_dir = os.path.join(self.temp_dir, "out")
+        with collect_metrics("split", [sample_3_pages]) as metrics:
+            success, message, output_files = PdfSplitter().split_pdf(sample_3_pages, output_dir)
+            metrics.finish(success, message, output_files)
+        
+        record = metrics.to_dict()
+        assert record["success"] is True
+        assert record["pages"] == 3
+        assert (record["files_in"], record["bytes_in"]) == (1, os.path.getsize(sample_3_pages))
+        assert record["files_out"] == 3
+        assert record["bytes_out"] == sum(os.path.getsize(path) for path in output_files)
+        assert record["phases"]["open"] > 0 and record["phases"]["serialize"] > 0
+        assert sum(record["phases"].values()) == pytest.approx(record["wall_s"], abs=1e-3)
+        
+        # Etkin kayıt yokken core çağrıları ölçüm yapmaz
+        PdfSplitter().split_pdf(sample_3_pages, os.path.join(self.temp_dir, "out2"))
+        assert metrics.files_out == 3
+        
+        log_path = os.path.join(self.temp_dir, "log", "metrics.jsonl")
+        append_metrics_log(record, log_path)
+        append_metrics_log(record, log_path)
+        with open(log_path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2 and json.loads(lines[0]) == record
+
+    
+    def test_peak_rss_delta_is_scoped_to_job(self):
+        """Bellek artışı iş başındaki RSS'e göre ölçülmeli; işten önce tutulan bellek sayılmamalı."""
+        from marnak_pdf_tools.core.metrics import read_memory
+        if read_memory().get("rss") is None:
+            pytest.skip("/proc/self/status okunamıyor")
+        
+        # Arayüzün/havuzun işten önce tuttuğu bellek
+        held = b"\x01" * (128 * 1024 * 1024)
+        with collect_metrics("idle") as idle:
+            time.sleep(0.05)
+        assert idle.peak_rss_delta_mb < 32
+        
+        with collect_metrics("allocate") as busy:
+            block = b"\x01" * (64 * 1024 * 1024)
+            time.sleep(0.05)
+            del block
+        assert busy.peak_rss_delta_mb >= 48
+        assert busy.to_dict()["peak_rss_delta_mb"] == round(busy.peak_rss_delta_mb, 1)
+        del held
+
+
+class TestJobProfiling:
+    """İş profili kaydı testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_profile_with_fingerprint_options_and_summary(self):
+        """Profil, girdi parmak izi ve seçeneklerle yazılmalı; özet en çok zaman alan fonksiyonları listelemeli."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        profile_dir = os.path.join(self.temp_dir, "profiles")
+        options = {"mode": PdfSplitter.SPLIT_MODE_EVERY_N_PAGES, "pages_per_split": 2}
+        with collect_metrics("split", [sample_3_pages]) as metrics:
+            with profile_job(metrics, options, profile_dir) as paths:
+                success, message, output_files = PdfSplitter().split_pdf(
+                    sample_3_pages, os.path.join(self.temp_dir, "out"), options)
+                metrics.finish(success, message, output_files)
+        
+        assert success
+        assert latest_profile(profile_dir) == paths["profile"]
+        with open(paths["info"], "r", encoding="utf-8") as f:
+            info = json.load(f)
+        assert info["operation"] == "split" and info["success"] is True
+        assert info["options"] == options
+        assert info["inputs"][0]["bytes"] == os.path.getsize(sample_3_pages)
+        assert len(info["inputs"][0]["sha256"]) == 64
+        
+        summary = summarize_profile(paths["profile"], top=10)
+        assert "split_pdf" in summary
+        assert "sha256" in summary
+        assert len(summary.splitlines()) <= 7 + 10
+
+
+class TestProgressThrottle:
+    """İlerleme seyrekleştirme testleri."""
+    
+    def test_coalesces_by_interval_and_percent(self):
+        """Aynı yüzde tekrarlanmamalı, aralık içindeki değerler birleştirilmeli, %100 hep geçmeli."""
+        now = [0.0]
+        updates = []
+        throttle = ProgressThrottle(updates.append, interval_ms=100, clock=lambda: now[0])
+        
+        for step in range(1, 1001):
+            now[0] = step * 0.001  # 1000 bildirim, 1 sn
+            throttle(step // 10)
+        throttle.flush()
+        
+        percents = [update.percent for update in updates]
+        assert throttle.received == 1000
+        assert percents[0] == 0 and percents[-1] == 100
+        assert percents == sorted(set(percents))
+        assert len(updates) <= 12
+        # Kalan süre geçen süreyle orantılı tahmin edilir
+        middle = next(update for update in updates if update.percent >= 50)
+        assert middle.eta_s == pytest.approx(middle.elapsed_s * (100 - middle.percent) / middle.percent)
+        assert updates[-1].eta_s == 0.0
+    
+    def test_flush_publishes_pending_value(self):
+        """Aralık yüzünden bekleyen son değer flush ile yayınlanmalı; iş sayaçları taşınmalı."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        temp_dir = tempfile.mkdtemp()
+        try:
+            updates = []
+            throttle = ProgressThrottle(updates.append, interval_ms=60000)
+            with collect_metrics("split"):
+                success, _, _ = PdfSplitter().split_pdf(sample_3_pages, temp_dir, progress_callback=throttle)
+                assert [update.percent for update in updates] == [33, 100]
+                throttle(100)
+                throttle.flush()
+            # Son bildirim son dosya teslim edilmeden gelir; flush güncel sayaçlarla yineler
+            assert success and throttle.received == 4
+            assert [update.percent for update in updates] == [33, 100, 100]
+            assert (updates[-1].files, updates[-1].pages) == (3, 3)
+            assert updates[-1].current_file.endswith(".pdf")
+            
+            throttle.start()
+            throttle(10)
+            throttle(20)
+            throttle.flush()
+            assert [update.percent for update in updates[3:]] == [10, 20]
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestLoggingPipeline:
+    """Kuyruklu günlük yapılandırması testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root_level = logging.getLogger().level
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        shutdown_logging()
+        logging.getLogger().setLevel(self.root_level)
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def test_job_summary_at_info_and_detail_at_debug(self):
+        """INFO'da yalnızca iş özeti, DEBUG'da dosya başına satırlar yazılmalı; dosya döndürülmeli."""
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        log_path = os.path.join(self.temp_dir, "app.log")
+        splitter = PdfSplitter(logger=logging.getLogger("PdfService"))
+        
+        setup_logging(log_path, level="INFO", console=False)
+        splitter.split_pdf(sample_3_pages, os.path.join(self.temp_dir, "out1"))
+        shutdown_logging()
+        with open(log_path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        assert "3 dosya, 3 sayfa" in lines[0]
+        
+        setup_logging(log_path, level="DEBUG", console=False)
+        splitter.split_pdf(sample_3_pages, os.path.join(self.temp_dir, "out2"))
+        shutdown_logging()
+        with open(log_path, "r", encoding="utf-8") as f:
+            assert f.read().count("Dosya oluşturuldu") == 3
+        
+        # Boyut sınırında dosya döndürülür, en fazla backup_count eski dosya kalır
+        setup_logging(log_path, level="DEBUG", console=False, max_bytes=200, backup_count=1)
+        splitter.split_pdf(sample_3_pages, os.path.join(self.temp_dir, "out3"))
+        shutdown_logging()
+        rotated = sorted(name for name in os.listdir(self.temp_dir) if name.startswith("app.log"))
+        assert rotated == ["app.log", "app.log.1"]
+        assert all(os.path.getsize(os.path.join(self.temp_dir, name)) < 400 for name in rotated)
+    
+    def test_rate_limit_keeps_warnings_and_counts_suppressed(self):
+        """Sınır aşılınca bilgi kayıtları atlanmalı, uyarılar geçmeli ve atlanan sayı bildirilmeli."""
+        now = [0.0]
+        rate_filter = RateLimitFilter(rate=10, burst=2, clock=lambda: now[0])
+        
+        def record(level, msg):
+            return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+        
+        passed = [rate_filter.filter(record(logging.INFO, f"satır {i}")) for i in range(5)]
+        assert passed == [True, True, False, False, False]
+        
+        warning = record(logging.WARNING, "uyarı")
+        assert rate_filter.filter(warning)
+        assert "3 kayıt" in warning.getMessage()
+        
+        now[0] = 0.1  # Bir jeton dolar
+        assert rate_filter.filter(record(logging.INFO, "sonra"))
+
+
+class TestStallWatchdog:
+    """Olay döngüsü takılma bekçisi testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        from PyQt6.QtCore import QCoreApplication
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _spin(self, seconds):
+        """Olay döngüsünü verilen süre boyunca döndürür."""
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.002)
+    
+    def _block_event_loop(self, seconds):
+        """Ana iş parçacığını olay döngüsüne dönmeden meşgul eder."""
+        time.sleep(seconds)
+    
+    def test_stall_logs_main_thread_stack_and_exports_histogram(self):
+        """Eşiği aşan takılmada ana iş parçacığının yığını kaydedilmeli, histogram dışa aktarılmalı."""
+        logger = logging.getLogger("StallWatchdogTest")
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        
+        watchdog = StallWatchdog(interval_ms=10, threshold_ms=100, logger=logger)
+        watchdog.start()
+        try:
+            self._spin(0.1)
+            self._block_event_loop(0.4)
+            self._spin(0.1)
+        finally:
+            watchdog.stop()
+            logger.removeHandler(handler)
+        
+        assert len(watchdog.stalls) == 1
+        stall = watchdog.stalls[0]
+        assert stall["duration_ms"] >= 350
+        assert "_block_event_loop" in "".join(stall["stacks"][0])
+        assert any("_block_event_loop" in record.getMessage() for record in records)
+        
+        report_path = os.path.join(self.temp_dir, "event_loop.json")
+        watchdog.export(report_path)
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+        latency = report["latency"]
+        assert latency["samples"] == sum(latency["buckets_ms"].values()) > 5
+        assert latency["max_ms"] >= 250
+        assert report["stalls"][0]["duration_ms"] == stall["duration_ms"]
+    
+    def test_stall_missed_by_monitor_is_reported_from_late_heartbeat(self):
+        """İzleyici takılma sırasında yığın alamadıysa (GIL tutuluyordu) geciken kalp atışı takılmayı kaydetmeli."""
+        logger = logging.getLogger("StallWatchdogGilTest")
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        
+        watchdog = StallWatchdog(interval_ms=10, threshold_ms=100, logger=logger)
+        # GIL'i bırakmayan bir C çağrısında izleyici hiç çalışamaz; örnekleme hiç olmamış gibi
+        watchdog._sample_stack = lambda stalled_ms: None
+        watchdog.start()
+        try:
+            self._spin(0.1)
+            self._block_event_loop(0.4)
+            self._spin(0.1)
+        finally:
+            watchdog.stop()
+            logger.removeHandler(handler)
+        
+        assert len(watchdog.stalls) == 1
+        stall = watchdog.stalls[0]
+        assert stall["duration_ms"] >= 350 and stall["stacks"] == []
+        assert any("yığın alınamadı" in record.getMessage() for record in records)
+        assert watchdog.report()["stalls"][0]["duration_ms"] == stall["duration_ms"]
+
+class TestLazyImports:
+    """Paket içe aktarımlarının ağır bağımlılıkları ilk kullanıma ertelediğini doğrular."""
+    
+    def test_app_modules_do_not_load_pdf_libraries(self):
+        """Servis ve ana pencere modülleri fitz/PyPDF2 yüklememeli; paket adları ilk erişimde çözülmeli."""
+        code = (
+            "import sys\n"
+            "import marnak_pdf_tools, marnak_pdf_tools.services.pdf_service, marnak_pdf_tools.ui.windows.main_window\n"
+            "print(sorted(name for name in ('fitz', 'PyPDF2') if name in sys.modules))\n"
+            "from marnak_pdf_tools.core import PdfMerger\n"
+            "print(marnak_pdf_tools.PdfMerger is PdfMerger, 'fitz' in sys.modules)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        completed = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True)
+        assert completed.returncode == 0, completed.stderr
+        lines = completed.stdout.splitlines()  # fitz içe aktarılırken stdout'a uyarı yazabilir
+        assert lines[0] == "[]"
+        assert lines[-1] == "True True"
+
+
+class TestFrozenEntryPoint:
+    """Donmuş (PyInstaller) yapının giriş noktası testleri."""
+    
+    def test_pool_worker_launch_does_not_start_gui(self):
+        """Giriş noktası GUI'den önce freeze_support çağırmalı (süreç havuzu işçisi arayüzü açmamalı)."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        app_path = os.path.join(root, "marnak_pdf_tools", "app.py")
+        # Havuz işçisi exe'yi --multiprocessing-fork ile başlatır; freeze_support burada görevi çalıştırıp çıkar
+        code = (
+            "import multiprocessing, runpy, sys\n"
+            "def worker():\n"
+            "    print('işçi')\n"
+            "    sys.exit(0)\n"
+            "multiprocessing.freeze_support = worker\n"
+            f"sys.argv = [{app_path!r}, '--multiprocessing-fork']\n"
+            f"runpy.run_path({app_path!r}, run_name='__main__')\n"
+            "print('arayüz')\n"
+        )
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        completed = subprocess.run([sys.executable, "-c", code], cwd=root, env=env,
+                                   capture_output=True, text=True, timeout=30)
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.splitlines()[-1] == "işçi"
+
+
+class TestCommandLine:
+    """Komut satırı arayüzü testleri."""
+    
+    def setup_method(self):
+        """Her test öncesi çalışır."""
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def teardown_method(self):
+        """Her test sonrası çalışır."""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    @pytest.mark.parametrize("range_args", [["-r", "-2-"], ["--range", "-2-"], ["-r=-2-"], ["--range=-2-"]])
+    def test_split_range_starting_with_dash(self, range_args, capsys):
+        """'-' ile başlayan aralık (-2-: son 2 sayfa) -r/--range değeri olarak kabul edilmeli."""
+        from marnak_pdf_tools.__main__ import main
+        sample_3_pages = os.path.join("tests", "assets", "sample_3_pages.pdf")
+        
+        if not os.path.exists(sample_3_pages):
+            pytest.skip("Test PDF dosyası bulunamadı")
+        
+        exit_code = main(["split", sample_3_pages, "-o", self.temp_dir, "-m", "range"] + range_args)
+        
+        assert exit_code == 0, capsys.readouterr().out
+        assert os.listdir(self.temp_dir) == ["sample_3_pages_sayfa_2-3.pdf"]
+
+
 class TestCoreIntegration:
     """Core modülleri entegrasyon testleri."""
     
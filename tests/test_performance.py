@@ -0,0 +1,93 @@
+"""
+Performans gerileme testleri (yalnızca ``pytest --perf`` ile çalışır).
+
+Ölçüm ve karşılaştırma mantığı ``benchmarks/regression.py``, bellek profili
+``benchmarks/memory_profile.py``, açılış ölçümü ``benchmarks/startup_benchmark.py``
+içindedir.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import regression
+import memory_profile
+import startup_benchmark
+from corpus import write_large_pdf
+
+
+@pytest.mark.perf
+class TestPerformanceRegression:
+    """Core işlemlerinin kayıtlı tabana göre yavaşlamadığını doğrular."""
+
+    def test_core_operations_within_baseline(self, request):
+        if request.config.getoption("--perf-update-baseline"):
+            regression.save_baseline(regression.measure())
+            pytest.skip(f"Taban güncellendi: {regression.BASELINE_PATH}")
+
+        baseline = regression.load_baseline()
+        assert baseline is not None, (
+            f"Taban dosyası yok: {regression.BASELINE_PATH} (--perf-update-baseline ile oluşturun)")
+        assert baseline.get("corpus_version") == regression.CORPUS_VERSION, (
+            "Derlem sürümü değişmiş, taban yeniden oluşturulmalı (--perf-update-baseline)")
+
+        tolerance = request.config.getoption("--perf-tolerance") or regression.DEFAULT_TOLERANCE
+        measurement, rows = regression.check(baseline, tolerance)
+        table = regression.format_table(rows, measurement["calibration_s"] / baseline["calibration_s"])
+        print("\n" + table)
+
+        regressed = [row["name"] for row in rows if row["status"] == regression.STATUS_REGRESSED]
+        assert not regressed, f"Yavaşlayan durumlar: {', '.join(regressed)}\n\n{table}"
+
+
+@pytest.mark.perf
+class TestMemoryBudgets:
+    """Akışlı işlemlerin en yüksek RSS'inin girdi boyutundan bağımsız bütçede kaldığını doğrular."""
+
+    def setup_method(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    @pytest.mark.parametrize("operation", sorted(memory_profile.MEMORY_BUDGETS_MB))
+    def test_peak_rss_within_budget(self, request, operation):
+        size_mb = request.config.getoption("--perf-memory-input-mb")
+        # Büyük girdi çalıştırmalar arasında yeniden kullanılır
+        input_dir = os.path.join(tempfile.gettempdir(), "marnak_bellek")
+        os.makedirs(input_dir, exist_ok=True)
+        path = os.path.join(input_dir, f"buyuk_{size_mb}mb.pdf")
+        write_large_pdf(path, size_mb)
+
+        report = memory_profile.profile_in_subprocess(operation, [path], self.output_dir)
+        if report.peak_rss_mb is None:
+            pytest.skip("RSS bu sistemde okunamıyor")
+
+        budget = memory_profile.MEMORY_BUDGETS_MB[operation]
+        assert report.peak_rss_mb <= budget, (
+            f"{operation}: {size_mb} MB girdide en yüksek RSS {report.peak_rss_mb:.1f} MB, "
+            f"bütçe {budget} MB\n{memory_profile.format_report(report)}")
+
+
+@pytest.mark.perf
+class TestStartupTime:
+    """Ana pencerenin ilk karesinin araç pencereleri kurulmadan ve ağır modüller yüklenmeden çizildiğini doğrular."""
+
+    def test_time_to_first_frame(self):
+        lazy = [startup_benchmark.measure_startup() for _ in range(3)]
+        eager = [startup_benchmark.measure_startup(eager=True) for _ in range(3)]
+        lazy_s = sorted(run["first_frame_s"] for run in lazy)[1]
+        eager_s = sorted(run["first_frame_s"] for run in eager)[1]
+        print(f"\nİlk kare: {lazy_s:.3f} sn (tüm pencereler kurulu: {eager_s:.3f} sn)")
+
+        assert lazy[-1]["heavy_modules"] == []
+        assert lazy[-1]["built_windows"] == ["rename_window"]
+        assert lazy[-1]["built_after_navigation"] == ["rename_window", "split_window"]
+        assert lazy_s <= startup_benchmark.STARTUP_BUDGET_S, (
+            f"İlk kare {lazy_s:.3f} sn, bütçe {startup_benchmark.STARTUP_BUDGET_S} sn")
+        assert lazy_s <= eager_s * startup_benchmark.EAGER_RATIO, (
+            f"İlk kare {lazy_s:.3f} sn, tüm pencereler kurulu açılış {eager_s:.3f} sn")